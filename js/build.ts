@@ -69,6 +69,13 @@ const opts: Array<BuildOptions> = [
     minify: false,
     sourcemap: false,
   },
+  {
+    entryPoints: {
+      "reconnect/reconnect": "reconnect/reconnect.ts",
+    },
+    minify: false,
+    sourcemap: false,
+  },
   {
     entryPoints: { "spin/spin": "spin/spin.scss" },
     plugins: [sassPlugin({ type: "css", sourceMap: false })],
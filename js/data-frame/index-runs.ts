@@ -0,0 +1,44 @@
+export type IndexRuns = { runs: number[] };
+
+// Encode row indices as runs of consecutive indices: a flat array of
+// `[start, length, start, length, ...]`, where a negative length is a descending
+// run. Unsorted or filtered rows (and rows sorted by an already sorted column)
+// become a few runs, instead of one number per row. The indices are returned as
+// they are when the runs wouldn't be shorter (e.g., rows sorted by an unsorted
+// column). Decoded by the `shiny.dataframe.indices` input handler on the server.
+export function encodeIndexRuns(
+  indices: readonly number[]
+): IndexRuns | readonly number[] {
+  const runs: number[] = [];
+  let i = 0;
+  while (i < indices.length) {
+    if (runs.length + 2 >= indices.length) {
+      return indices;
+    }
+    let j = i + 1;
+    const step = j < indices.length ? indices[j]! - indices[i]! : 0;
+    if (step === 1 || step === -1) {
+      while (j < indices.length && indices[j]! - indices[j - 1]! === step) {
+        j++;
+      }
+    }
+    runs.push(indices[i]!, step === -1 ? i - j : j - i);
+    i = j;
+  }
+  return runs.length < indices.length ? { runs } : indices;
+}
+
+// Decode runs created by `encodeIndexRuns()` (or by the server, e.g. for the rows
+// of style infos) back into row indices.
+export function decodeIndexRuns({ runs }: IndexRuns): number[] {
+  const indices: number[] = [];
+  for (let i = 0; i < runs.length; i += 2) {
+    const start = runs[i]!;
+    const length = runs[i + 1]!;
+    const step = length < 0 ? -1 : 1;
+    for (let j = 0; j < Math.abs(length); j++) {
+      indices.push(start + j * step);
+    }
+  }
+  return indices;
+}
@@ -36,6 +36,7 @@ import {
   type CellPatchPy,
 } from "./data-update";
 import { findFirstItemInView, getStyle } from "./dom-utils";
+import { encodeIndexRuns } from "./index-runs";
 import { ColumnFiltersState, Filter, FilterValue, useFilters } from "./filter";
 import type { CellSelection, SelectionModesProp } from "./selection";
 import { SelectionModes, initSelectionModes, useSelection } from "./selection";
@@ -701,7 +702,12 @@ const ShinyDataGrid: FC<ShinyDataGridProps<unknown>> = ({
     } else {
       console.error("Unhandled row selection mode:", selectionModes);
     }
-    Shiny.setInputValue!(`${id}_cell_selection`, shinyValue);
+    Shiny.setInputValue!(
+      `${id}_cell_selection:shiny.dataframe.cellSelection`,
+      shinyValue !== null && "rows" in shinyValue
+        ? { ...shinyValue, rows: encodeIndexRuns(shinyValue.rows) }
+        : shinyValue
+    );
   }, [id, selection, selectionModes, table, table.getSortedRowModel]);
 
   useEffect(() => {
@@ -744,10 +750,17 @@ const ShinyDataGrid: FC<ShinyDataGridProps<unknown>> = ({
       // Already prefiltered rows!
       .getSortedRowModel()
       .rows.map((row) => row.index);
-    Shiny.setInputValue!(`${id}_data_view_rows`, shinyRows);
+    const shinyRowRuns = encodeIndexRuns(shinyRows);
+    Shiny.setInputValue!(
+      `${id}_data_view_rows:shiny.dataframe.indices`,
+      shinyRowRuns
+    );
 
     // Legacy value as of 2024-05-13
-    Shiny.setInputValue!(`${id}_data_view_indices`, shinyRows);
+    Shiny.setInputValue!(
+      `${id}_data_view_indices:shiny.dataframe.indices`,
+      shinyRowRuns
+    );
   }, [
     id,
     table,
@@ -773,7 +786,10 @@ const ShinyDataGrid: FC<ShinyDataGridProps<unknown>> = ({
         .filter((x): x is number => x !== null)
         .sort();
     }
-    Shiny.setInputValue!(`${id}_selected_rows`, shinyValue);
+    Shiny.setInputValue!(
+      `${id}_selected_rows:shiny.dataframe.indices`,
+      shinyValue === null ? null : encodeIndexRuns(shinyValue)
+    );
   }, [id, selection, selectionModes, table]);
 
   // ### End row selection ############################################################
@@ -3,6 +3,7 @@
 import { enableMapSet } from "immer";
 import { useCallback, useEffect } from "react";
 import { Updater, useImmer } from "use-immer";
+import { IndexRuns, decodeIndexRuns } from "./index-runs";
 
 enableMapSet();
 
@@ -10,7 +11,8 @@ export type CellStyle = { [key: string]: string | null };
 
 type StyleInfoBody = {
   location: "body";
-  rows: number[] | null;
+  // Many rows may be sent as runs of consecutive rows
+  rows: number[] | IndexRuns | null;
   cols: number[] | null;
   style?: CellStyle;
   class?: string;
@@ -74,7 +76,12 @@ export const useStyleInfoMap = ({
       const { location, rows, cols } = styleInfo;
 
       setStyleInfoMap((draft) => {
-        const rowArr = rows ?? Array.from({ length: nrow }, (_, i) => i);
+        const rowArr =
+          rows === null || rows === undefined
+            ? Array.from({ length: nrow }, (_, i) => i)
+            : Array.isArray(rows)
+            ? rows
+            : decodeIndexRuns(rows);
         const colArr = cols ?? Array.from({ length: ncol }, (_, j) => j);
         for (const rowIndex of rowArr) {
           for (const columnIndex of colArr) {
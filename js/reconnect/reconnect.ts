@@ -0,0 +1,57 @@
+// When the app is created with `reconnect_timeout`, reconnect to the same session
+// after the websocket drops, rather than starting a new session.
+
+// The secret for reconnecting to the session, from the server
+let resumeToken: string | null = null;
+// The number of messages received in the session
+let received = 0;
+
+function createSocket(): WebSocket {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  let path = window.location.pathname;
+  if (!path.endsWith("/")) path += "/";
+  path += "websocket/";
+  if (resumeToken !== null) {
+    path += `?resume=${encodeURIComponent(resumeToken)}&received=${received}`;
+  }
+
+  const ws = new WebSocket(`${protocol}//${window.location.host}${path}`);
+  ws.binaryType = "arraybuffer";
+  // Let Shiny reconnect when the connection drops
+  (ws as WebSocket & { allowReconnect: boolean }).allowReconnect = true;
+
+  let first = true;
+  let ackTimeout: number | null = null;
+  ws.addEventListener("message", (e: MessageEvent) => {
+    // A new session starts with its config (and the server sends the missed
+    // messages instead when it continues a session)
+    if (first && typeof e.data === "string" && e.data.startsWith('{"config"')) {
+      resumeToken = null;
+      received = 0;
+    }
+    first = false;
+    received++;
+
+    // Acknowledge the received messages (at most once a second), so that the server
+    // doesn't need to keep them
+    if (ackTimeout === null) {
+      ackTimeout = window.setTimeout(() => {
+        ackTimeout = null;
+        if (ws.readyState === WebSocket.OPEN) {
+          ws.send(JSON.stringify({ ack: received }));
+        }
+      }, 1000);
+    }
+  });
+
+  return ws;
+}
+
+// Don't replace the websocket of an app that's hosted with its own (e.g., by a server
+// that has its own way of reconnecting)
+if (!Shiny.createSocket) {
+  Shiny.addCustomMessageHandler("shiny.resume", (token: string) => {
+    resumeToken = token;
+  });
+  Shiny.createSocket = createSocket;
+}
@@ -1,7 +1,10 @@
 """A package for building reactive web applications."""
 
+from typing import TYPE_CHECKING
+
 from ._version import __version__
 
+from ._lazy import lazy_getattr
 from ._shinyenv import is_pyodide as _is_pyodide
 
 # User-facing subpackages that should be available on `from shiny import *`
@@ -27,8 +30,12 @@ if _is_pyodide:
     # In pyodide, avoid importing _main because it imports packages that aren't
     # available.
     run_app = None
-else:
+elif TYPE_CHECKING:
     from ._main import run_app
+else:
+    # _main imports uvicorn and click, which apps don't need unless they're launched
+    # with `run_app()`, so only import it when it's used
+    __getattr__ = lazy_getattr(__name__, {"run_app": "._main"})
 
 
 # N.B.: we intentionally don't import 'developer-facing' submodules (e.g.,
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import functools
+import hashlib
+import math
 import os
 import secrets
+import signal
+import threading
+import time
 from contextlib import AsyncExitStack, asynccontextmanager
 from inspect import signature
 from pathlib import Path
-from typing import Any, Callable, Mapping, Optional, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Mapping,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 import starlette.applications
 import starlette.exceptions
@@ -21,18 +37,41 @@ from htmltools import (
     Tag,
     TagList,
 )
-from starlette.requests import Request
+from starlette.requests import HTTPConnection, Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from . import _compress
 from ._autoreload import InjectAutoreloadMiddleware, autoreload_url
-from ._connection import Connection, StarletteConnection
+from ._connection import Connection, ResumableConnection, StarletteConnection
+from ._datastructures import LRUCache
+from ._dependency_server import SHARED_DIR_ENV_VAR, DependencyServer
 from ._error import ErrorMiddleware
 from ._shinyenv import is_pyodide
 from ._utils import guess_mime_type, is_async_callable, sort_keys_length
+from ._workers import WORKERS_DIR_ENV_VAR, Workers
 from .html_dependencies import jquery_deps, require_deps, shiny_deps
 from .http_staticfiles import FileResponse, StaticFiles
+from .session._admission import (
+    RESERVATION_TIMEOUT,
+    TICKET_COOKIE,
+    Admission,
+    AdmissionControl,
+    PageAdmission,
+    admission_page,
+)
+from .session._memory import (
+    MemoryAccounting,
+    SessionMemoryUsage,
+    disable_node_tracking,
+    enable_node_tracking,
+    memory_usage_json,
+)
 from .session._session import AppSession, Inputs, Outputs, Session, session_context
+from .ui._html_deps_py_shiny import reconnect_dependency
+
+if TYPE_CHECKING:
+    from .store import Store
 
 T = TypeVar("T")
 
@@ -42,6 +81,11 @@ SANITIZE_ERRORS: bool = False
 SANITIZE_ERROR_MSG: str = (
     "An error has occurred. Check your logs or contact the app author for clarification."
 )
+# Cache-Control header for files that never change at a given URL.
+IMMUTABLE_CACHE_CONTROL: str = "public, max-age=31536000, immutable"
+
+# How often (in seconds) a drained app checks for sessions to close
+DRAIN_CHECK_INTERVAL: float = 0.25
 
 
 class App:
@@ -66,6 +110,66 @@ class App:
         that mount point.
     debug
         Whether to enable debug mode.
+    ui_cache_key
+        When `ui` is a function, a function that takes the
+        :class:`~starlette.requests.Request` and returns a hashable key identifying the
+        variant of the page to serve (e.g., based on the locale, query parameters, or
+        user group). Pages rendered for the same key are cached and reused, instead of
+        calling `ui` for every pageview. Only use this if the rendered page depends
+        solely on the information used in the key. If `None` (the default), `ui` is
+        called for every pageview.
+    ui_cache_size
+        The maximum number of rendered pages to keep in the cache when `ui_cache_key` is
+        provided. The least recently used page is evicted when the cache is full.
+    ui_cache_ttl
+        The number of seconds that a cached page can be reused before it is rendered
+        again. If `None` (the default), cached pages are only evicted when the cache is
+        full.
+    memory_accounting
+        A :class:`~shiny.session.MemoryAccounting` object, to estimate (and optionally
+        limit) the memory retained by each session. See :meth:`memory_usage`. If `None`
+        (the default), memory isn't accounted for.
+    reconnect_timeout
+        If not `None`, the number of seconds that a session is kept after its client
+        loses its connection, for the client to reconnect to it. Messages to the client
+        are kept while it's away, and its inputs, outputs and reactive state are still
+        there when it reconnects, rather than a new session being started (and
+        recomputing everything). If `None` (the default), a session ends when its
+        connection is lost.
+    store
+        A :class:`~shiny.store.Store` for app-scoped data, like caches, which is
+        available as :attr:`store`. If `None` (the default), a
+        :class:`~shiny.store.MemoryStore` is used, or a
+        :class:`~shiny.store.SQLiteStore` that's shared by the worker processes when
+        the app is run with several workers (e.g., with `shiny run --workers 4`).
+    health_endpoint
+        A path (e.g., `"/admin/health"`) at which the app serves its status, for load
+        balancers and process managers. A `GET` request for the path always succeeds,
+        and one for `{health_endpoint}/ready` fails (with status 503) once the app is
+        being drained (see :meth:`drain`). A `POST` request for
+        `{health_endpoint}/drain` starts draining the app. Each responds with JSON with
+        the app's `status` (`"ok"`, `"draining"` or `"drained"`) and its number of
+        `sessions`. The endpoint isn't protected, so it should only be used when access
+        to the path is restricted (e.g., by a reverse proxy).
+    drain_timeout
+        The number of seconds that draining the app (see :meth:`drain`) waits for its
+        sessions to end, before closing the remaining ones. If `None` (the default), it
+        waits until they've all ended.
+    drain_idle_timeout
+        When the app is being drained, a session that hasn't received a message from
+        its browser for this many seconds is closed. If `None` (the default), sessions
+        are only closed after `drain_timeout`.
+    drain_on_sigusr1
+        If `True`, sending the process `SIGUSR1` (on Unix) drains the app (see
+        :meth:`drain`) and then stops the process with `SIGTERM`. This is always done
+        when the app is run with several workers (e.g., with `shiny run --workers 4`).
+        If `False` (the default), the app doesn't handle the signal, so embedding the
+        app in another ASGI server doesn't change how the process handles signals.
+    admission_control
+        A :class:`~shiny.session.AdmissionControl` object, to limit the number of
+        sessions, and the rate at which clients start them, and queue the browsers that
+        arrive when the app is full. If `None` (the default), every browser that
+        connects gets a session.
 
     Examples
     --------
@@ -115,6 +219,17 @@ class App:
         *,
         static_assets: Optional[str | Path | Mapping[str, str | Path]] = None,
         debug: bool = False,
+        ui_cache_key: Optional[Callable[[Request], Hashable]] = None,
+        ui_cache_size: int = 32,
+        ui_cache_ttl: Optional[float] = None,
+        memory_accounting: Optional[MemoryAccounting] = None,
+        reconnect_timeout: Optional[float] = None,
+        store: Optional[Store] = None,
+        health_endpoint: Optional[str] = None,
+        drain_timeout: Optional[float] = None,
+        drain_idle_timeout: Optional[float] = None,
+        drain_on_sigusr1: bool = False,
+        admission_control: Optional[AdmissionControl] = None,
     ) -> None:
         # Used to store callbacks to be called when the app is shutting down (according
         # to the ASGI lifespan protocol)
@@ -167,10 +282,42 @@ class App:
 
         self._sessions: dict[str, AppSession] = {}
 
+        self._memory_accounting: Optional[MemoryAccounting] = memory_accounting
+        if memory_accounting is not None:
+            enable_node_tracking()
+            self.on_shutdown(disable_node_tracking)
+
+        self._reconnect_timeout: Optional[float] = reconnect_timeout
+
+        # The worker processes that serve the app, if there's more than one
+        self._workers: Optional[Workers] = None
+        workers_dir = os.getenv(WORKERS_DIR_ENV_VAR)
+        if workers_dir:
+            self._workers = Workers(workers_dir)
+
+        self._store: Optional[Store] = store
+
+        self._health_endpoint: Optional[str] = health_endpoint
+        self._drain_timeout: Optional[float] = drain_timeout
+        self._drain_idle_timeout: Optional[float] = drain_idle_timeout
+        self._drain_on_sigusr1: bool = drain_on_sigusr1
+        # Started when the app is drained
+        self._drain_task: Optional[asyncio.Task[None]] = None
+
+        self._admission: Optional[Admission] = None
+        if admission_control is not None:
+            self._admission = Admission(admission_control)
+
         self._sessions_needing_flush: dict[int, AppSession] = {}
 
         self._registered_dependencies: dict[str, HTMLDependency] = {}
         self._dependency_handler = starlette.routing.Router()
+        # HTML dependencies are served by a single route (rather than a Mount per
+        # dependency), which dispatches with a dict lookup.
+        self._dependency_server = DependencyServer(
+            shared_dir=os.getenv(SHARED_DIR_ENV_VAR)
+        )
+        self._dependency_handler.routes.append(self._dependency_server)
 
         for mount_point, static_asset_path in self._static_assets.items():
             self._dependency_handler.routes.append(
@@ -181,6 +328,17 @@ class App:
 
         self.starlette_app = starlette_app
 
+        # Rendered pages (and their ETags) for callable UI, keyed by `ui_cache_key`
+        self._ui_cache_key = ui_cache_key
+        self._ui_cache: LRUCache[Hashable, _RenderedPage] = LRUCache(
+            ui_cache_size, ttl=ui_cache_ttl
+        )
+        # The ETag of the static UI, computed on the first request
+        self._static_page: Optional[_RenderedPage] = None
+
+        if ui_cache_key is not None and not is_uifunc(ui):
+            raise ValueError("`ui_cache_key` can only be used when `ui` is a function.")
+
         if is_uifunc(ui):
             if is_async_callable(cast(Callable[[Request], Any], ui)):
                 raise TypeError("App UI cannot be a coroutine function")
@@ -209,6 +367,28 @@ class App:
             ),
             starlette.routing.Mount("/", app=self._dependency_handler),
         ]
+        if self._memory_accounting and self._memory_accounting.endpoint:
+            routes.insert(
+                0,
+                starlette.routing.Route(
+                    self._memory_accounting.endpoint,
+                    self._on_memory_request_cb,
+                    methods=["GET"],
+                ),
+            )
+        if self._health_endpoint:
+            endpoint = self._health_endpoint.rstrip("/")
+            routes[0:0] = [
+                starlette.routing.Route(
+                    endpoint, self._on_health_request_cb, methods=["GET"]
+                ),
+                starlette.routing.Route(
+                    f"{endpoint}/ready", self._on_ready_request_cb, methods=["GET"]
+                ),
+                starlette.routing.Route(
+                    f"{endpoint}/drain", self._on_drain_request_cb, methods=["POST"]
+                ),
+            ]
         middleware: list[starlette.middleware.Middleware] = []
         if autoreload_url():
             shared_dir = os.path.join(os.path.dirname(__file__), "www", "shared")
@@ -241,14 +421,63 @@ class App:
     @asynccontextmanager
     async def _lifespan(self, app: starlette.applications.Starlette):
         async with self._exit_stack:
+            if self._workers is not None:
+                await self._workers.start(self)
+                self._exit_stack.push_async_callback(self._workers.stop)
+            if self._drain_on_sigusr1 or self._workers is not None:
+                self._add_drain_signal_handler()
             yield
 
+    def _add_drain_signal_handler(self) -> None:
+        # On Unix, SIGUSR1 drains the app and then stops the process (unless the
+        # process handles the signal itself)
+        sig = getattr(signal, "SIGUSR1", None)
+        if (
+            sig is None
+            or threading.current_thread() is not threading.main_thread()
+            or signal.getsignal(sig) is not signal.SIG_DFL
+        ):
+            return
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(sig, self._drain_and_exit)
+        self._exit_stack.callback(loop.remove_signal_handler, sig)
+
+    def _drain_and_exit(self) -> None:
+        self._start_drain().add_done_callback(
+            lambda _: signal.raise_signal(signal.SIGTERM)
+        )
+
+    @property
+    def store(self) -> Store:
+        """
+        The app's :class:`~shiny.store.Store`, for app-scoped data like caches.
+        """
+        if self._store is None:
+            from .store import MemoryStore, SQLiteStore
+
+            if self._workers is not None:
+                self._store = SQLiteStore(
+                    os.path.join(self._workers.directory, "store.sqlite3")
+                )
+            else:
+                self._store = MemoryStore()
+        return self._store
+
     def _create_session(self, conn: Connection) -> AppSession:
-        id = secrets.token_hex(32)
+        if self._reconnect_timeout is not None:
+            conn = ResumableConnection(
+                conn, self._reconnect_timeout, token=self._new_id()
+            )
+        id = self._new_id()
         session = AppSession(self, id, conn, debug=self._debug)
         self._sessions[id] = session
         return session
 
+    def _new_id(self) -> str:
+        if self._workers is not None:
+            return self._workers.new_id()
+        return secrets.token_hex(32)
+
     def _remove_session(self, session: AppSession | str) -> None:
         if isinstance(session, AppSession):
             session = session.id
@@ -344,6 +573,108 @@ class App:
         for session in list(self._sessions.values()):
             await session.close()
 
+    @property
+    def draining(self) -> bool:
+        """
+        Whether the app is being (or has been) drained. See :meth:`drain`.
+        """
+        return self._drain_task is not None
+
+    async def drain(self) -> None:
+        """
+        Stop starting new sessions, and wait for the existing sessions to end.
+
+        This lets the process that serves the app be stopped (or replaced) without
+        interrupting its users. While the app is drained, browsers that connect to it
+        are sent to another worker process of the app that isn't drained, if there's
+        one (e.g., with `shiny run --workers 4`), and are otherwise disconnected (so a
+        load balancer should stop sending them, which it can tell from the app's
+        `health_endpoint`). Existing sessions continue until they end, or they're
+        closed when they've been idle for `drain_idle_timeout` seconds, or when
+        `drain_timeout` seconds have passed.
+
+        With several worker processes, a drained worker also stops accepting
+        connections (so they go to the other workers), and waits for the requests that
+        it forwards to other workers (like the websockets of their sessions) to end.
+
+        Draining can also be started by a `POST` request for
+        `{health_endpoint}/drain`, or by sending the process `SIGUSR1` (on Unix) when
+        the app is run with several workers or `drain_on_sigusr1=True`, after which the
+        process is stopped once the app is drained. `shiny run --workers 4 --preload`
+        does this to replace its workers when it's sent `SIGHUP` (the new workers are
+        forked from the process that loaded the app, so they run the same code; restart
+        that process to run changed code).
+
+        See Also
+        --------
+        * :class:`~shiny.App` (`health_endpoint`, `drain_timeout`,
+          `drain_idle_timeout` and `drain_on_sigusr1`)
+        """
+        await asyncio.shield(self._start_drain())
+
+    def _start_drain(self) -> asyncio.Task[None]:
+        if self._drain_task is None:
+            if self._workers is not None:
+                from ._prefork import stop_accepting
+
+                self._workers.set_draining()
+                # Connections that this worker would forward to the others (and that
+                # would keep it running) go straight to them instead
+                stop_accepting()
+            self._drain_task = asyncio.create_task(self._drain())
+        return self._drain_task
+
+    async def _drain(self) -> None:
+        start = time.monotonic()
+        while self._sessions or self._forwarding():
+            now = time.monotonic()
+            timed_out = (
+                self._drain_timeout is not None and now - start >= self._drain_timeout
+            )
+            for session in list(self._sessions.values()):
+                if timed_out or (
+                    self._drain_idle_timeout is not None
+                    and now - session._last_received >= self._drain_idle_timeout
+                ):
+                    await session.close()
+            if timed_out and not self._sessions:
+                # Requests that are still being forwarded to other workers (e.g., the
+                # websockets of their sessions) aren't waited for any longer
+                return
+            await asyncio.sleep(DRAIN_CHECK_INTERVAL)
+
+    def _forwarding(self) -> bool:
+        return self._workers is not None and self._workers.forwarding > 0
+
+    def memory_usage(self) -> list[SessionMemoryUsage]:
+        """
+        Estimate the memory retained by each session.
+
+        This requires the app to be created with `memory_accounting`.
+
+        Returns
+        -------
+        :
+            For each session, a dictionary with the session's `id`, the estimated total
+            number of `bytes` it retains, and the estimated bytes of its reactive
+            `nodes` (inputs, outputs, reactive calculations, other reactive values and
+            uploaded files), largest first.
+
+        See Also
+        --------
+        * :class:`~shiny.session.MemoryAccounting`
+        """
+        if self._memory_accounting is None:
+            raise RuntimeError(
+                "Memory usage is only available when the app is created with "
+                "`memory_accounting`."
+            )
+        return [
+            session._memory.usage()
+            for session in list(self._sessions.values())
+            if session._memory is not None
+        ]
+
     # ==========================================================================
     # Connection callbacks
     # ==========================================================================
@@ -352,23 +683,190 @@ class App:
         Callback passed to the ConnectionManager which is invoked when a HTTP
         request for / occurs.
         """
-        ui: RenderedHTML
-        if callable(self.ui):
-            ui = self._render_page(self.ui(request), self.lib_prefix)
-        else:
-            ui = self.ui
-        return HTMLResponse(content=ui["html"])
+        admission: Optional[PageAdmission] = None
+        if self._admission is not None:
+            admission = self._admission.admit_page(
+                client_host(request),
+                len(self._sessions),
+                request.cookies.get(TICKET_COOKIE),
+            )
+            if admission.status != "ok":
+                return admission_response(admission)
+
+        response = self._page_response(request)
+        if admission is not None and admission.ticket is not None:
+            # The session held for the browser is taken with this ticket
+            set_ticket_cookie(response, admission.ticket, RESERVATION_TIMEOUT)
+        return response
+
+    def _page_response(self, request: Request) -> Response:
+        page = self._get_page(request)
+
+        # Compress the page if the client allows it. (The autoreload middleware needs
+        # to modify the uncompressed page, so don't compress when it's in use.)
+        encoding: Optional[_compress.ContentEncoding] = None
+        if not autoreload_url() and len(page.html) >= _compress.MIN_COMPRESS_SIZE:
+            encoding = _compress.accepted_encoding(request.headers)
+
+        etag = _compress.encoding_etag(page.etag, encoding)
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return HTMLResponse(content=page.html, headers=headers)
+
+        headers["Content-Encoding"] = encoding
+        return HTMLResponse(content=page.encoded(encoding), headers=headers)
+
+    def _get_page(self, request: Request) -> _RenderedPage:
+        if not callable(self.ui):
+            # Static UI; only hash it again if it has been replaced
+            html = self.ui["html"]
+            if self._static_page is None or self._static_page.html is not html:
+                self._static_page = _RenderedPage(html)
+            return self._static_page
+
+        if self._ui_cache_key is None:
+            return _RenderedPage(
+                self._render_page(self.ui(request), self.lib_prefix)["html"]
+            )
+
+        key = self._ui_cache_key(request)
+        page = self._ui_cache.get(key)
+        if page is None:
+            page = _RenderedPage(
+                self._render_page(self.ui(request), self.lib_prefix)["html"]
+            )
+            self._ui_cache.set(key, page)
+        return page
 
     async def _on_connect_cb(self, ws: starlette.websockets.WebSocket) -> None:
         """
         Callback which is invoked when a new WebSocket connection is established.
         """
+        token = ws.query_params.get("resume")
+        if token is not None and self._workers is not None:
+            # The session may be on another worker
+            worker_id = self._workers.owner(token)
+            if worker_id is not None and await self._workers.forward(
+                worker_id, ws.scope, ws.receive, ws.send
+            ):
+                return
+
+        if self.draining and (token is None or self._resumable_session(token) is None):
+            await self._refuse_session(ws)
+            return
+
         await ws.accept()
         conn = StarletteConnection(ws)
+
+        if token is not None and self._reconnect_timeout is not None:
+            received = ws.query_params.get("received", "")
+            if await self._resume_session(token, conn, received):
+                return
+
+        if self.draining:
+            await ws.close(code=1013)
+            return
+
+        if self._admission is not None and not self._admission.admit_session(
+            client_host(ws), len(self._sessions), ws.cookies.get(TICKET_COOKIE)
+        ):
+            # "Try Again Later"
+            await ws.close(code=1013)
+            return
+
         session = self._create_session(conn)
 
         await session._run()
 
+    async def _resume_session(
+        self, token: str, conn: Connection, received: str
+    ) -> bool:
+        """
+        Continue a session with a new connection from its client, after its previous
+        connection was lost. Returns `False` if there's no such session, or the client
+        can't continue it.
+        """
+        session = self._resumable_session(token)
+        if session is None:
+            return False
+        old_conn = cast(ResumableConnection, session._conn)
+        if received.isdigit() and await old_conn.resume(conn, int(received)):
+            return True
+        # The client missed messages that are no longer kept, so it must start over
+        # with a new session
+        await session.close()
+        return False
+
+    def _resumable_session(self, token: str) -> Optional[AppSession]:
+        for session in self._sessions.values():
+            conn = session._conn
+            if isinstance(conn, ResumableConnection) and secrets.compare_digest(
+                conn.token.encode(), token.encode()
+            ):
+                return session
+        return None
+
+    async def _refuse_session(self, ws: starlette.websockets.WebSocket) -> None:
+        """
+        Send a browser that connects while the app is drained to another worker, or
+        else disconnect it.
+        """
+        if self._workers is not None:
+            worker_id = self._workers.available()
+            if worker_id is not None and await self._workers.forward(
+                worker_id, ws.scope, ws.receive, ws.send
+            ):
+                return
+        await ws.accept()
+        # "Try Again Later"
+        await ws.close(code=1013)
+
+    async def _on_memory_request_cb(self, request: Request) -> Response:
+        """
+        Callback which is invoked when a HTTP request for the memory accounting
+        endpoint occurs.
+        """
+        # The sessions are measured in a thread, so as not to hold them up
+        usage = await asyncio.to_thread(memory_usage_json, self)
+        return JSONResponse(usage, headers={"Cache-Control": "no-store"})
+
+    def _health(self) -> dict[str, object]:
+        if self._drain_task is None:
+            status = "ok"
+        elif self._drain_task.done():
+            status = "drained"
+        else:
+            status = "draining"
+        return {"status": status, "sessions": len(self._sessions)}
+
+    async def _on_health_request_cb(self, request: Request) -> Response:
+        """
+        Callback which is invoked when a HTTP request for the health endpoint occurs.
+        """
+        return JSONResponse(self._health(), headers={"Cache-Control": "no-store"})
+
+    async def _on_ready_request_cb(self, request: Request) -> Response:
+        """
+        Callback which is invoked when a HTTP request for the readiness endpoint
+        occurs.
+        """
+        return JSONResponse(
+            self._health(),
+            status_code=503 if self.draining else 200,
+            headers={"Cache-Control": "no-store"},
+        )
+
+    async def _on_drain_request_cb(self, request: Request) -> Response:
+        """
+        Callback which is invoked when a HTTP request for the drain endpoint occurs.
+        """
+        self._start_drain()
+        return JSONResponse(
+            self._health(), status_code=202, headers={"Cache-Control": "no-store"}
+        )
+
     async def _on_session_request_cb(self, request: Request) -> ASGIApp:
         """
         Callback passed to the ConnectionManager which is invoked when a HTTP
@@ -383,8 +881,22 @@ class App:
             with session_context(session):
                 return await session._handle_request(request, action, subpath)
 
+        if self._workers is not None:
+            # The session may be on another worker
+            worker_id = self._workers.owner(session_id)
+            if worker_id is not None:
+                return functools.partial(self._forward_request, worker_id)
+
         return JSONResponse({"detail": "Not Found"}, status_code=404)
 
+    async def _forward_request(
+        self, worker_id: str, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        assert self._workers is not None
+        if not await self._workers.forward(worker_id, scope, receive, send):
+            response = JSONResponse({"detail": "Not Found"}, status_code=404)
+            await response(scope, receive, send)
+
     # ==========================================================================
     # Flush
     # ==========================================================================
@@ -423,17 +935,28 @@ class App:
         if dep.source:
             paths = dep.source_path_map(lib_prefix=self.lib_prefix)
             if paths["source"] != "":
-                self._dependency_handler.routes.insert(
-                    0,
-                    starlette.routing.Mount(
-                        "/" + paths["href"],
-                        StaticFiles(directory=paths["source"]),
-                        name=dep_name,
-                    ),
+                self._dependency_server.add(
+                    paths["href"],
+                    paths["source"],
+                    name=dep_name,
+                    cache_control=self._dependency_cache_control(dep),
                 )
 
         self._registered_dependencies[dep_name] = dep
 
+    def _dependency_cache_control(self, dep: HTMLDependency) -> Optional[str]:
+        # The files of a dependency that's installed as part of a Python package with a
+        # release version (which is part of the dependency's URL) can't change without
+        # the URL changing too, so browsers can cache them without revalidating.
+        # During development (where files are edited in place), always revalidate.
+        if self._debug or autoreload_url():
+            return None
+        if dep.source is None or dep.source.get("package") is None:
+            return None
+        if dep.version.is_prerelease or dep.version.local is not None:
+            return None
+        return IMMUTABLE_CACHE_CONTROL
+
     def _render_page(self, ui: Tag | TagList, lib_prefix: str) -> RenderedHTML:
         ui_res = copy.copy(ui)
         # Use presence of the Bootstrap dependency as a signal that the UI uses a
@@ -443,10 +966,7 @@ class App:
         )
         # Make sure requirejs, jQuery, and Shiny come before any other dependencies.
         # (see require_deps() for a comment about why we even include it)
-        ui_res.insert(
-            0,
-            [require_deps(), jquery_deps(), *shiny_deps(include_css=not has_bootstrap)],
-        )
+        ui_res.insert(0, self._page_deps(include_css=not has_bootstrap))
         rendered = HTMLDocument(ui_res).render(lib_prefix=lib_prefix)
         self._ensure_web_dependencies(rendered["dependencies"])
         return rendered
@@ -457,7 +977,7 @@ class App:
 
         doc = HTMLTextDocument(
             page_html,
-            deps=[require_deps(), jquery_deps(), *shiny_deps(include_css=True)],
+            deps=self._page_deps(include_css=True),
             deps_replace_pattern='<meta name="shiny-dependency-placeholder" content="">',
         )
 
@@ -466,6 +986,75 @@ class App:
 
         return rendered
 
+    def _page_deps(self, include_css: bool) -> list[HTMLDependency]:
+        deps = [require_deps(), jquery_deps(), *shiny_deps(include_css=include_css)]
+        if self._reconnect_timeout is not None:
+            deps.append(reconnect_dependency())
+        return deps
+
+
+class _RenderedPage:
+    """The HTML of a rendered page, along with its ETag and compressed versions."""
+
+    __slots__ = ("html", "etag", "_encoded")
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+        self.etag = '"' + hashlib.sha256(html.encode("utf-8")).hexdigest()[:32] + '"'
+        self._encoded: dict[str, bytes] = {}
+
+    def encoded(self, encoding: _compress.ContentEncoding) -> bytes:
+        if encoding not in self._encoded:
+            self._encoded[encoding] = _compress.compress(
+                self.html.encode("utf-8"), encoding
+            )
+        return self._encoded[encoding]
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's `If-None-Match` header matches `etag`."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+def client_host(conn: HTTPConnection) -> str:
+    """The IP address of the client of a request or websocket."""
+    return conn.client.host if conn.client else ""
+
+
+def admission_response(admission: PageAdmission) -> Response:
+    """The page for a browser that wasn't let into the app."""
+    headers = {
+        "Cache-Control": "no-store",
+        "Retry-After": str(math.ceil(admission.retry_after)),
+    }
+    if admission.status == "wait":
+        response = HTMLResponse(admission_page(admission), headers=headers)
+        assert admission.ticket is not None
+        # The ticket is kept while the page is reloaded, and expires when it isn't
+        set_ticket_cookie(response, admission.ticket, 3 * admission.retry_after)
+        return response
+    status_code = 503 if admission.status == "busy" else 429
+    return HTMLResponse(
+        admission_page(admission), status_code=status_code, headers=headers
+    )
+
+
+def set_ticket_cookie(response: Response, ticket: str, max_age: float) -> None:
+    response.set_cookie(
+        TICKET_COOKIE,
+        ticket,
+        max_age=math.ceil(max_age),
+        httponly=True,
+        samesite="lax",
+    )
+
 
 def is_uifunc(x: Path | Tag | TagList | Callable[[Request], Tag | TagList]) -> bool:
     if (
@@ -499,7 +1088,7 @@ def create_static_asset_route(
     if static_asset_path.is_dir():
         return starlette.routing.Mount(
             mount_point,
-            StaticFiles(directory=static_asset_path),
+            StaticFiles(directory=static_asset_path, compress=True),
             name="shiny-app-static-assets-" + mount_point,
         )
     else:
@@ -0,0 +1,104 @@
+"""
+Helpers for compressing HTTP responses with gzip, or with brotli when the optional
+`brotli` package is installed.
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import Literal, Optional
+
+from starlette.datastructures import Headers
+
+try:
+    import brotli  # pyright: ignore[reportMissingImports]
+except ImportError:
+    brotli = None
+
+__all__ = (
+    "ContentEncoding",
+    "MIN_COMPRESS_SIZE",
+    "accepted_encoding",
+    "compress",
+    "encoding_etag",
+    "is_compressible",
+)
+
+ContentEncoding = Literal["br", "gzip"]
+
+# Responses smaller than this aren't worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+_compressible_types = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "font/otf",
+    "font/ttf",
+    "image/svg+xml",
+    "image/x-icon",
+}
+
+
+def accepted_encoding(headers: Headers) -> Optional[ContentEncoding]:
+    """
+    Choose the best content encoding allowed by the request's `Accept-Encoding` header,
+    or `None` if the response should not be compressed.
+    """
+    accept_encoding = headers.get("accept-encoding")
+    if not accept_encoding:
+        return None
+
+    accepted: set[str] = set()
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        if any(not _accepts(param) for param in params):
+            continue
+        accepted.add(coding.strip().lower())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def _accepts(param: str) -> bool:
+    # Whether a parameter of a coding in `Accept-Encoding` doesn't rule it out. A
+    # q-value that isn't a number (e.g. `q=abc`) is treated as 0.
+    name, _, value = param.partition("=")
+    if name.strip().lower() != "q":
+        return True
+    try:
+        return float(value.strip()) > 0
+    except ValueError:
+        return False
+
+
+def compress(data: bytes, encoding: ContentEncoding) -> bytes:
+    if encoding == "br":
+        assert brotli is not None
+        return brotli.compress(data)  # pyright: ignore
+    # `mtime=0` makes the output deterministic
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def is_compressible(media_type: str) -> bool:
+    """Whether content of `media_type` (e.g., `text/css; charset=utf-8`) compresses
+    well."""
+    media_type = media_type.partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in _compressible_types
+
+
+def encoding_etag(etag: str, encoding: Optional[ContentEncoding]) -> str:
+    """
+    The ETag for the `encoding` representation of a resource with the given
+    (uncompressed) `etag`. Each encoding must have a distinct ETag.
+    """
+    if encoding is None:
+        return etag
+    if etag.endswith('"'):
+        return etag[:-1] + "-" + encoding + '"'
+    return etag + "-" + encoding
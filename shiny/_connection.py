@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import json
+import secrets
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Optional
 
 import starlette.websockets
@@ -135,6 +139,164 @@ class StarletteConnection(Connection):
         return self.conn
 
 
+# The maximum size of the messages that a `ResumableConnection` keeps to send again
+MAX_REPLAY_BYTES: int = 16 * 1024 * 1024
+
+
+class ResumableConnection(Connection):
+    """
+    A connection that the client can reconnect to, after its websocket drops.
+
+    While the client is away, :meth:`receive` waits (for up to `timeout` seconds) for
+    it to reconnect with :meth:`resume`, and the messages to the client are kept. The
+    client acknowledges the messages it has received, and when it reconnects, it tells
+    how many it has received, so that the ones it missed are sent again.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        timeout: float,
+        *,
+        token: Optional[str] = None,
+        max_replay_bytes: int = MAX_REPLAY_BYTES,
+    ):
+        # The secret that the client uses to reconnect
+        self.token: str = token if token is not None else secrets.token_hex(32)
+        self._timeout = timeout
+        self._max_replay_bytes = max_replay_bytes
+        self._http_conn = conn.get_http_conn()
+
+        # The current connection (`None` while the client is away), and the task that
+        # reads its messages into `_messages`
+        self._conn: Optional[Connection] = conn
+        self._reader: Optional[asyncio.Task[None]] = None
+        self._messages: asyncio.Queue[tuple[Optional[Connection], Optional[str]]] = (
+            asyncio.Queue()
+        )
+        self._deadline: float = 0
+        self._closed = False
+
+        # The number of messages sent, and the last ones that the client hasn't
+        # acknowledged
+        self._sent: int = 0
+        self._replay: deque[str] = deque()
+        self._replay_bytes: int = 0
+        self._send_lock = asyncio.Lock()
+
+    async def send(self, message: str) -> None:
+        async with self._send_lock:
+            if self._closed:
+                return
+            self._sent += 1
+            self._replay.append(message)
+            self._replay_bytes += len(message)
+            while self._replay_bytes > self._max_replay_bytes:
+                self._replay_bytes -= len(self._replay.popleft())
+            if self._conn is not None:
+                await self._conn.send(message)
+
+    async def receive(self) -> str:
+        if self._reader is None and self._conn is not None:
+            self._reader = self._read(self._conn)
+
+        while True:
+            if self._closed:
+                raise ConnectionClosed()
+
+            if self._conn is None:
+                timeout = self._deadline - asyncio.get_running_loop().time()
+                try:
+                    conn, message = await asyncio.wait_for(
+                        self._messages.get(), max(timeout, 0)
+                    )
+                except asyncio.TimeoutError:
+                    # The client didn't come back in time
+                    self._closed = True
+                    raise ConnectionClosed()
+            else:
+                conn, message = await self._messages.get()
+
+            if self._closed:
+                raise ConnectionClosed()
+            if conn is not self._conn:
+                # A message from a connection that has been replaced
+                continue
+            if message is None:
+                # The client went away; wait for it to reconnect
+                self._conn = None
+                self._reader = None
+                self._deadline = asyncio.get_running_loop().time() + self._timeout
+                continue
+            return message
+
+    async def resume(self, conn: Connection, received: int) -> bool:
+        """
+        Continue with a new connection from the client, after it has received
+        `received` messages.
+
+        Returns `False` if the client can't continue (because some of the messages that
+        it hasn't received are no longer kept). Otherwise, returns when the new
+        connection is closed, or replaced by another one.
+        """
+        async with self._send_lock:
+            first = self._sent - len(self._replay)
+            if self._closed or not first <= received <= self._sent:
+                return False
+            missed = list(itertools.islice(self._replay, received - first, None))
+            for message in missed:
+                await conn.send(message)
+            old_conn, old_reader = self._conn, self._reader
+            self._conn = conn
+            self._reader = reader = self._read(conn)
+
+        # The client may reconnect before the old connection is known to be closed
+        if old_reader is not None:
+            old_reader.cancel()
+        if old_conn is not None:
+            await old_conn.close(1001, None)
+
+        await asyncio.wait([reader])
+        return True
+
+    async def close(self, code: int, reason: Optional[str]) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Wake up `receive()`
+        self._messages.put_nowait((None, None))
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._conn is not None:
+            await self._conn.close(code, reason)
+
+    def get_http_conn(self) -> HTTPConnection:
+        return self._http_conn
+
+    def _read(self, conn: Connection) -> asyncio.Task[None]:
+        async def read() -> None:
+            try:
+                while True:
+                    message = await conn.receive()
+                    # The client's acknowledgement of the messages it has received
+                    if message.startswith('{"ack":'):
+                        self._ack(json.loads(message)["ack"])
+                    else:
+                        self._messages.put_nowait((conn, message))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # `ConnectionClosed`, or the connection failed
+                self._messages.put_nowait((conn, None))
+
+        return asyncio.create_task(read())
+
+    def _ack(self, received: int) -> None:
+        first = self._sent - len(self._replay)
+        for _ in range(min(received - first, len(self._replay))):
+            self._replay_bytes -= len(self._replay.popleft())
+
+
 class ConnectionClosed(Exception):
     """Raised when a Connection is closed from the other side."""
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from queue import PriorityQueue
-from typing import Generic, TypeVar
+import heapq
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Generator, Generic, Optional, TypeVar, cast
 
 T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 class PriorityQueueFIFO(Generic[T]):
@@ -12,13 +17,18 @@ class PriorityQueueFIFO(Generic[T]):
     priority, they are returned in the order they were inserted. Also, the item
     is kept separate from the priority value (with PriorityQueue, the priority
     is part of the item).
+
+    Unlike queue.PriorityQueue, this queue is not thread-safe, and `get()` raises an
+    `IndexError` instead of blocking when the queue is empty. Items are kept in a
+    first-in-first-out bucket per priority, so putting and getting items of a priority
+    that's already in the queue (typically, all items have the same priority) doesn't
+    touch the heap of priorities.
     """
 
     def __init__(self) -> None:
-        # Using Tuple instead of tuple because in Python 3.8 and earlier, tuple isn't
-        # generic
-        self._pq: PriorityQueue[tuple[int, int, T]] = PriorityQueue()
-        self._counter: int = 0
+        self._buckets: dict[int, deque[T]] = {}
+        # A heap of the negated priorities that have a bucket
+        self._priorities: list[int] = []
 
     def put(self, priority: int, item: T) -> None:
         """
@@ -33,12 +43,100 @@ class PriorityQueueFIFO(Generic[T]):
         item
             The item to put in the queue.
         """
-        self._counter += 1
-        self._pq.put((-priority, self._counter, item))
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = deque()
+            heapq.heappush(self._priorities, -priority)
+        bucket.append(item)
 
     def get(self) -> T:
-        iteminfo: tuple[int, int, T] = self._pq.get()
-        return iteminfo[2]
+        priority = -self._priorities[0]
+        bucket = self._buckets[priority]
+        item = bucket.popleft()
+        if not bucket:
+            del self._buckets[priority]
+            heapq.heappop(self._priorities)
+        return item
+
+    def drain(self) -> Generator[T, None, None]:
+        """
+        Remove and yield items until the queue is empty.
+
+        Items that are put in the queue while draining are yielded too, in priority
+        order.
+        """
+        buckets = self._buckets
+        priorities = self._priorities
+        while priorities:
+            priority = -priorities[0]
+            bucket = buckets[priority]
+            item = bucket.popleft()
+            if not bucket:
+                del buckets[priority]
+                heapq.heappop(priorities)
+            yield item
 
     def empty(self) -> bool:
-        return self._pq.empty()
+        return not self._buckets
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A dictionary-like cache that holds at most `max_size` items, evicting the least
+    recently used item when full. If `ttl` is not `None`, items also expire `ttl`
+    seconds after they were set.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("`max_size` must be at least 1.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("`ttl` must be a positive number of seconds (or `None`).")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._timer = timer
+        # Maps key to (expiration time, value)
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Get the value for `key` (marking it as recently used), or `default` if it's not
+        in the cache or has expired.
+        """
+        item = self._items.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if self._timer() >= expires:
+            del self._items[key]
+            return default
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Set the value for `key`, evicting the least recently used item if the cache is
+        full.
+        """
+        expires = math.inf if self._ttl is None else self._timer() + self._ttl
+        self._items[key] = (expires, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __contains__(self, key: object) -> bool:
+        item = self._items.get(cast(K, key))
+        return item is not None and self._timer() < item[0]
+
+    def __len__(self) -> int:
+        return len(self._items)
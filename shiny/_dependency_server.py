@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+import starlette.routing
+from starlette.datastructures import URLPath
+from starlette.routing import Match
+from starlette.types import Receive, Scope, Send
+
+from .http_staticfiles import StaticFiles
+
+__all__ = ("DependencyServer",)
+
+# Environment variable naming a directory used to share the table of dependency
+# mounts between processes (e.g., multiple workers serving the same app).
+SHARED_DIR_ENV_VAR = "SHINY_DEPENDENCY_TABLE_DIR"
+
+_MOUNT_KEY = "shiny.dependency_mount"
+
+# The resolution (in nanoseconds) assumed for the modification time of the shared
+# directory
+_MTIME_RESOLUTION = 2_000_000_000
+
+
+class DependencyServer(starlette.routing.BaseRoute):
+    """
+    A route that serves the files of HTML dependencies, each under its own href (e.g.,
+    `lib/bootstrap-5.3.1/`).
+
+    A Starlette `Router` checks its routes one at a time, so an app with a `Mount` per
+    dependency would do more work for each asset request as more dependencies are
+    registered. Instead, this route finds the dependency for a request with dict
+    lookups on the leading segments of the path.
+
+    If `shared_dir` is not `None`, each registered dependency is also recorded in that
+    directory, and a request for an href that this process hasn't registered checks the
+    directory for registrations made by other processes. This lets any worker serve a
+    dependency that was rendered (e.g., by dynamic UI) in a session on another worker.
+    The directory is only read again when its modification time changes, so requests
+    for missing files don't read it each time.
+    """
+
+    def __init__(self, shared_dir: Optional[str] = None) -> None:
+        self._mounts: dict[str, starlette.routing.Mount] = {}
+        self._names: dict[str, starlette.routing.Mount] = {}
+        self._shared_dir = shared_dir
+        # The files of the shared directory that were read, and its modification time
+        # when it was last read
+        self._shared_files: set[str] = set()
+        self._shared_mtime: Optional[int] = None
+        if shared_dir is not None:
+            os.makedirs(shared_dir, exist_ok=True)
+
+    def add(
+        self,
+        href: str,
+        directory: str,
+        *,
+        name: str,
+        cache_control: Optional[str] = None,
+    ) -> None:
+        """
+        Serve the files in `directory` under `href`.
+        """
+        href = href.strip("/")
+        self._add_mount(href, directory, name=name, cache_control=cache_control)
+
+        if self._shared_dir is not None:
+            self._write_shared(
+                href,
+                {"directory": directory, "name": name, "cache_control": cache_control},
+            )
+
+    def __contains__(self, href: str) -> bool:
+        return href.strip("/") in self._mounts
+
+    def __len__(self) -> int:
+        return len(self._mounts)
+
+    def _add_mount(
+        self,
+        href: str,
+        directory: str,
+        *,
+        name: str,
+        cache_control: Optional[str],
+    ) -> starlette.routing.Mount:
+        mount = starlette.routing.Mount(
+            "/" + href,
+            StaticFiles(
+                directory=directory, compress=True, cache_control=cache_control
+            ),
+            name=name,
+        )
+        self._mounts[href] = mount
+        self._names[name] = mount
+        return mount
+
+    # ==========================================================================
+    # Route interface
+    # ==========================================================================
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        segments = path.lstrip("/").split("/")
+        match, child_scope = self._match(segments, scope)
+        if match == Match.NONE and self._read_shared():
+            match, child_scope = self._match(segments, scope)
+        return match, child_scope
+
+    def _match(self, segments: list[str], scope: Scope) -> tuple[Match, Scope]:
+        # The last segment is the file name, so it can't be part of the href. Try the
+        # longest candidate href first.
+        for i in range(len(segments) - 1, 0, -1):
+            mount = self._mounts.get("/".join(segments[:i]))
+            if mount is None:
+                continue
+            match, child_scope = mount.matches(scope)
+            if match == Match.FULL:
+                child_scope[_MOUNT_KEY] = mount
+                return match, child_scope
+
+        return Match.NONE, {}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        mount: starlette.routing.Mount = scope[_MOUNT_KEY]
+        await mount.handle(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
+        mount = self._names.get(name)
+        if mount is None:
+            raise starlette.routing.NoMatchFound(name, path_params)
+        return mount.url_path_for(name, **path_params)
+
+    # ==========================================================================
+    # Sharing registrations between processes
+    # ==========================================================================
+    def _shared_file(self, href: str) -> str:
+        assert self._shared_dir is not None
+        key = hashlib.sha256(href.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self._shared_dir, key + ".json")
+
+    def _write_shared(self, href: str, info: dict[str, Optional[str]]) -> None:
+        path = self._shared_file(href)
+        if os.path.exists(path):
+            return
+        # Write to a temp file and rename, so that readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self._shared_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"href": href, **info}, f)
+        os.replace(tmp_path, path)
+
+    def _read_shared(self) -> bool:
+        """
+        Add the dependencies that other processes registered since the shared directory
+        was last read. Returns whether any were added.
+        """
+        if self._shared_dir is None:
+            return False
+        try:
+            mtime = os.stat(self._shared_dir).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        # A file added within the same tick of the clock as the last read doesn't
+        # change the modification time, so read again while it's recent
+        if mtime == self._shared_mtime and time.time_ns() - mtime > _MTIME_RESOLUTION:
+            return False
+        self._shared_mtime = mtime
+
+        added = False
+        for entry in os.scandir(self._shared_dir):
+            if entry.name in self._shared_files or not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, "r") as f:
+                    info = json.load(f)
+            except (FileNotFoundError, ValueError):
+                continue
+            self._shared_files.add(entry.name)
+            href = info["href"]
+            if href in self._mounts:
+                continue
+            self._add_mount(
+                href,
+                info["directory"],
+                name=info["name"],
+                cache_control=info.get("cache_control"),
+            )
+            added = True
+        return added
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Callable
+
+__all__ = ("lazy_getattr",)
+
+
+def lazy_getattr(
+    module_name: str, lazy_imports: dict[str, str]
+) -> Callable[[str], object]:
+    """
+    Create a module-level `__getattr__` (PEP 562) that imports attributes on first use.
+
+    This keeps `import shiny` fast by deferring the import of submodules with heavy
+    dependencies (e.g., `narwhals` for data frames) until one of their attributes is
+    used.
+
+    Parameters
+    ----------
+    module_name
+        The name of the module that the `__getattr__` function is created for, i.e.
+        its `__name__`.
+    lazy_imports
+        A dictionary mapping attribute names to the (relative) name of the submodule
+        that defines them.
+
+    Returns
+    -------
+    :
+        A function to assign to `__getattr__` in the module. To keep type checkers
+        from treating every attribute of the module as valid, assign it inside an
+        `if not TYPE_CHECKING:` block and import the lazy attributes for type checkers
+        inside an `if TYPE_CHECKING:` block.
+    """
+
+    def __getattr__(name: str) -> object:
+        submodule_name = lazy_imports.get(name)
+        if submodule_name is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        submodule = importlib.import_module(submodule_name, module_name)
+        value = getattr(submodule, name)
+        # Cache the value so that `__getattr__` isn't called for it again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
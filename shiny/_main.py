@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import copy
 import importlib
 import importlib.util
@@ -7,7 +8,9 @@ import inspect
 import os
 import platform
 import re
+import shutil
 import sys
+import tempfile
 import types
 from pathlib import Path
 from typing import Any, Optional
@@ -19,8 +22,11 @@ import uvicorn.config
 import shiny
 
 from . import __version__, _autoreload, _hostenv, _static, _utils
+from ._dependency_server import SHARED_DIR_ENV_VAR
 from ._docstring import no_example
+from ._prefork import run_prefork
 from ._typing_extensions import NotRequired, TypedDict
+from ._workers import WORKERS_DIR_ENV_VAR
 from .express import is_express_app
 from .express._utils import escape_to_var_name
 
@@ -154,6 +160,24 @@ any of the following will work:
     help="Launch app browser after app starts, using the Python webbrowser module.",
     show_default=True,
 )
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    default=1,
+    help="The number of worker processes. Requests for a session are routed to the "
+    "worker that has it. Not valid with --reload.",
+    show_default=True,
+)
+@click.option(
+    "--preload",
+    is_flag=True,
+    default=False,
+    help="Load the app once, and fork the worker processes from the process that "
+    "loaded it, so they start quickly and share its memory. Only used with --workers. "
+    "SIGHUP replaces the workers, without loading changed code.",
+    show_default=True,
+)
 @click.option(
     "--dev-mode/--no-dev-mode",
     is_flag=True,
@@ -177,6 +201,8 @@ def run(
     app_dir: str,
     factory: bool,
     launch_browser: bool,
+    workers: int,
+    preload: bool,
     dev_mode: bool,
     **kwargs: object,
 ) -> None:
@@ -196,6 +222,8 @@ def run(
         app_dir=app_dir,
         factory=factory,
         launch_browser=launch_browser,
+        workers=workers,
+        preload=preload,
         dev_mode=dev_mode,
         **kwargs,
     )
@@ -216,6 +244,8 @@ def run_app(
     app_dir: Optional[str] = ".",
     factory: bool = False,
     launch_browser: bool = False,
+    workers: int = 1,
+    preload: bool = False,
     dev_mode: bool = True,
     **kwargs: object,
 ) -> None:
@@ -261,6 +291,22 @@ def run_app(
         Treat ``app`` as an application factory, i.e. a () -> <ASGI app> callable.
     launch_browser
         Launch app browser after app starts, using the Python webbrowser module.
+    workers
+        The number of worker processes. With more than one, ``app`` must be a string,
+        and each worker has its own sessions; requests for a session (e.g., file
+        uploads and downloads) are forwarded to the worker that has it, and the app's
+        :attr:`~shiny.App.store` is shared by the workers. Can't be used with
+        ``reload``.
+    preload
+        With more than one worker, load the app once, and fork the worker processes
+        from the process that loaded it (instead of each worker loading the app). The
+        workers start quickly, and share the memory of the app (its rendered UI, and
+        any data that's loaded when it's created) until they modify it. Then ``app``
+        can also be an :class:`~shiny.App` object. Not supported on Windows. Sending
+        the process ``SIGHUP`` replaces the workers with new ones that are forked from
+        it, and drains the old ones (see :meth:`~shiny.App.drain`), which exit once
+        their sessions have ended. The new workers run the code that was loaded when
+        the process started, so to run changed code, restart the process instead.
     **kwargs
         Additional keyword arguments which are passed to ``uvicorn.run``. For more
         information see [Uvicorn documentation](https://www.uvicorn.org/).
@@ -291,6 +337,9 @@ def run_app(
     ```
     """
 
+    if workers > 1 and reload:
+        raise click.UsageError("--workers can't be used with --reload.")
+
     # If port is 0, randomize
     if port == 0:
         port = _utils.random_port(host=host)
@@ -364,6 +413,29 @@ def run_app(
 
     maybe_setup_rsw_proxying(log_config)
 
+    if workers > 1:
+        setup_shared_dependency_table()
+        setup_workers_dir()
+
+    if preload and workers > 1:
+        if app_dir is not None:
+            sys.path.insert(0, app_dir)
+        config = uvicorn.Config(
+            app,
+            host=host,
+            port=port,
+            ws_max_size=ws_max_size,
+            log_level=log_level,
+            log_config=log_config,
+            factory=factory,
+            lifespan="on",
+            loop="asyncio",
+            workers=workers,
+            **kwargs,  # pyright: ignore[reportArgumentType]
+        )
+        run_prefork(config)
+        return
+
     uvicorn.run(  # pyright: ignore[reportUnknownMemberType]
         app,
         host=host,
@@ -377,6 +449,7 @@ def run_app(
         # Don't allow shiny to use uvloop!
         # https://github.com/posit-dev/py-shiny/issues/1373
         loop="asyncio",
+        workers=workers,
         **reload_args,  # pyright: ignore[reportArgumentType]
         **kwargs,
     )
@@ -401,6 +474,27 @@ def setup_hot_reload(
     _autoreload.start_server(autoreload_port, app_port, launch_browser)
 
 
+def setup_shared_dependency_table() -> None:
+    # With multiple worker processes, a request for an HTML dependency's files can go to
+    # a different worker than the one that rendered it; share the table of dependency
+    # mounts between workers through a temporary directory.
+    if os.getenv(SHARED_DIR_ENV_VAR):
+        return
+    shared_dir = tempfile.mkdtemp(prefix="shiny-dependencies-")
+    atexit.register(shutil.rmtree, shared_dir, ignore_errors=True)
+    os.environ[SHARED_DIR_ENV_VAR] = shared_dir
+
+
+def setup_workers_dir() -> None:
+    # Each worker listens on a socket in this directory, for requests for its sessions
+    # that are sent to other workers (and the app's shared store is kept there)
+    if os.getenv(WORKERS_DIR_ENV_VAR):
+        return
+    workers_dir = tempfile.mkdtemp(prefix="shiny-workers-")
+    atexit.register(shutil.rmtree, workers_dir, ignore_errors=True)
+    os.environ[WORKERS_DIR_ENV_VAR] = workers_dir
+
+
 def setup_launch_browser(log_config: dict[str, Any]):
     log_config["handlers"]["shiny_launch_browser"] = {
         "class": "shiny._launchbrowser.LaunchBrowserHandler",
@@ -653,6 +747,75 @@ def static_assets(command: str) -> None:
         raise click.UsageError(f"Unknown command: {command}")
 
 
+@main.command(
+    help="""Compile the themes of a Shiny app and save them in the theme cache.
+
+Load the app given by APP (as in `shiny run`), which compiles any `ui.Theme` used by a
+static app UI, and compile any `ui.Theme` objects defined at the top level of the app's
+module. The compiled CSS is saved in the theme cache directory, so that app processes
+using the same cache directory reuse it instead of compiling the themes again. Run this
+when building or deploying an app, e.g.:
+
+    shiny compile-themes app.py --cache-dir ./theme-cache
+
+and then run the app with SHINY_THEME_CACHE_DIR=./theme-cache.
+"""
+)
+@click.argument("app", default="app.py:app")
+@click.option(
+    "--app-dir",
+    default=".",
+    help="Look for APP in the specified directory, by adding this to the PYTHONPATH."
+    " Defaults to the current working directory. If APP is a file path, this argument"
+    " is ignored.",
+)
+@click.option(
+    "--cache-dir",
+    type=str,
+    default=None,
+    help="The theme cache directory. Defaults to the SHINY_THEME_CACHE_DIR environment"
+    " variable.",
+)
+def compile_themes(app: str, app_dir: str, cache_dir: Optional[str]) -> None:
+    from .ui._theme import THEME_CACHE_DIR_ENV_VAR, Theme, theme_css_cache_dir
+
+    if cache_dir is not None:
+        os.environ[THEME_CACHE_DIR_ENV_VAR] = os.path.realpath(cache_dir)
+
+    cache_dir = theme_css_cache_dir()
+    if cache_dir is None:
+        raise click.UsageError(
+            f"Set the theme cache directory with --cache-dir or {THEME_CACHE_DIR_ENV_VAR}."
+        )
+
+    app_module: Optional[types.ModuleType] = None
+    app_no_suffix = re.sub(r":app$", "", app)
+    if is_express_app(app_no_suffix, app_dir):
+        from .express._run import wrap_express_app
+
+        # Creating the App object renders the (static) UI of an Express app, which
+        # compiles its theme
+        wrap_express_app(Path(app_no_suffix).resolve())
+    else:
+        app, app_dir_resolved = resolve_app(app, app_dir)
+        if app_dir_resolved:
+            sys.path.insert(0, os.path.realpath(app_dir_resolved))
+        module, _, _ = app.partition(":")
+        app_module = importlib.import_module(module)
+
+    n_themes = 0
+    if app_module is not None:
+        for obj in list(vars(app_module).values()):
+            if isinstance(obj, Theme):
+                obj.to_css()
+                n_themes += 1
+
+    print(
+        f"Compiled {n_themes} top-level theme(s) and the themes of the app's static UI."
+    )
+    print(f"Theme cache directory: {cache_dir}")
+
+
 @main.command(help="""Convert a JSON file with code cells to a py file.""")
 @click.argument(
     "json_file",
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import gc
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from multiprocessing.process import BaseProcess
+from socket import socket
+from typing import Optional
+
+from uvicorn.config import Config
+from uvicorn.server import Server
+
+__all__ = ("run_prefork", "stop_accepting")
+
+logger = logging.getLogger("uvicorn.error")
+
+_SIGNALS = {
+    getattr(signal, f"SIG{x}"): x
+    for x in ("INT", "TERM", "HUP")
+    if hasattr(signal, f"SIG{x}")
+}
+
+# The exit code of a worker whose app failed to start (the same as uvicorn's)
+_STARTUP_FAILURE = 3
+
+# The server of this process, if it's a worker
+_worker_server: Optional[Server] = None
+
+
+def run_prefork(config: Config) -> None:
+    """
+    Load the app of `config` in this process, and then serve it with `config.workers`
+    worker processes that are forked from this one.
+
+    The workers start with this process's memory (the imported modules, and the app
+    with its rendered UI and any data that was loaded when it was created), which the
+    operating system shares between the processes until one of them writes to it. So
+    the workers start quickly and use less memory than workers that each import the
+    app. For the same reason, the workers that replace others on SIGHUP run the code
+    that this process loaded: to run changed code, restart this process.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError(
+            "Preloading the app is only supported on platforms with fork."
+        )
+
+    config.load()
+    sock = config.bind_socket()
+    try:
+        Prefork(config, [sock]).run()
+    finally:
+        sock.close()
+
+
+class Prefork:
+    """
+    Starts the worker processes, restarts the ones that exit, and stops them on SIGINT
+    or SIGTERM.
+
+    On SIGHUP, the workers are replaced by new ones, and sent SIGUSR1, which makes them
+    drain their app (see :meth:`~shiny.App.drain`): they stop accepting connections,
+    and exit once their sessions have ended (and the requests that they forward to
+    other workers are done). The new workers are forked from this process, so they
+    don't load the app's code again.
+    """
+
+    def __init__(self, config: Config, sockets: list[socket]) -> None:
+        self.config = config
+        self.sockets = sockets
+        self.processes: list[BaseProcess] = []
+        # Replaced workers that are being drained
+        self.draining: list[BaseProcess] = []
+        self.should_exit = threading.Event()
+        self.signal_queue: list[int] = []
+        self._context = multiprocessing.get_context("fork")
+
+    def run(self) -> None:
+        logger.info(f"Started parent process [{os.getpid()}]")
+        for sig in _SIGNALS:
+            signal.signal(sig, lambda sig, frame: self.signal_queue.append(sig))
+
+        # Move the objects that exist now out of reach of the garbage collector, so
+        # that it doesn't write to them (and un-share their memory) in the workers
+        gc.freeze()
+
+        try:
+            for _ in range(self.config.workers):
+                self.processes.append(self._start_process())
+            while not self.should_exit.wait(0.5):
+                self._handle_signals()
+                self._keep_processes_alive()
+        finally:
+            for process in self.processes + self.draining:
+                self._terminate(process)
+            for process in self.processes + self.draining:
+                process.join()
+
+        logger.info(f"Stopping parent process [{os.getpid()}]")
+
+    def _start_process(self) -> BaseProcess:
+        process = self._context.Process(target=self._serve)
+        process.start()
+        return process
+
+    def _serve(self) -> None:
+        # In the worker process. The server handles the signals while it runs, and then
+        # raises the one it got again. Ignore SIGINT (which the parent process also gets
+        # from Ctrl+C, and then terminates the workers), rather than raising
+        # KeyboardInterrupt after the server has shut down.
+        for sig in _SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        global _worker_server
+        server = _worker_server = Server(config=self.config)
+        server.run(sockets=self.sockets)
+        if not server.started:
+            sys.exit(_STARTUP_FAILURE)
+
+    def _terminate(self, process: BaseProcess) -> None:
+        if process.exitcode is None:
+            process.terminate()
+            logger.info(f"Terminated child process [{process.pid}]")
+
+    def _keep_processes_alive(self) -> None:
+        if self.should_exit.is_set():
+            return
+        for process in [p for p in self.draining if not p.is_alive()]:
+            process.join()
+            self.draining.remove(process)
+            logger.info(f"Child process [{process.pid}] was drained")
+        for i, process in enumerate(self.processes):
+            if process.is_alive():
+                continue
+            process.join()
+            if process.exitcode == _STARTUP_FAILURE:
+                # The app would fail the same way in a new worker
+                logger.error(
+                    f"Child process [{process.pid}] failed to start, stopping the "
+                    "parent process."
+                )
+                self.should_exit.set()
+                return
+            logger.info(f"Child process [{process.pid}] died")
+            self.processes[i] = self._start_process()
+
+    def _handle_signals(self) -> None:
+        while self.signal_queue:
+            sig = self.signal_queue.pop(0)
+            if sig == getattr(signal, "SIGHUP", None):
+                logger.info("Received SIGHUP, restarting processes.")
+                self._restart_all()
+            else:
+                logger.info(f"Received SIG{_SIGNALS[sig]}, exiting.")
+                self.should_exit.set()
+
+    def _restart_all(self) -> None:
+        for i, process in enumerate(self.processes):
+            self.processes[i] = self._start_process()
+            if process.exitcode is None and hasattr(signal, "SIGUSR1"):
+                assert process.pid is not None
+                os.kill(process.pid, signal.SIGUSR1)
+                self.draining.append(process)
+                logger.info(f"Draining child process [{process.pid}]")
+            else:
+                self._terminate(process)
+                process.join()
+
+
+def stop_accepting() -> None:
+    """
+    In a worker process, stop accepting connections on the sockets that are shared with
+    the other workers, so that new connections go to the others (e.g., while the
+    worker is drained).
+    """
+    if _worker_server is None:
+        return
+    for server in getattr(_worker_server, "servers", []):
+        server.close()
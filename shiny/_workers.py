@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import marshal
+import os
+import random
+import re
+import secrets
+import struct
+from typing import Any, Optional, cast
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = ("Workers", "WORKERS_DIR_ENV_VAR")
+
+# Environment variable naming a directory where the worker processes of an app listen
+# for requests from each other (and keep the app's shared store).
+WORKERS_DIR_ENV_VAR = "SHINY_WORKERS_DIR"
+
+# The scope keys that are sent to another worker. (Others, like "state", "app" and
+# "extensions", hold objects of this process.)
+_SCOPE_KEYS = (
+    "type",
+    "asgi",
+    "http_version",
+    "method",
+    "scheme",
+    "path",
+    "raw_path",
+    "root_path",
+    "query_string",
+    "headers",
+    "client",
+    "server",
+    "subprotocols",
+)
+
+_WORKER_ID_RE = re.compile("[0-9a-f]{8}")
+
+_LENGTH = struct.Struct("!I")
+
+
+class Workers:
+    """
+    The worker processes that serve an app.
+
+    Each worker process has its own sessions, but the browser's requests for a session
+    (e.g., file uploads and downloads, and reconnecting websockets) can be sent to any
+    of the workers. So each worker listens on a Unix socket in a shared `directory`,
+    the IDs of sessions start with the ID of the worker that has them, and a worker
+    forwards a request for another worker's session to that worker. (The ASGI messages
+    of the request are passed back and forth, so the request is handled by the other
+    worker's app as if it had received it.)
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        # Set when this worker starts listening (in the worker process)
+        self.id: Optional[str] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._path: Optional[str] = None
+        # The number of requests that this worker is forwarding to others
+        self.forwarding: int = 0
+
+    async def start(self, app: ASGIApp) -> None:
+        """
+        Listen for requests forwarded by other workers, and handle them with `app`.
+        """
+        self.id = secrets.token_hex(4)
+        self._path = self._socket_path(self.id)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            try:
+                await _serve_forwarded(app, reader, writer)
+            finally:
+                writer.close()
+
+        self._server = await asyncio.start_unix_server(handle, path=self._path)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if self._path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._path)
+            self._path = None
+        if self.id is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._draining_path(self.id))
+
+    def set_draining(self) -> None:
+        """
+        Let the other workers know that this worker doesn't take new sessions.
+        """
+        if self.id is not None:
+            with open(self._draining_path(self.id), "w"):
+                pass
+
+    def available(self) -> Optional[str]:
+        """
+        The ID of a random other worker that takes new sessions, if any.
+        """
+        ids: list[str] = []
+        for name in os.listdir(self.directory):
+            worker_id, ext = os.path.splitext(name)
+            if (
+                ext == ".sock"
+                and worker_id != self.id
+                and not os.path.exists(self._draining_path(worker_id))
+            ):
+                ids.append(worker_id)
+        return random.choice(ids) if ids else None
+
+    def new_id(self) -> str:
+        """
+        A new random ID (for a session, or a secret of one), which identifies this
+        worker.
+        """
+        token = secrets.token_hex(32)
+        if self.id is None:
+            return token
+        return f"{self.id}-{token}"
+
+    def owner(self, id: str) -> Optional[str]:
+        """
+        The ID of the other worker that created `id` with :meth:`new_id`, if any.
+        """
+        worker_id, sep, _ = id.partition("-")
+        if not sep or worker_id == self.id or not _WORKER_ID_RE.fullmatch(worker_id):
+            return None
+        return worker_id
+
+    async def forward(
+        self, worker_id: str, scope: Scope, receive: Receive, send: Send
+    ) -> bool:
+        """
+        Let another worker handle a request (an HTTP request, or a websocket). Returns
+        `False` if the worker isn't running.
+        """
+        try:
+            reader, writer = await asyncio.open_unix_connection(
+                self._socket_path(worker_id)
+            )
+        except OSError:
+            return False
+
+        async def forward_received() -> None:
+            try:
+                while True:
+                    message = await receive()
+                    _write_message(writer, message)
+                    await writer.drain()
+                    if message["type"] in ("http.disconnect", "websocket.disconnect"):
+                        return
+            except Exception:
+                # The other worker went away
+                pass
+
+        _write_message(writer, {k: scope[k] for k in _SCOPE_KEYS if k in scope})
+        received = asyncio.create_task(forward_received())
+        self.forwarding += 1
+        try:
+            while True:
+                message = await _read_message(reader)
+                if message is None:
+                    break
+                await send(message)
+        except Exception:
+            # The client went away
+            pass
+        finally:
+            self.forwarding -= 1
+            received.cancel()
+            writer.close()
+        return True
+
+    def _socket_path(self, worker_id: str) -> str:
+        return os.path.join(self.directory, f"{worker_id}.sock")
+
+    def _draining_path(self, worker_id: str) -> str:
+        return os.path.join(self.directory, f"{worker_id}.draining")
+
+
+async def _serve_forwarded(
+    app: ASGIApp, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    scope = await _read_message(reader)
+    if scope is None:
+        return
+    disconnect: Message = (
+        {"type": "http.disconnect"}
+        if scope["type"] == "http"
+        else {"type": "websocket.disconnect", "code": 1006}
+    )
+
+    async def receive() -> Message:
+        message = await _read_message(reader)
+        return disconnect if message is None else message
+
+    async def send(message: Message) -> None:
+        _write_message(writer, message)
+        await writer.drain()
+
+    await app(dict(scope, state={}), receive, send)
+
+    # Let the other worker know that the response is complete, and wait for it to
+    # close the connection. (Closing it while a message from the other worker is still
+    # unread would reset it, and the other worker could lose the end of the response.)
+    writer.write_eof()
+    while await _read_message(reader) is not None:
+        pass
+
+
+def _write_message(writer: asyncio.StreamWriter, message: Any) -> None:
+    data = marshal.dumps(message)
+    writer.write(_LENGTH.pack(len(data)) + data)
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Optional[Message]:
+    try:
+        (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+        data = await reader.readexactly(length)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    return cast(Message, marshal.loads(data))
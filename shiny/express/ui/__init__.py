@@ -90,6 +90,7 @@ from ...ui import (
     update_numeric,
     update_select,
     update_selectize,
+    SelectizeChoices,
     update_slider,
     update_task_button,
     update_text,
@@ -245,6 +246,7 @@ __all__ = (
     "update_numeric",
     "update_select",
     "update_selectize",
+    "SelectizeChoices",
     "update_slider",
     "update_task_button",
     "update_text",
@@ -335,6 +337,8 @@ _known_missing = {
         "output_markdown_stream",
         # Chat knows how to render itself in express
         "chat_ui",
+        # Memoized functions return UI objects, which express UI is not built from
+        "memoize",
     ),
     # Items from shiny.express.ui that don't have a counterpart in shiny.ui
     "shiny.express.ui": (
@@ -12,7 +12,7 @@ not true when running in native Python, we want to be as safe as possible.
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, Optional
 
 from . import _utils
 
@@ -24,6 +24,7 @@ __all__ = (
 import sys
 
 from starlette.background import BackgroundTask
+from starlette.types import Scope
 
 if "pyodide" not in sys.modules:
     # Running in native mode; use starlette StaticFiles
@@ -31,18 +32,50 @@ if "pyodide" not in sys.modules:
 
     import starlette.responses
     import starlette.staticfiles
+    from starlette.datastructures import Headers
+
+    from . import _compress
+    from ._datastructures import LRUCache
 
     FileResponse = starlette.responses.FileResponse  # type: ignore
 
-    # Wrapper for StaticFiles to fix .js content-type issues on Windows 10 (see #1601)
+    # Compressed file contents, keyed by (path, mtime, size, encoding), shared by all
+    # StaticFiles instances.
+    _compressed_files: LRUCache[tuple[str, int, int, str], bytes] = LRUCache(256)
+
+    # Wrapper for StaticFiles to fix .js content-type issues on Windows 10 (see #1601),
+    # and to optionally compress responses and set a Cache-Control header.
     class StaticFiles(starlette.staticfiles.StaticFiles):  # type: ignore
-        def file_response(
+        def __init__(
             self,
-            full_path: str | os.PathLike[str],
             *args: Any,
+            compress: bool = False,
+            cache_control: Optional[str] = None,
             **kwargs: Any,
+        ) -> None:
+            """
+            Parameters
+            ----------
+            compress
+                Whether to compress (compressible) files with gzip or brotli, as allowed
+                by the request's `Accept-Encoding` header. A precompressed `<file>.br`
+                or `<file>.gz` next to the file is used if present; otherwise the file
+                is compressed on first request and kept in memory.
+            cache_control
+                The value of the `Cache-Control` header for successful responses.
+            """
+            super().__init__(*args, **kwargs)
+            self.compress = compress
+            self.cache_control = cache_control
+
+        def file_response(
+            self,
+            full_path: str | os.PathLike[str],
+            stat_result: os.stat_result,
+            scope: Scope,
+            status_code: int = 200,
         ) -> starlette.responses.Response:
-            resp = super().file_response(full_path, *args, **kwargs)
+            resp = super().file_response(full_path, stat_result, scope, status_code)
             if resp.headers.get("content-type", "").startswith("text/plain"):
                 correct_type = _utils.guess_mime_type(full_path)
                 resp.headers["content-type"] = (
@@ -51,8 +84,86 @@ if "pyodide" not in sys.modules:
                     else correct_type
                 )
                 resp.media_type = correct_type
+
+            if resp.status_code != 200:
+                return resp
+
+            if self.cache_control is not None:
+                resp.headers["cache-control"] = self.cache_control
+
+            if self.compress:
+                resp = self._compressed_response(resp, full_path, stat_result, scope)
             return resp
 
+        def _compressed_response(
+            self,
+            resp: starlette.responses.Response,
+            full_path: str | os.PathLike[str],
+            stat_result: os.stat_result,
+            scope: Scope,
+        ) -> starlette.responses.Response:
+            request_headers = Headers(scope=scope)
+            if (
+                stat_result.st_size < _compress.MIN_COMPRESS_SIZE
+                or "range" in request_headers
+                or not _compress.is_compressible(resp.headers.get("content-type", ""))
+            ):
+                return resp
+
+            encoding = _compress.accepted_encoding(request_headers)
+            if encoding is None:
+                resp.headers["vary"] = "Accept-Encoding"
+                return resp
+
+            headers = {
+                k: v
+                for k, v in resp.headers.items()
+                if k not in ("content-length", "accept-ranges")
+            }
+            headers["content-encoding"] = encoding
+            headers["vary"] = "Accept-Encoding"
+            if "etag" in headers:
+                headers["etag"] = _compress.encoding_etag(headers["etag"], encoding)
+                if self.is_not_modified(Headers(headers), request_headers):
+                    return starlette.responses.Response(
+                        status_code=304,
+                        headers={
+                            k: v
+                            for k, v in headers.items()
+                            if k not in ("content-type", "content-encoding")
+                        },
+                    )
+
+            return starlette.responses.Response(
+                _read_compressed(str(full_path), stat_result, encoding),
+                headers=headers,
+            )
+
+    def _read_compressed(
+        full_path: str,
+        stat_result: os.stat_result,
+        encoding: _compress.ContentEncoding,
+    ) -> bytes:
+        key = (full_path, stat_result.st_mtime_ns, stat_result.st_size, encoding)
+        data = _compressed_files.get(key)
+        if data is not None:
+            return data
+
+        # Prefer a file that was precompressed at build time
+        precompressed = full_path + (".br" if encoding == "br" else ".gz")
+        if (
+            os.path.isfile(precompressed)
+            and os.stat(precompressed).st_mtime_ns >= stat_result.st_mtime_ns
+        ):
+            with open(precompressed, "rb") as f:
+                data = f.read()
+        else:
+            with open(full_path, "rb") as f:
+                data = _compress.compress(f.read(), encoding)
+
+        _compressed_files.set(key, data)
+        return data
+
 else:
     # Running in wasm mode; must use our own simple StaticFiles
 
@@ -60,16 +171,24 @@ else:
     import os.path
     import pathlib
     import urllib.parse
-    from typing import Iterable, MutableMapping, Optional
+    from typing import Iterable, MutableMapping
 
     from starlette.responses import PlainTextResponse
-    from starlette.types import Receive, Scope, Send
+    from starlette.types import Receive, Send
 
     class StaticFiles:
         dir: pathlib.Path
         root_path: str
 
-        def __init__(self, *, directory: str | os.PathLike[str]):
+        def __init__(
+            self,
+            *,
+            directory: str | os.PathLike[str],
+            compress: bool = False,
+            cache_control: Optional[str] = None,
+        ):
+            # `compress` and `cache_control` are accepted for compatibility, but have
+            # no effect: everything is served from within the browser.
             self.dir = pathlib.Path(os.path.realpath(os.path.normpath(directory)))
 
         async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
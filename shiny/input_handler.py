@@ -3,7 +3,8 @@ from __future__ import annotations
 __all__ = ("input_handlers",)
 
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, Callable, Dict
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Dict, Union
 
 if TYPE_CHECKING:
     from .session import Session
@@ -141,6 +142,47 @@ def _(value: int, name: ResolvedId, session: Session) -> ActionButtonValue:
     return ActionButtonValue(value)
 
 
+# Row indices of a data frame (e.g., the rows in view after sorting and filtering) are
+# sent by the browser as runs of consecutive indices: `{"runs": [start, length, ...]}`,
+# where a negative length is a descending run. Unsorted and filtered views (and sorts
+# of already sorted columns) are a handful of runs, instead of one number per row.
+# Indices that wouldn't be shorter as runs are sent as a list.
+IndexRuns = Dict[str, "list[int]"]
+
+
+@input_handlers.add("shiny.dataframe.indices")
+def _(
+    value: Union[IndexRuns, list[int], None], name: ResolvedId, session: Session
+) -> tuple[int, ...] | None:
+    return _decode_index_runs(value)
+
+
+@input_handlers.add("shiny.dataframe.cellSelection")
+def _(
+    value: dict[str, Any] | None, name: ResolvedId, session: Session
+) -> dict[str, Any] | None:
+    if value is None or "rows" not in value:
+        return value
+    return {**value, "rows": _decode_index_runs(value["rows"])}
+
+
+def _decode_index_runs(
+    value: Union[IndexRuns, list[int], None],
+) -> tuple[int, ...] | None:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return tuple(value)
+
+    runs = value["runs"]
+    return tuple(
+        chain.from_iterable(
+            range(start, start + length, 1 if length >= 0 else -1)
+            for start, length in zip(runs[::2], runs[1::2])
+        )
+    )
+
+
 # The inputs handlers below currently do nothing, but still need to be defined,
 # otherwise there will be an error when the input value is handled.
 
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-__all__ = ("brushed_points", "near_points")
+__all__ = ("brushed_points", "near_points", "PointIndex")
 
 
-from typing import TYPE_CHECKING, Literal, Optional, Union, cast
+import math
+import sys
+from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence, Union, cast
+
+import narwhals.stable.v1 as nw
 
 from ._typing_extensions import TypedDict
 from .types import BrushInfo, CoordInfo, CoordXY
 
 if TYPE_CHECKING:
+    import numpy as np
     import numpy.typing as npt
     import pandas as pd
+    from narwhals.stable.v1.typing import (
+        IntoDataFrame,
+        IntoDataFrameT,
+        IntoFrameT,
+        IntoSeries,
+    )
+
+    FloatArray = npt.NDArray[np.float64]
+    IntpArray = npt.NDArray[np.intp]
 
 DataFrameColumn = Union[
     "pd.Series[int]",
@@ -20,6 +34,8 @@ DataFrameColumn = Union[
     "pd.Series[str]",
     "pd.Categorical",
     "pd.DatetimeIndex",
+    "nw.Series",
+    "IntoSeries",
 ]
 
 
@@ -28,8 +44,13 @@ class SeriesFloatXY(TypedDict):
     y: pd.Series[float]
 
 
+class ArrayFloatXY(TypedDict):
+    x: FloatArray
+    y: FloatArray
+
+
 def brushed_points(
-    df: pd.DataFrame,
+    df: IntoFrameT,
     brush: BrushInfo | None,
     xvar: Optional[str] = None,
     yvar: Optional[str] = None,
@@ -37,7 +58,7 @@ def brushed_points(
     panelvar2: Optional[str] = None,
     *,
     all_rows: bool = False,
-) -> pd.DataFrame:
+) -> IntoFrameT:
     """Find rows of data selected on an interactive plot.
 
     This function is used with interactive plots. It returns the rows of a data frame
@@ -50,7 +71,10 @@ def brushed_points(
     Parameters
     ----------
     df
-        A pandas DataFrame from which to select rows.
+        A data frame from which to select rows. Any data frame supported by
+        [narwhals](https://narwhals-dev.github.io/narwhals/) (e.g. pandas or polars)
+        can be used, including lazy frames (e.g. a polars `LazyFrame`) when the x and y
+        columns are numeric or datetime.
     brush
         The data from a brush, like `input.myplot_brush()`.
     xvar
@@ -74,22 +98,21 @@ def brushed_points(
     Returns
     -------
     :
-        A pandas DataFrame containing the rows selected by the brush. If `all_rows` is
-        `True`, then all rows from the original data will be returned, along with an
-        additional column named `selected_`, which indicates whether or not each row was
-        selected.
+        A data frame (of the same type as `df`) containing the rows selected by the
+        brush. If `all_rows` is `True`, then all rows from the original data will be
+        returned, along with an additional column named `selected_`, which indicates
+        whether or not each row was selected.
     """
-    import pandas as pd
 
-    new_df = df.copy()
+    frame = nw.from_native(df)
 
     if brush is None:
         if all_rows:
-            new_df["selected_"] = False
+            frame = frame.with_columns(nw.lit(False).alias("selected_"))
         else:
-            new_df = new_df.loc[[]]
+            frame = frame.head(0)
 
-        return new_df
+        return _to_native_like(frame, df)
 
     if "xmin" not in brush:
         raise ValueError(
@@ -101,11 +124,11 @@ def brushed_points(
     use_x = "x" in brush["direction"]
     use_y = "y" in brush["direction"]
 
-    # Filter out x and y values
-    keep_rows: pd.Series[bool] = pd.Series(
-        True,
-        index=new_df.index,  # pyright: ignore[reportUnknownMemberType]
-    )
+    columns = frame.columns
+
+    # Filter out x and y values. Each condition is a narwhals expression when
+    # possible (so lazy frames stay lazy), or a boolean Series otherwise.
+    keep_rows: list[nw.Expr | nw.Series] = []
     if use_x:
         if xvar is None and "x" in brush["mapping"]:
             xvar = brush["mapping"]["x"]
@@ -113,9 +136,9 @@ def brushed_points(
             raise ValueError(
                 "brushed_points: not able to automatically infer `xvar` from brush. You must supply `xvar` to brushed_points()"
             )
-        if xvar not in new_df:
+        if xvar not in columns:
             raise ValueError(f"brushed_points: `xvar` ({xvar}) not in dataframe")
-        keep_rows &= within_brush(new_df[xvar], brush, "x")
+        keep_rows.append(_within_brush(frame, xvar, brush, "x"))
 
     if use_y:
         if yvar is None and "y" in brush["mapping"]:
@@ -124,38 +147,38 @@ def brushed_points(
             raise ValueError(
                 "brushed_points: not able to automatically infer `yvar` from brush. You must supply `yvar` to brushed_points()"
             )
-        if yvar not in new_df:
+        if yvar not in columns:
             raise ValueError(f"brushed_points: `yvar` ({yvar}) not in dataframe")
-        keep_rows &= within_brush(new_df[yvar], brush, "y")
+        keep_rows.append(_within_brush(frame, yvar, brush, "y"))
 
     # Find which rows are matches for the panel vars (if present)
     if panelvar1 is None and "panelvar1" in brush["mapping"]:
         panelvar1 = brush["mapping"]["panelvar1"]
-        if panelvar1 not in new_df:
+        if panelvar1 not in columns:
             raise ValueError(
                 f"brushed_points: `panelvar1` ({panelvar1}) not in dataframe"
             )
-        keep_rows &= new_df[panelvar1] == brush["panelvar1"]  # pyright: ignore
+        keep_rows.append(nw.col(panelvar1) == brush["panelvar1"])  # pyright: ignore
 
     if panelvar2 is None and "panelvar2" in brush["mapping"]:
         panelvar2 = brush["mapping"]["panelvar2"]
-        if panelvar2 not in new_df:
+        if panelvar2 not in columns:
             raise ValueError(
                 f"brushed_points: `panelvar2` ({panelvar2}) not in dataframe"
             )
-        keep_rows &= new_df[panelvar2] == brush["panelvar2"]  # pyright: ignore
+        keep_rows.append(nw.col(panelvar2) == brush["panelvar2"])  # pyright: ignore
 
     if all_rows:
-        new_df["selected_"] = False
-        new_df.loc[keep_rows, "selected_"] = True
-    else:
-        new_df = new_df.loc[keep_rows]
+        selected = _all_horizontal(frame, keep_rows)
+        frame = frame.with_columns(selected.alias("selected_"))
+    elif len(keep_rows) > 0:
+        frame = frame.filter(_all_horizontal(frame, keep_rows))
 
-    return new_df
+    return _to_native_like(frame, df)
 
 
 def near_points(
-    df: pd.DataFrame,
+    df: IntoDataFrameT,
     coordinfo: CoordInfo | None,
     xvar: Optional[str] = None,
     yvar: Optional[str] = None,
@@ -166,7 +189,7 @@ def near_points(
     max_points: Optional[int] = None,
     add_dist: bool = False,
     all_rows: bool = False,
-) -> pd.DataFrame:
+) -> IntoDataFrameT:
     """Find rows of data selected on an interactive plot.
 
     This function is used with interactive plots. It returns the rows of a data frame
@@ -179,7 +202,9 @@ def near_points(
     Parameters
     ----------
     df
-        A pandas DataFrame from which to select rows.
+        A data frame from which to select rows. Any eager data frame supported by
+        [narwhals](https://narwhals-dev.github.io/narwhals/) (e.g. pandas or polars)
+        can be used.
     coordinfo
         The data from a click/dblclick/hover event, like `input.myplot_click()`.
     xvar
@@ -213,26 +238,26 @@ def near_points(
     Returns
     -------
     :
-        A pandas DataFrame containing the rows selected by the brush. If `all_rows` is
-        `True`, then all rows from the original data will be returned, along with an
-        additional column named `selected_`, which indicates whether or not each row was
-        selected.
+        A data frame (of the same type as `df`) containing the rows selected by the
+        brush. If `all_rows` is `True`, then all rows from the original data will be
+        returned, along with an additional column named `selected_`, which indicates
+        whether or not each row was selected.
     """
     import numpy as np
 
-    new_df = df.copy()
+    frame = nw.from_native(df, eager_only=True)
 
     # For no current coordinfo
     if coordinfo is None:
         if add_dist:
-            new_df["dist"] = np.nan
+            frame = frame.with_columns(nw.lit(np.nan).alias("dist"))
 
         if all_rows:
-            new_df["selected_"] = False
+            frame = frame.with_columns(nw.lit(False).alias("selected_"))
         else:
-            new_df = new_df.loc[[]]
+            frame = frame.head(0)
 
-        return new_df
+        return _to_native_like(frame, df)
 
     # Try to extract vars from coordinfo object
     coordinfo_mapping = coordinfo["mapping"]
@@ -242,66 +267,63 @@ def near_points(
         yvar = coordinfo_mapping["y"]
 
     if xvar is None:
-        if xvar is None and "x" in coordinfo["mapping"]:
-            xvar = coordinfo["mapping"]["x"]
         raise ValueError(
             "near_points: not able to automatically infer `xvar` from coordinfo. You must supply `xvar` to near_points()"
         )
     if yvar is None:
-        if yvar is None and "y" in coordinfo["mapping"]:
-            yvar = coordinfo["mapping"]["y"]
         raise ValueError(
             "near_points: not able to automatically infer `yvar` from coordinfo. You must supply `yvar` to near_points()"
         )
 
-    if xvar not in new_df.columns:
+    if xvar not in frame.columns:
         raise ValueError(f"near_points: `xvar` ('{xvar}')  not in names of input.")
-    if yvar not in new_df.columns:
+    if yvar not in frame.columns:
         raise ValueError(f"near_points: `yvar` ('{yvar}')  not in names of input.")
 
-    x: pd.Series[float] = to_float(new_df[xvar])
-    y: pd.Series[float] = to_float(new_df[yvar])
+    x: FloatArray = _to_float_array(frame[xvar])
+    y: FloatArray = _to_float_array(frame[yvar])
 
     # Get the coordinates of the point (in img pixel coordinates)
     point_img: CoordXY = coordinfo["coords_img"]
 
     # Get coordinates of data points (in img pixel coordinates)
-    data_img: SeriesFloatXY = scale_coords(x, y, coordinfo)
+    data_img: ArrayFloatXY = scale_coords(x, y, coordinfo)
 
     # Get x/y distances (in css coordinates)
-    dist_css: SeriesFloatXY = {
+    dist_css: ArrayFloatXY = {
         "x": (data_img["x"] - point_img["x"]) / coordinfo["img_css_ratio"]["x"],
         "y": (data_img["y"] - point_img["y"]) / coordinfo["img_css_ratio"]["y"],
     }
 
     # Distances of data points to the target point, in css pixels.
-    dists: pd.Series[float] = (dist_css["x"] ** 2 + dist_css["y"] ** 2) ** 0.5
+    dists: FloatArray = (dist_css["x"] ** 2 + dist_css["y"] ** 2) ** 0.5
 
     if add_dist:
-        new_df["dist"] = dists
+        frame = frame.with_columns(_new_series(frame, "dist", dists, nw.Float64))
 
     keep_rows = dists <= threshold
 
     # Find which rows are matches for the panel vars (if present)
     if panelvar1 is None and "panelvar1" in coordinfo["mapping"]:
         panelvar1 = coordinfo["mapping"]["panelvar1"]
-        if panelvar1 not in new_df:
+        if panelvar1 not in frame.columns:
             raise ValueError(f"near_points: `panelvar1` ({panelvar1}) not in dataframe")
-        keep_rows &= new_df[panelvar1] == coordinfo["panelvar1"]  # pyright: ignore
+        panel_value = coordinfo["panelvar1"]  # pyright: ignore
+        keep_rows &= _equals(frame[panelvar1], panel_value)
 
     if panelvar2 is None and "panelvar2" in coordinfo["mapping"]:
         panelvar2 = coordinfo["mapping"]["panelvar2"]
-        if panelvar2 not in new_df:
+        if panelvar2 not in frame.columns:
             raise ValueError(f"near_points: `panelvar2` ({panelvar2}) not in dataframe")
-        keep_rows &= new_df[panelvar2] == coordinfo["panelvar2"]  # pyright: ignore
+        panel_value = coordinfo["panelvar2"]  # pyright: ignore
+        keep_rows &= _equals(frame[panelvar2], panel_value)
 
     # Track the row indices to keep (note this is the row position, 0, 1, 2, not the
     # pandas index column, which can have arbitrary values).
-    keep_idx = np.where(keep_rows)[0]
+    keep_idx: IntpArray = np.flatnonzero(keep_rows)
 
     # Order by distance
-    dists = dists.iloc[keep_idx]
-    keep_idx: npt.NDArray[np.intp] = keep_idx[dists.argsort()]
+    keep_idx = keep_idx[np.argsort(dists[keep_idx], kind="stable")]
 
     # Keep max number of rows
     if max_points is not None and len(keep_idx) > max_points:
@@ -309,22 +331,475 @@ def near_points(
 
     if all_rows:
         # Add selected_ column if needed
-        new_df["selected_"] = False
-        new_df.iloc[  # pyright: ignore[reportArgumentType]
-            keep_idx,
-            new_df.columns.get_loc(  # pyright: ignore[reportUnknownMemberType]
-                "selected_"
-            ),
-        ] = True
+        selected = np.zeros(len(frame), dtype=bool)
+        selected[keep_idx] = True
+        frame = frame.with_columns(
+            _new_series(frame, "selected_", selected, nw.Boolean)
+        )
     else:
-        new_df = new_df.iloc[keep_idx]
+        frame = frame[keep_idx]
+
+    return _to_native_like(frame, df)
+
+
+class PointIndex:
+    """A reusable spatial index of the points in a data frame.
+
+    `near_points()` and `brushed_points()` look at every row of the data frame each
+    time they are called. For large data sets and frequently firing events (like
+    hovering), it is much cheaper to build a `PointIndex` once (for example, in a
+    `@reactive.calc` that depends only on the data) and query it for each event.
+
+    The index is built lazily, the first time a given combination of variables, log
+    scales, and panel is queried, and is then reused for every later event with the
+    same combination. Queries return row positions (not index labels), so the data
+    frame is never copied; use e.g. `df.iloc[rows]` (pandas) or `df[rows]` (polars) to
+    retrieve the matching rows.
+
+    Parameters
+    ----------
+    df
+        A data frame from which to select rows. Any eager data frame supported by
+        [narwhals](https://narwhals-dev.github.io/narwhals/) (e.g. pandas or polars)
+        can be used. The data frame must not be modified in place after the index is
+        created.
+    xvar
+        The name of the column in `df` that contains the x values. If `None`, it is
+        inferred from the event data, as in `near_points()`.
+    yvar
+        The name of the column in `df` that contains the y values.
+    panelvar1
+        The name of the column in `df` that contains the first variable used for
+        subpanels (if subpanels are used). If `None`, it is inferred from the event
+        data. Unlike `near_points()` and `brushed_points()`, which only keep the rows
+        of the event's panel when the panel variables are inferred, the rows are also
+        filtered by a supplied panel variable.
+    panelvar2
+        The name of the column in `df` that contains the second variable used for
+        subpanels.
+
+    Examples
+    --------
+    ```python
+    @reactive.calc
+    def index():
+        return plotutils.PointIndex(df)
+
+    @render.data_frame
+    def hovered():
+        return df.iloc[index().near(input.plot_hover())]
+    ```
+    """
+
+    def __init__(
+        self,
+        df: IntoDataFrame,
+        xvar: Optional[str] = None,
+        yvar: Optional[str] = None,
+        panelvar1: Optional[str] = None,
+        panelvar2: Optional[str] = None,
+    ) -> None:
+        self.df = df
+        self._frame: nw.DataFrame[Any] = nw.from_native(df, eager_only=True)
+        self._xvar = xvar
+        self._yvar = yvar
+        self._panelvar1 = panelvar1
+        self._panelvar2 = panelvar2
+        self._grids: dict[tuple[object, ...], _PointGrid] = {}
+
+    def near(
+        self,
+        coordinfo: CoordInfo | None,
+        *,
+        threshold: float = 5,
+        max_points: Optional[int] = None,
+    ) -> IntpArray:
+        """Find the row positions near a click/dblclick/hover event.
+
+        Parameters
+        ----------
+        coordinfo
+            The data from a click/dblclick/hover event, like `input.myplot_click()`.
+        threshold
+            A maximum distance (in pixels) to the pointer location.
+        max_points
+            Maximum number of row positions to return. If `None` (the default), will
+            return all rows within the threshold distance.
+
+        Returns
+        -------
+        :
+            The row positions of the selected points, ordered by their distance to the
+            pointer (closest first). Unless `panelvar1` or `panelvar2` were supplied to
+            `PointIndex()`, this is the same set of rows, in the same order, as
+            returned by `near_points()`.
+        """
+        import numpy as np
+
+        if coordinfo is None:
+            return np.empty(0, dtype=np.intp)
+
+        xvar, yvar = self._resolve_xy(coordinfo, "near")
+        log = coordinfo["log"]
+        grid = self._grid(coordinfo, xvar, yvar, log["x"], log["y"])
+
+        domain = coordinfo["domain"]
+        range = coordinfo["range"]
+        point_img: CoordXY = coordinfo["coords_img"]
+        ratio: CoordXY = coordinfo["img_css_ratio"]
+
+        # Translate the threshold circle (in css pixels) into a rectangle in the
+        # (possibly log-transformed) data space that the grid was built on.
+        xlo, xhi = _pixel_window_to_domain(
+            point_img["x"],
+            threshold * abs(ratio["x"]),
+            domain["left"],
+            domain["right"],
+            range["left"],
+            range["right"],
+        )
+        ylo, yhi = _pixel_window_to_domain(
+            point_img["y"],
+            threshold * abs(ratio["y"]),
+            domain["bottom"],
+            domain["top"],
+            range["bottom"],
+            range["top"],
+        )
+        rows, x, y = grid.within(xlo, xhi, ylo, yhi)
+
+        # Exact distances, computed the same way as `near_points()`, but only for the
+        # candidate points.
+        data_img_x = map_linear(
+            x, domain["left"], domain["right"], range["left"], range["right"]
+        )
+        data_img_y = map_linear(
+            y, domain["bottom"], domain["top"], range["bottom"], range["top"]
+        )
+        dists = (
+            ((data_img_x - point_img["x"]) / ratio["x"]) ** 2
+            + ((data_img_y - point_img["y"]) / ratio["y"]) ** 2
+        ) ** 0.5
+
+        keep = dists <= threshold
+        rows = rows[keep]
+        dists = dists[keep]
+
+        # Order by distance, breaking ties by row position
+        order = np.lexsort((rows, dists))
+        rows = rows[order]
+
+        if max_points is not None and len(rows) > max_points:
+            rows = rows[:max_points]
+
+        return rows
+
+    def brushed(self, brush: BrushInfo | None) -> IntpArray:
+        """Find the row positions under a brush.
+
+        Parameters
+        ----------
+        brush
+            The data from a brush, like `input.myplot_brush()`.
+
+        Returns
+        -------
+        :
+            The (sorted) row positions of the selected points. Unless `panelvar1` or
+            `panelvar2` were supplied to `PointIndex()`, this is the same set of rows
+            as returned by `brushed_points()`.
+        """
+        import numpy as np
+
+        if brush is None:
+            return np.empty(0, dtype=np.intp)
+
+        if "xmin" not in brush:
+            raise ValueError(
+                "PointIndex.brushed requires a brush object with xmin, xmax, ymin, and ymax."
+            )
+
+        use_x = "x" in brush["direction"]
+        use_y = "y" in brush["direction"]
+        xvar = self._resolve_var(brush, "x", "brushed") if use_x else None
+        yvar = self._resolve_var(brush, "y", "brushed") if use_y else None
+
+        grid = self._grid(brush, xvar, yvar, None, None)
+        rows, _, _ = grid.within(
+            brush["xmin"] if use_x else -math.inf,
+            brush["xmax"] if use_x else math.inf,
+            brush["ymin"] if use_y else -math.inf,
+            brush["ymax"] if use_y else math.inf,
+        )
+        return np.sort(rows)
+
+    # ---------------------------------------------------------------------------
+    # Internal helpers
+    # ---------------------------------------------------------------------------
+    def _resolve_var(
+        self,
+        info: CoordInfo | BrushInfo,
+        axis: Literal["x", "y"],
+        method: str,
+    ) -> str:
+        var = self._xvar if axis == "x" else self._yvar
+        if var is None:
+            var = info["mapping"].get(axis)
+        if var is None:
+            raise ValueError(
+                f"PointIndex.{method}: not able to automatically infer `{axis}var`. "
+                f"You must supply `{axis}var` to PointIndex()"
+            )
+        if var not in self._frame.columns:
+            raise ValueError(
+                f"PointIndex.{method}: `{axis}var` ('{var}') not in names of input."
+            )
+        return var
+
+    def _resolve_xy(self, info: CoordInfo | BrushInfo, method: str) -> tuple[str, str]:
+        return (
+            self._resolve_var(info, "x", method),
+            self._resolve_var(info, "y", method),
+        )
 
-    return new_df
+    def _panel_filters(
+        self, info: CoordInfo | BrushInfo
+    ) -> tuple[tuple[str, Any], ...]:
+        filters: list[tuple[str, Any]] = []
+        mapping = cast("dict[str, str]", info["mapping"])
+        values = cast("dict[str, Any]", info)
+        panelvar: Optional[str]
+        for panelvar_key, panelvar in (
+            ("panelvar1", self._panelvar1),
+            ("panelvar2", self._panelvar2),
+        ):
+            if panelvar is None:
+                panelvar = mapping.get(panelvar_key)
+            if panelvar is None or panelvar_key not in values:
+                continue
+            if panelvar not in self._frame.columns:
+                raise ValueError(
+                    f"PointIndex: `{panelvar_key}` ({panelvar}) not in dataframe"
+                )
+            filters.append((panelvar, values[panelvar_key]))
+        return tuple(filters)
+
+    def _grid(
+        self,
+        info: CoordInfo | BrushInfo,
+        xvar: Optional[str],
+        yvar: Optional[str],
+        logx: Optional[float],
+        logy: Optional[float],
+    ) -> _PointGrid:
+        import numpy as np
+
+        panel_filters = self._panel_filters(info)
+        key = (xvar, yvar, logx, logy, panel_filters)
+        grid = self._grids.get(key)
+        if grid is not None:
+            return grid
+
+        frame = self._frame
+        keep = np.ones(len(frame), dtype=bool)
+        for panelvar, value in panel_filters:
+            keep &= _equals(frame[panelvar], value)
+        rows = np.flatnonzero(keep)
+
+        def values(var: Optional[str], logbase: Optional[float]) -> FloatArray:
+            if var is None:
+                return np.zeros(len(rows), dtype=np.float64)
+            vals = _to_float_array(frame[var])[rows]
+            if logbase is not None:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    vals = np.log(vals) / np.log(logbase)
+            return vals
+
+        grid = _PointGrid(rows, values(xvar, logx), values(yvar, logy))
+        self._grids[key] = grid
+        return grid
+
+
+class _PointGrid:
+    """A uniform grid over 2-D points, answering within-rectangle queries.
+
+    Points are bucketed into roughly `sqrt(n)`-by-`sqrt(n)` cells (with a handful of
+    points per cell) and stored sorted by cell, so a rectangle query only touches the
+    points in the cells overlapping the rectangle. Non-finite coordinates can't be
+    bucketed; the few points that have them are checked on every query.
+    """
+
+    # Target number of points per grid cell
+    _points_per_cell = 8
+
+    def __init__(self, rows: IntpArray, x: FloatArray, y: FloatArray) -> None:
+        import numpy as np
+
+        finite = np.isfinite(x) & np.isfinite(y)
+        # NaN never matches any query; infinite values may (they are clipped to the
+        # plotting region), so keep them aside.
+        other = ~finite & ~np.isnan(x) & ~np.isnan(y)
+        self._other_rows = rows[other]
+        self._other_x = x[other]
+        self._other_y = y[other]
+
+        rows = rows[finite]
+        x = x[finite]
+        y = y[finite]
+        n = len(rows)
+
+        nbins = max(1, int(math.sqrt(n / self._points_per_cell)))
+        self._nx = self._ny = nbins
+        if n > 0:
+            self._xmin, self._xmax = float(x.min()), float(x.max())
+            self._ymin, self._ymax = float(y.min()), float(y.max())
+        else:
+            self._xmin = self._xmax = self._ymin = self._ymax = 0.0
+
+        cx = self._cell(x, self._xmin, self._xmax, self._nx)
+        cy = self._cell(y, self._ymin, self._ymax, self._ny)
+        cells = cy * self._nx + cx
+        order = np.argsort(cells, kind="stable")
+        self._rows = rows[order]
+        self._x = x[order]
+        self._y = y[order]
+        self._starts = np.searchsorted(cells[order], np.arange(self._nx * self._ny + 1))
+
+    @staticmethod
+    def _cell(vals: FloatArray, vmin: float, vmax: float, nbins: int) -> IntpArray:
+        import numpy as np
+
+        width = vmax - vmin
+        if width <= 0:
+            return np.zeros(len(vals), dtype=np.intp)
+        cell = ((vals - vmin) / width * nbins).astype(np.intp)
+        return np.clip(cell, 0, nbins - 1)
+
+    def _cell_range(
+        self, lo: float, hi: float, vmin: float, vmax: float, nbins: int
+    ) -> tuple[int, int] | None:
+        if hi < vmin or lo > vmax or lo > hi:
+            return None
+        width = vmax - vmin
+        if width <= 0:
+            return 0, 0
+        lo_cell = 0 if lo <= vmin else min(int((lo - vmin) / width * nbins), nbins - 1)
+        hi_cell = (
+            nbins - 1
+            if hi >= vmax
+            else min(int((hi - vmin) / width * nbins), nbins - 1)
+        )
+        return lo_cell, hi_cell
+
+    def within(
+        self, xlo: float, xhi: float, ylo: float, yhi: float
+    ) -> tuple[IntpArray, FloatArray, FloatArray]:
+        """Return the rows (and their x/y values) inside the (closed) rectangle."""
+        import numpy as np
+
+        idx: IntpArray = np.empty(0, dtype=np.intp)
+        xr = self._cell_range(xlo, xhi, self._xmin, self._xmax, self._nx)
+        yr = self._cell_range(ylo, yhi, self._ymin, self._ymax, self._ny)
+        if len(self._rows) > 0 and xr is not None and yr is not None:
+            # Cells are stored row-major, so each row of cells overlapping the
+            # rectangle is one contiguous slice of the sorted points.
+            slices: list[IntpArray] = [
+                np.arange(
+                    self._starts[cy * self._nx + xr[0]],
+                    self._starts[cy * self._nx + xr[1] + 1],
+                )
+                for cy in range(yr[0], yr[1] + 1)
+            ]
+            idx = np.concatenate(slices)
+
+        rows = np.concatenate((self._rows[idx], self._other_rows))
+        x = np.concatenate((self._x[idx], self._other_x))
+        y = np.concatenate((self._y[idx], self._other_y))
+        keep = (x >= xlo) & (x <= xhi) & (y >= ylo) & (y <= yhi)
+        return rows[keep], x[keep], y[keep]
+
+
+# Convert a window of +/- `radius` image pixels around `center` (in image pixels) to
+# the matching (lo, hi) window in the domain. Since points outside of the domain are
+# clipped to its edge, a window that reaches an edge extends to infinity past it.
+def _pixel_window_to_domain(
+    center: float,
+    radius: float,
+    domain_min: float,
+    domain_max: float,
+    range_min: float,
+    range_max: float,
+) -> tuple[float, float]:
+    factor = (range_max - range_min) / (domain_max - domain_min)
+    a = (center - radius - range_min) / factor + domain_min
+    b = (center + radius - range_min) / factor + domain_min
+    # Pad the window slightly so that rounding can't exclude a point lying exactly
+    # on the threshold; candidates are checked exactly afterwards.
+    pad = abs(b - a) * 1e-9 + abs(domain_max - domain_min) * 1e-12
+    lo, hi = min(a, b) - pad, max(a, b) + pad
+    if lo <= min(domain_min, domain_max):
+        lo = -math.inf
+    if hi >= max(domain_min, domain_max):
+        hi = math.inf
+    return lo, hi
 
 
 # ===============================================================================
 # Helper functions
 # ===============================================================================
+# Return `frame` as the same kind of object as `like`: either a narwhals frame, or the
+# native (e.g. pandas or polars) frame that it wraps.
+def _to_native_like(frame: Any, like: Any) -> Any:
+    if isinstance(like, (nw.DataFrame, nw.LazyFrame)):
+        return frame
+    return nw.to_native(frame)
+
+
+def _new_series(
+    frame: nw.DataFrame[Any], name: str, values: Any, dtype: Any
+) -> nw.Series:
+    return nw.new_series(
+        name,
+        values,
+        dtype,
+        native_namespace=nw.get_native_namespace(frame),
+    )
+
+
+# Combine boolean conditions (expressions and/or Series) with `&`, treating missing
+# values as `False`.
+def _all_horizontal(
+    frame: nw.DataFrame[Any] | nw.LazyFrame[Any],
+    conditions: Sequence[nw.Expr | nw.Series],
+) -> nw.Expr | nw.Series:
+    exprs = [cond for cond in conditions if isinstance(cond, nw.Expr)]
+    series = [cond for cond in conditions if isinstance(cond, nw.Series)]
+    if len(series) == 0:
+        combined = nw.lit(True)
+        for expr in exprs:
+            combined = combined & expr
+        return combined.fill_null(False)
+
+    # At least one condition could only be computed eagerly, so evaluate everything.
+    import numpy as np
+
+    eager = cast("nw.DataFrame[Any]", frame)
+    mask = np.ones(len(eager), dtype=bool)
+    for cond in series:
+        mask &= cond.fill_null(False).to_numpy().astype(bool)
+    if len(exprs) > 0:
+        mask &= (
+            eager.select(_all_horizontal(eager, exprs).alias("keep"))["keep"]
+            .to_numpy()
+            .astype(bool)
+        )
+    return _new_series(eager, "keep", mask, nw.Boolean)
+
+
+def _equals(col: nw.Series, value: Any) -> npt.NDArray[np.bool_]:
+    return (col == value).fill_null(False).to_numpy().astype(bool)
+
+
 # Helper to determine if data values are within the limits of
 # an input brush.
 def within_brush(
@@ -336,38 +811,137 @@ def within_brush(
     return (vals >= brush[var + "min"]) & (vals <= brush[var + "max"])
 
 
-def to_float(x: DataFrameColumn) -> pd.Series[float]:
-    import pandas as pd
-    import pandas.api.types as ptypes
+# Whether the values of column `var` are within the brush: an expression when possible
+# (so lazy frames stay lazy), or a boolean Series otherwise
+def _within_brush(
+    frame: nw.DataFrame[Any] | nw.LazyFrame[Any],
+    var: str,
+    brush: BrushInfo,
+    axis: Literal["x", "y"] = "x",
+) -> nw.Expr | nw.Series:
+    lo = brush[axis + "min"]
+    hi = brush[axis + "max"]
+
+    dtype = frame.collect_schema()[var]
+    vals = _float_expr(var, dtype)
+    if vals is not None:
+        # NaN compares as larger than every number in some backends (e.g. polars)
+        return (vals >= lo) & (vals <= hi) & ~vals.is_nan()
+
+    if isinstance(frame, nw.LazyFrame):
+        raise ValueError(
+            f"brushed_points: the dtype of `{var}` ({dtype}) is only supported for eager "
+            "data frames. Collect the data frame before calling brushed_points()."
+        )
+
+    # NumPy fallback
+    float_vals = _to_float_array(frame[var])
+    return _new_series(frame, var, (float_vals >= lo) & (float_vals <= hi), nw.Boolean)
+
+
+_ns_per_day = 24 * 60 * 60 * 1e9
+
 
-    """Convert int/float/str/categorical Series to a float Series.
+# An expression converting a column to floats (the same values as `_to_float_array()`), or
+# `None` if that can't be done with an expression.
+def _float_expr(var: str, dtype: Any) -> nw.Expr | None:
+    if dtype.is_numeric():
+        return nw.col(var).cast(nw.Float64)
+    if isinstance(dtype, (nw.Datetime, nw.Date)):
+        # We need to convert the datetimes to matplotlib datetimes, which are in days
+        # since epoch.
+        return nw.col(var).dt.timestamp("ns").cast(nw.Float64) / _ns_per_day
+    return None
 
-    If the input is a int or float Series, this returns a copy. Otherwise, it returns a
-    new Series object.
+
+def to_float(x: DataFrameColumn) -> pd.Series[float]:
+    """Convert a int/float/str/categorical/datetime Series to a float Series.
+
+    If the input is a int or float Series, this returns it as is. Otherwise, it returns
+    a new Series object of the same type (for pandas, with the same index).
     """
-    if ptypes.is_numeric_dtype(x):  # pyright: ignore[reportUnknownMemberType]
+    try:
+        col: nw.Series = nw.from_native(x, series_only=True, allow_series=True)
+    except TypeError:
+        # E.g. a `pd.DatetimeIndex` or `pd.Categorical`
+        import pandas as pd
+
+        return to_float(pd.Series(x))
+
+    if col.dtype.is_numeric():
         return cast("pd.Series[float]", x)
-    elif isinstance(x, ptypes.CategoricalDtype):
-        return cast("pd.Series[float]", x.cat.codes + 1)  # pyright: ignore
-    elif ptypes.is_string_dtype(x):  # pyright: ignore[reportUnknownMemberType]
-        return cast(
-            "pd.Series[float]", x.astype("category").cat.codes + 1  # pyright: ignore
-        )
-    elif ptypes.is_datetime64_any_dtype(x):  # pyright: ignore[reportUnknownMemberType]
-        # We need to convert the pandas datetimes, which are in nanoseconds since epoch,
-        # to matplotlib datetimes, which are in days since epoch..
-        return (
-            cast(
-                "pd.Series[int]",
-                pd.Series(x.astype("int64")),  # pyright: ignore
-            )
-            / (24 * 60 * 60)
-            / 1e9
-        )
+
+    vals = _to_float_array(col)
+    native = col.to_native()
+    if _is_pandas_series(native):
+        import pandas as pd
+
+        return pd.Series(vals, index=native.index, name=native.name)
+    return cast(
+        "pd.Series[float]",
+        nw.new_series(
+            col.name, vals, nw.Float64, native_namespace=nw.get_native_namespace(col)
+        ).to_native(),
+    )
+
+
+def _is_pandas_series(x: object) -> bool:
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(x, pd.Series)
+
+
+def _to_float_array(x: DataFrameColumn) -> FloatArray:
+    """Convert a int/float/str/categorical/datetime Series to a float array.
+
+    `x` can be any Series supported by narwhals (e.g. a pandas or polars Series). For
+    numeric Series without missing values, this is usually zero-copy. Missing values
+    become NaN.
+    """
+    import numpy as np
+
+    col: nw.Series = nw.from_native(x, series_only=True, allow_series=True)
+    dtype = col.dtype
+
+    if dtype.is_numeric():
+        if col.null_count() > 0:
+            col = col.cast(nw.Float64).fill_null(float("nan"))
+        return np.asarray(col.to_numpy(), dtype=np.float64)
+
+    elif isinstance(dtype, (nw.Categorical, nw.Enum)):
+        # Codes of the categories (in category order), starting at 1
+        categories = np.asarray(col.cat.get_categories().to_list(), dtype=object)
+        return _codes(col.cast(nw.String), categories)
+
+    elif isinstance(dtype, nw.String):
+        # Codes of the (sorted) unique values, starting at 1
+        return _codes(col, None)
+
+    elif isinstance(dtype, (nw.Datetime, nw.Date)):
+        # We need to convert the datetimes, which are in nanoseconds since epoch,
+        # to matplotlib datetimes, which are in days since epoch.
+        days = col.dt.timestamp("ns").cast(nw.Float64) / _ns_per_day
+        return _to_float_array(days)
 
     raise ValueError("to_float: unsupported dtype for x")
 
 
+def _codes(col: nw.Series, categories: npt.NDArray[Any] | None) -> FloatArray:
+    import numpy as np
+
+    is_null = col.is_null().to_numpy().astype(bool)
+    vals = np.asarray(col.to_numpy(), dtype=object)
+    present = vals[~is_null].astype(str)
+    if categories is None:
+        categories = np.unique(present)
+    categories = categories.astype(str)
+
+    sorter = np.argsort(categories, kind="stable")
+    pos = np.searchsorted(categories, present, sorter=sorter)
+    codes = np.zeros(len(vals), dtype=np.float64)
+    codes[~is_null] = sorter[pos] + 1
+    return codes
+
+
 # ===============================================================================
 # Scaling functions
 # ===============================================================================
@@ -378,16 +952,16 @@ def to_float(x: DataFrameColumn) -> pd.Series[float]:
 # Map a value x from a domain to a range. If clip is true, clip it to the
 # range.
 def map_linear(
-    x: pd.Series[float],
+    x: FloatArray,
     domain_min: float,
     domain_max: float,
     range_min: float,
     range_max: float,
     clip: bool = True,
-) -> pd.Series[float]:
+) -> FloatArray:
     factor = (range_max - range_min) / (domain_max - domain_min)
-    val: pd.Series[float] = x - domain_min
-    newval: pd.Series[float] = (val * factor) + range_min
+    val: FloatArray = x - domain_min
+    newval: FloatArray = (val * factor) + range_min
 
     if clip:
         maxval = max(range_max, range_min)
@@ -400,18 +974,19 @@ def map_linear(
 
 # Scale val from domain to range. If logbase is present, use log scaling.
 def scale_1d(
-    val: pd.Series[float],
+    val: FloatArray,
     domain_min: float,
     domain_max: float,
     range_min: float,
     range_max: float,
     logbase: Optional[float] = None,
     clip: bool = True,
-) -> pd.Series[float]:
+) -> FloatArray:
     import numpy as np
 
     if logbase is not None:
-        val = np.log(val) / np.log(logbase)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            val = np.log(val) / np.log(logbase)
 
     return map_linear(val, domain_min, domain_max, range_min, range_max, clip)
 
@@ -421,10 +996,10 @@ def scale_1d(
 # corresponds to one element from the coordmap object generated by getPrevPlotCoordmap
 # or getGgplotCoordmap; it is the scaling information for one panel in a plot.
 def scale_coords(
-    x: pd.Series[float],
-    y: pd.Series[float],
+    x: FloatArray,
+    y: FloatArray,
     coordinfo: CoordInfo,
-) -> SeriesFloatXY:
+) -> ArrayFloatXY:
     domain = coordinfo["domain"]
     range = coordinfo["range"]
     log = coordinfo["log"]
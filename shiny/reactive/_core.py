@@ -42,11 +42,23 @@ warnings.simplefilter("always", ReactiveWarning)
 class Context:
     """A reactive context"""
 
+    __slots__ = (
+        "id",
+        "_invalidated",
+        "_invalidate_callbacks",
+        "_flush_callbacks",
+        "_dependencies",
+    )
+
     def __init__(self) -> None:
         self.id: int = _reactive_environment.next_id()
         self._invalidated: bool = False
-        self._invalidate_callbacks: list[Callable[[], None]] = []
-        self._flush_callbacks: list[Callable[[], Awaitable[None]]] = []
+        # Callback lists are created on first use; most contexts never need them
+        self._invalidate_callbacks: Optional[list[Callable[[], None]]] = None
+        self._flush_callbacks: Optional[list[Callable[[], Awaitable[None]]]] = None
+        # The `Dependents` this context is registered with, so that it can remove
+        # itself from them when invalidated
+        self._dependencies: Optional[list[Dependents]] = None
 
     def __call__(self) -> typing.ContextManager[None]:
         return _reactive_environment.use_context(self)
@@ -60,15 +72,24 @@ class Context:
 
         self._invalidated = True
 
-        for cb in self._invalidate_callbacks:
-            cb()
+        dependencies = self._dependencies
+        if dependencies is not None:
+            self._dependencies = None
+            for dependents in dependencies:
+                dependents._dependents.pop(self.id, None)
 
-        self._invalidate_callbacks.clear()
+        callbacks = self._invalidate_callbacks
+        if callbacks is not None:
+            self._invalidate_callbacks = None
+            for cb in callbacks:
+                cb()
 
     def on_invalidate(self, func: Callable[[], None]) -> None:
         """Register a function to be called when this context is invalidated"""
         if self._invalidated:
             func()
+        elif self._invalidate_callbacks is None:
+            self._invalidate_callbacks = [func]
         else:
             self._invalidate_callbacks.append(func)
 
@@ -79,43 +100,90 @@ class Context:
 
     def on_flush(self, func: Callable[[], Awaitable[None]]) -> None:
         """Register a function to be called when this context is flushed."""
-        self._flush_callbacks.append(func)
+        if self._flush_callbacks is None:
+            self._flush_callbacks = [func]
+        else:
+            self._flush_callbacks.append(func)
 
     async def execute_flush_callbacks(self) -> None:
         """Execute all flush callbacks"""
-        for cb in self._flush_callbacks:
+        callbacks = self._flush_callbacks
+        if callbacks is None:
+            return
+
+        for cb in callbacks:
             await cb()
 
-        self._flush_callbacks.clear()
+        callbacks.clear()
 
 
 class Dependents:
+    """
+    The contexts that depend on a reactive object.
+
+    Each edge of the reactive graph is stored twice: the context is stored here (keyed
+    by its id), and this object is stored in the context's list of dependencies, so the
+    context can remove itself when it is invalidated.
+    """
+
+    __slots__ = ("_dependents", "_max_id", "_ordered")
+
     def __init__(self) -> None:
         self._dependents: dict[int, Context] = {}
+        # Contexts are usually registered in the order they were created, in which case
+        # the dict is already in id order and doesn't need to be sorted on invalidation
+        self._max_id: int = -1
+        self._ordered: bool = True
 
     def register(self) -> None:
         ctx: Context = get_current_context()
 
-        if ctx.id in self._dependents:
+        if ctx._invalidated:
+            # An invalidated context won't be invalidated again, so there's no need to
+            # keep track of it.
+            return
+
+        ctx_id = ctx.id
+        dependents = self._dependents
+        if ctx_id in dependents:
             # This context is already registered; no need to register it.
             return
 
-        self._dependents[ctx.id] = ctx
+        if not dependents:
+            # Start over once all of the previous dependents have been removed
+            self._max_id = -1
+            self._ordered = True
 
-        def on_invalidate_cb() -> None:
-            if ctx.id in self._dependents:
-                del self._dependents[ctx.id]
+        dependents[ctx_id] = ctx
+        if ctx_id > self._max_id:
+            self._max_id = ctx_id
+        else:
+            self._ordered = False
 
-        ctx.on_invalidate(on_invalidate_cb)
+        if ctx._dependencies is None:
+            ctx._dependencies = [self]
+        else:
+            ctx._dependencies.append(self)
 
     def invalidate(self) -> None:
-        # TODO: Check sort order
-        # Invalidate all dependents. This gets all the dependents as list, then iterates
-        # over the list. It's done this way instead of iterating over keys because it's
-        # possible that a dependent is removed from the dict while iterating over it.
+        # Invalidate all dependents, in the order in which they were created. The
+        # dependents are swapped out before iterating, because invalidating a context
+        # removes it from `self._dependents`.
         # https://github.com/posit-dev/py-shiny/issues/26
-        ids = sorted(self._dependents.keys())
-        for dep_ctx in [self._dependents[id] for id in ids]:
+        dependents = self._dependents
+        if not dependents:
+            return
+
+        ordered = self._ordered
+        self._dependents = {}
+        self._max_id = -1
+        self._ordered = True
+
+        if ordered:
+            contexts = dependents.values()
+        else:
+            contexts = [dependents[id] for id in sorted(dependents)]
+        for dep_ctx in contexts:
             dep_ctx.invalidate()
 
 
@@ -180,8 +248,7 @@ class ReactiveEnvironment:
     async def _flush_sequential(self) -> None:
         # Sequential flush: instead of storing the tasks in a list and calling gather()
         # on them later, just run each effect in sequence.
-        while not self._pending_flush_queue.empty():
-            ctx = self._pending_flush_queue.get()
+        for ctx in self._pending_flush_queue.drain():
             await ctx.execute_flush_callbacks()
 
     def add_pending_flush(self, ctx: Context, priority: int) -> None:
@@ -21,6 +21,7 @@ import traceback
 import warnings
 from typing import (
     TYPE_CHECKING,
+    Any,
     Awaitable,
     Callable,
     Generic,
@@ -48,6 +49,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# A function that's called with each new `Value` and `Calc_`. It's set by
+# `shiny.session._memory` when memory accounting is enabled.
+_track_node: Optional[Callable[[Value[Any] | Calc_[Any]], None]] = None
+
 
 # ==============================================================================
 # Value
@@ -99,6 +104,14 @@ class Value(Generic[T]):
     * :func:`~shiny.reactive.effect`
     """
 
+    __slots__ = (
+        "_value",
+        "_read_only",
+        "_value_dependents",
+        "_is_set_dependents",
+        "__weakref__",
+    )
+
     # These overloads are necessary so that the following hold:
     # - Value() is marked by the type checker as an error, because the type T is
     #   unknown. (It is not a run-time error.)
@@ -123,6 +136,9 @@ class Value(Generic[T]):
         self._value_dependents: Dependents = Dependents()
         self._is_set_dependents: Dependents = Dependents()
 
+        if _track_node is not None:
+            _track_node(self)
+
     def __call__(self) -> T:
         return self.get()
 
@@ -256,6 +272,8 @@ class Calc_(Generic[T]):
         # passed an async function, it will not change it.
         self._fn: CalcFunctionAsync[T] = _utils.wrap_async(fn)
         self._is_async: bool = _utils.is_async_callable(fn)
+        # Sync functions are also run directly (see `__call__()`), without coroutines
+        self._fn_sync: Optional[CalcFunction[T]] = None if self._is_async else fn
 
         self._dependents: Dependents = Dependents()
         self._invalidated: bool = True
@@ -283,14 +301,40 @@ class Calc_(Generic[T]):
         # Optional[T].
         self._value: list[T] = []
         self._error: list[Exception] = []
+        # Whether the value was evicted, and how to restore it without recomputing it
+        # (see `_evict_value()`)
+        self._evicted: bool = False
+        self._restore: Optional[Callable[[], T]] = None
+
+        if _track_node is not None:
+            _track_node(self)
 
     def __call__(self) -> T:
-        # Run the Coroutine (synchronously), and then return the value.
-        # If the Coroutine yields control, then an error will be raised.
-        return _utils.run_coro_sync(self.get_value())
+        if self._fn_sync is None:
+            # Run the Coroutine (synchronously), and then return the value.
+            # If the Coroutine yields control, then an error will be raised.
+            return _utils.run_coro_sync(self.get_value())
+
+        # Same as `get_value()`, but without creating coroutines
+        if self._evicted:
+            self._update_value_sync(self._fn_sync)
+        self._dependents.register()
+
+        if self._invalidated or self._running:
+            self._update_value_sync(self._fn_sync)
+
+        if self._error:
+            raise self._error[0]
+
+        return self._value[0]
 
     # TODO: should this be private?
     async def get_value(self) -> T:
+        if self._evicted:
+            # Get an evicted value back before registering the caller, so that it isn't
+            # invalidated along with the calc's other dependents (if the value is
+            # recomputed)
+            await self.update_value()
         self._dependents.register()
 
         if self._invalidated or self._running:
@@ -303,13 +347,10 @@ class Calc_(Generic[T]):
 
     # TODO: should this be private?
     async def update_value(self) -> None:
-        self._ctx = Context()
-        self._most_recent_ctx_id = self._ctx.id
-
-        self._ctx.on_invalidate(self._on_invalidate_cb)
+        if self._restore is not None and self._restore_value():
+            return
 
-        self._exec_count += 1
-        self._invalidated = False
+        ctx = self._start_update()
 
         was_running = self._running
         self._running = True
@@ -318,13 +359,101 @@ class Calc_(Generic[T]):
 
         with session_context(self._session):
             try:
-                with self._ctx():
+                with ctx():
                     await self._run_func()
             finally:
                 self._running = was_running
 
+    def _update_value_sync(self, fn: CalcFunction[T]) -> None:
+        if self._restore is not None and self._restore_value():
+            return
+
+        ctx = self._start_update()
+
+        was_running = self._running
+        self._running = True
+
+        from ..session import session_context
+
+        with session_context(self._session):
+            try:
+                with ctx():
+                    self._error.clear()
+                    try:
+                        self._value.append(fn())
+                    except Exception as err:
+                        self._error.append(err)
+            finally:
+                self._running = was_running
+
+    def _start_update(self) -> Context:
+        if self._evicted and self._ctx is not None:
+            # The recomputed value may differ from the evicted one (e.g., if the calc
+            # reads the time), so the old context is invalidated, along with the calc's
+            # dependents, as if its dependencies had changed
+            self._ctx.invalidate()
+
+        ctx = self._ctx = Context()
+        self._most_recent_ctx_id = ctx.id
+
+        ctx.on_invalidate(self._on_invalidate_cb)
+
+        self._exec_count += 1
+        self._invalidated = False
+        return ctx
+
+    def _evict_value(
+        self, offload: Optional[Callable[[T], Callable[[], T]]] = None
+    ) -> bool:
+        """
+        Drop the cached value, so that it's recomputed the next time it's read.
+
+        Unlike invalidation, this doesn't invalidate the calc's dependents right away,
+        because its dependencies haven't changed; they're invalidated when the value is
+        recomputed, since it may differ. If `offload` is provided, it's called with the
+        value (e.g., to write it to disk), and the function it returns is called to
+        restore the value the next time it's read, instead of recomputing it (which
+        keeps the dependents). Returns whether a value was dropped.
+        """
+        if self._ctx is None or self._invalidated or self._running or not self._value:
+            return False
+
+        if offload is not None:
+            try:
+                self._restore = offload(self._value[0])
+            except Exception:
+                # The value can't be offloaded, so it'll be recomputed
+                self._restore = None
+
+        self._value.clear()
+        self._evicted = True
+        self._invalidated = True
+        return True
+
+    def _restore_value(self) -> bool:
+        """
+        Restore an offloaded value (see `_evict_value()`). Returns whether the value
+        was restored; if not, it needs to be recomputed.
+        """
+        restore = self._restore
+        self._restore = None
+        if restore is None:
+            return False
+
+        try:
+            value = restore()
+        except Exception:
+            return False
+
+        self._value.append(value)
+        self._evicted = False
+        self._invalidated = False
+        return True
+
     def _on_invalidate_cb(self) -> None:
         self._invalidated = True
+        self._evicted = False
+        self._restore = None
         self._value.clear()  # Allow old value to be GC'd
         self._dependents.invalidate()
         self._ctx = None  # Allow context to be GC'd
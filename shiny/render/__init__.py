@@ -2,20 +2,12 @@
 Tools for reactively rendering output for the user interface.
 """
 
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_getattr
 from . import (  # noqa: F401
     transformer,  # pyright: ignore[reportUnusedImport]
 )
-from ._data_frame import (
-    CellPatch,
-    CellValue,
-    DataGrid,
-    DataTable,
-    data_frame,
-)
-from ._data_frame_utils._selection import CellSelection
-from ._data_frame_utils._types import (  # noqa: F401
-    StyleInfo,
-)
 from ._deprecated import (  # noqa: F401
     RenderFunction,  # pyright: ignore[reportUnusedImport]
     RenderFunctionAsync,  # pyright: ignore[reportUnusedImport]
@@ -33,6 +25,31 @@ from ._render import (
     ui,
 )
 
+if TYPE_CHECKING:
+    from ._data_frame import (
+        CellPatch,
+        CellValue,
+        DataGrid,
+        DataTable,
+        data_frame,
+    )
+    from ._data_frame_utils._selection import CellSelection
+    from ._data_frame_utils._types import StyleInfo
+else:
+    # Data frame rendering depends on `narwhals`, so only import it when it's used
+    __getattr__ = lazy_getattr(
+        __name__,
+        {
+            "CellPatch": "._data_frame",
+            "CellValue": "._data_frame",
+            "DataGrid": "._data_frame",
+            "DataTable": "._data_frame",
+            "data_frame": "._data_frame",
+            "CellSelection": "._data_frame_utils._selection",
+            "StyleInfo": "._data_frame_utils._types",
+        },
+    )
+
 __all__ = (
     # TODO-future: Document which variables are exposed via different import approaches
     "data_frame",
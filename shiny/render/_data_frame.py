@@ -16,9 +16,11 @@ from ..session._utils import require_active_session, session_context
 from ..types import JsonifiableDict, ListOrTuple
 from ._data_frame_utils._datagridtable import DataGrid, DataTable
 from ._data_frame_utils._html import maybe_as_cell_html
+from ._data_frame_utils._indices import as_index_array
 from ._data_frame_utils._patch import (
     CellPatch,
     CellValue,
+    PatchedFrame,
     PatchesFn,
     PatchesFnSync,
     PatchFn,
@@ -32,16 +34,24 @@ from ._data_frame_utils._selection import (
     SelectionModes,
     as_cell_selection,
 )
-from ._data_frame_utils._styles import as_browser_style_infos
+from ._data_frame_utils._sort_filter import SortFilterEngine
+from ._data_frame_utils._styles import (
+    as_browser_style_infos,
+    drop_browser_style_info_rows,
+    encode_browser_style_infos,
+    window_browser_style_infos,
+)
 from ._data_frame_utils._tbl_data import (
-    apply_frame_patches,
     as_data_frame,
+    as_lazy_frame,
     assert_data_is_not_none,
+    collect_lazy_frame,
     data_frame_to_native,
     serialize_frame,
     subset_frame,
 )
 from ._data_frame_utils._types import (
+    BrowserStyleInfo,
     CellPatchProcessed,
     ColumnFilter,
     ColumnSort,
@@ -57,6 +67,7 @@ from .renderer import Jsonifiable, Renderer, ValueFn
 
 if TYPE_CHECKING:
     from ..session import Session
+    from ._data_frame_utils._indices import IndexArray
 
 
 @add_example()
@@ -83,6 +94,12 @@ class data_frame(
            object. This object will be internally upgraded to a default
            `shiny.render.DataGrid(df)`.
 
+        A lazy frame supported by narwhals (e.g. a polars `LazyFrame` or a DuckDB
+        relation) may be used in place of a `DataFrame`. Only the rows that are shown
+        (see `max_rows` of :class:`~shiny.render.DataGrid`) are collected, after adding
+        the user's sorting and filtering to its query, and the methods below (e.g.
+        `.data()`) return the collected data frame. Lazy frames can't be edited.
+
     Row selection
     -------------
     When using the row selection feature, you can access the selected rows by using the
@@ -139,6 +156,9 @@ class data_frame(
           user's sorting and filtering applied. It represents the data frame as viewed
           by the user within the browser.
         * If `selected=True`, only the selected rows are returned.
+    * `.data_view_indices(*, selected: bool)`:
+        * Reactive function that returns the row numbers of `.data_view()` as a NumPy
+          array.
     * `.update_cell_value(value, row, col)`:
         * Sets a new entry in `.cell_patches()`.
         * Calling this method will **not** reset the user's sorting or filtering.
@@ -196,6 +216,24 @@ class data_frame(
     """
     Reactive value of the data frame's updated data value object.
     """
+    _data_window: reactive.Value[IntoDataFrameT]
+    """
+    Reactive value of the collected rows of a lazy frame, as shown in the browser.
+    Unset for other data.
+    """
+    _data_window_sort_filter: tuple[tuple[ColumnSort, ...], tuple[ColumnFilter, ...]]
+    """
+    The sorting and filtering that were added to the lazy frame's query to collect
+    `._data_window()`.
+    """
+    _data_window_rows: reactive.Value[IndexArray | None]
+    """
+    Reactive value of the rows of `.data_patched()` that were sent to the browser, in
+    order, when a data frame is sorted and filtered on the server (see
+    `server_sort_filter` of :class:`~shiny.render.DataGrid`). `None` when the browser
+    has every row. The browser's row numbers (e.g. of its cell selection and edits) are
+    positions within these rows.
+    """
 
     def _req_value(self):
         """
@@ -223,6 +261,10 @@ class data_frame(
         the data frame supplied to `.update_data(data)`, whichever has been most
         recently set.
 
+        For a lazy frame, this is the data frame of its collected rows: at most
+        `max_rows` rows (see :class:`~shiny.render.DataGrid`), after the user's
+        sorting and filtering. A warning is shown when the lazy frame has more rows.
+
         The returned value is a shallow copy of the original data frame. It is possible
         that alterations to the `.data()` data frame could alter other associated data
         frame values. Please be cautious when using this value directly.
@@ -234,6 +276,11 @@ class data_frame(
             or the data frame supplied to `.update_data(data)`, whichever has been most
             recently set.
         """
+        # A lazy frame's collected rows (those shown in the browser) are used in its
+        # place
+        if self._data_window.is_set():
+            return self._data_window()
+
         # iff updated data exists, return it
         # Can be unset on a followup render call
         if self._updated_data.is_set():
@@ -303,15 +350,39 @@ class data_frame(
     patches with updated values.
     """
 
-    _cell_patch_map: reactive.Value[dict[tuple[int, int], CellPatch]]
+    _patched_frame: PatchedFrame[IntoDataFrameT]
+    """
+    The patches to be applied to the data frame and the incrementally updated patched
+    data frame.
     """
-    Reactive dictionary of patches to be applied to the data frame.
 
-    This map is used for faster deduplications of patches at each location given the row
-    and column indices.
+    _cell_patch_version: reactive.Value[int]
+    """
+    Reactive version of `._patched_frame`'s patches. Updated whenever the patches
+    change.
+    """
 
-    The key is defined as `(row_index, column_index)`.
+    _browser_styles: list[BrowserStyleInfo] | None
     """
+    The styles last sent to the browser, for the rows of `.data_patched()` (even when
+    only some of its rows were sent).
+    """
+
+    @reactive_calc_method
+    def _cell_patch_map(self) -> dict[tuple[int, int], CellPatch]:
+        """
+        Reactive dictionary of patches to be applied to the data frame.
+
+        This map is used for faster deduplications of patches at each location given
+        the row and column indices.
+
+        The key is defined as `(row_index, column_index)`.
+
+        A new dictionary is returned whenever the patches change, so a returned
+        dictionary is never modified by later edits.
+        """
+        self._cell_patch_version()
+        return dict(self._patched_frame.patches)
 
     @reactive_calc_method
     def cell_patches(self) -> list[CellPatch]:
@@ -339,7 +410,9 @@ class data_frame(
         :
             The data frame with all the user's edit patches applied to it.
         """
-        return apply_frame_patches(self._nw_data(), self.cell_patches())
+        self._cell_patch_version()
+        # Only the patches added since the last calculation are applied
+        return self._patched_frame.apply(self._nw_data())
 
     @reactive_calc_method
     def data_patched(self) -> IntoDataFrameT:
@@ -393,12 +466,10 @@ class data_frame(
             data.
         """
 
-        if selected:
-            rows = self.cell_selection()["rows"]
-        else:
-            rows = self.data_view_rows()
-
-        nw_data = subset_frame(self._nw_data_patched(), rows=rows)
+        nw_data = subset_frame(
+            self._nw_data_patched(),
+            rows=self.data_view_indices(selected=selected),
+        )
 
         patched_subsetted_into_data = self._nw_data_to_original_type(nw_data)
 
@@ -435,7 +506,11 @@ class data_frame(
 
         This function will return the `.data_patched()` data frame with the user's
         sorting and filtering applied. It represents the data frame as viewed by the
-        user within the browser.
+        user within the browser. For a lazy frame, it only contains the rows that were
+        collected (see `.data()`). For a data frame that is sorted and filtered on the
+        server (see `server_sort_filter` of :class:`~shiny.render.DataGrid`), it
+        contains all of the sorted and filtered rows, not only those sent to the
+        browser.
 
         The returned value is a shallow copy of the original data frame. It is possible
         that alterations to the `.data_view()` data frame could alter other associated
@@ -509,6 +584,15 @@ class data_frame(
             data_view_cols=tuple(range(self._nw_data().shape[1])),
         )
 
+        window_rows = self._data_window_rows()
+        if window_rows is not None and cell_selection["type"] in ("row", "rect"):
+            # The browser's rows are positions within the rows it was sent
+            cell_selection["rows"] = tuple(
+                int(window_rows[row])
+                for row in cell_selection["rows"]
+                if row < len(window_rows)
+            )
+
         return cell_selection
 
     @reactive_calc_method
@@ -519,17 +603,78 @@ class data_frame(
         This value is a wrapper around `input.<id>_data_view_rows()`, where `<id>` is the
         `id` of the data frame output.
 
+        If the data frame is sorted and filtered on the server (see
+        `server_sort_filter` of :class:`~shiny.render.DataGrid`), the row numbers are
+        instead calculated on the server from `.sort()` and `.filter()`, and include
+        the rows that were not sent to the browser.
+
         Returns
         -------
         :
             The row numbers of the data frame that are currently being viewed in the browser
             after sorting and filtering has been applied.
+
+        See Also
+        --------
+        * `.data_view_indices()` returns the same row numbers as a NumPy array.
         """
+        if self._data_window_rows() is not None:
+            return tuple(self._data_view_indices_all().tolist())
+
         input_data_view_rows = self._get_session().input[
             f"{self.output_id}_data_view_rows"
         ]()
         return tuple(input_data_view_rows)
 
+    @reactive_calc_method
+    def _sort_filter_engine(self) -> SortFilterEngine[IntoDataFrameT]:
+        return SortFilterEngine(self._nw_data_patched())
+
+    @reactive_calc_method
+    def _server_view_rows(self) -> IndexArray:
+        """
+        Reactive calculation of the rows of `.data_patched()` in view, after the server
+        sorts and filters them.
+        """
+        return self._sort_filter_engine().view_rows(*self._browser_sort_filter())
+
+    @reactive_calc_method
+    def _data_view_indices_all(self) -> IndexArray:
+        if self._data_window_rows() is not None:
+            return self._server_view_rows()
+        return as_index_array(self.data_view_rows())
+
+    @reactive_calc_method
+    def _data_view_indices_selected(self) -> IndexArray:
+        return as_index_array(self.cell_selection()["rows"])
+
+    def data_view_indices(self, *, selected: bool = False) -> IndexArray:
+        """
+        Reactive function that retrieves the row numbers of the data as it is viewed
+        within the browser.
+
+        These are the rows of `.data_patched()` that `.data_view()` returns, in the same
+        order: the row numbers in view after the user's sorting and filtering (see
+        `.data_view_rows()`), or the selected row numbers (see `.cell_selection()`).
+        Large tables are better served by this NumPy array than by a tuple of Python
+        integers, e.g. to subset other data with `df.iloc[indices]` or `df[indices]`.
+
+        Parameters
+        ----------
+        selected
+            If `True`, return the selected row numbers. Defaults to `False` (all rows in
+            view).
+
+        Returns
+        -------
+        :
+            A NumPy array of row numbers (of dtype `intp`).
+        """
+        if selected:
+            return self._data_view_indices_selected()
+        else:
+            return self._data_view_indices_all()
+
     # @reactive_calc_method
     def sort(self) -> tuple[ColumnSort, ...]:
         """
@@ -558,22 +703,31 @@ class data_frame(
 
     def _reset_reactives(self) -> None:
         self._value.set(None)
-        self._cell_patch_map.set({})
+        self._clear_cell_patches()
+        self._browser_styles = None
         self._updated_data.unset()
+        self._data_window.unset()
+        self._data_window_rows.set(None)
 
     def _init_reactives(self) -> None:
 
         # Init
         self._value = reactive.Value(None)
-        self._cell_patch_map = reactive.Value({})
+        self._patched_frame = PatchedFrame()
+        self._cell_patch_version = reactive.Value(self._patched_frame.version)
+        self._browser_styles = None
         self._updated_data = reactive.Value()  # Create with no value
+        self._data_window = reactive.Value()  # Create with no value
+        self._data_window_sort_filter = ((), ())
+        self._data_window_rows = reactive.Value(None)
 
         # Update the styles any time the cell patch map or new data updates
         def should_update_styles():
             return (
-                self._cell_patch_map(),
+                self._cell_patch_version(),
                 # If the udpated data is unset, use a `None` value which is not allowed.
                 self._updated_data() if self._updated_data.is_set() else None,
+                self._data_window() if self._data_window.is_set() else None,
             )
 
         @reactive.effect
@@ -588,6 +742,146 @@ class data_frame(
             # It currently is, as `@reactive.event()` is being used
             await self._attempt_update_cell_style()
 
+        # Collect the rows of a lazy frame again when the user sorts or filters them
+        @reactive.effect
+        async def _():
+            if not self._data_window.is_set():
+                return
+            sort_filter = self._browser_sort_filter()
+            if sort_filter == self._data_window_sort_filter:
+                return
+            with reactive.isolate():
+                await self._update_data_window(self._lazy_data(), *sort_filter)
+
+        # Send the first rows in view again when the server sorts and filters a data
+        # frame differently (e.g. after the user sorts it, or edits a sorted column)
+        @reactive.effect
+        async def _():
+            window_rows = self._data_window_rows()
+            if window_rows is None:
+                return
+            rows = self._server_view_rows()[: self._req_value().max_rows]
+            if len(rows) == len(window_rows) and bool((rows == window_rows).all()):
+                return
+            with reactive.isolate():
+                await self._update_data_window_rows(rows)
+
+    def _lazy_data(self) -> IntoDataFrameT:
+        """
+        The lazy frame whose rows are shown, from the render method or from
+        `.update_data()`.
+        """
+        if self._updated_data.is_set():
+            return self._updated_data()
+        return self._req_value().data
+
+    def _browser_sort_filter(
+        self,
+    ) -> tuple[tuple[ColumnSort, ...], tuple[ColumnFilter, ...]]:
+        """
+        The user's sorting and filtering, or none until the browser has reported them.
+        """
+        session_input = self._get_session().input
+        if not (
+            session_input[f"{self.output_id}_column_sort"].is_set()
+            and session_input[f"{self.output_id}_column_filter"].is_set()
+        ):
+            return ((), ())
+        return (self.sort(), self.filter())
+
+    async def _update_data_window(
+        self,
+        data: IntoDataFrameT,
+        sort: tuple[ColumnSort, ...],
+        filters: tuple[ColumnFilter, ...],
+    ) -> None:
+        """
+        Collect the rows of lazy frame `data` to show, after sorting and filtering them
+        lazily, and send them to the browser.
+        """
+        window = collect_lazy_frame(
+            data,
+            max_rows=self._req_value().max_rows,
+            sort=sort,
+            filters=filters,
+        )
+        with session_context(self._get_session()):
+            info = serialize_frame(window)
+
+        # Lazy frames can't be edited, so there are no patches to keep
+        self._data_window_sort_filter = (sort, filters)
+        self._data_window.set(window)
+
+        # The browser keeps the user's sorting and filtering, which leave the rows as
+        # they are
+        await self._send_message_to_browser(
+            "updateData",
+            {
+                "data": info["data"],
+                "columns": info["columns"],
+                "typeHints": info["typeHints"],
+            },
+        )
+
+    async def _update_data_window_rows(self, rows: IndexArray) -> None:
+        """
+        Send rows `rows` of the patched data frame (and their styles) to the browser, as
+        the rows shown when the data frame is sorted and filtered on the server.
+        """
+        nw_data_patched = self._nw_data_patched()
+        with session_context(self._get_session()):
+            info = serialize_frame(subset_frame(nw_data_patched, rows=rows))
+
+        # The patches are kept, as they refer to the rows of the data frame. The sent
+        # rows already contain the patched values.
+        self._data_window_rows.set(rows)
+
+        await self._send_message_to_browser(
+            "updateData",
+            {
+                "data": info["data"],
+                "columns": info["columns"],
+                "typeHints": info["typeHints"],
+            },
+        )
+
+        if self._browser_styles is None:
+            self._browser_styles = as_browser_style_infos(
+                self._req_value().styles,
+                into_data=self._nw_data_to_original_type(nw_data_patched),
+            )
+        await self._send_browser_styles(self._browser_styles)
+
+    def _browser_row_positions(self) -> dict[int, int] | None:
+        """
+        The positions of the rows of `.data_patched()` that were sent to the browser,
+        when the data frame is sorted and filtered on the server. `None` when the
+        browser has every row.
+        """
+        with reactive.isolate():
+            window_rows = self._data_window_rows()
+        if window_rows is None:
+            return None
+        return {row: i for i, row in enumerate(window_rows.tolist())}
+
+    async def _send_browser_styles(self, styles: list[BrowserStyleInfo]) -> None:
+        """
+        Send the styles of the rows of `.data_patched()` to the browser, for the rows it
+        was sent.
+        """
+        with reactive.isolate():
+            window_rows = self._data_window_rows()
+            if window_rows is not None:
+                styles = window_browser_style_infos(
+                    styles,
+                    window_rows,
+                    nrow=self._nw_data().shape[0],
+                )
+        await self._send_message_to_browser(
+            "updateStyles",
+            {"styles": encode_browser_style_infos(styles)},
+        )
+
     def _get_session(self) -> Session:
         if self._session is None:
             raise RuntimeError(
@@ -721,6 +1015,17 @@ class data_frame(
         """
         assert_patches_shape(patches)
 
+        with reactive.isolate():
+            window_rows = self._data_window_rows()
+        if window_rows is not None:
+            # The browser's rows are positions within the rows it was sent
+            data_patches: list[CellPatch] = []
+            for patch in patches:
+                data_patch = patch.copy()
+                data_patch["row_index"] = int(window_rows[patch["row_index"]])
+                data_patches.append(data_patch)
+            patches = tuple(data_patches)
+
         with session_context(self._get_session()):
             # Call user's cell update method to retrieve formatted values
             val = await self._patches_fn(patches=patches)
@@ -767,11 +1072,10 @@ class data_frame(
         Returns
         -------
         :
-            A list of processed (by the session) patches to apply to the data frame.
+            A list of processed (by the session) patches to apply to the data frame in
+            the browser. Patches of rows that were not sent to the browser (see
+            `._data_window_rows`) are stored but not returned.
         """
-        # Use copy to set the new value
-        cell_patch_map = self._cell_patch_map().copy()
-
         for patch in patches:
             row_index = patch["row_index"]
             column_index = patch["column_index"]
@@ -787,17 +1091,21 @@ class data_frame(
             # TODO-render.data_frame; The `value` should be coerced by pandas to the correct type
             # TODO-render.data_frame; See https://pandas.pydata.org/pandas-docs/stable/user_guide/basics.html#object-conversion
 
-            cell_patch_map[(row_index, column_index)] = patch
-
         # Once all patches are set, update the cell patch map with new version
-        self._cell_patch_map.set(cell_patch_map)
+        self._patched_frame.add(patches)
+        self._cell_patch_version.set(self._patched_frame.version)
 
         # Upgrade any HTML-like content to `CellHtml` json objects
         # for sending to the client
         session = self._get_session()
+        browser_rows = self._browser_row_positions()
         processed_patches: list[CellPatchProcessed] = [
             {
-                "row_index": patch["row_index"],
+                "row_index": (
+                    patch["row_index"]
+                    if browser_rows is None
+                    else browser_rows[patch["row_index"]]
+                ),
                 "column_index": patch["column_index"],
                 # Only upgrade the value if it is necessary
                 "value": maybe_as_cell_html(
@@ -806,6 +1114,7 @@ class data_frame(
                 ),
             }
             for patch in patches
+            if browser_rows is None or patch["row_index"] in browser_rows
         ]
 
         # Prep the processed patches as dictionaries for sending to the client
@@ -822,17 +1131,53 @@ class data_frame(
         if not isinstance(rendered_value, (DataGrid, DataTable)):
             return
 
+        dirty_rows = self._patched_frame.pop_dirty_rows()
+
         styles_fn = rendered_value.styles
         if not callable(styles_fn):
             return
 
-        patched_into_data = self._nw_data_to_original_type(self._nw_data_patched())
-        new_styles = as_browser_style_infos(styles_fn, into_data=patched_into_data)
+        nw_data_patched = self._nw_data_patched()
+
+        if (
+            rendered_value.styles_by_row
+            and dirty_rows is not None
+            and self._browser_styles is not None
+        ):
+            # Only restyle the patched rows
+            if len(dirty_rows) == 0:
+                return
+            rows = sorted(dirty_rows)
+            rows_into_data = self._nw_data_to_original_type(
+                subset_frame(nw_data_patched, rows=rows)
+            )
+            rows_styles = as_browser_style_infos(styles_fn, into_data=rows_into_data)
+            # Map the subset's row positions back to the data's row positions
+            for info in rows_styles:
+                info_rows = info["rows"]
+                info["rows"] = (
+                    tuple(rows)
+                    if info_rows is None
+                    else tuple(rows[row] for row in info_rows)
+                )
+            new_styles = [
+                *drop_browser_style_info_rows(
+                    self._browser_styles,
+                    dirty_rows,
+                    nrow=nw_data_patched.shape[0],
+                ),
+                *rows_styles,
+            ]
+        else:
+            patched_into_data = self._nw_data_to_original_type(nw_data_patched)
+            new_styles = as_browser_style_infos(styles_fn, into_data=patched_into_data)
 
-        await self._send_message_to_browser(
-            "updateStyles",
-            {"styles": new_styles},
-        )
+        self._browser_styles = new_styles
+        await self._send_browser_styles(new_styles)
+
+    def _clear_cell_patches(self) -> None:
+        self._patched_frame.clear()
+        self._cell_patch_version.set(self._patched_frame.version)
 
     async def update_cell_value(
         self,
@@ -845,17 +1190,29 @@ class data_frame(
         Update the value of a cell in the data frame.
 
         Calling this method will set a new entry in `.cell_patches()`. It will not reset
-        the user's sorting or filtering of their rendered data frame.
+        the user's sorting or filtering of their rendered data frame. The cells of a
+        lazy frame can't be updated.
 
         Parameters
         ----------
         value
             The new value to set the cell to.
         row
-            The row index of the cell to update.
+            The row index of the cell to update. When the data frame is sorted and
+            filtered on the server (see `server_sort_filter` of
+            :class:`~shiny.render.DataGrid`), the browser is only updated if the row
+            was sent to it.
         column
             The column index of the cell to update.
         """
+        with reactive.isolate():
+            if self._data_window.is_set():
+                raise ValueError(
+                    "The cells of a lazy frame can't be updated, as only some of its "
+                    "rows are collected (again whenever the user sorts or filters "
+                    "them)."
+                )
+
         # TODO-barret; Test these assertions
         # Convert column name to index if necessary
         if isinstance(col, str):
@@ -917,10 +1274,40 @@ class data_frame(
         Parameters
         ----------
         data
-            The new data to render.
+            The new data to render. Only the rows of a lazy frame (e.g. a polars
+            `LazyFrame`) that are shown are collected, after adding the user's sorting
+            and filtering to its query. A lazy frame can't be used when the data frame
+            is editable.
         """
         assert_data_is_not_none(data)
 
+        if as_lazy_frame(data) is not None:
+            with reactive.isolate():
+                if self._req_value().editable:
+                    raise ValueError(
+                        "Lazy frames can't be edited, so an editable data frame can't "
+                        "be updated with one. Collect the lazy frame (e.g., with "
+                        "`.collect()`) first."
+                    )
+                sort_filter = self._browser_sort_filter()
+            self._clear_cell_patches()
+            self._data_window_rows.set(None)
+            self._updated_data.set(data)
+            await self._update_data_window(data, *sort_filter)
+            return
+
+        with reactive.isolate():
+            server_sort_filter = self._req_value().server_sort_filter
+        if server_sort_filter:
+            self._clear_cell_patches()
+            self._browser_styles = None
+            self._data_window.unset()
+            self._updated_data.set(data)
+            with reactive.isolate():
+                rows = self._server_view_rows()[: self._req_value().max_rows]
+                await self._update_data_window_rows(rows)
+            return
+
         # Serialize the data within the session context,
         # similar to `.to_payload()` on the `._value()`
         with session_context(self._get_session()):
@@ -929,7 +1316,8 @@ class data_frame(
         # Reset patches & set new data
         # Perform only after serializing the frame
         # (which performs sanity checks. E.g. `data is not None`
-        self._cell_patch_map.set({})
+        self._clear_cell_patches()
+        self._data_window.unset()
         self._updated_data.set(data)
 
         await self._send_message_to_browser(
@@ -1003,6 +1391,13 @@ class data_frame(
         # Use session context so `to_payload()` gets the correct session
         with session_context(self._get_session()):
             payload = value.to_payload()
+            if as_lazy_frame(value.data) is not None:
+                # The browser's table starts out unsorted and unfiltered
+                self._data_window_sort_filter = ((), ())
+                self._data_window.set(
+                    value._collect_data()  # pyright: ignore[reportArgumentType]
+                )
+            self._data_window_rows.set(value._server_window_rows())
 
             ret: FrameRender = {
                 "payload": payload,
@@ -1075,6 +1470,15 @@ class data_frame(
             data_view_cols=data_view_cols,
         )
 
+        browser_rows = self._browser_row_positions()
+        if browser_rows is not None:
+            # The browser's rows are positions within the rows it was sent
+            cell_selection["rows"] = tuple(
+                browser_rows[row]
+                for row in cell_selection["rows"]
+                if row in browser_rows
+            )
+
         if cell_selection["type"] == "none":
             pass
         elif cell_selection["type"] == "rect":
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Generic, Literal
+from typing import TYPE_CHECKING, Generic, Literal
 
 from ..._docstring import add_example
 from ._selection import (
@@ -13,16 +13,60 @@ from ._selection import (
     SelectionModes,
     as_selection_modes,
 )
-from ._styles import StyleFn, StyleInfo, as_browser_style_infos, as_style_infos
-from ._tbl_data import assert_data_is_not_none, serialize_frame
+from ._styles import (
+    StyleFn,
+    StyleInfo,
+    as_browser_style_infos,
+    as_style_infos,
+    encode_browser_style_infos,
+    window_browser_style_infos,
+)
+from ._tbl_data import (
+    as_data_frame,
+    as_lazy_frame,
+    assert_data_is_not_none,
+    collect_lazy_frame,
+    serialize_frame,
+    subset_frame,
+)
 from ._types import FrameJson, IntoDataFrameT
 
+if TYPE_CHECKING:
+    from ._indices import IndexArray
+
 
 class AbstractTabularData(abc.ABC):
     @abc.abstractmethod
     def to_payload(self) -> FrameJson: ...
 
 
+def server_window_rows(
+    data: IntoDataFrameT,
+    *,
+    server_sort_filter: bool,
+    max_rows: int,
+) -> IndexArray | None:
+    """
+    The first `max_rows` rows of data frame `data` when it's sorted and filtered on the
+    server, or `None` when the browser receives all of its rows (or `data` is a lazy
+    frame).
+    """
+    if not server_sort_filter or as_lazy_frame(data) is not None:
+        return None
+
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "The `numpy` package is required to sort and filter data frames on the "
+            "server (`server_sort_filter=True`). Please install it with "
+            "`pip install numpy`."
+        ) from e
+
+    nrow = as_data_frame(data).shape[0]
+    return np.arange(min(nrow, max_rows), dtype=np.intp)
+
+
 @add_example(ex_dir="../../api-examples/data_frame_grid_table")
 @add_example(ex_dir="../../api-examples/data_frame_styles")
 class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
@@ -44,7 +88,9 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
     data
         A [pandas](https://pandas.pydata.org/), [polars](https://pola.rs/), or
         eager [`narwhals`](https://narwhals-dev.github.io/narwhals/) compatible `DataFrame`
-        object.
+        object. A lazy frame supported by narwhals (e.g. a polars `LazyFrame` or a
+        DuckDB relation) is also accepted: only its first `max_rows` rows are collected
+        (into the backend's eager data frame, e.g. a polars `DataFrame`) and shown.
     width
         A _maximum_ amount of horizontal space for the data grid to occupy, in CSS units
         (e.g. `"400px"`) or as a number, which will be interpreted as pixels. The
@@ -67,7 +113,8 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
     editable
         If `True`, allows the user to edit the cells in the grid. When a cell is edited,
         the new value is sent to the server for processing. The server can then return
-        a new value for the cell, which will be displayed in the grid.
+        a new value for the cell, which will be displayed in the grid. Lazy frames (see
+        `data`) can't be edited.
     selection_mode
         Single string or a `set`/`list`/`tuple` of string values to define possible ways
         to select data within the data frame.
@@ -90,7 +137,10 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
         Style info object key/value description:
         * `location`: This value `"body"` and is not required.
         * `rows`: The row numbers to which the style should be applied. If `None`, the
-            style will be applied to all rows.
+            style will be applied to all rows. A boolean list, a boolean Series, or a
+            [narwhals expression](https://narwhals-dev.github.io/narwhals/api-reference/expr/)
+            evaluated against the data (e.g. `nw.col("mpg") > 25`) may be used to select
+            the rows, which is much faster than a list of row numbers for large data.
         * `cols`: The column numbers to which the style should be applied. If `None`,
             the style will be applied to all columns.
         * `style`: A dictionary of CSS properties and values to apply to the selected
@@ -102,6 +152,31 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
         If both `style` and `class` are missing or `None`, nothing will be applied. If
         both `rows` and `cols` are missing or `None`, the style will be applied to the
         complete data frame.
+    styles_by_row
+        If `True`, `styles` is a function whose styles for each row depend only on the
+        values in that row. When cells are edited, the function is then only called
+        with the edited rows (as a data frame containing just those rows, whose style
+        info `rows` refer to positions within it), and the styles of the other rows
+        are kept. This avoids restyling the whole data frame after each edit. If
+        `False` (the default), the function is called with the whole data frame after
+        each edit.
+    server_sort_filter
+        If `True`, the server sorts and filters the data frame with the user's column
+        sorting and filtering, and only the first `max_rows` rows of the result are sent
+        to the browser (again whenever the user sorts or filters them), rather than
+        every row. The row order of each sort is cached, so returning to a previous sort
+        does not sort the data again. The `.data_view()`, `.data_view_rows()`, and
+        `.data_view_indices()` methods of :class:`~shiny.render.data_frame` still cover
+        all of the sorted and filtered rows. This requires the `numpy` package. Lazy
+        frames (see `data`) are always sorted and filtered on the server.
+    max_rows
+        The maximum number of rows of a lazy frame (see `data`) that are collected and
+        shown. The user's sorting and filtering are added to the lazy frame's query, so
+        that they apply to all of its rows, and the rows are collected again when they
+        change. Only the collected rows are returned by the `.data()` and
+        `.data_view()` methods of :class:`~shiny.render.data_frame`, and a warning is
+        shown when a lazy frame has more rows. Data frames are shown in full, unless
+        `server_sort_filter=True`.
     row_selection_mode
         Deprecated. Please use `selection_mode=` instead.
 
@@ -126,6 +201,9 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
     editable: bool
     selection_modes: SelectionModes
     styles: list[StyleInfo] | StyleFn[IntoDataFrameT]
+    styles_by_row: bool
+    server_sort_filter: bool
+    max_rows: int
 
     def __init__(
         self,
@@ -138,6 +216,9 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
         editable: bool = False,
         selection_mode: SelectionModeInput = "none",
         styles: StyleInfo | list[StyleInfo] | StyleFn[IntoDataFrameT] | None = None,
+        styles_by_row: bool = False,
+        server_sort_filter: bool = False,
+        max_rows: int = 1000,
         row_selection_mode: RowSelectionModeDeprecated = "deprecated",
     ):
         assert_data_is_not_none(data)
@@ -154,6 +235,17 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
             row_selection_mode=row_selection_mode,
         )
         self.styles = as_style_infos(styles)
+        self.styles_by_row = bool(styles_by_row)
+        self.server_sort_filter = bool(server_sort_filter)
+        self.max_rows = max_rows
+        if self.editable and as_lazy_frame(data) is not None:
+            raise ValueError(
+                "Lazy frames can't be edited, as only some of their rows are collected "
+                "(again whenever the user sorts or filters them). Collect the lazy "
+                "frame (e.g., with `.collect()`) to use `editable=True`."
+            )
+        # `(data,)` once collected
+        self._collected_data: tuple[IntoDataFrameT] | None = None
 
     def to_payload(self) -> FrameJson:
         """
@@ -164,8 +256,18 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
         :
             The payload dictionary representing the `DataGrid` object.
         """
+        data = self._collect_data()
+        styles = as_browser_style_infos(self.styles, into_data=data)
+        window_rows = self._server_window_rows()
+        if window_rows is not None:
+            # Only the first rows of the (unsorted and unfiltered) data are sent
+            nw_data = as_data_frame(data)
+            styles = window_browser_style_infos(
+                styles, window_rows, nrow=nw_data.shape[0]
+            )
+            data = subset_frame(nw_data, rows=window_rows)
         res: FrameJson = {
-            **serialize_frame(self.data),
+            **serialize_frame(data),
             "options": {
                 "width": self.width,
                 "height": self.height,
@@ -174,14 +276,33 @@ class DataGrid(AbstractTabularData, Generic[IntoDataFrameT]):
                 "editable": self.editable,
                 "style": "grid",
                 "fill": self.height is None,
-                "styles": as_browser_style_infos(
-                    self.styles,
-                    into_data=self.data,
-                ),
+                "styles": encode_browser_style_infos(styles),
             },
         }
         return res
 
+    def _collect_data(self) -> IntoDataFrameT:
+        """
+        The data to show: `data`, or the first `max_rows` rows of a lazy frame (which
+        are collected once).
+        """
+        if self._collected_data is None:
+            self._collected_data = (
+                collect_lazy_frame(self.data, max_rows=self.max_rows),
+            )
+        return self._collected_data[0]
+
+    def _server_window_rows(self) -> IndexArray | None:
+        """
+        The rows of `data` that are first sent to the browser when it's sorted and
+        filtered on the server (see `server_sort_filter`), or `None` otherwise.
+        """
+        return server_window_rows(
+            self.data,
+            server_sort_filter=self.server_sort_filter,
+            max_rows=self.max_rows,
+        )
+
 
 @add_example(ex_dir="../../api-examples/data_frame_grid_table")
 @add_example(ex_dir="../../api-examples/data_frame_styles")
@@ -204,7 +325,9 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
     data
         A [pandas](https://pandas.pydata.org/), [polars](https://pola.rs/), or
         eager [`narwhals`](https://narwhals-dev.github.io/narwhals/) compatible `DataFrame`
-        object.
+        object. A lazy frame supported by narwhals (e.g. a polars `LazyFrame` or a
+        DuckDB relation) is also accepted: only its first `max_rows` rows are collected
+        (into the backend's eager data frame, e.g. a polars `DataFrame`) and shown.
     width
         A _maximum_ amount of vertical space for the data table to occupy, in CSS units
         (e.g. `"400px"`) or as a number, which will be interpreted as pixels. The
@@ -227,7 +350,8 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
     editable
         If `True`, allows the user to edit the cells in the grid. When a cell is edited,
         the new value is sent to the server for processing. The server can then return
-        a new value for the cell, which will be displayed in the grid.
+        a new value for the cell, which will be displayed in the grid. Lazy frames (see
+        `data`) can't be edited.
     selection_mode
         Single string or a `set`/`list`/`tuple` of string values to define possible ways
         to select data within the data frame.
@@ -250,7 +374,10 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
         Style info object key/value description:
         * `location`: This value `"body"` and is not required.
         * `rows`: The row numbers to which the style should be applied. If `None`, the
-            style will be applied to all rows.
+            style will be applied to all rows. A boolean list, a boolean Series, or a
+            [narwhals expression](https://narwhals-dev.github.io/narwhals/api-reference/expr/)
+            evaluated against the data (e.g. `nw.col("mpg") > 25`) may be used to select
+            the rows, which is much faster than a list of row numbers for large data.
         * `cols`: The column numbers to which the style should be applied. If `None`,
             the style will be applied to all columns.
         * `style`: A dictionary of CSS properties and values to apply to the selected
@@ -262,6 +389,31 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
         If both `style` and `class` are missing or `None`, nothing will be applied. If
         both `rows` and `cols` are missing or `None`, the style will be applied to the
         complete data frame.
+    styles_by_row
+        If `True`, `styles` is a function whose styles for each row depend only on the
+        values in that row. When cells are edited, the function is then only called
+        with the edited rows (as a data frame containing just those rows, whose style
+        info `rows` refer to positions within it), and the styles of the other rows
+        are kept. This avoids restyling the whole data frame after each edit. If
+        `False` (the default), the function is called with the whole data frame after
+        each edit.
+    server_sort_filter
+        If `True`, the server sorts and filters the data frame with the user's column
+        sorting and filtering, and only the first `max_rows` rows of the result are sent
+        to the browser (again whenever the user sorts or filters them), rather than
+        every row. The row order of each sort is cached, so returning to a previous sort
+        does not sort the data again. The `.data_view()`, `.data_view_rows()`, and
+        `.data_view_indices()` methods of :class:`~shiny.render.data_frame` still cover
+        all of the sorted and filtered rows. This requires the `numpy` package. Lazy
+        frames (see `data`) are always sorted and filtered on the server.
+    max_rows
+        The maximum number of rows of a lazy frame (see `data`) that are collected and
+        shown. The user's sorting and filtering are added to the lazy frame's query, so
+        that they apply to all of its rows, and the rows are collected again when they
+        change. Only the collected rows are returned by the `.data()` and
+        `.data_view()` methods of :class:`~shiny.render.data_frame`, and a warning is
+        shown when a lazy frame has more rows. Data frames are shown in full, unless
+        `server_sort_filter=True`.
     row_selection_mode
         Deprecated. Please use `mode={row_selection_mode}_row` instead.
 
@@ -286,6 +438,9 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
     editable: bool
     selection_modes: SelectionModes
     styles: list[StyleInfo] | StyleFn[IntoDataFrameT]
+    styles_by_row: bool
+    server_sort_filter: bool
+    max_rows: int
 
     def __init__(
         self,
@@ -298,6 +453,9 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
         editable: bool = False,
         selection_mode: SelectionModeInput = "none",
         styles: StyleInfo | list[StyleInfo] | StyleFn[IntoDataFrameT] | None = None,
+        styles_by_row: bool = False,
+        server_sort_filter: bool = False,
+        max_rows: int = 1000,
         row_selection_mode: Literal["deprecated"] = "deprecated",
     ):
         assert_data_is_not_none(data)
@@ -315,6 +473,17 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
             row_selection_mode=row_selection_mode,
         )
         self.styles = as_style_infos(styles)
+        self.styles_by_row = bool(styles_by_row)
+        self.server_sort_filter = bool(server_sort_filter)
+        self.max_rows = max_rows
+        if self.editable and as_lazy_frame(data) is not None:
+            raise ValueError(
+                "Lazy frames can't be edited, as only some of their rows are collected "
+                "(again whenever the user sorts or filters them). Collect the lazy "
+                "frame (e.g., with `.collect()`) to use `editable=True`."
+            )
+        # `(data,)` once collected
+        self._collected_data: tuple[IntoDataFrameT] | None = None
 
     def to_payload(self) -> FrameJson:
         """
@@ -325,8 +494,18 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
         :
             The payload dictionary representing the `DataTable` object.
         """
+        data = self._collect_data()
+        styles = as_browser_style_infos(self.styles, into_data=data)
+        window_rows = self._server_window_rows()
+        if window_rows is not None:
+            # Only the first rows of the (unsorted and unfiltered) data are sent
+            nw_data = as_data_frame(data)
+            styles = window_browser_style_infos(
+                styles, window_rows, nrow=nw_data.shape[0]
+            )
+            data = subset_frame(nw_data, rows=window_rows)
         res: FrameJson = {
-            **serialize_frame(self.data),
+            **serialize_frame(data),
             "options": {
                 "width": self.width,
                 "height": self.height,
@@ -334,10 +513,29 @@ class DataTable(AbstractTabularData, Generic[IntoDataFrameT]):
                 "filters": self.filters,
                 "editable": self.editable,
                 "style": "table",
-                "styles": as_browser_style_infos(
-                    self.styles,
-                    into_data=self.data,
-                ),
+                "styles": encode_browser_style_infos(styles),
             },
         }
         return res
+
+    def _collect_data(self) -> IntoDataFrameT:
+        """
+        The data to show: `data`, or the first `max_rows` rows of a lazy frame (which
+        are collected once).
+        """
+        if self._collected_data is None:
+            self._collected_data = (
+                collect_lazy_frame(self.data, max_rows=self.max_rows),
+            )
+        return self._collected_data[0]
+
+    def _server_window_rows(self) -> IndexArray | None:
+        """
+        The rows of `data` that are first sent to the browser when it's sorted and
+        filtered on the server (see `server_sort_filter`), or `None` otherwise.
+        """
+        return server_window_rows(
+            self.data,
+            server_sort_filter=self.server_sort_filter,
+            max_rows=self.max_rows,
+        )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ...types import ListOrTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    IndexArray = npt.NDArray[np.intp]
+
+
+def as_index_array(rows: ListOrTuple[int]) -> IndexArray:
+    """
+    Convert row numbers to a NumPy array of row numbers.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "The `numpy` package is required to retrieve data frame row numbers as an "
+            "array. Please install it with `pip install numpy`."
+        ) from e
+
+    return np.fromiter(rows, dtype=np.intp, count=len(rows))
+
+
+def encode_index_runs(rows: ListOrTuple[int] | IndexArray) -> list[int]:
+    """
+    Encode row numbers as runs of consecutive row numbers.
+
+    The runs are a flat list of `[start, length, start, length, ...]`, where a negative
+    length is a descending run. This is the same encoding that the browser uses to send
+    row numbers (see `shiny.dataframe.indices` in `shiny/input_handler.py`).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        runs: list[int] = []
+        i = 0
+        n = len(rows)
+        while i < n:
+            j = i + 1
+            step = rows[j] - rows[i] if j < n else 0
+            if step == 1 or step == -1:
+                while j < n and rows[j] - rows[j - 1] == step:
+                    j += 1
+            runs.extend((rows[i], i - j if step == -1 else j - i))
+            i = j
+        return runs
+
+    rows_arr = np.asarray(rows, dtype=np.intp)
+    if len(rows_arr) == 0:
+        return []
+    steps = np.diff(rows_arr)
+    unit = (steps == 1) | (steps == -1)
+    # A row continues the run of the row before it when they're one apart, in the
+    # same direction as the rest of the run (if any)
+    joined = unit.copy()
+    joined[1:] &= (steps[1:] == steps[:-1]) | ~unit[:-1]
+    starts = np.concatenate(([0], np.flatnonzero(~joined) + 1))
+    lengths = np.diff(np.append(starts, len(rows_arr)))
+    descending = np.append(steps, 0)[starts] == -1
+    lengths[descending] *= -1
+    return np.column_stack((rows_arr[starts], lengths)).ravel().tolist()
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 # TODO-barret-render.data_frame; Docs
 # TODO-barret-render.data_frame; Add examples of patch!
-from typing import Protocol, Sequence
+from typing import Generic, Optional, Protocol, Sequence
 
 from ...types import ListOrTuple
-from ._types import CellPatch, CellValue
+from ._tbl_data import apply_frame_patches
+from ._types import CellPatch, CellValue, DataFrame, IntoDataFrameT
 
 
 class PatchFn(Protocol):
@@ -48,3 +49,84 @@ def assert_patches_shape(x: Sequence[CellPatch]) -> None:
         assert "row_index" in patch
         assert "column_index" in patch
         assert "value" in patch
+
+
+class PatchedFrame(Generic[IntoDataFrameT]):
+    """
+    The cell patches of a data frame, along with the patched data frame.
+
+    The patched data frame is kept up to date incrementally: when patches are added,
+    only the new patches are applied to the previously patched data frame (rather than
+    applying every patch to a new copy of the data). The rows that have been patched are
+    also tracked so that work derived from the patched data (e.g. styles) can be limited
+    to those rows.
+    """
+
+    version: int
+    """Incremented every time the patches are changed."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._patches: dict[tuple[int, int], CellPatch] = {}
+        self._pending: dict[tuple[int, int], CellPatch] = {}
+        self._data: Optional[DataFrame[IntoDataFrameT]] = None
+        self._patched: Optional[DataFrame[IntoDataFrameT]] = None
+        self._dirty_rows: Optional[set[int]] = None
+
+    @property
+    def patches(self) -> dict[tuple[int, int], CellPatch]:
+        """
+        All patches, keyed by `(row_index, column_index)`.
+        """
+        return self._patches
+
+    def add(self, patches: ListOrTuple[CellPatch]) -> None:
+        """
+        Add patches, replacing any existing patch at the same location.
+        """
+        for patch in patches:
+            key = (patch["row_index"], patch["column_index"])
+            self._patches[key] = patch
+            self._pending[key] = patch
+            if self._dirty_rows is not None:
+                self._dirty_rows.add(patch["row_index"])
+        self.version += 1
+
+    def clear(self) -> None:
+        """
+        Remove all patches. All rows are considered dirty afterwards.
+        """
+        self._patches = {}
+        self._pending = {}
+        self._data = None
+        self._patched = None
+        self._dirty_rows = None
+        self.version += 1
+
+    def apply(self, data: DataFrame[IntoDataFrameT]) -> DataFrame[IntoDataFrameT]:
+        """
+        Return `data` with all patches applied.
+
+        If `data` is the same data frame as the previous call, only the patches added
+        since then are applied to the previous result.
+        """
+        if self._patched is None or data is not self._data:
+            patched = apply_frame_patches(data, list(self._patches.values()))
+        else:
+            patched = apply_frame_patches(self._patched, list(self._pending.values()))
+
+        self._data = data
+        self._patched = patched
+        self._pending = {}
+        return patched
+
+    def pop_dirty_rows(self) -> Optional[set[int]]:
+        """
+        Return the row indices patched since the last call, and reset them.
+
+        `None` is returned if the patches were cleared since the last call, meaning that
+        every row should be considered dirty.
+        """
+        rows = self._dirty_rows
+        self._dirty_rows = set()
+        return rows
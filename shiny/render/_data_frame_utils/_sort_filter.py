@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING, Any, Generic, Optional
+
+import narwhals.stable.v1 as nw
+
+from ..._datastructures import LRUCache
+from ...types import ListOrTuple
+from ._types import ColumnFilter, ColumnSort, DataFrame, IntoDataFrameT
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from ._indices import IndexArray
+
+__all__ = (
+    "SortFilterEngine",
+    "sort_filter_lazy_frame",
+)
+
+
+class SortFilterEngine(Generic[IntoDataFrameT]):
+    """
+    Evaluates the browser's column sorting and filtering on the server.
+
+    The row order of each sort (e.g. sorting by a single column, ascending) is cached,
+    so switching back to a previous sort is a lookup rather than a new sort of the data.
+    The semantics match those of the browser's table: string filters are
+    case-insensitive substring matches, numeric filters are inclusive ranges, missing
+    values are sorted last, and ties keep their original row order.
+
+    Parameters
+    ----------
+    nw_data
+        The data frame to sort and filter. A new engine should be created when the data
+        changes.
+    max_sorts
+        The maximum number of row orders to cache.
+    """
+
+    def __init__(self, nw_data: DataFrame[IntoDataFrameT], *, max_sorts: int = 16):
+        if importlib.util.find_spec("numpy") is None:
+            raise ImportError(
+                "The `numpy` package is required to sort and filter data frames on the "
+                "server. Please install it with `pip install numpy`."
+            )
+
+        self._nw_data = nw_data
+        self._row_index_name = _unique_name("__shiny_row_index__", nw_data.columns)
+        self._sorted_rows: LRUCache[tuple[tuple[int, bool], ...], IndexArray] = (
+            LRUCache(max_sorts)
+        )
+
+    def sorted_rows(self, sort: ListOrTuple[ColumnSort]) -> IndexArray:
+        """
+        Row numbers of the data in sorted order.
+        """
+        key = tuple((info["col"], bool(info["desc"])) for info in sort)
+        rows = self._sorted_rows.get(key)
+        if rows is None:
+            rows = self._sort(key)
+            self._sorted_rows.set(key, rows)
+        return rows
+
+    def filter_mask(
+        self, filters: ListOrTuple[ColumnFilter]
+    ) -> Optional[npt.NDArray[np.bool_]]:
+        """
+        A boolean array of the rows that pass all filters, or `None` if there are no
+        filters.
+        """
+        expr = _filters_expr(filters, columns=self._nw_data.columns)
+        if expr is None:
+            return None
+        mask = self._nw_data.select(expr.alias("mask"))["mask"]
+        return mask.to_numpy().astype(bool, copy=False)
+
+    def view_rows(
+        self,
+        sort: ListOrTuple[ColumnSort],
+        filters: ListOrTuple[ColumnFilter],
+    ) -> IndexArray:
+        """
+        Row numbers of the data after sorting and filtering, in sorted order.
+        """
+        rows = self.sorted_rows(sort)
+        mask = self.filter_mask(filters)
+        if mask is None:
+            return rows
+        return rows[mask[rows]]
+
+    def _sort(self, key: tuple[tuple[int, bool], ...]) -> IndexArray:
+        import numpy as np
+
+        nrow = self._nw_data.shape[0]
+        if len(key) == 0:
+            return np.arange(nrow, dtype=np.intp)
+
+        columns = self._nw_data.columns
+        row_index = self._row_index_name
+        # Sort by the row number last so that ties keep their original order
+        sorted_data = self._nw_data.with_row_index(row_index).sort(
+            [columns[col] for col, _ in key] + [row_index],
+            descending=[desc for _, desc in key] + [False],
+            nulls_last=True,
+        )
+        return sorted_data[row_index].to_numpy().astype(np.intp, copy=False)
+
+
+def sort_filter_lazy_frame(
+    nw_lazy: nw.LazyFrame[Any],
+    sort: ListOrTuple[ColumnSort],
+    filters: ListOrTuple[ColumnFilter],
+) -> nw.LazyFrame[Any]:
+    """
+    Add the browser's column sorting and filtering to the query of a lazy frame.
+
+    As in the browser's table, string filters are case-insensitive substring matches,
+    numeric filters are inclusive ranges, and missing values are sorted last. (Ties may
+    not keep their original row order, depending on the backend.)
+    """
+    columns = nw_lazy.columns
+    expr = _filters_expr(filters, columns=columns)
+    if expr is not None:
+        nw_lazy = nw_lazy.filter(expr)
+
+    if len(sort) > 0:
+        nw_lazy = nw_lazy.sort(
+            [columns[info["col"]] for info in sort],
+            descending=[bool(info["desc"]) for info in sort],
+            nulls_last=True,
+        )
+    return nw_lazy
+
+
+def _filters_expr(
+    filters: ListOrTuple[ColumnFilter], *, columns: ListOrTuple[str]
+) -> Optional[nw.Expr]:
+    """
+    An expression of the rows that pass all `filters` (with missing values failing
+    them), or `None` if no filter applies.
+    """
+    exprs = [
+        expr
+        for expr in (
+            _filter_expr(column_filter, columns=columns) for column_filter in filters
+        )
+        if expr is not None
+    ]
+    if len(exprs) == 0:
+        return None
+
+    expr = exprs[0]
+    for other in exprs[1:]:
+        expr = expr & other
+    return expr.fill_null(False)
+
+
+def _filter_expr(
+    column_filter: ColumnFilter, *, columns: ListOrTuple[str]
+) -> Optional[nw.Expr]:
+    col = nw.col(columns[column_filter["col"]])
+    value = column_filter["value"]
+
+    if isinstance(value, str):
+        if value == "":
+            return None
+        return (
+            col.cast(nw.String)
+            .str.to_lowercase()
+            .str.contains(value.lower(), literal=True)
+        )
+
+    min_value, max_value = value
+    if min_value is not None and max_value is not None and min_value > max_value:
+        min_value, max_value = max_value, min_value
+
+    expr: Optional[nw.Expr] = None
+    if min_value is not None:
+        expr = col >= min_value
+    if max_value is not None:
+        expr = col <= max_value if expr is None else expr & (col <= max_value)
+    return expr
+
+
+def _unique_name(name: str, existing: ListOrTuple[str]) -> str:
+    while name in existing:
+        name = f"_{name}"
+    return name
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from typing import Callable, List
+from typing import TYPE_CHECKING, Any, Callable, List
+
+import narwhals.stable.v1 as nw
 
 from ...types import ListOrTuple
+from ._indices import encode_index_runs
 from ._tbl_data import as_data_frame
-from ._types import BrowserStyleInfo, IntoDataFrameT, StyleInfo
+from ._types import (
+    BrowserStyleInfo,
+    BrowserStyleInfoEncoded,
+    DataFrame,
+    IntoDataFrameT,
+    StyleInfo,
+)
+
+if TYPE_CHECKING:
+    from ._indices import IndexArray
 
 StyleFn = Callable[[IntoDataFrameT], List["StyleInfo"]]
 
@@ -12,7 +24,7 @@ StyleFn = Callable[[IntoDataFrameT], List["StyleInfo"]]
 def style_info_to_browser_style_info(
     info: StyleInfo,
     *,
-    nrow: int,
+    nw_data: DataFrame[Any],
     browser_column_names: ListOrTuple[str],
 ) -> BrowserStyleInfo | None:
     if not isinstance(info, dict):
@@ -27,7 +39,7 @@ def style_info_to_browser_style_info(
             f"`StyleInfo` `location` value must be 'body', not '{location}'"
         )
 
-    rows = style_info_rows(info, nrow=nrow)
+    rows = style_info_rows(info, nw_data=nw_data)
     cols = style_info_cols(info, browser_column_names=browser_column_names)
 
     style = info.get("style", None)
@@ -122,15 +134,34 @@ def style_info_cols(
 def style_info_rows(
     info: StyleInfo,
     *,
-    nrow: int,
+    nw_data: DataFrame[Any],
 ) -> None | tuple[int, ...]:
+    nrow = nw_data.shape[0]
     rows = info.get("rows", None)
     if rows is None:
         return None
     if isinstance(rows, (bool, int)):
         return (rows,)
-    if not isinstance(rows, (list, tuple)):
-        raise TypeError("`StyleInfo` `rows` value must be a list, tuple, int or string")
+    if isinstance(rows, nw.Expr):
+        # Evaluate the expression as a column of the data
+        rows = nw_data.select(rows.alias("rows"))["rows"]
+    elif not isinstance(rows, (nw.Series, list, tuple)):
+        try:
+            rows = nw.from_native(rows, series_only=True)
+        except TypeError:
+            raise TypeError(
+                "`StyleInfo` `rows` value must be a list, tuple, int, boolean Series, "
+                "or narwhals expression"
+            ) from None
+    if isinstance(rows, nw.Series):
+        if not isinstance(rows.dtype, nw.Boolean):
+            raise TypeError("`StyleInfo` `rows` Series must have a boolean dtype")
+        if len(rows) != nrow:
+            raise ValueError(
+                "Length of `StyleInfo` `rows` must match the number of rows in the data frame when `rows` is a boolean Series."
+            )
+        # Find the rows to style in a single pass over the mask
+        return tuple(rows.fill_null(False).arg_true().to_list())
 
     rows_tup = tuple(rows)
     if len(rows_tup) == 0:
@@ -197,14 +228,94 @@ def as_browser_style_infos(
 
     nw_data = as_data_frame(into_data)
     browser_column_names = nw_data.columns
-    nrow = nw_data.shape[0]
 
     browser_infos = [
         style_info_to_browser_style_info(
             info,
-            nrow=nrow,
+            nw_data=nw_data,
             browser_column_names=browser_column_names,
         )
         for info in style_infos
     ]
     return [browser_info for browser_info in browser_infos if browser_info is not None]
+
+
+def drop_browser_style_info_rows(
+    infos: list[BrowserStyleInfo],
+    rows: set[int],
+    *,
+    nrow: int,
+) -> list[BrowserStyleInfo]:
+    """
+    Remove `rows` from the rows that each browser style info applies to.
+
+    Style infos that no longer apply to any row are dropped.
+    """
+    ret: list[BrowserStyleInfo] = []
+    for info in infos:
+        info_rows = info["rows"]
+        if info_rows is None:
+            info_rows = range(nrow)
+        elif rows.isdisjoint(info_rows):
+            ret.append(info)
+            continue
+
+        kept_rows = tuple(row for row in info_rows if row not in rows)
+        if len(kept_rows) > 0:
+            ret.append({**info, "rows": kept_rows})
+    return ret
+
+
+def window_browser_style_infos(
+    infos: list[BrowserStyleInfo],
+    rows: IndexArray,
+    *,
+    nrow: int,
+) -> list[BrowserStyleInfo]:
+    """
+    Map the rows that each browser style info applies to onto their positions within
+    `rows`, the rows (of a data frame with `nrow` rows) that are shown in the browser.
+
+    Style infos that no longer apply to any row are dropped.
+    """
+    import numpy as np
+
+    positions = np.full(nrow, -1, dtype=np.intp)
+    positions[rows] = np.arange(len(rows), dtype=np.intp)
+
+    ret: list[BrowserStyleInfo] = []
+    for info in infos:
+        info_rows = info["rows"]
+        if info_rows is None:
+            ret.append(info)
+            continue
+
+        info_rows_arr = np.asarray(info_rows, dtype=np.intp)
+        info_rows_arr = info_rows_arr[(info_rows_arr >= 0) & (info_rows_arr < nrow)]
+        info_positions = positions[info_rows_arr]
+        info_positions = np.sort(info_positions[info_positions >= 0])
+        if len(info_positions) > 0:
+            ret.append({**info, "rows": tuple(info_positions.tolist())})
+    return ret
+
+
+def encode_browser_style_infos(
+    infos: list[BrowserStyleInfo],
+) -> list[BrowserStyleInfoEncoded]:
+    """
+    Encode the rows of browser style infos as runs of consecutive rows, when that is
+    shorter than listing every row.
+
+    Styles of conditional formatting often apply to many (mostly consecutive) rows, so
+    this keeps the styles sent to the browser small.
+    """
+    ret: list[BrowserStyleInfoEncoded] = []
+    for info in infos:
+        rows = info["rows"]
+        if rows is not None and len(rows) > 2:
+            runs = encode_index_runs(rows)
+            if len(runs) < len(rows):
+                ret.append({**info, "rows": {"runs": runs}})
+                continue
+        ret.append({**info, "rows": rows})
+    return ret
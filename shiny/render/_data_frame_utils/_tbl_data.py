@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING, Any, List, TypedDict, cast
 
 import narwhals.stable.v1 as nw
 import orjson
+from htmltools import HTMLDependency, TagList
 
 from ...session import Session, require_active_session
-from ...types import Jsonifiable, JsonifiableDict
+from ...types import Jsonifiable, JsonifiableDict, ListOrTuple
 from ._html import as_cell_html, ui_must_be_processed
+from ._sort_filter import sort_filter_lazy_frame
 from ._types import (
     CellHtml,
     CellPatch,
     CellValue,
     ColsList,
+    ColumnFilter,
+    ColumnSort,
     DataFrame,
     DataFrameT,
     DType,
@@ -26,6 +31,8 @@ from ._types import (
 
 __all__ = (
     "as_data_frame",
+    "as_lazy_frame",
+    "collect_lazy_frame",
     "data_frame_to_native",
     "apply_frame_patches",
     "serialize_dtype",
@@ -95,6 +102,60 @@ def as_data_frame(
             raise e
 
 
+def as_lazy_frame(data: object) -> nw.LazyFrame[Any] | None:
+    """
+    Wrap a lazy frame supported by narwhals (e.g. a polars `LazyFrame` or a DuckDB
+    relation) as a narwhals `LazyFrame`. Returns `None` for any other data.
+    """
+    if isinstance(data, nw.LazyFrame):
+        return cast(nw.LazyFrame[Any], data)
+    try:
+        nw_data = nw.from_native(data)  # pyright: ignore[reportUnknownVariableType]
+    except TypeError:
+        return None
+    if isinstance(nw_data, nw.LazyFrame):
+        return cast(nw.LazyFrame[Any], nw_data)
+    return None
+
+
+def collect_lazy_frame(
+    data: IntoDataFrameT,
+    *,
+    max_rows: int,
+    sort: ListOrTuple[ColumnSort] = (),
+    filters: ListOrTuple[ColumnFilter] = (),
+) -> IntoDataFrameT:
+    """
+    Collect the rows of a lazy frame that are shown in the browser.
+
+    If `data` is a lazy frame supported by narwhals (e.g. a polars `LazyFrame`, a
+    DuckDB relation, or an Ibis table), the user's `sort` and `filters` are added to
+    its query, and only the first `max_rows` rows are collected into the backend's
+    eager data frame (e.g. a polars `DataFrame`). A warning is shown when there are
+    more rows. A narwhals `LazyFrame` is collected into a narwhals `DataFrame`. Any
+    other data is returned as is.
+    """
+    nw_lazy = as_lazy_frame(data)
+    if nw_lazy is None:
+        return data
+
+    # One more row tells whether the rows were truncated
+    nw_data = (
+        sort_filter_lazy_frame(nw_lazy, sort, filters).head(max_rows + 1).collect()
+    )
+    if nw_data.shape[0] > max_rows:
+        warnings.warn(
+            f"Only the first {max_rows} rows of the lazy frame are shown in the data "
+            "frame, and returned by its `.data()` and `.data_view()` methods. Set "
+            "`max_rows=` of `render.DataGrid()` or `render.DataTable()` to show more.",
+            stacklevel=2,
+        )
+        nw_data = nw_data.head(max_rows)
+    if isinstance(data, nw.LazyFrame):
+        return cast(IntoDataFrameT, nw_data)
+    return cast(IntoDataFrameT, nw.to_native(nw_data))
+
+
 def compatible_to_pandas(
     data: IntoDataFrame,
 ) -> pd.DataFrame:
@@ -130,13 +191,6 @@ def apply_frame_patches(
     if len(patches) == 0:
         return nw_data
 
-    # Apply the patches
-
-    # Copy the data to make sure the original data is not modified in place.
-    # If https://github.com/narwhals-dev/narwhals/issues/1154 is resolved, this
-    # should be able to be removed.
-    nw_data = nw_data.clone()
-
     # # https://discord.com/channels/1235257048170762310/1235257049626181656/1283415086722977895
     # # Using narwhals >= v1.7.0
     # @nw.narwhalify
@@ -167,9 +221,14 @@ def apply_frame_patches(
         )
         cell_patches_by_column[column_name]["values"].append(cell_patch["value"])
 
+    # Copy only the patched columns to make sure the original data is not modified in
+    # place. If https://github.com/narwhals-dev/narwhals/issues/1154 is resolved, this
+    # should be able to be removed.
+    patched_columns = nw_data.select(list(cell_patches_by_column.keys())).clone()
+
     # Upgrade the Scatter info to new column Series objects
     scatter_columns = [
-        nw_data[column_name].scatter(
+        patched_columns[column_name].scatter(
             scatter_values["row_indexes"], scatter_values["values"]
         )
         for column_name, scatter_values in cell_patches_by_column.items()
@@ -238,11 +297,26 @@ def serialize_frame(into_data: IntoDataFrame) -> FrameJson:
     #     sending it to the client!
     #   * The only serialization would occur during "send to browser"
     #   * This approach would lose the ability to upgrade the column type hints to "html"
-    data_rows = data.rows(named=False)
-
     session: Session | None = None
     html_deps: list[RenderedDependency] = []
 
+    html_col_indexes = [
+        i for i, type_hint in enumerate(type_hints) if type_hint["type"] == "html"
+    ]
+    if len(html_col_indexes) == 0:
+        data_rows = data.rows(named=False)
+    else:
+        # Render the cells of HTML columns in bulk, rather than one at a time while
+        # serializing
+        session = require_active_session(None)
+        columns: list[list[Any]] = [
+            data[col_name].to_list() for col_name in data.columns
+        ]
+        for i in html_col_indexes:
+            columns[i], col_html_deps = _render_html_cells(columns[i], session=session)
+            html_deps.extend(col_html_deps)
+        data_rows = list(zip(*columns))
+
     # Collect all html deps and dedupe them. Send the html separately from its deps
     # Otherwise, serialize as `str()`
     def default_orjson_serializer(val: Any) -> Jsonifiable:
@@ -285,6 +359,46 @@ def serialize_frame(into_data: IntoDataFrame) -> FrameJson:
     }
 
 
+def _render_html_cells(
+    values: list[Any],
+    *,
+    session: Session,
+) -> tuple[list[Any], list[RenderedDependency]]:
+    """
+    Render the HTML-like cells of a column.
+
+    Each distinct cell value (e.g. the same `Tag` object, or equal `HTML` strings, in
+    many rows) is rendered once, and the HTML dependencies of all cells are collected
+    and registered with the session once for the column. Other values are returned as
+    is.
+    """
+    rendered: dict[object, CellHtml] = {}
+    deps: dict[str, HTMLDependency] = {}
+    ret: list[Any] = []
+    for val in values:
+        if not ui_must_be_processed(val):
+            ret.append(val)
+            continue
+
+        # Strings (i.e. `HTML`) are compared by value, other objects by identity
+        key = val if isinstance(val, str) else id(val)
+        cell_html = rendered.get(key)
+        if cell_html is None:
+            res = TagList(val).render()
+            for dep in res["dependencies"]:
+                cur_dep = deps.get(dep.name)
+                if cur_dep is None or dep.version > cur_dep.version:
+                    deps[dep.name] = dep
+            # The deps are sent separately, for the whole data frame
+            cell_html = as_cell_html({"deps": [], "html": res["html"]})
+            rendered[key] = cell_html
+        ret.append(cell_html)
+
+    if len(deps) == 0:
+        return ret, []
+    return ret, session._process_ui(TagList(*deps.values()))["deps"]
+
+
 # subset_frame -------------------------------------------------------------------------
 def subset_frame(
     data: DataFrameT,
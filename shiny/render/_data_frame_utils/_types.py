@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Literal,
     Optional,
@@ -19,6 +20,7 @@ from narwhals.stable.v1.typing import DataFrameT as DataFrameT
 from narwhals.stable.v1.typing import IntoDataFrame as IntoDataFrame
 from narwhals.stable.v1.typing import IntoDataFrameT as IntoDataFrameT
 from narwhals.stable.v1.typing import IntoExpr as IntoExpr
+from narwhals.stable.v1.typing import IntoSeries as IntoSeries
 
 from ..._typing_extensions import Annotated, NotRequired, Required, TypedDict
 from ...types import Jsonifiable, JsonifiableDict, ListOrTuple
@@ -27,6 +29,7 @@ if TYPE_CHECKING:
     import pandas as pd
 
     from ...session._utils import RenderedDeps
+    from ._indices import IndexArray
 
 __all__ = (
     "IntoExpr",
@@ -57,6 +60,8 @@ __all__ = (
     "StyleInfo",
     "BrowserStyleInfoBody",
     "BrowserStyleInfo",
+    "BrowserStyleInfoEncoded",
+    "IndexRuns",
     "CellValue",
     "CellPatch",
     "CellPatchProcessed",
@@ -151,7 +156,7 @@ class FrameJsonOptions(TypedDict):
     editable: NotRequired[bool]
     style: NotRequired[str]
     fill: NotRequired[bool]
-    styles: NotRequired[list[BrowserStyleInfo]]
+    styles: NotRequired[list[BrowserStyleInfoEncoded]]
 
 
 class FrameJson(TypedDict):
@@ -165,7 +170,7 @@ class FrameJson(TypedDict):
     htmlDeps: NotRequired[list[JsonifiableDict]]
 
 
-RowsList = Optional[ListOrTuple[int]]
+RowsList = Optional[Union[ListOrTuple[int], "IndexArray"]]
 ColsList = Optional[ListOrTuple[Union[str, int]]]
 
 
@@ -217,7 +222,18 @@ StyleInfoBody = TypedDict(
     "StyleInfoBody",
     {
         "location": NotRequired[Literal["body"]],
-        "rows": NotRequired[Union[int, ListOrTuple[int], ListOrTuple[bool], None]],
+        "rows": NotRequired[
+            Union[
+                int,
+                ListOrTuple[int],
+                ListOrTuple[bool],
+                # A boolean Series or an expression that evaluates to one
+                nw.Expr,
+                "nw.Series[Any]",
+                IntoSeries,
+                None,
+            ]
+        ],
         "cols": NotRequired[
             Union[str, int, ListOrTuple[str], ListOrTuple[int], ListOrTuple[bool], None]
         ],
@@ -241,6 +257,23 @@ BrowserStyleInfoBody = TypedDict(
 BrowserStyleInfo = BrowserStyleInfoBody
 
 
+class IndexRuns(TypedDict):
+    runs: list[int]
+
+
+# `BrowserStyleInfo` as sent to the browser, where `rows` may be encoded as runs
+BrowserStyleInfoEncoded = TypedDict(
+    "BrowserStyleInfoEncoded",
+    {
+        "location": Required[Literal["body"]],
+        "rows": Required[Union[Tuple[int, ...], IndexRuns, None]],
+        "cols": Required[Union[Tuple[int, ...], None]],
+        "style": Required[Union[Dict[str, Jsonifiable], None]],
+        "class": Required[Union[str, None]],
+    },
+)
+
+
 # Cell patches ----------------------------------------------------------
 
 # CellValue = str | TagList | Tag | HTML
@@ -11,12 +11,10 @@ from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast
 
 from htmltools import Tag, TagAttrValue, TagChild
 
-from ._data_frame_utils._tbl_data import as_data_frame
-from ._data_frame_utils._types import IntoDataFrame
-
 if TYPE_CHECKING:
 
     from ..session._utils import RenderedDeps
+    from ._data_frame_utils._types import IntoDataFrame
 
 from .. import _utils
 from .. import ui as _ui
@@ -449,7 +447,7 @@ class image(Renderer[ImgData]):
 
 
 @add_example(ex_dir="../api-examples/output_table")
-class table(Renderer[IntoDataFrame]):
+class table(Renderer["IntoDataFrame"]):
     """
     Reactively render a pandas ``DataFrame`` object (or similar) as a basic HTML
     table.
@@ -529,6 +527,8 @@ class table(Renderer[IntoDataFrame]):
             )
         else:
             if not isinstance(value, pandas.DataFrame):
+                from ._data_frame_utils._tbl_data import as_data_frame
+
                 try:
                     nw_data = as_data_frame(value)
                 except Exception as e:
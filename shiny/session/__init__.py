@@ -2,6 +2,8 @@
 Tools for working within a (user) session context.
 """
 
+from ._admission import AdmissionControl
+from ._memory import MemoryAccounting
 from ._session import ClientData, Inputs, Outputs, Session
 from ._utils import (  # noqa: F401
     get_current_session,
@@ -14,6 +16,8 @@ __all__ = (
     "Inputs",
     "Outputs",
     "ClientData",
+    "MemoryAccounting",
+    "AdmissionControl",
     "get_current_session",
     "require_active_session",
 )
@@ -0,0 +1,275 @@
+"""Limits on the sessions that an app starts."""
+
+from __future__ import annotations
+
+__all__ = ("AdmissionControl",)
+
+import html
+import math
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from .._datastructures import LRUCache
+from .._docstring import no_example
+
+# The maximum number of clients whose rate of new sessions is kept track of. (A client
+# that's evicted starts over with a full bucket.)
+MAX_CLIENTS: int = 10_000
+
+# The number of seconds that a session is held for a browser that was sent the app's
+# page, for it to connect
+RESERVATION_TIMEOUT: float = 30
+
+# The name of the cookie that identifies a browser's place in the queue, or the session
+# held for it
+TICKET_COOKIE: str = "shiny_admission_ticket"
+
+
+@no_example()
+class AdmissionControl:
+    """
+    Limit the sessions that an app starts.
+
+    Pass an instance of this class to :class:`~shiny.App` (as `admission_control`), so
+    that when more users arrive than the app can serve, it turns away (or queues) the
+    new ones, rather than slowing down for everyone.
+
+    With `max_sessions`, the app has at most that many sessions at a time. When it's
+    full, up to `max_queued` browsers that request the app's page are shown a page that
+    asks them to wait, which is reloaded every `retry_after` seconds, until a session
+    is available for them (first come, first served). Other browsers are shown a page
+    that asks them to try again later (with status 503).
+
+    With `rate`, each client (IP address) can start `rate` new sessions per second on
+    average, and up to `burst` sessions at once. A client that starts more is shown a
+    page that asks it to try again later (with status 429), and its new sessions are
+    refused.
+
+    Parameters
+    ----------
+    max_sessions
+        The maximum number of sessions that the app has at a time.
+    max_queued
+        The maximum number of browsers that wait for a session when the app has
+        `max_sessions` sessions.
+    rate
+        The number of new sessions per second that each client can start, on average.
+    burst
+        The number of new sessions that each client can start at once, when it hasn't
+        started any for a while.
+    retry_after
+        The number of seconds after which a browser that's waiting (or was turned
+        away) should request the app's page again.
+
+    Note
+    ----
+    The limits apply to each process that serves the app: with `shiny run --workers 4`,
+    each worker has up to `max_sessions` sessions. Clients are identified by the IP
+    address of their connection, so behind a reverse proxy, the proxy should pass on
+    the address of each client (e.g., with uvicorn's `--forwarded-allow-ips`).
+
+    Examples
+    --------
+    ```python
+    from shiny import App
+    from shiny.session import AdmissionControl
+
+    app = App(
+        app_ui,
+        server,
+        admission_control=AdmissionControl(
+            max_sessions=200,
+            max_queued=1000,
+            rate=1,
+            burst=5,
+        ),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: Optional[int] = None,
+        max_queued: int = 0,
+        rate: Optional[float] = None,
+        burst: int = 5,
+        retry_after: float = 5,
+    ) -> None:
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("`max_sessions` must be at least 1.")
+        if max_queued < 0:
+            raise ValueError("`max_queued` can't be negative.")
+        if rate is not None and rate <= 0:
+            raise ValueError("`rate` must be positive.")
+        if burst < 1:
+            raise ValueError("`burst` must be at least 1.")
+        if retry_after <= 0:
+            raise ValueError("`retry_after` must be positive.")
+
+        self.max_sessions: Optional[int] = max_sessions
+        self.max_queued: int = max_queued
+        self.rate: Optional[float] = rate
+        self.burst: int = burst
+        self.retry_after: float = retry_after
+
+
+@dataclass
+class PageAdmission:
+    """
+    Whether to send a browser the app's page (`"ok"`, with the `ticket` of the session
+    held for it), or a page that asks it to wait (at `position` in the queue, with
+    `ticket`), or to try again later.
+    """
+
+    status: Literal["ok", "wait", "busy", "rate_limited"]
+    retry_after: float = 0
+    position: int = 0
+    ticket: Optional[str] = None
+
+
+class Admission:
+    """
+    The state of an app's admission control: the clients' rates of new sessions, the
+    queue of waiting browsers, and the sessions held for browsers that were let in.
+    """
+
+    def __init__(self, control: AdmissionControl) -> None:
+        self.control = control
+        # Maps client to its token bucket: (tokens, when they were counted)
+        self._buckets: LRUCache[str, tuple[float, float]] = LRUCache(MAX_CLIENTS)
+        # Maps the ticket of each waiting browser to when it last requested the page,
+        # in the order in which they arrived
+        self._queue: OrderedDict[str, float] = OrderedDict()
+        # Maps the ticket of each browser that was sent the app's page, but hasn't
+        # connected yet, to when the session held for it expires (in that order)
+        self._reserved: OrderedDict[str, float] = OrderedDict()
+
+    def admit_page(
+        self, client: str, sessions: int, ticket: Optional[str]
+    ) -> PageAdmission:
+        """
+        Decide whether to send the app's page to a browser, given the number of
+        sessions the app has, and the browser's ticket, if it's waiting.
+        """
+        control = self.control
+        now = time.monotonic()
+        self._expire(now)
+
+        if control.rate is not None:
+            tokens = self._tokens(client, now)
+            if tokens < 1:
+                return PageAdmission(
+                    "rate_limited", retry_after=(1 - tokens) / control.rate
+                )
+
+        if control.max_sessions is None:
+            return PageAdmission("ok")
+
+        if ticket is not None and ticket in self._reserved:
+            # The page was reloaded before the browser connected
+            self._reserved[ticket] = now + RESERVATION_TIMEOUT
+            self._reserved.move_to_end(ticket)
+            return PageAdmission("ok", ticket=ticket)
+
+        available = control.max_sessions - sessions - len(self._reserved)
+        waiting = list(self._queue)
+        # Browsers are let in in the order in which they arrived
+        position = waiting.index(ticket) if ticket in self._queue else len(waiting)
+        if position < available:
+            if ticket is not None and ticket in self._queue:
+                del self._queue[ticket]
+            else:
+                ticket = secrets.token_urlsafe(16)
+            self._reserved[ticket] = now + RESERVATION_TIMEOUT
+            return PageAdmission("ok", ticket=ticket)
+
+        if ticket is None or ticket not in self._queue:
+            if len(self._queue) >= control.max_queued:
+                return PageAdmission("busy", retry_after=control.retry_after)
+            ticket = secrets.token_urlsafe(16)
+        self._queue[ticket] = now
+        return PageAdmission(
+            "wait",
+            retry_after=control.retry_after,
+            position=position + 1,
+            ticket=ticket,
+        )
+
+    def admit_session(self, client: str, sessions: int, ticket: Optional[str]) -> bool:
+        """
+        Decide whether to start a session for a client that connected, given the number
+        of sessions the app has, and the ticket of the session held for it, if any.
+        """
+        control = self.control
+        now = time.monotonic()
+        self._expire(now)
+
+        reserved = ticket is not None and ticket in self._reserved
+        if control.max_sessions is not None:
+            # A client without a ticket can't take the sessions held for others
+            held = 0 if reserved else len(self._reserved)
+            if sessions + held >= control.max_sessions:
+                return False
+
+        if control.rate is not None:
+            tokens = self._tokens(client, now)
+            if tokens < 1:
+                return False
+            self._buckets.set(client, (tokens - 1, now))
+
+        if reserved:
+            assert ticket is not None
+            del self._reserved[ticket]
+        return True
+
+    def _tokens(self, client: str, now: float) -> float:
+        rate = self.control.rate
+        assert rate is not None
+        burst = self.control.burst
+        tokens, counted = self._buckets.get(client) or (burst, now)
+        return min(burst, tokens + (now - counted) * rate)
+
+    def _expire(self, now: float) -> None:
+        while self._reserved:
+            ticket, expires = next(iter(self._reserved.items()))
+            if expires > now:
+                break
+            del self._reserved[ticket]
+        # Browsers that stopped reloading the page have left the queue
+        abandoned = now - 3 * self.control.retry_after
+        for ticket, seen in list(self._queue.items()):
+            if seen < abandoned:
+                del self._queue[ticket]
+
+
+def admission_page(admission: PageAdmission) -> str:
+    """
+    The HTML of a page for a browser that wasn't sent the app's page.
+    """
+    if admission.status == "wait":
+        title = "Please wait"
+        message = (
+            f"The app is busy. You're number {admission.position} in line, and this "
+            "page will open the app when it's your turn."
+        )
+        refresh = (
+            f'<meta http-equiv="refresh" content="{math.ceil(admission.retry_after)}">'
+        )
+    elif admission.status == "busy":
+        title = "The app is busy"
+        message = "The app is serving as many users as it can. Please try again later."
+        refresh = ""
+    else:
+        title = "Too many requests"
+        message = "Too many sessions were started. Please try again later."
+        refresh = ""
+    return (
+        "<!DOCTYPE html>\n"
+        '<html><head><meta charset="utf-8">'
+        f"{refresh}<title>{html.escape(title)}</title></head>"
+        f"<body><h1>{html.escape(title)}</h1><p>{html.escape(message)}</p></body></html>"
+    )
@@ -0,0 +1,525 @@
+"""Estimates and limits of the memory retained by sessions."""
+
+from __future__ import annotations
+
+__all__ = ("MemoryAccounting",)
+
+import asyncio
+import functools
+import hashlib
+import logging
+import math
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from types import FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Optional, cast
+from weakref import WeakSet
+
+from .._docstring import no_example
+from .._typing_extensions import TypedDict
+from ..reactive import _reactives
+from ..reactive._core import Context, Dependents, lock
+from ..reactive._reactives import Calc_, Value
+
+if TYPE_CHECKING:
+    from .._app import App
+    from ._session import AppSession
+
+# The maximum number of objects visited when estimating the size of a session. Sizes
+# of very large object graphs are underestimated, rather than taking a long time.
+MAX_OBJECTS: int = 1_000_000
+
+logger = logging.getLogger(__name__)
+
+# The number of apps that keep track of the reactive objects created by sessions
+_node_tracking_count: int = 0
+
+
+class ReactiveNodeMemory(TypedDict):
+    kind: Literal["input", "output", "calc", "value", "uploads"]
+    name: str
+    bytes: int
+
+
+class SessionMemoryUsage(TypedDict):
+    id: str
+    bytes: int
+    nodes: list[ReactiveNodeMemory]
+
+
+@no_example()
+class MemoryAccounting:
+    """
+    Estimate and limit the memory retained by each session.
+
+    Pass an instance of this class to :class:`~shiny.App` (as `memory_accounting`) to
+    keep track of the reactive values, calculations and outputs created by each session.
+    The memory that they retain can then be estimated with
+    :meth:`~shiny.App.memory_usage`, or requested from `endpoint`.
+
+    When a limit is given, a session's memory is estimated after it handles a message
+    from the browser (at most once every `check_interval` seconds). When the estimate
+    exceeds `soft_limit`, the cached values of the session's reactive calculations are
+    evicted, largest first, until it's below the limit (they're recomputed the next time
+    they're read). When the estimate still exceeds `hard_limit`, the session is closed.
+
+    With `idle_timeout`, the cached values of all of a session's reactive calculations
+    are evicted once the session hasn't received a message from the browser for that
+    long (e.g., a dashboard left open overnight). With `offload_dir`, evicted values are
+    pickled to disk and read back when they're needed, instead of being recomputed.
+
+    Parameters
+    ----------
+    soft_limit
+        The number of bytes a session can retain before the cached values of its
+        reactive calculations are evicted.
+    hard_limit
+        The number of bytes a session can retain before it's closed.
+    check_interval
+        The minimum number of seconds between checks of a session's memory against the
+        limits.
+    endpoint
+        A path (e.g., `"/admin/memory"`) at which the app serves the estimated memory
+        of its sessions, as JSON. Session IDs are replaced by a hash in the response.
+        The endpoint isn't protected, so it should only be used when access to the path
+        is restricted (e.g., by a reverse proxy).
+    idle_timeout
+        The number of seconds a session can be idle (i.e., not receive messages from the
+        browser) before the cached values of its reactive calculations are evicted.
+    offload_dir
+        A directory in which to store the evicted values of reactive calculations, so
+        that they can be read back rather than recomputed. Each session's values are
+        stored in a temporary subdirectory, which is removed when the session ends.
+        Values that can't be pickled are dropped, and recomputed when needed.
+
+    Note
+    ----
+    The sizes are estimates: data frames (pandas, polars, pyarrow and narwhals) and
+    NumPy arrays report their own size, and containers (e.g., `list`, `dict`, and the
+    attributes of objects) are traversed. Objects that are shared by several reactive
+    objects are counted once, for the first one, and objects that aren't specific to
+    the session (e.g., functions, modules and sessions) aren't counted. Files uploaded
+    to the session are counted with their size on disk.
+
+    Examples
+    --------
+    ```python
+    from shiny import App
+    from shiny.session import MemoryAccounting
+
+    app = App(
+        app_ui,
+        server,
+        memory_accounting=MemoryAccounting(
+            soft_limit=200e6,
+            hard_limit=500e6,
+            idle_timeout=30 * 60,
+        ),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        soft_limit: Optional[float] = None,
+        hard_limit: Optional[float] = None,
+        check_interval: float = 5,
+        endpoint: Optional[str] = None,
+        idle_timeout: Optional[float] = None,
+        offload_dir: Optional[str | Path] = None,
+    ) -> None:
+        if soft_limit is not None and soft_limit <= 0:
+            raise ValueError("`soft_limit` must be positive.")
+        if hard_limit is not None and hard_limit <= 0:
+            raise ValueError("`hard_limit` must be positive.")
+        if soft_limit is not None and hard_limit is not None:
+            if soft_limit > hard_limit:
+                raise ValueError("`soft_limit` can't be greater than `hard_limit`.")
+        if endpoint is not None and not endpoint.startswith("/"):
+            raise ValueError("`endpoint` must start with '/'.")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("`idle_timeout` must be positive.")
+        if offload_dir is not None and not os.path.isdir(offload_dir):
+            raise ValueError(f"`offload_dir` is not a directory: {offload_dir}")
+
+        self.soft_limit: Optional[float] = soft_limit
+        self.hard_limit: Optional[float] = hard_limit
+        self.check_interval: float = check_interval
+        self.endpoint: Optional[str] = endpoint
+        self.idle_timeout: Optional[float] = idle_timeout
+        self.offload_dir: Optional[str | Path] = offload_dir
+
+
+def enable_node_tracking() -> None:
+    """
+    Keep track of the reactive values and calcs created by sessions from now on.
+    """
+    global _node_tracking_count
+    _node_tracking_count += 1
+    _reactives._track_node = _track_node
+
+
+def disable_node_tracking() -> None:
+    """
+    Undo a call to `enable_node_tracking()`. Reactive objects are no longer tracked once
+    every call has been undone.
+    """
+    global _node_tracking_count
+    _node_tracking_count = max(_node_tracking_count - 1, 0)
+    if _node_tracking_count == 0:
+        _reactives._track_node = None
+
+
+def _track_node(node: Value[Any] | Calc_[Any]) -> None:
+    from ._session import AppSession, Session
+    from ._utils import get_current_session
+
+    session = node._session if isinstance(node, Calc_) else get_current_session()
+    if not isinstance(session, Session):
+        return
+    root = session.root_scope()
+    if isinstance(root, AppSession) and root._memory is not None:
+        root._memory.track(node)
+
+
+class SessionMemory:
+    """
+    The reactive objects of a session, whose memory can be estimated.
+    """
+
+    def __init__(self, session: AppSession, accounting: MemoryAccounting) -> None:
+        self._session = session
+        self._accounting = accounting
+        self._calcs: WeakSet[Calc_[Any]] = WeakSet()
+        self._values: WeakSet[Value[Any]] = WeakSet()
+        self._last_check: float = -math.inf
+        self._last_activity: float = time.monotonic()
+        self._activity: Optional[asyncio.Event] = None
+        self._idle_task: Optional[asyncio.Task[None]] = None
+        self._offload_dir: Optional[str] = None
+
+        session.on_ended(self._on_ended)
+
+    def track(self, node: Value[Any] | Calc_[Any]) -> None:
+        if isinstance(node, Calc_):
+            self._calcs.add(node)
+        else:
+            self._values.add(node)
+
+    def usage(self) -> SessionMemoryUsage:
+        """
+        Estimate the memory retained by the session.
+        """
+        return self._measure()[0]
+
+    def evict_calcs(self, nbytes: float = math.inf) -> int:
+        """
+        Evict the cached values of calcs, largest first, until at least `nbytes` bytes
+        have been freed (or no calcs are left). Returns the number of bytes freed.
+        """
+        return self._evict(self._measure()[1], nbytes)
+
+    def start(self) -> None:
+        """
+        Start watching for the session to become idle, if there's an `idle_timeout`.
+        """
+        idle_timeout = self._accounting.idle_timeout
+        if idle_timeout is None or self._idle_task is not None:
+            return
+        self._activity = asyncio.Event()
+        self._idle_task = asyncio.create_task(self._watch_idle(idle_timeout))
+
+    def on_activity(self) -> None:
+        """
+        Record that the session received a message from the browser.
+        """
+        self._last_activity = time.monotonic()
+        if self._activity is not None:
+            self._activity.set()
+
+    async def _watch_idle(self, idle_timeout: float) -> None:
+        activity = cast(asyncio.Event, self._activity)
+        while True:
+            delay = self._last_activity + idle_timeout - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            async with lock():
+                for calc in list(self._calcs):
+                    self._evict_calc(calc)
+
+            # Nothing is left to evict until the session is used again
+            activity.clear()
+            await activity.wait()
+
+    def _on_ended(self) -> None:
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+            self._idle_task = None
+        if self._offload_dir is not None:
+            shutil.rmtree(self._offload_dir, ignore_errors=True)
+            self._offload_dir = None
+
+    def _evict_calc(self, calc: Calc_[Any]) -> bool:
+        offload_dir = self._accounting.offload_dir
+        if offload_dir is None:
+            return calc._evict_value()
+
+        if self._offload_dir is None:
+            self._offload_dir = tempfile.mkdtemp(
+                prefix="shiny-offload-", dir=offload_dir
+            )
+        return calc._evict_value(functools.partial(_offload, self._offload_dir))
+
+    async def check(self) -> bool:
+        """
+        Check the session's memory against the limits. Returns whether the session is
+        still open.
+        """
+        accounting = self._accounting
+        soft_limit = accounting.soft_limit
+        hard_limit = accounting.hard_limit
+        if soft_limit is None and hard_limit is None:
+            return True
+
+        now = time.monotonic()
+        if now - self._last_check < accounting.check_interval:
+            return True
+        self._last_check = now
+
+        # Objects are measured in a thread, so that the app's other sessions aren't held
+        # up by a large session
+        try:
+            usage, calc_sizes = await asyncio.to_thread(self._measure)
+        except RuntimeError:
+            # A container was changed while it was measured (e.g., by another session's
+            # code, on the event loop); check again after the next message
+            self._last_check = -math.inf
+            return True
+        total = usage["bytes"]
+
+        if soft_limit is not None and total > soft_limit:
+            async with lock():
+                total -= self._evict(calc_sizes, total - soft_limit)
+
+        if hard_limit is not None and total > hard_limit:
+            logger.warning(
+                f"Closing session {session_hash(self._session.id)}, which retains an "
+                f"estimated {total} bytes, more than the limit of {hard_limit:.0f} "
+                "bytes."
+            )
+            # 1008: Policy Violation
+            await self._session.close(1008)
+            return False
+
+        return True
+
+    def _evict(self, calc_sizes: list[tuple[Calc_[Any], int]], nbytes: float) -> int:
+        freed = 0
+        for calc, size in sorted(calc_sizes, key=lambda x: x[1], reverse=True):
+            if freed >= nbytes or size == 0:
+                break
+            if self._evict_calc(calc):
+                freed += size
+        return freed
+
+    def _measure(self) -> tuple[SessionMemoryUsage, list[tuple[Calc_[Any], int]]]:
+        session = self._session
+        sizer = _Sizer()
+        nodes: list[ReactiveNodeMemory] = []
+
+        for name, value in session.input._map.items():
+            nodes.append({"kind": "input", "name": name, "bytes": sizer.size(value)})
+
+        for name, info in session.output._outputs.items():
+            # Renderers (e.g., `render.data_frame`) keep their data in reactive values
+            values: list[object] = [
+                x for x in vars(info.renderer).values() if isinstance(x, Value)
+            ]
+            nodes.append({"kind": "output", "name": name, "bytes": sizer.size(*values)})
+
+        calc_sizes: list[tuple[Calc_[Any], int]] = []
+        for calc in list(self._calcs):
+            size = sizer.size(*calc._value)
+            calc_sizes.append((calc, size))
+            nodes.append({"kind": "calc", "name": calc.__name__, "bytes": size})
+
+        nodes.append(
+            {
+                "kind": "value",
+                "name": "(other reactive values)",
+                "bytes": sizer.size(*self._values),
+            }
+        )
+
+        nodes.append(
+            {
+                "kind": "uploads",
+                "name": "(uploaded files)",
+                "bytes": _dir_size(session._file_upload_manager._basedir),
+            }
+        )
+
+        nodes.sort(key=lambda node: node["bytes"], reverse=True)
+        usage: SessionMemoryUsage = {
+            "id": session.id,
+            "bytes": sum(node["bytes"] for node in nodes),
+            "nodes": nodes,
+        }
+        return usage, calc_sizes
+
+
+def _offload(dir: str, value: object) -> Callable[[], object]:
+    fd, path = tempfile.mkstemp(suffix=".pickle", dir=dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        os.remove(path)
+        raise
+    return _OffloadedValue(path)
+
+
+class _OffloadedValue:
+    """
+    A value pickled to a file, which is removed when this object is garbage collected.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        weakref.finalize(self, _remove_file, path)
+
+    def __call__(self) -> object:
+        with open(self._path, "rb") as f:
+            return pickle.load(f)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def session_hash(id: str) -> str:
+    """
+    A short hash of a session ID, to identify a session in logs and responses without
+    revealing its ID.
+    """
+    return hashlib.sha256(id.encode("utf-8")).hexdigest()[:16]
+
+
+def memory_usage_json(app: App) -> dict[str, object]:
+    usages = app.memory_usage()
+    return {
+        "bytes": sum(usage["bytes"] for usage in usages),
+        "sessions": [{**usage, "id": session_hash(usage["id"])} for usage in usages],
+    }
+
+
+# Objects that aren't traversed when estimating sizes, because they're shared with
+# other sessions or are part of the reactive graph rather than its data
+_OPAQUE_TYPES: tuple[type, ...] = (
+    type,
+    ModuleType,
+    FunctionType,
+    MethodType,
+    Calc_,
+    Context,
+    Dependents,
+)
+
+_ATOMIC_TYPES: tuple[type, ...] = (str, bytes, bytearray, int, float, complex, bool)
+
+
+class _Sizer:
+    """
+    Estimates the sizes of objects, counting each object once across calls.
+    """
+
+    def __init__(self) -> None:
+        self._seen: set[int] = set()
+        self._budget: int = MAX_OBJECTS
+
+    def size(self, *objs: object) -> int:
+        from ._session import Session
+
+        seen = self._seen
+        total = 0
+        stack: list[object] = list(objs)
+        while stack and self._budget > 0:
+            x = stack.pop()
+            if id(x) in seen or x is None:
+                continue
+            seen.add(id(x))
+            self._budget -= 1
+
+            if isinstance(x, _ATOMIC_TYPES):
+                total += sys.getsizeof(x)
+                continue
+            if isinstance(x, _OPAQUE_TYPES) or isinstance(x, Session):
+                continue
+            if isinstance(x, Value):
+                stack.append(cast("Value[Any]", x)._value)
+                continue
+
+            frame_size = _data_size(x)
+            if frame_size is not None:
+                total += frame_size
+                continue
+
+            total += sys.getsizeof(x)
+            if isinstance(x, dict):
+                items = cast("dict[object, object]", x)
+                stack.extend(items.keys())
+                stack.extend(items.values())
+            elif isinstance(x, (list, tuple, set, frozenset, deque)):
+                stack.extend(cast("Iterable[object]", x))
+            elif hasattr(x, "__dict__") and not callable(x):
+                stack.append(vars(x))
+
+        return total
+
+
+def _data_size(x: object) -> Optional[int]:
+    """
+    The size of a data frame, series or array, or `None` if `x` isn't one.
+    """
+    module = type(x).__module__.split(".", 1)[0]
+    obj: Any = x
+    try:
+        if module == "numpy" and hasattr(obj, "nbytes"):
+            return int(obj.nbytes)
+        if module == "pandas" and hasattr(obj, "memory_usage"):
+            usage = obj.memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        if module == "polars" and hasattr(obj, "estimated_size"):
+            return int(obj.estimated_size())
+        if module == "pyarrow" and hasattr(obj, "nbytes"):
+            return int(obj.nbytes)
+        if module == "narwhals" and hasattr(obj, "to_native"):
+            native = obj.to_native()
+            return _data_size(native) or sys.getsizeof(native)
+    except Exception:
+        return None
+    return None
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+    return total
@@ -11,6 +11,7 @@ import json
 import os
 import re
 import sys
+import time
 import traceback
 import typing
 import urllib.parse
@@ -37,7 +38,7 @@ from starlette.responses import HTMLResponse, PlainTextResponse, StreamingRespon
 from starlette.types import ASGIApp
 
 from .. import _utils, reactive, render
-from .._connection import Connection, ConnectionClosed
+from .._connection import Connection, ConnectionClosed, ResumableConnection
 from .._deprecated import warn_deprecated
 from .._docstring import add_example
 from .._fileupload import FileInfo, FileUploadManager
@@ -56,6 +57,7 @@ from ..types import (
     SilentException,
     SilentOperationInProgressException,
 )
+from ._memory import SessionMemory
 from ._utils import RenderedDeps, read_thunk_opt, session_context
 
 if TYPE_CHECKING:
@@ -554,6 +556,15 @@ class AppSession(Session):
         self._flush_callbacks = _utils.AsyncCallbacks()
         self._flushed_callbacks = _utils.AsyncCallbacks()
 
+        # The reactive objects of the session, if the app accounts for their memory
+        self._memory: SessionMemory | None = None
+        if app._memory_accounting is not None:
+            self._memory = SessionMemory(self, app._memory_accounting)
+
+        # When the session last received a message from the browser (for closing idle
+        # sessions when the app is drained)
+        self._last_received: float = time.monotonic()
+
     def _register_session_end_callbacks(self) -> None:
         # This is to be called from the initialization. It registers functions
         # that are called when a session ends.
@@ -596,11 +607,20 @@ class AppSession(Session):
                         }
                     }
                 )
+                if isinstance(self._conn, ResumableConnection):
+                    # Let the client reconnect to this session if its connection drops
+                    await self._send_message({"allowReconnect": True})
+                    await self._send_message(
+                        {"custom": {"shiny.resume": self._conn.token}}
+                    )
 
                 while True:
                     message: str = await self._conn.receive()
+                    self._last_received = time.monotonic()
                     if self._debug:
                         print("RECV: " + message, flush=True)
+                    if self._memory is not None:
+                        self._memory.on_activity()
 
                     try:
                         message_obj = json.loads(
@@ -619,7 +639,17 @@ class AppSession(Session):
                         return
 
                     async with lock():
-                        if message_obj["method"] == "init":
+                        if (
+                            message_obj["method"] == "init"
+                            and conn_state == ConnectionState.Running
+                            and isinstance(self._conn, ResumableConnection)
+                        ):
+                            # The client has reconnected, and sends all of its input
+                            # values again
+                            message_obj = typing.cast(ClientMessageInit, message_obj)
+                            self._manage_inputs(message_obj["data"])
+
+                        elif message_obj["method"] == "init":
                             verify_state(ConnectionState.Start)
 
                             # When a reactive flush occurs, flush the session's outputs,
@@ -637,6 +667,9 @@ class AppSession(Session):
                             with session_context(self):
                                 self.app.server(self.input, self.output, self)
 
+                            if self._memory is not None:
+                                self._memory.start()
+
                         elif message_obj["method"] == "update":
                             verify_state(ConnectionState.Running)
 
@@ -664,6 +697,9 @@ class AppSession(Session):
 
                         await flush()
 
+                    if self._memory is not None and not await self._memory.check():
+                        return
+
             except ConnectionClosed:
                 ...
             except Exception as e:
@@ -0,0 +1,320 @@
+"""
+Key-value stores for app-scoped data, like caches of expensive results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from ._docstring import no_example
+
+__all__ = (
+    "Store",
+    "MemoryStore",
+    "FileStore",
+    "SQLiteStore",
+)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+# The number of seconds that a `SQLiteStore` waits for another process that's writing
+# to the database, before it gives up (with `sqlite3.OperationalError`)
+BUSY_TIMEOUT: float = 5
+
+
+@no_example()
+class Store(ABC):
+    """
+    A key-value store for app-scoped data, like caches of expensive results.
+
+    An app's store is :attr:`~shiny.App.store`. When the app is run with several worker
+    processes (e.g., with `shiny run --workers 4`), each worker has its own sessions
+    and its own copy of the app's Python objects, so data that the workers should share
+    must be kept outside of the processes, by a :class:`FileStore` or a
+    :class:`SQLiteStore`.
+
+    Values are pickled (except by :class:`MemoryStore`), so they must be picklable, and
+    a value that's read from the store is a copy of the value that was set.
+
+    The methods of a store block: those of a :class:`FileStore` or :class:`SQLiteStore`
+    read or write the disk, and may wait for other processes. In async code (e.g., an
+    async `@reactive.effect`), use their async counterparts, like
+    :meth:`~shiny.store.Store.get_async`, which run them in a thread, so that the
+    app's other sessions aren't held up in the meantime.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get the value of `key`, or `default` if it's not set (or has expired).
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        """
+        Set the value of `key`. If `ttl` is not `None`, the value expires after `ttl`
+        seconds.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove `key` from the store, if it's there.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all keys from the store.
+        """
+
+    def get_or_set(
+        self, key: str, fn: Callable[[], T], *, ttl: Optional[float] = None
+    ) -> T:
+        """
+        Get the value of `key`, or if it isn't set, set it to the result of `fn()`.
+
+        Note that several processes (or threads) that find that `key` isn't set may all
+        call `fn()`.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fn()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    async def get_async(self, key: str, default: Any = None) -> Any:
+        """
+        Like :meth:`get`, but without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def set_async(
+        self, key: str, value: Any, *, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Like :meth:`set`, but without blocking the event loop.
+        """
+        await asyncio.to_thread(self.set, key, value, ttl=ttl)
+
+    async def delete_async(self, key: str) -> None:
+        """
+        Like :meth:`delete`, but without blocking the event loop.
+        """
+        await asyncio.to_thread(self.delete, key)
+
+    async def clear_async(self) -> None:
+        """
+        Like :meth:`clear`, but without blocking the event loop.
+        """
+        await asyncio.to_thread(self.clear)
+
+
+@no_example()
+class MemoryStore(Store):
+    """
+    A store that keeps values in the memory of the process.
+
+    This is the default store of an app that's run in a single process. Values aren't
+    copied, so a mutable value that's read from the store is the value that was set.
+    """
+
+    def __init__(self) -> None:
+        # Maps key to (expiration time, value)
+        self._items: dict[str, tuple[Optional[float], Any]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._items.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if _expired(expires):
+            self._items.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        self._items[key] = (_expiration(ttl), value)
+
+    def delete(self, key: str) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    # The values are in memory, so there's no need for a thread
+
+    async def get_async(self, key: str, default: Any = None) -> Any:
+        return self.get(key, default)
+
+    async def set_async(
+        self, key: str, value: Any, *, ttl: Optional[float] = None
+    ) -> None:
+        self.set(key, value, ttl=ttl)
+
+    async def delete_async(self, key: str) -> None:
+        self.delete(key)
+
+    async def clear_async(self) -> None:
+        self.clear()
+
+
+@no_example()
+class FileStore(Store):
+    """
+    A store that keeps each value in a file in a directory.
+
+    Parameters
+    ----------
+    directory
+        The directory to keep the values in. It's created if it doesn't exist.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, expires, value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return default
+        if stored_key != key:
+            return default
+        if _expired(expires):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            return default
+        return value
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        data = pickle.dumps((key, _expiration(ttl), value))
+        # Write to a temporary file, and then move it into place, so that other
+        # processes never read a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._path(key).unlink()
+
+    def clear(self) -> None:
+        for path in self._dir.glob("*.pickle"):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / (hashlib.sha256(key.encode()).hexdigest() + ".pickle")
+
+
+@no_example()
+class SQLiteStore(Store):
+    """
+    A store that keeps values in a SQLite database.
+
+    This is the default store of an app that's run with several worker processes
+    (e.g., with `shiny run --workers 4`), which keeps the database in a temporary
+    directory that's shared by the workers.
+
+    While another process writes to the database, reading or writing it waits (for up
+    to a few seconds), so in async code, prefer the async methods, like
+    :meth:`~shiny.store.Store.get_async`.
+
+    Parameters
+    ----------
+    path
+        The path of the database file. It's created if it doesn't exist.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = str(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # The process that opened `_conn` (a connection can't be used by a forked
+        # process)
+        self._pid: Optional[int] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value, expires FROM shiny_store WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return default
+        data, expires = row
+        if _expired(expires):
+            self.delete(key)
+            return default
+        return pickle.loads(data)
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        data = pickle.dumps(value)
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO shiny_store (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, data, _expiration(ttl)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM shiny_store WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM shiny_store")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                self._path,
+                timeout=BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # Let processes read while another one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS shiny_store "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+
+def _expiration(ttl: Optional[float]) -> Optional[float]:
+    if ttl is None:
+        return None
+    if ttl <= 0:
+        raise ValueError("`ttl` must be a positive number of seconds (or `None`).")
+    # Wall-clock time, which is shared by processes
+    return time.time() + ttl
+
+
+def _expired(expires: Optional[float]) -> bool:
+    return expires is not None and time.time() >= expires
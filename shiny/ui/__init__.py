@@ -3,6 +3,8 @@ Tools for creating user interfaces including: custom components, HTML components
 layout helpers, page-level containers, and more.
 """
 
+from typing import TYPE_CHECKING
+
 from htmltools import (
     HTML,
     Tag,
@@ -31,6 +33,8 @@ from htmltools import (
     tags,
 )
 
+from .._lazy import lazy_getattr
+
 # The css module is for internal use, so we won't re-export it.
 from . import css  # noqa: F401  # pyright: ignore[reportUnusedImport]
 
@@ -66,7 +70,6 @@ from ._card import (
     card_footer,
     card_header,
 )
-from ._chat import Chat, chat_ui
 from ._download_button import download_button, download_link
 from ._include_helpers import include_css, include_js
 from ._input_action_button import input_action_button, input_action_link
@@ -109,7 +112,8 @@ from ._insert import insert_ui, remove_ui
 from ._layout import layout_column_wrap
 from ._layout_columns import layout_columns
 from ._markdown import markdown
-from ._markdown_stream import MarkdownStream, output_markdown_stream
+from ._memoize import memoize
+from ._selectize_choices import SelectizeChoices
 from ._modal import modal, modal_button, modal_remove, modal_show
 from ._navs import (
     nav_control,
@@ -169,6 +173,21 @@ from ._valuebox import (
 )
 from .dataframe import output_data_frame
 
+if TYPE_CHECKING:
+    from ._chat import Chat, chat_ui
+    from ._markdown_stream import MarkdownStream, output_markdown_stream
+else:
+    # Chat and markdown streams aren't used by most apps, so only import them when used
+    __getattr__ = lazy_getattr(
+        __name__,
+        {
+            "Chat": "._chat",
+            "chat_ui": "._chat",
+            "MarkdownStream": "._markdown_stream",
+            "output_markdown_stream": "._markdown_stream",
+        },
+    )
+
 __all__ = (
     # _bootstrap
     "row",
@@ -261,6 +280,7 @@ __all__ = (
     "update_numeric",
     "update_select",
     "update_selectize",
+    "SelectizeChoices",
     "update_slider",
     "update_task_button",
     "update_text",
@@ -273,6 +293,8 @@ __all__ = (
     "remove_ui",
     # _markdown
     "markdown",
+    # _memoize
+    "memoize",
     # _markdown_stream
     "output_markdown_stream",
     "MarkdownStream",
@@ -74,6 +74,15 @@ def page_output_dependency() -> HTMLDependency:
     )
 
 
+def reconnect_dependency() -> HTMLDependency:
+    return HTMLDependency(
+        "shiny-reconnect",
+        __version__,
+        source={"package": "shiny", "subdir": "www/py-shiny/reconnect"},
+        script={"src": "reconnect.js", "type": "module"},
+    )
+
+
 def spin_dependency() -> HTMLDependency:
     return HTMLDependency(
         "shiny-spin",
@@ -18,10 +18,10 @@ __all__ = (
     "update_navs",
 )
 
+import asyncio
 import json
-import re
 from datetime import date
-from typing import TYPE_CHECKING, Literal, Mapping, Optional, cast, overload
+from typing import TYPE_CHECKING, Literal, Optional, cast, overload
 
 from htmltools import TagChild, TagList, tags
 from starlette.requests import Request
@@ -29,7 +29,6 @@ from starlette.responses import JSONResponse, Response
 
 from .._docstring import add_example, doc_format, no_example
 from .._namespaces import ResolvedId, resolve_id
-from .._typing_extensions import NotRequired, TypedDict
 from .._utils import drop_none
 from ..input_handler import input_handlers
 from ..session import require_active_session, session_context
@@ -38,10 +37,12 @@ from ._input_check_radio import ChoicesArg, _generate_options
 from ._input_date import _as_date_attr
 from ._input_select import SelectChoicesArg, _normalize_choices, _render_choices
 from ._input_slider import SliderStepArg, SliderValueArg, _as_numeric, _slider_type
+from ._selectize_choices import SelectizeChoices, shared_selectize_choices
 from ._utils import JSEval, _session_on_flush_send_msg, extract_js_keys
 
 if TYPE_CHECKING:
     from ..session import Session
+    from ..session._session import DynamicRouteHandler
 
 
 _note = """
@@ -664,19 +665,13 @@ def update_select(
     session.send_input_message(id, drop_none(msg))
 
 
-class FlatSelectChoice(TypedDict):
-    label: str
-    value: str
-    optgroup: NotRequired[str]
-
-
 @add_example()
 @doc_format(note=_note)
 def update_selectize(
     id: str,
     *,
     label: Optional[str] = None,
-    choices: Optional[SelectChoicesArg] = None,
+    choices: Optional[SelectChoicesArg | SelectizeChoices] = None,
     selected: Optional[str | list[str]] = None,
     options: Optional[dict[str, str | float | JSEval]] = None,
     server: bool = False,
@@ -696,7 +691,8 @@ def update_selectize(
         that if a dictionary is provided, the keys are used as the (input) values so
         that the dictionary values can hold HTML labels. A dictionary of dictionaries is
         also supported, and in that case, the top-level keys are treated as
-        ``<optgroup>`` labels.
+        ``<optgroup>`` labels. When `server=True`, this can also be a
+        :class:`~shiny.ui.SelectizeChoices` object, which can be shared by sessions.
     selected
         The values that should be initially selected, if any.
     options
@@ -704,7 +700,9 @@ def update_selectize(
     server
         Whether to store choices on the server side, and load the select options
         dynamically on searching, instead of writing all choices into the page at once
-        (i.e., only use the client-side version of selectize.js)
+        (i.e., only use the client-side version of selectize.js). For a large number of
+        choices, create a :class:`~shiny.ui.SelectizeChoices` object once, and pass it
+        as `choices`, so that its search index is shared by all sessions.
     session
         A :class:`~shiny.Session` instance. If not provided, it is inferred via
         :func:`~shiny.session.get_current_session`.
@@ -716,11 +714,14 @@ def update_selectize(
     See Also
     --------
     * :func:`~shiny.ui.input_selectize`
+    * :class:`~shiny.ui.SelectizeChoices`
     """
 
     session = require_active_session(session)
 
     if not server:
+        if isinstance(choices, SelectizeChoices):
+            raise TypeError("`SelectizeChoices` can only be used with `server=True`.")
         return update_select(
             id, label=label, choices=choices, selected=selected, session=session
         )
@@ -736,46 +737,27 @@ def update_selectize(
         )
         session.send_input_message(id, drop_none({"config": cfg.get_html_string()}))
 
-    # Transform choices to a list of dicts (this is the form the client wants)
+    # The choices are searched, and rendered to the list of dicts that the client
+    # wants, when the client asks for them
     # [{"label": "Foo", "value": "foo", "optgroup": "foo"}, ...]
-    flat_choices: list[FlatSelectChoice] = []
-    if choices is not None:
-        for k, v in _normalize_choices(choices).items():
-            if not isinstance(v, Mapping):
-                flat_choices.append(
-                    FlatSelectChoice(value=k, label=session._process_ui(v)["html"])
-                )
-            else:  # The optgroup case
-                flat_choices.extend(
-                    [
-                        FlatSelectChoice(
-                            optgroup=k, value=k2, label=session._process_ui(v2)["html"]
-                        )
-                        for (k2, v2) in v.items()
-                    ]
-                )
+    index: Optional[SelectizeChoices] = None
+    if isinstance(choices, SelectizeChoices):
+        index = choices
+    elif choices is not None:
+        index = shared_selectize_choices(choices)
 
     selected_values = selected
     if isinstance(selected, str):
         selected_values = [selected]
 
-    # Find any selected choices now so we have them ready to send to the client
-    if selected_values is None:
-        selected_choices = []
-    else:
-        selected_choices = [x for x in flat_choices if x["value"] in selected_values]
-
-    def selectize_choices_json(request: Request) -> Response:
-        if choices is None:
+    async def selectize_choices_json(request: Request) -> Response:
+        if index is None:
             return Response([], status_code=200)
 
         # N.B. relevant query parameters that shiny.js setscan be found here
         # https://github.com/rstudio/shiny/blob/78d77ce/srcts/src/bindings/input/selectInput.ts#L138-L142
         qparams = request.query_params
 
-        # The (space-separated) input value(s) in lower-case (for case-insensitive matching)
-        keywords = set(re.split(r"\s+", qparams.get("query", "").lower()))
-
         # Also note that the user (at least someday) has the ability to customize any of
         # these options https://github.com/rstudio/shiny/blob/78d77ce/srcts/src/bindings/input/selectInput.ts#L231
         #
@@ -785,10 +767,10 @@ def update_selectize(
         max_options = int(qparams.get("maxop", 1000))
 
         # i.e. searchConjunction (defaults to 'and', but can also be 'or')
-        conjunction = any if qparams.get("conju", "and") == "or" else all
+        conjunction = qparams.get("conju", "and")
 
         # i.e. searchFields (defaults to ['label'])
-        search_fields: list[str] = json.loads(qparams.get("field", "['label']"))
+        search_fields: list[str] = json.loads(qparams.get("field", '["label"]'))
         if len(search_fields) == 0:
             raise ValueError("The selectize.js searchFields option must be non-empty")
 
@@ -810,37 +792,32 @@ def update_selectize(
                 "The selectize.js valueField option must be set to 'value'"
             )
 
-        filtered_choices: list[FlatSelectChoice] = []
-        for choice in flat_choices:
-            # Short-circuit if we've reached the max number of options
-            if (len(filtered_choices) + len(selected_choices)) > max_options:
-                break
-
-            # If this is a selected value, *don't* add it here (add after this loop)
-            if selected_values and choice["value"] in selected_values:
-                continue
-
-            match = False
-            for f in search_fields:
-                val: Optional[str] = choice.get(f, None)
-                # optgroup could be requested, but not necessarily present/relevant
-                if val is None:
-                    continue
-                if conjunction([x in val.lower() for x in keywords]):
-                    match = True
-
-            if match:
-                filtered_choices.append(choice)
-
-        if selected_choices:
-            filtered_choices.extend(selected_choices)
+        # Selected choices are always sent, after the matching choices
+        selected_positions = index.positions(selected_values or [])
+        # The search (which builds the search index, the first time) runs in a thread,
+        # so as not to hold up the app's sessions
+        positions = await asyncio.to_thread(
+            index.search,
+            qparams.get("query", ""),
+            limit=max_options + 1 - len(selected_positions),
+            fields=search_fields,
+            conjunction=conjunction,
+            exclude=selected_values or [],
+        )
 
-        return JSONResponse(filtered_choices, status_code=200)
+        return JSONResponse(
+            index.choices(positions + selected_positions, session=session),
+            status_code=200,
+        )
 
     msg = {
         "label": label,
         "value": selected_values,
-        "url": session.dynamic_route(f"update_selectize_{id}", selectize_choices_json),
+        # (Async route handlers are awaited)
+        "url": session.dynamic_route(
+            f"update_selectize_{id}",
+            cast("DynamicRouteHandler", selectize_choices_json),
+        ),
     }
 
     return session.send_input_message(id, drop_none(msg))
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+__all__ = ("memoize",)
+
+import functools
+from typing import Callable, Hashable, Optional, overload
+
+from htmltools import HTML, HTMLDependency, TagChild, TagList
+
+from .._datastructures import LRUCache
+from .._docstring import no_example
+from .._namespaces import current_namespace
+from .._typing_extensions import ParamSpec
+
+P = ParamSpec("P")
+
+
+@overload
+def memoize(fn: Callable[P, TagChild], /) -> Callable[P, TagList]: ...
+
+
+@overload
+def memoize(
+    *, max_size: int = 128
+) -> Callable[[Callable[P, TagChild]], Callable[P, TagList]]: ...
+
+
+@no_example()
+def memoize(
+    fn: Optional[Callable[P, TagChild]] = None,
+    /,
+    *,
+    max_size: int = 128,
+) -> Callable[P, TagList] | Callable[[Callable[P, TagChild]], Callable[P, TagList]]:
+    """
+    Cache the rendered HTML of a function that creates UI.
+
+    Functions that build UI (e.g., a card or a navigation menu) create a new tree of
+    tags, and each time the UI is rendered (e.g., by :func:`~shiny.render.ui` or
+    :func:`~shiny.ui.insert_ui`), the whole tree is rendered to HTML and its HTML
+    dependencies collected. When the same UI is created again and again, decorating the
+    function with `@ui.memoize` does this work only once for each distinct set of
+    arguments: the first call renders the UI, and later calls with the same arguments
+    return the stored HTML and dependencies, which are quick to render.
+
+    Parameters
+    ----------
+    fn
+        A function that returns UI. It should be pure: its result should depend only
+        on its arguments (and the current module namespace, which is part of the cache
+        key), not on reactive values or other state.
+    max_size
+        The maximum number of distinct calls whose results are kept. When the cache is
+        full, the least recently used result is discarded.
+
+    Returns
+    -------
+    :
+        A function with the same arguments as `fn`, which returns the rendered UI as a
+        :class:`~htmltools.TagList`.
+
+    Note
+    ----
+    Arguments must be hashable to be used as a cache key. If they aren't (e.g., a
+    `list`, or a `Tag` child), the function is called and rendered as usual.
+
+    Since the same HTML is returned for the same arguments, UI containing randomly
+    generated IDs (e.g., a navset or accordion without an `id`) will have the same IDs
+    each time it is returned. Give such components explicit IDs (as arguments of the
+    function) if the UI may appear on a page more than once.
+
+    See Also
+    --------
+    * :func:`~shiny.render.ui`
+    * :func:`~shiny.ui.insert_ui`
+
+    Examples
+    --------
+    ```python
+    from shiny import ui
+
+    @ui.memoize
+    def header_card(title: str):
+        return ui.card(ui.card_header(title), ui.markdown(LONG_HELP_TEXT))
+    ```
+    """
+
+    def decorator(fn: Callable[P, TagChild]) -> Callable[P, TagList]:
+        cache: LRUCache[Hashable, tuple[str, list[HTMLDependency]]] = LRUCache(max_size)
+
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> TagList:
+            key = (current_namespace(), args, tuple(sorted(kwargs.items())))
+            try:
+                rendered = cache.get(key)
+            except TypeError:
+                # Unhashable arguments can't be cached
+                return TagList(fn(*args, **kwargs))
+
+            if rendered is None:
+                res = TagList(fn(*args, **kwargs)).render()
+                rendered = (res["html"], res["dependencies"])
+                cache.set(key, rendered)
+
+            html, deps = rendered
+            return TagList(HTML(html), *deps)
+
+        return wrapper
+
+    if fn is None:
+        return decorator
+    return decorator(fn)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+__all__ = ("SelectizeChoices",)
+
+import copy
+import heapq
+import re
+import threading
+from array import array
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping, Optional
+
+from htmltools import TagChild, TagList
+
+from .._datastructures import LRUCache
+from .._docstring import no_example
+from .._typing_extensions import NotRequired, TypedDict
+from ._input_select import SelectChoicesArg, _normalize_choices
+
+if TYPE_CHECKING:
+    from ..session import Session
+
+SearchFunction = Callable[[str, int], Iterable[str]]
+"""
+A function that takes a search query and the maximum number of results, and returns
+the values of the matching choices.
+"""
+
+# Length of the substrings that are indexed
+NGRAM: int = 3
+
+_EMPTY: array[int] = array("I")
+
+# The number of lists (or dictionaries) of choices passed to `update_selectize()` whose
+# `SelectizeChoices` are kept, so that sessions that pass the same choices share them
+MAX_SHARED_CHOICES: int = 16
+
+
+class FlatSelectChoice(TypedDict):
+    label: str
+    value: str
+    optgroup: NotRequired[str]
+
+
+@no_example()
+class SelectizeChoices:
+    """
+    Searchable choices for a server-side selectize input.
+
+    With :func:`~shiny.ui.update_selectize` and `server=True`, the choices are kept on
+    the server, and the browser asks the server for the choices that match what the
+    user has typed. Create a `SelectizeChoices` object once (e.g., at the top level of
+    the app) and pass it as the `choices` of `update_selectize()`, to share the choices
+    and their search index across all sessions, rather than giving each session its own
+    copy of a large list of choices.
+
+    Searches look for each (lowercase) word of the query in the lowercase labels of the
+    choices, like selectize.js does in the browser. The first search builds an index of
+    the substrings of the labels, which is used by later searches to only look at the
+    choices that can match. Searches run in a thread (so the first one, which can take
+    a few seconds for hundreds of thousands of choices, doesn't hold up the app's
+    sessions). Labels are only rendered to HTML when a choice is sent to the browser.
+
+    Parameters
+    ----------
+    choices
+        Either a list of choices or a dictionary mapping choice values to labels. A
+        dictionary of dictionaries is also supported, and in that case, the top-level
+        keys are treated as ``<optgroup>`` labels.
+    search
+        A function to use instead of the built-in search, e.g., to search a full-text
+        index in a database. It's called with the search query and the maximum number
+        of choices to return, and returns the values of the matching choices (which
+        must be values of `choices`), in the order in which to show them. The
+        selectize.js `searchField` and `searchConjunction` options are ignored when
+        this is provided. It's called in a thread (so, e.g., a database connection that
+        it uses must allow that).
+
+    Examples
+    --------
+    ```python
+    import sqlite3
+
+    from shiny import ui
+
+    db = sqlite3.connect("products.db", check_same_thread=False)
+    products = dict(db.execute("SELECT id, name FROM products"))
+
+    def search_products(query: str, limit: int):
+        rows = db.execute(
+            "SELECT id FROM products_fts WHERE products_fts MATCH ? LIMIT ?",
+            (query, limit),
+        )
+        return [row[0] for row in rows]
+
+    product_choices = ui.SelectizeChoices(products, search=search_products)
+
+    def server(input, output, session):
+        ui.update_selectize("product", choices=product_choices, server=True)
+    ```
+    """
+
+    def __init__(
+        self,
+        choices: SelectChoicesArg,
+        *,
+        search: Optional[SearchFunction] = None,
+    ) -> None:
+        self._values: list[str] = []
+        self._labels: list[TagChild] = []
+        self._optgroups: list[Optional[str]] = []
+        for k, v in _normalize_choices(choices).items():
+            if not isinstance(v, Mapping):
+                self._append(k, v, None)
+            else:  # The optgroup case
+                for k2, v2 in v.items():
+                    self._append(k2, v2, k)
+
+        self._positions: dict[str, int] = {}
+        for i, value in enumerate(self._values):
+            self._positions.setdefault(value, i)
+
+        self._search_fn = search
+        # Search indexes of the fields, created on first use (by one of the threads
+        # that search)
+        self._indexes: dict[str, _TextIndex] = {}
+        self._lock = threading.Lock()
+
+    def _append(self, value: str, label: TagChild, optgroup: Optional[str]) -> None:
+        self._values.append(value)
+        self._labels.append(label)
+        self._optgroups.append(optgroup)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        fields: Iterable[str] = ("label",),
+        conjunction: str = "and",
+        exclude: Iterable[str] = (),
+    ) -> list[int]:
+        """
+        Find the choices that match `query`.
+
+        Returns the positions of (at most `limit`) matching choices, in order.
+        """
+        exclude = set(exclude)
+        if self._search_fn is not None:
+            positions: Iterable[int] = (
+                self._positions[value]
+                for value in self._search_fn(query, limit + len(exclude))
+                if value in self._positions
+            )
+        else:
+            # The (space-separated) words of the query, in lower case (for
+            # case-insensitive matching)
+            keywords = set(re.split(r"\s+", query.lower()))
+            match_all = conjunction != "or"
+            positions = _unique(
+                heapq.merge(
+                    *(
+                        self._index(field).search(keywords, match_all)
+                        for field in fields
+                    )
+                )
+            )
+
+        result: list[int] = []
+        if limit <= 0:
+            return result
+        for i in positions:
+            if self._values[i] in exclude:
+                continue
+            result.append(i)
+            if len(result) >= limit:
+                break
+        return result
+
+    def choices(
+        self, positions: Iterable[int], *, session: Session
+    ) -> list[FlatSelectChoice]:
+        """
+        The choices at `positions`, with their labels rendered to HTML.
+        """
+        result: list[FlatSelectChoice] = []
+        for i in positions:
+            choice = FlatSelectChoice(
+                value=self._values[i],
+                label=session._process_ui(self._labels[i])["html"],
+            )
+            optgroup = self._optgroups[i]
+            if optgroup is not None:
+                choice["optgroup"] = optgroup
+            result.append(choice)
+        return result
+
+    def positions(self, values: Iterable[str]) -> list[int]:
+        """
+        The positions of the choices with the given values, in the order of the choices.
+        """
+        return sorted(self._positions[x] for x in set(values) if x in self._positions)
+
+    def _index(self, field: str) -> _TextIndex:
+        with self._lock:
+            index = self._indexes.get(field)
+            if index is None:
+                if field == "label":
+                    texts = [_label_text(x) for x in self._labels]
+                elif field == "value":
+                    texts = [x.lower() for x in self._values]
+                elif field == "optgroup":
+                    texts = [(x or "").lower() for x in self._optgroups]
+                else:
+                    raise ValueError(f"Unknown search field: {field}")
+                index = self._indexes[field] = _TextIndex(texts)
+            return index
+
+
+# Maps the id of choices passed to `update_selectize()` to (a copy of the choices, their
+# `SelectizeChoices`)
+_shared_choices: LRUCache[int, tuple[SelectChoicesArg, SelectizeChoices]] = LRUCache(
+    MAX_SHARED_CHOICES
+)
+
+
+def shared_selectize_choices(choices: SelectChoicesArg) -> SelectizeChoices:
+    """
+    The `SelectizeChoices` of a list (or dictionary) of choices, which is shared by the
+    calls with the same choices (e.g., a list at the top level of the app, which every
+    session passes to `update_selectize()`), so that its search index is built once.
+    """
+    cached = _shared_choices.get(id(choices))
+    # The copy is compared with the choices, in case they were modified (or are a new
+    # object with the id of one that was garbage collected)
+    if cached is not None and cached[0] == choices:
+        return cached[1]
+    index = SelectizeChoices(choices)
+    _shared_choices.set(id(choices), (copy.copy(choices), index))
+    return index
+
+
+def _label_text(label: TagChild) -> str:
+    if isinstance(label, str):
+        return label.lower()
+    return TagList(label).get_html_string().lower()
+
+
+class _TextIndex:
+    """
+    A substring index of a list of (lowercase) strings.
+
+    Each substring of length `NGRAM` is mapped to the positions of the strings that
+    contain it, so that a search for a keyword only looks at the strings that contain
+    all of the keyword's substrings of that length.
+    """
+
+    def __init__(self, texts: list[str]) -> None:
+        self._texts = texts
+        self._ngrams: Optional[dict[str, array[int]]] = None
+        self._lock = threading.Lock()
+
+    def search(self, keywords: set[str], match_all: bool) -> Iterator[int]:
+        """
+        The positions of the strings that contain all (or any) of the keywords, in
+        order.
+        """
+        texts = self._texts
+        if match_all:
+            # Only look at the candidates of the most selective keyword, and check
+            # the others
+            candidates = min(
+                (self._candidates(x) for x in keywords),
+                key=lambda x: len(texts) if x is None else len(x),
+            )
+            positions: Iterable[int] = (
+                range(len(texts)) if candidates is None else candidates
+            )
+            for i in positions:
+                text = texts[i]
+                if all(x in text for x in keywords):
+                    yield i
+        else:
+            yield from _unique(heapq.merge(*(self._matches(x) for x in keywords)))
+
+    def _matches(self, keyword: str) -> Iterator[int]:
+        texts = self._texts
+        candidates = self._candidates(keyword)
+        if candidates is None:
+            return (i for i, text in enumerate(texts) if keyword in text)
+        return (i for i in candidates if keyword in texts[i])
+
+    def _candidates(self, keyword: str) -> Optional[array[int]]:
+        """
+        The positions of the strings that may contain `keyword`, or `None` if the
+        keyword is too short to use the index (and all strings must be scanned).
+        """
+        if len(keyword) < NGRAM:
+            return None
+        ngrams = self._get_ngrams()
+        return min(
+            (ngrams.get(x, _EMPTY) for x in _ngrams_of(keyword)),
+            key=len,
+        )
+
+    def _get_ngrams(self) -> dict[str, array[int]]:
+        with self._lock:
+            if self._ngrams is None:
+                ngrams: dict[str, list[int]] = {}
+                for i, text in enumerate(self._texts):
+                    for ngram in _ngrams_of(text):
+                        ngrams.setdefault(ngram, []).append(i)
+                self._ngrams = {k: array("I", v) for k, v in ngrams.items()}
+            return self._ngrams
+
+
+def _ngrams_of(text: str) -> set[str]:
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def _unique(positions: Iterable[int]) -> Iterator[int]:
+    """Drop consecutive duplicates from sorted positions."""
+    last = -1
+    for i in positions:
+        if i != last:
+            yield i
+            last = i
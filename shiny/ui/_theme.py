@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import pathlib
 import re
@@ -11,6 +13,7 @@ if TYPE_CHECKING:
     from brand_yml import Brand
 from htmltools import HTMLDependency
 
+from .. import __version__
 from .._docstring import add_example
 from .._typing_extensions import NotRequired, TypedDict
 from .._versions import bootstrap
@@ -40,6 +43,14 @@ class SassCompileArgs(TypedDict):
 
 theme_temporary_directories: set[tempfile.TemporaryDirectory[str]] = set()
 
+# Environment variable naming the directory where compiled theme CSS is cached. The
+# cache is disabled when it isn't set (or is empty).
+THEME_CACHE_DIR_ENV_VAR = "SHINY_THEME_CACHE_DIR"
+
+# The maximum number of files in the theme cache directory. The least recently used
+# ones are removed when there are more.
+THEME_CACHE_MAX_FILES = 100
+
 
 @add_example()
 class Theme:
@@ -63,8 +74,15 @@ class Theme:
 
     Customized themes are compiled to CSS when the theme is used. The `Theme` class
     caches the compiled CSS so that it's only compiled for the first user to load your
-    app, but you can speed up app loading (and avoid the runtime `libsass` dependency)
-    by pre-compiling the theme CSS and saving it to a file. To do this, use the
+    app. If the `SHINY_THEME_CACHE_DIR` environment variable names a directory, the
+    compiled CSS is also saved there, keyed by a hash of the theme's Sass code, so that
+    other processes (e.g., app workers, or the app after a restart) using an identical
+    theme don't need to compile it again. The directory keeps the 100 most recently used
+    themes. Use `shiny compile-themes APP --cache-dir DIR` to fill the cache when
+    building or deploying your app.
+
+    You can also speed up app loading (and avoid the runtime `libsass` dependency) by
+    pre-compiling the theme CSS and saving it to a file. To do this, use the
     `.to_css()` method to render the theme to a single minified CSS string.
 
     ```{.python filename="my_theme.py"}
@@ -503,7 +521,9 @@ class Theme:
         :
             The compiled CSS for the theme. The value is cached such that previously
             compiled themes are returned immediately. Adding additional custom Sass code
-            or changing the preset will invalidate the cache.
+            or changing the preset will invalidate the cache. The CSS is also cached on
+            disk (see :class:`~shiny.ui.Theme`), so that themes with identical Sass code
+            are only compiled once, even across processes.
         """
         if self._css:
             return self._css
@@ -529,7 +549,18 @@ class Theme:
             **args,
         }
 
-        self._css = sass.compile(string=self.to_sass(), **args)
+        sass_code = self.to_sass()
+        cache_file = _css_cache_file(sass_code, args)
+        if cache_file is not None:
+            css = _read_css_cache(cache_file)
+            if css is not None:
+                self._css = css
+                return self._css
+
+        self._css = sass.compile(string=sass_code, **args)
+
+        if cache_file is not None:
+            _write_css_cache(cache_file, self._css)
 
         return self._css
 
@@ -707,6 +738,119 @@ def path_pkg_preset(preset: ShinyThemePreset, *args: str) -> str:
     return pathlib.Path(path).as_posix()
 
 
+def theme_css_cache_dir() -> Optional[str]:
+    """
+    The directory where compiled theme CSS is cached, or `None` if the cache is
+    disabled.
+    """
+    return os.environ.get(THEME_CACHE_DIR_ENV_VAR) or None
+
+
+def _css_cache_file(sass_code: str, args: SassCompileArgs) -> Optional[str]:
+    """
+    The path of the cache file for the CSS compiled from `sass_code` with `args`, or
+    `None` if the result can't be cached.
+    """
+    cache_dir = theme_css_cache_dir()
+    if cache_dir is None:
+        return None
+
+    # Custom functions and importers are arbitrary Python objects, which can't be
+    # reliably hashed
+    if "custom_functions" in args or "importers" in args:
+        return None
+
+    import sass
+
+    include_paths = args.get("include_paths", [])
+
+    key = hashlib.sha256()
+    for part in (
+        __version__,
+        bootstrap,
+        sass.__version__,  # pyright: ignore[reportUnknownMemberType]
+        json.dumps(args, sort_keys=True, default=str),
+        _include_paths_fingerprint(include_paths),
+        sass_code,
+    ):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+
+    return os.path.join(cache_dir, key.hexdigest()[:32] + ".css")
+
+
+def _include_paths_fingerprint(include_paths: Sequence[str]) -> str:
+    # Files in the include paths may be imported by the theme, so any change to them
+    # (as seen in their size or modification time) must invalidate the cached CSS
+    entries: list[str] = []
+    for include_path in include_paths:
+        for root, dirs, files in os.walk(include_path):
+            dirs.sort()
+            for file in sorted(files):
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(entries)
+
+
+def _read_css_cache(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            css = f.read()
+    except OSError:
+        return None
+    # Mark the file as recently used, so that it's kept when the cache is pruned (the
+    # cache may be read-only, e.g. when it was filled when building the app)
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return css
+
+
+def _write_css_cache(path: str, css: str) -> None:
+    # The cache is only an optimization, so failing to write it (e.g., on a read-only
+    # file system) isn't an error
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename, so that other processes never read a
+        # partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(css)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _prune_css_cache(cache_dir)
+    except OSError:
+        pass
+
+
+def _prune_css_cache(cache_dir: str) -> None:
+    # Remove the least recently used files (by modification time) beyond the limit
+    entries: list[tuple[float, str]] = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".css"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+    if len(entries) <= THEME_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - THEME_CACHE_MAX_FILES]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
 def check_is_valid_preset(preset: str) -> ShinyThemePreset:
     if preset not in shiny_theme_presets:
         raise ValueError(
@@ -4,7 +4,7 @@ var Qe,F,Kn,ti,Ie,Gn,jn,Pt,Ot,Dt,Vt,qn,Je={},Wn=[],ni=/acit|ex(?:s|g|n|p|$)|rph|
             color: hsl(${Math.max(0,Math.min(120-120*g,120))}deg 100% 31%);`,t?.key)}return o}}function E(e,n,t,r){return{debug:()=>{var o;return(o=e?.debugAll)!=null?o:e[n]},key:!1,onChange:r}}function ki(e,n,t,r){let o=()=>{var s;return(s=i.getValue())!=null?s:e.options.renderFallbackValue},i={id:`${n.id}_${t.id}`,row:n,column:t,getValue:()=>n.getValue(r),renderValue:o,getContext:C(()=>[e,t,n,i],(s,a,l,u)=>({table:s,column:a,row:l,cell:u,getValue:u.getValue,renderValue:u.renderValue}),E(e.options,"debugCells","cell.getContext"))};return e._features.forEach(s=>{s.createCell==null||s.createCell(i,t,n,e)},{}),i}function Hi(e,n,t,r){var o,i;let a={...e._getDefaultColumnDef(),...n},l=a.accessorKey,u=(o=(i=a.id)!=null?i:l?l.replace(".","_"):void 0)!=null?o:typeof a.header=="string"?a.header:void 0,f;if(a.accessorFn?f=a.accessorFn:l&&(l.includes(".")?f=g=>{let d=g;for(let p of l.split(".")){var h;d=(h=d)==null?void 0:h[p]}return d}:f=g=>g[a.accessorKey]),!u)throw new Error;let c={id:`${String(u)}`,accessorFn:f,parent:r,depth:t,columnDef:a,columns:[],getFlatColumns:C(()=>[!0],()=>{var g;return[c,...(g=c.columns)==null?void 0:g.flatMap(d=>d.getFlatColumns())]},E(e.options,"debugColumns","column.getFlatColumns")),getLeafColumns:C(()=>[e._getOrderColumnsFn()],g=>{var d;if((d=c.columns)!=null&&d.length){let h=c.columns.flatMap(p=>p.getLeafColumns());return g(h)}return[c]},E(e.options,"debugColumns","column.getLeafColumns"))};for(let g of e._features)g.createColumn==null||g.createColumn(c,e);return c}var Y="debugHeaders";function Pr(e,n,t){var r;let i={id:(r=t.id)!=null?r:n.id,column:n,index:t.index,isPlaceholder:!!t.isPlaceholder,placeholderId:t.placeholderId,depth:t.depth,subHeaders:[],colSpan:0,rowSpan:0,headerGroup:null,getLeafHeaders:()=>{let s=[],a=l=>{l.subHeaders&&l.subHeaders.length&&l.subHeaders.map(a),s.push(l)};return a(i),s},getContext:()=>({table:e,header:i,column:n})};return e._features.forEach(s=>{s.createHeader==null||s.createHeader(i,e)}),i}var Ai={createTable:e=>{e.getHeaderGroups=C(()=>[e.getAllColumns(),e.getVisibleLeafColumns(),e.getState().columnPinning.left,e.getState().columnPinning.right],(n,t,r,o)=>{var i,s;let a=(i=r?.map(c=>t.find(g=>g.id===c)).filter(Boolean))!=null?i:[],l=(s=o?.map(c=>t.find(g=>g.id===c)).filter(Boolean))!=null?s:[],u=t.filter(c=>!(r!=null&&r.includes(c.id))&&!(o!=null&&o.includes(c.id)));return gt(n,[...a,...u,...l],e)},E(e.options,Y,"getHeaderGroups")),e.getCenterHeaderGroups=C(()=>[e.getAllColumns(),e.getVisibleLeafColumns(),e.getState().columnPinning.left,e.getState().columnPinning.right],(n,t,r,o)=>(t=t.filter(i=>!(r!=null&&r.includes(i.id))&&!(o!=null&&o.includes(i.id))),gt(n,t,e,"center")),E(e.options,Y,"getCenterHeaderGroups")),e.getLeftHeaderGroups=C(()=>[e.getAllColumns(),e.getVisibleLeafColumns(),e.getState().columnPinning.left],(n,t,r)=>{var o;let i=(o=r?.map(s=>t.find(a=>a.id===s)).filter(Boolean))!=null?o:[];return gt(n,i,e,"left")},E(e.options,Y,"getLeftHeaderGroups")),e.getRightHeaderGroups=C(()=>[e.getAllColumns(),e.getVisibleLeafColumns(),e.getState().columnPinning.right],(n,t,r)=>{var o;let i=(o=r?.map(s=>t.find(a=>a.id===s)).filter(Boolean))!=null?o:[];return gt(n,i,e,"right")},E(e.options,Y,"getRightHeaderGroups")),e.getFooterGroups=C(()=>[e.getHeaderGroups()],n=>[...n].reverse(),E(e.options,Y,"getFooterGroups")),e.getLeftFooterGroups=C(()=>[e.getLeftHeaderGroups()],n=>[...n].reverse(),E(e.options,Y,"getLeftFooterGroups")),e.getCenterFooterGroups=C(()=>[e.getCenterHeaderGroups()],n=>[...n].reverse(),E(e.options,Y,"getCenterFooterGroups")),e.getRightFooterGroups=C(()=>[e.getRightHeaderGroups()],n=>[...n].reverse(),E(e.options,Y,"getRightFooterGroups")),e.getFlatHeaders=C(()=>[e.getHeaderGroups()],n=>n.map(t=>t.headers).flat(),E(e.options,Y,"getFlatHeaders")),e.getLeftFlatHeaders=C(()=>[e.getLeftHeaderGroups()],n=>n.map(t=>t.headers).flat(),E(e.options,Y,"getLeftFlatHeaders")),e.getCenterFlatHeaders=C(()=>[e.getCenterHeaderGroups()],n=>n.map(t=>t.headers).flat(),E(e.options,Y,"getCenterFlatHeaders")),e.getRightFlatHeaders=C(()=>[e.getRightHeaderGroups()],n=>n.map(t=>t.headers).flat(),E(e.options,Y,"getRightFlatHeaders")),e.getCenterLeafHeaders=C(()=>[e.getCenterFlatHeaders()],n=>n.filter(t=>{var r;return!((r=t.subHeaders)!=null&&r.length)}),E(e.options,Y,"getCenterLeafHeaders")),e.getLeftLeafHeaders=C(()=>[e.getLeftFlatHeaders()],n=>n.filter(t=>{var r;return!((r=t.subHeaders)!=null&&r.length)}),E(e.options,Y,"getLeftLeafHeaders")),e.getRightLeafHeaders=C(()=>[e.getRightFlatHeaders()],n=>n.filter(t=>{var r;return!((r=t.subHeaders)!=null&&r.length)}),E(e.options,Y,"getRightLeafHeaders")),e.getLeafHeaders=C(()=>[e.getLeftHeaderGroups(),e.getCenterHeaderGroups(),e.getRightHeaderGroups()],(n,t,r)=>{var o,i,s,a,l,u;return[...(o=(i=n[0])==null?void 0:i.headers)!=null?o:[],...(s=(a=t[0])==null?void 0:a.headers)!=null?s:[],...(l=(u=r[0])==null?void 0:u.headers)!=null?l:[]].map(f=>f.getLeafHeaders()).flat()},E(e.options,Y,"getLeafHeaders"))}};function gt(e,n,t,r){var o,i;let s=0,a=function(g,d){d===void 0&&(d=1),s=Math.max(s,d),g.filter(h=>h.getIsVisible()).forEach(h=>{var p;(p=h.columns)!=null&&p.length&&a(h.columns,d+1)},0)};a(e);let l=[],u=(g,d)=>{let h={depth:d,id:[r,`${d}`].filter(Boolean).join("_"),headers:[]},p=[];g.forEach(_=>{let m=[...p].reverse()[0],y=_.column.depth===h.depth,R,P=!1;if(y&&_.column.parent?R=_.column.parent:(R=_.column,P=!0),m&&m?.column===R)m.subHeaders.push(_);else{let I=Pr(t,R,{id:[r,d,R.id,_?.id].filter(Boolean).join("_"),isPlaceholder:P,placeholderId:P?`${p.filter(D=>D.column===R).length}`:void 0,depth:d,index:p.length});I.subHeaders.push(_),p.push(I)}h.headers.push(_),_.headerGroup=h}),l.push(h),d>0&&u(p,d-1)},f=n.map((g,d)=>Pr(t,g,{depth:s,index:d}));u(f,s-1),l.reverse();let c=g=>g.filter(h=>h.column.getIsVisible()).map(h=>{let p=0,_=0,m=[0];h.subHeaders&&h.subHeaders.length?(m=[],c(h.subHeaders).forEach(R=>{let{colSpan:P,rowSpan:I}=R;p+=P,m.push(I)})):p=1;let y=Math.min(...m);return _=_+y,h.colSpan=p,h.rowSpan=_,{colSpan:p,rowSpan:_}});return c((o=(i=l[0])==null?void 0:i.headers)!=null?o:[]),l}var mn=(e,n,t,r,o,i,s)=>{let a={id:n,index:r,original:t,depth:o,parentId:s,_valuesCache:{},_uniqueValuesCache:{},getValue:l=>{if(a._valuesCache.hasOwnProperty(l))return a._valuesCache[l];let u=e.getColumn(l);if(u!=null&&u.accessorFn)return a._valuesCache[l]=u.accessorFn(a.original,r),a._valuesCache[l]},getUniqueValues:l=>{if(a._uniqueValuesCache.hasOwnProperty(l))return a._uniqueValuesCache[l];let u=e.getColumn(l);if(u!=null&&u.accessorFn)return u.columnDef.getUniqueValues?(a._uniqueValuesCache[l]=u.columnDef.getUniqueValues(a.original,r),a._uniqueValuesCache[l]):(a._uniqueValuesCache[l]=[a.getValue(l)],a._uniqueValuesCache[l])},renderValue:l=>{var u;return(u=a.getValue(l))!=null?u:e.options.renderFallbackValue},subRows:i??[],getLeafRows:()=>Oi(a.subRows,l=>l.subRows),getParentRow:()=>a.parentId?e.getRow(a.parentId,!0):void 0,getParentRows:()=>{let l=[],u=a;for(;;){let f=u.getParentRow();if(!f)break;l.push(f),u=f}return l.reverse()},getAllCells:C(()=>[e.getAllLeafColumns()],l=>l.map(u=>ki(e,a,u,u.id)),E(e.options,"debugRows","getAllCells")),_getAllCellsByColumnId:C(()=>[a.getAllCells()],l=>l.reduce((u,f)=>(u[f.column.id]=f,u),{}),E(e.options,"debugRows","getAllCellsByColumnId"))};for(let l=0;l<e._features.length;l++){let u=e._features[l];u==null||u.createRow==null||u.createRow(a,e)}return a},Ni={createColumn:(e,n)=>{e._getFacetedRowModel=n.options.getFacetedRowModel&&n.options.getFacetedRowModel(n,e.id),e.getFacetedRowModel=()=>e._getFacetedRowModel?e._getFacetedRowModel():n.getPreFilteredRowModel(),e._getFacetedUniqueValues=n.options.getFacetedUniqueValues&&n.options.getFacetedUniqueValues(n,e.id),e.getFacetedUniqueValues=()=>e._getFacetedUniqueValues?e._getFacetedUniqueValues():new Map,e._getFacetedMinMaxValues=n.options.getFacetedMinMaxValues&&n.options.getFacetedMinMaxValues(n,e.id),e.getFacetedMinMaxValues=()=>{if(e._getFacetedMinMaxValues)return e._getFacetedMinMaxValues()}}},Vr=(e,n,t)=>{var r;let o=t.toLowerCase();return!!(!((r=e.getValue(n))==null||(r=r.toString())==null||(r=r.toLowerCase())==null)&&r.includes(o))};Vr.autoRemove=e=>ce(e);var $r=(e,n,t)=>{var r;return!!(!((r=e.getValue(n))==null||(r=r.toString())==null)&&r.includes(t))};$r.autoRemove=e=>ce(e);var Lr=(e,n,t)=>{var r;return((r=e.getValue(n))==null||(r=r.toString())==null?void 0:r.toLowerCase())===t?.toLowerCase()};Lr.autoRemove=e=>ce(e);var Or=(e,n,t)=>{var r;return(r=e.getValue(n))==null?void 0:r.includes(t)};Or.autoRemove=e=>ce(e)||!(e!=null&&e.length);var kr=(e,n,t)=>!t.some(r=>{var o;return!((o=e.getValue(n))!=null&&o.includes(r))});kr.autoRemove=e=>ce(e)||!(e!=null&&e.length);var Hr=(e,n,t)=>t.some(r=>{var o;return(o=e.getValue(n))==null?void 0:o.includes(r)});Hr.autoRemove=e=>ce(e)||!(e!=null&&e.length);var Ar=(e,n,t)=>e.getValue(n)===t;Ar.autoRemove=e=>ce(e);var Nr=(e,n,t)=>e.getValue(n)==t;Nr.autoRemove=e=>ce(e);var _n=(e,n,t)=>{let[r,o]=t,i=e.getValue(n);return i>=r&&i<=o};_n.resolveFilterValue=e=>{let[n,t]=e,r=typeof n!="number"?parseFloat(n):n,o=typeof t!="number"?parseFloat(t):t,i=n===null||Number.isNaN(r)?-1/0:r,s=t===null||Number.isNaN(o)?1/0:o;if(i>s){let a=i;i=s,s=a}return[i,s]};_n.autoRemove=e=>ce(e)||ce(e[0])&&ce(e[1]);var _e={includesString:Vr,includesStringSensitive:$r,equalsString:Lr,arrIncludes:Or,arrIncludesAll:kr,arrIncludesSome:Hr,equals:Ar,weakEquals:Nr,inNumberRange:_n};function ce(e){return e==null||e===""}var zi={getDefaultColumnDef:()=>({filterFn:"auto"}),getInitialState:e=>({columnFilters:[],...e}),getDefaultOptions:e=>({onColumnFiltersChange:te("columnFilters",e),filterFromLeafRows:!1,maxLeafRowFilterDepth:100}),createColumn:(e,n)=>{e.getAutoFilterFn=()=>{let t=n.getCoreRowModel().flatRows[0],r=t?.getValue(e.id);return typeof r=="string"?_e.includesString:typeof r=="number"?_e.inNumberRange:typeof r=="boolean"||r!==null&&typeof r=="object"?_e.equals:Array.isArray(r)?_e.arrIncludes:_e.weakEquals},e.getFilterFn=()=>{var t,r;return mt(e.columnDef.filterFn)?e.columnDef.filterFn:e.columnDef.filterFn==="auto"?e.getAutoFilterFn():(t=(r=n.options.filterFns)==null?void 0:r[e.columnDef.filterFn])!=null?t:_e[e.columnDef.filterFn]},e.getCanFilter=()=>{var t,r,o;return((t=e.columnDef.enableColumnFilter)!=null?t:!0)&&((r=n.options.enableColumnFilters)!=null?r:!0)&&((o=n.options.enableFilters)!=null?o:!0)&&!!e.accessorFn},e.getIsFiltered=()=>e.getFilterIndex()>-1,e.getFilterValue=()=>{var t;return(t=n.getState().columnFilters)==null||(t=t.find(r=>r.id===e.id))==null?void 0:t.value},e.getFilterIndex=()=>{var t,r;return(t=(r=n.getState().columnFilters)==null?void 0:r.findIndex(o=>o.id===e.id))!=null?t:-1},e.setFilterValue=t=>{n.setColumnFilters(r=>{let o=e.getFilterFn(),i=r?.find(f=>f.id===e.id),s=Re(t,i?i.value:void 0);if(Dr(o,s,e)){var a;return(a=r?.filter(f=>f.id!==e.id))!=null?a:[]}let l={id:e.id,value:s};if(i){var u;return(u=r?.map(f=>f.id===e.id?l:f))!=null?u:[]}return r!=null&&r.length?[...r,l]:[l]})}},createRow:(e,n)=>{e.columnFilters={},e.columnFiltersMeta={}},createTable:e=>{e.setColumnFilters=n=>{let t=e.getAllLeafColumns(),r=o=>{var i;return(i=Re(n,o))==null?void 0:i.filter(s=>{let a=t.find(l=>l.id===s.id);if(a){let l=a.getFilterFn();if(Dr(l,s.value,a))return!1}return!0})};e.options.onColumnFiltersChange==null||e.options.onColumnFiltersChange(r)},e.resetColumnFilters=n=>{var t,r;e.setColumnFilters(n?[]:(t=(r=e.initialState)==null?void 0:r.columnFilters)!=null?t:[])},e.getPreFilteredRowModel=()=>e.getCoreRowModel(),e.getFilteredRowModel=()=>(!e._getFilteredRowModel&&e.options.getFilteredRowModel&&(e._getFilteredRowModel=e.options.getFilteredRowModel(e)),e.options.manualFiltering||!e._getFilteredRowModel?e.getPreFilteredRowModel():e._getFilteredRowModel())}};function Dr(e,n,t){return(e&&e.autoRemove?e.autoRemove(n,t):!1)||typeof n>"u"||typeof n=="string"&&!n}var Gi=(e,n,t)=>t.reduce((r,o)=>{let i=o.getValue(e);return r+(typeof i=="number"?i:0)},0),Bi=(e,n,t)=>{let r;return t.forEach(o=>{let i=o.getValue(e);i!=null&&(r>i||r===void 0&&i>=i)&&(r=i)}),r},Ui=(e,n,t)=>{let r;return t.forEach(o=>{let i=o.getValue(e);i!=null&&(r<i||r===void 0&&i>=i)&&(r=i)}),r},Ki=(e,n,t)=>{let r,o;return t.forEach(i=>{let s=i.getValue(e);s!=null&&(r===void 0?s>=s&&(r=o=s):(r>s&&(r=s),o<s&&(o=s)))}),[r,o]},ji=(e,n)=>{let t=0,r=0;if(n.forEach(o=>{let i=o.getValue(e);i!=null&&(i=+i)>=i&&(++t,r+=i)}),t)return r/t},qi=(e,n)=>{if(!n.length)return;let t=n.map(i=>i.getValue(e));if(!Li(t))return;if(t.length===1)return t[0];let r=Math.floor(t.length/2),o=t.sort((i,s)=>i-s);return t.length%2!==0?o[r]:(o[r-1]+o[r])/2},Wi=(e,n)=>Array.from(new Set(n.map(t=>t.getValue(e))).values()),Xi=(e,n)=>new Set(n.map(t=>t.getValue(e))).size,Yi=(e,n)=>n.length,rn={sum:Gi,min:Bi,max:Ui,extent:Ki,mean:ji,median:qi,unique:Wi,uniqueCount:Xi,count:Yi},Ji={getDefaultColumnDef:()=>({aggregatedCell:e=>{var n,t;return(n=(t=e.getValue())==null||t.toString==null?void 0:t.toString())!=null?n:null},aggregationFn:"auto"}),getInitialState:e=>({grouping:[],...e}),getDefaultOptions:e=>({onGroupingChange:te("grouping",e),groupedColumnMode:"reorder"}),createColumn:(e,n)=>{e.toggleGrouping=()=>{n.setGrouping(t=>t!=null&&t.includes(e.id)?t.filter(r=>r!==e.id):[...t??[],e.id])},e.getCanGroup=()=>{var t,r;return((t=e.columnDef.enableGrouping)!=null?t:!0)&&((r=n.options.enableGrouping)!=null?r:!0)&&(!!e.accessorFn||!!e.columnDef.getGroupingValue)},e.getIsGrouped=()=>{var t;return(t=n.getState().grouping)==null?void 0:t.includes(e.id)},e.getGroupedIndex=()=>{var t;return(t=n.getState().grouping)==null?void 0:t.indexOf(e.id)},e.getToggleGroupingHandler=()=>{let t=e.getCanGroup();return()=>{t&&e.toggleGrouping()}},e.getAutoAggregationFn=()=>{let t=n.getCoreRowModel().flatRows[0],r=t?.getValue(e.id);if(typeof r=="number")return rn.sum;if(Object.prototype.toString.call(r)==="[object Date]")return rn.extent},e.getAggregationFn=()=>{var t,r;if(!e)throw new Error;return mt(e.columnDef.aggregationFn)?e.columnDef.aggregationFn:e.columnDef.aggregationFn==="auto"?e.getAutoAggregationFn():(t=(r=n.options.aggregationFns)==null?void 0:r[e.columnDef.aggregationFn])!=null?t:rn[e.columnDef.aggregationFn]}},createTable:e=>{e.setGrouping=n=>e.options.onGroupingChange==null?void 0:e.options.onGroupingChange(n),e.resetGrouping=n=>{var t,r;e.setGrouping(n?[]:(t=(r=e.initialState)==null?void 0:r.grouping)!=null?t:[])},e.getPreGroupedRowModel=()=>e.getFilteredRowModel(),e.getGroupedRowModel=()=>(!e._getGroupedRowModel&&e.options.getGroupedRowModel&&(e._getGroupedRowModel=e.options.getGroupedRowModel(e)),e.options.manualGrouping||!e._getGroupedRowModel?e.getPreGroupedRowModel():e._getGroupedRowModel())},createRow:(e,n)=>{e.getIsGrouped=()=>!!e.groupingColumnId,e.getGroupingValue=t=>{if(e._groupingValuesCache.hasOwnProperty(t))return e._groupingValuesCache[t];let r=n.getColumn(t);return r!=null&&r.columnDef.getGroupingValue?(e._groupingValuesCache[t]=r.columnDef.getGroupingValue(e.original),e._groupingValuesCache[t]):e.getValue(t)},e._groupingValuesCache={}},createCell:(e,n,t,r)=>{e.getIsGrouped=()=>n.getIsGrouped()&&n.id===t.groupingColumnId,e.getIsPlaceholder=()=>!e.getIsGrouped()&&n.getIsGrouped(),e.getIsAggregated=()=>{var o;return!e.getIsGrouped()&&!e.getIsPlaceholder()&&!!((o=t.subRows)!=null&&o.length)}}};function Qi(e,n,t){if(!(n!=null&&n.length)||!t)return e;let r=e.filter(i=>!n.includes(i.id));return t==="remove"?r:[...n.map(i=>e.find(s=>s.id===i)).filter(Boolean),...r]}var Zi={getInitialState:e=>({columnOrder:[],...e}),getDefaultOptions:e=>({onColumnOrderChange:te("columnOrder",e)}),createColumn:(e,n)=>{e.getIndex=C(t=>[tt(n,t)],t=>t.findIndex(r=>r.id===e.id),E(n.options,"debugColumns","getIndex")),e.getIsFirstColumn=t=>{var r;return((r=tt(n,t)[0])==null?void 0:r.id)===e.id},e.getIsLastColumn=t=>{var r;let o=tt(n,t);return((r=o[o.length-1])==null?void 0:r.id)===e.id}},createTable:e=>{e.setColumnOrder=n=>e.options.onColumnOrderChange==null?void 0:e.options.onColumnOrderChange(n),e.resetColumnOrder=n=>{var t;e.setColumnOrder(n?[]:(t=e.initialState.columnOrder)!=null?t:[])},e._getOrderColumnsFn=C(()=>[e.getState().columnOrder,e.getState().grouping,e.options.groupedColumnMode],(n,t,r)=>o=>{let i=[];if(!(n!=null&&n.length))i=o;else{let s=[...n],a=[...o];for(;a.length&&s.length;){let l=s.shift(),u=a.findIndex(f=>f.id===l);u>-1&&i.push(a.splice(u,1)[0])}i=[...i,...a]}return Qi(i,t,r)},E(e.options,"debugTable","_getOrderColumnsFn"))}},on=()=>({left:[],right:[]}),es={getInitialState:e=>({columnPinning:on(),...e}),getDefaultOptions:e=>({onColumnPinningChange:te("columnPinning",e)}),createColumn:(e,n)=>{e.pin=t=>{let r=e.getLeafColumns().map(o=>o.id).filter(Boolean);n.setColumnPinning(o=>{var i,s;if(t==="right"){var a,l;return{left:((a=o?.left)!=null?a:[]).filter(c=>!(r!=null&&r.includes(c))),right:[...((l=o?.right)!=null?l:[]).filter(c=>!(r!=null&&r.includes(c))),...r]}}if(t==="left"){var u,f;return{left:[...((u=o?.left)!=null?u:[]).filter(c=>!(r!=null&&r.includes(c))),...r],right:((f=o?.right)!=null?f:[]).filter(c=>!(r!=null&&r.includes(c)))}}return{left:((i=o?.left)!=null?i:[]).filter(c=>!(r!=null&&r.includes(c))),right:((s=o?.right)!=null?s:[]).filter(c=>!(r!=null&&r.includes(c)))}})},e.getCanPin=()=>e.getLeafColumns().some(r=>{var o,i,s;return((o=r.columnDef.enablePinning)!=null?o:!0)&&((i=(s=n.options.enableColumnPinning)!=null?s:n.options.enablePinning)!=null?i:!0)}),e.getIsPinned=()=>{let t=e.getLeafColumns().map(a=>a.id),{left:r,right:o}=n.getState().columnPinning,i=t.some(a=>r?.includes(a)),s=t.some(a=>o?.includes(a));return i?"left":s?"right":!1},e.getPinnedIndex=()=>{var t,r;let o=e.getIsPinned();return o?(t=(r=n.getState().columnPinning)==null||(r=r[o])==null?void 0:r.indexOf(e.id))!=null?t:-1:0}},createRow:(e,n)=>{e.getCenterVisibleCells=C(()=>[e._getAllVisibleCells(),n.getState().columnPinning.left,n.getState().columnPinning.right],(t,r,o)=>{let i=[...r??[],...o??[]];return t.filter(s=>!i.includes(s.column.id))},E(n.options,"debugRows","getCenterVisibleCells")),e.getLeftVisibleCells=C(()=>[e._getAllVisibleCells(),n.getState().columnPinning.left],(t,r)=>(r??[]).map(i=>t.find(s=>s.column.id===i)).filter(Boolean).map(i=>({...i,position:"left"})),E(n.options,"debugRows","getLeftVisibleCells")),e.getRightVisibleCells=C(()=>[e._getAllVisibleCells(),n.getState().columnPinning.right],(t,r)=>(r??[]).map(i=>t.find(s=>s.column.id===i)).filter(Boolean).map(i=>({...i,position:"right"})),E(n.options,"debugRows","getRightVisibleCells"))},createTable:e=>{e.setColumnPinning=n=>e.options.onColumnPinningChange==null?void 0:e.options.onColumnPinningChange(n),e.resetColumnPinning=n=>{var t,r;return e.setColumnPinning(n?on():(t=(r=e.initialState)==null?void 0:r.columnPinning)!=null?t:on())},e.getIsSomeColumnsPinned=n=>{var t;let r=e.getState().columnPinning;if(!n){var o,i;return!!((o=r.left)!=null&&o.length||(i=r.right)!=null&&i.length)}return!!((t=r[n])!=null&&t.length)},e.getLeftLeafColumns=C(()=>[e.getAllLeafColumns(),e.getState().columnPinning.left],(n,t)=>(t??[]).map(r=>n.find(o=>o.id===r)).filter(Boolean),E(e.options,"debugColumns","getLeftLeafColumns")),e.getRightLeafColumns=C(()=>[e.getAllLeafColumns(),e.getState().columnPinning.right],(n,t)=>(t??[]).map(r=>n.find(o=>o.id===r)).filter(Boolean),E(e.options,"debugColumns","getRightLeafColumns")),e.getCenterLeafColumns=C(()=>[e.getAllLeafColumns(),e.getState().columnPinning.left,e.getState().columnPinning.right],(n,t,r)=>{let o=[...t??[],...r??[]];return n.filter(i=>!o.includes(i.id))},E(e.options,"debugColumns","getCenterLeafColumns"))}},pt={size:150,minSize:20,maxSize:Number.MAX_SAFE_INTEGER},sn=()=>({startOffset:null,startSize:null,deltaOffset:null,deltaPercentage:null,isResizingColumn:!1,columnSizingStart:[]}),ts={getDefaultColumnDef:()=>pt,getInitialState:e=>({columnSizing:{},columnSizingInfo:sn(),...e}),getDefaultOptions:e=>({columnResizeMode:"onEnd",columnResizeDirection:"ltr",onColumnSizingChange:te("columnSizing",e),onColumnSizingInfoChange:te("columnSizingInfo",e)}),createColumn:(e,n)=>{e.getSize=()=>{var t,r,o;let i=n.getState().columnSizing[e.id];return Math.min(Math.max((t=e.columnDef.minSize)!=null?t:pt.minSize,(r=i??e.columnDef.size)!=null?r:pt.size),(o=e.columnDef.maxSize)!=null?o:pt.maxSize)},e.getStart=C(t=>[t,tt(n,t),n.getState().columnSizing],(t,r)=>r.slice(0,e.getIndex(t)).reduce((o,i)=>o+i.getSize(),0),E(n.options,"debugColumns","getStart")),e.getAfter=C(t=>[t,tt(n,t),n.getState().columnSizing],(t,r)=>r.slice(e.getIndex(t)+1).reduce((o,i)=>o+i.getSize(),0),E(n.options,"debugColumns","getAfter")),e.resetSize=()=>{n.setColumnSizing(t=>{let{[e.id]:r,...o}=t;return o})},e.getCanResize=()=>{var t,r;return((t=e.columnDef.enableResizing)!=null?t:!0)&&((r=n.options.enableColumnResizing)!=null?r:!0)},e.getIsResizing=()=>n.getState().columnSizingInfo.isResizingColumn===e.id},createHeader:(e,n)=>{e.getSize=()=>{let t=0,r=o=>{if(o.subHeaders.length)o.subHeaders.forEach(r);else{var i;t+=(i=o.column.getSize())!=null?i:0}};return r(e),t},e.getStart=()=>{if(e.index>0){let t=e.headerGroup.headers[e.index-1];return t.getStart()+t.getSize()}return 0},e.getResizeHandler=t=>{let r=n.getColumn(e.column.id),o=r?.getCanResize();return i=>{if(!r||!o||(i.persist==null||i.persist(),ln(i)&&i.touches&&i.touches.length>1))return;let s=e.getSize(),a=e?e.getLeafHeaders().map(m=>[m.column.id,m.column.getSize()]):[[r.id,r.getSize()]],l=ln(i)?Math.round(i.touches[0].clientX):i.clientX,u={},f=(m,y)=>{typeof y=="number"&&(n.setColumnSizingInfo(R=>{var P,I;let D=n.options.columnResizeDirection==="rtl"?-1:1,q=(y-((P=R?.startOffset)!=null?P:0))*D,U=Math.max(q/((I=R?.startSize)!=null?I:0),-.999999);return R.columnSizingStart.forEach(K=>{let[G,Z]=K;u[G]=Math.round(Math.max(Z+Z*U,0)*100)/100}),{...R,deltaOffset:q,deltaPercentage:U}}),(n.options.columnResizeMode==="onChange"||m==="end")&&n.setColumnSizing(R=>({...R,...u})))},c=m=>f("move",m),g=m=>{f("end",m),n.setColumnSizingInfo(y=>({...y,isResizingColumn:!1,startOffset:null,startSize:null,deltaOffset:null,deltaPercentage:null,columnSizingStart:[]}))},d=t||typeof document<"u"?document:null,h={moveHandler:m=>c(m.clientX),upHandler:m=>{d?.removeEventListener("mousemove",h.moveHandler),d?.removeEventListener("mouseup",h.upHandler),g(m.clientX)}},p={moveHandler:m=>(m.cancelable&&(m.preventDefault(),m.stopPropagation()),c(m.touches[0].clientX),!1),upHandler:m=>{var y;d?.removeEventListener("touchmove",p.moveHandler),d?.removeEventListener("touchend",p.upHandler),m.cancelable&&(m.preventDefault(),m.stopPropagation()),g((y=m.touches[0])==null?void 0:y.clientX)}},_=ns()?{passive:!1}:!1;ln(i)?(d?.addEventListener("touchmove",p.moveHandler,_),d?.addEventListener("touchend",p.upHandler,_)):(d?.addEventListener("mousemove",h.moveHandler,_),d?.addEventListener("mouseup",h.upHandler,_)),n.setColumnSizingInfo(m=>({...m,startOffset:l,startSize:s,deltaOffset:0,deltaPercentage:0,columnSizingStart:a,isResizingColumn:r.id}))}}},createTable:e=>{e.setColumnSizing=n=>e.options.onColumnSizingChange==null?void 0:e.options.onColumnSizingChange(n),e.setColumnSizingInfo=n=>e.options.onColumnSizingInfoChange==null?void 0:e.options.onColumnSizingInfoChange(n),e.resetColumnSizing=n=>{var t;e.setColumnSizing(n?{}:(t=e.initialState.columnSizing)!=null?t:{})},e.resetHeaderSizeInfo=n=>{var t;e.setColumnSizingInfo(n?sn():(t=e.initialState.columnSizingInfo)!=null?t:sn())},e.getTotalSize=()=>{var n,t;return(n=(t=e.getHeaderGroups()[0])==null?void 0:t.headers.reduce((r,o)=>r+o.getSize(),0))!=null?n:0},e.getLeftTotalSize=()=>{var n,t;return(n=(t=e.getLeftHeaderGroups()[0])==null?void 0:t.headers.reduce((r,o)=>r+o.getSize(),0))!=null?n:0},e.getCenterTotalSize=()=>{var n,t;return(n=(t=e.getCenterHeaderGroups()[0])==null?void 0:t.headers.reduce((r,o)=>r+o.getSize(),0))!=null?n:0},e.getRightTotalSize=()=>{var n,t;return(n=(t=e.getRightHeaderGroups()[0])==null?void 0:t.headers.reduce((r,o)=>r+o.getSize(),0))!=null?n:0}}},ht=null;function ns(){if(typeof ht=="boolean")return ht;let e=!1;try{let n={get passive(){return e=!0,!1}},t=()=>{};window.addEventListener("test",t,n),window.removeEventListener("test",t)}catch{e=!1}return ht=e,ht}function ln(e){return e.type==="touchstart"}var rs={getInitialState:e=>({columnVisibility:{},...e}),getDefaultOptions:e=>({onColumnVisibilityChange:te("columnVisibility",e)}),createColumn:(e,n)=>{e.toggleVisibility=t=>{e.getCanHide()&&n.setColumnVisibility(r=>({...r,[e.id]:t??!e.getIsVisible()}))},e.getIsVisible=()=>{var t,r;let o=e.columns;return(t=o.length?o.some(i=>i.getIsVisible()):(r=n.getState().columnVisibility)==null?void 0:r[e.id])!=null?t:!0},e.getCanHide=()=>{var t,r;return((t=e.columnDef.enableHiding)!=null?t:!0)&&((r=n.options.enableHiding)!=null?r:!0)},e.getToggleVisibilityHandler=()=>t=>{e.toggleVisibility==null||e.toggleVisibility(t.target.checked)}},createRow:(e,n)=>{e._getAllVisibleCells=C(()=>[e.getAllCells(),n.getState().columnVisibility],t=>t.filter(r=>r.column.getIsVisible()),E(n.options,"debugRows","_getAllVisibleCells")),e.getVisibleCells=C(()=>[e.getLeftVisibleCells(),e.getCenterVisibleCells(),e.getRightVisibleCells()],(t,r,o)=>[...t,...r,...o],E(n.options,"debugRows","getVisibleCells"))},createTable:e=>{let n=(t,r)=>C(()=>[r(),r().filter(o=>o.getIsVisible()).map(o=>o.id).join("_")],o=>o.filter(i=>i.getIsVisible==null?void 0:i.getIsVisible()),E(e.options,"debugColumns",t));e.getVisibleFlatColumns=n("getVisibleFlatColumns",()=>e.getAllFlatColumns()),e.getVisibleLeafColumns=n("getVisibleLeafColumns",()=>e.getAllLeafColumns()),e.getLeftVisibleLeafColumns=n("getLeftVisibleLeafColumns",()=>e.getLeftLeafColumns()),e.getRightVisibleLeafColumns=n("getRightVisibleLeafColumns",()=>e.getRightLeafColumns()),e.getCenterVisibleLeafColumns=n("getCenterVisibleLeafColumns",()=>e.getCenterLeafColumns()),e.setColumnVisibility=t=>e.options.onColumnVisibilityChange==null?void 0:e.options.onColumnVisibilityChange(t),e.resetColumnVisibility=t=>{var r;e.setColumnVisibility(t?{}:(r=e.initialState.columnVisibility)!=null?r:{})},e.toggleAllColumnsVisible=t=>{var r;t=(r=t)!=null?r:!e.getIsAllColumnsVisible(),e.setColumnVisibility(e.getAllLeafColumns().reduce((o,i)=>({...o,[i.id]:t||!(i.getCanHide!=null&&i.getCanHide())}),{}))},e.getIsAllColumnsVisible=()=>!e.getAllLeafColumns().some(t=>!(t.getIsVisible!=null&&t.getIsVisible())),e.getIsSomeColumnsVisible=()=>e.getAllLeafColumns().some(t=>t.getIsVisible==null?void 0:t.getIsVisible()),e.getToggleAllColumnsVisibilityHandler=()=>t=>{var r;e.toggleAllColumnsVisible((r=t.target)==null?void 0:r.checked)}}};function tt(e,n){return n?n==="center"?e.getCenterVisibleLeafColumns():n==="left"?e.getLeftVisibleLeafColumns():e.getRightVisibleLeafColumns():e.getVisibleLeafColumns()}var os={createTable:e=>{e._getGlobalFacetedRowModel=e.options.getFacetedRowModel&&e.options.getFacetedRowModel(e,"__global__"),e.getGlobalFacetedRowModel=()=>e.options.manualFiltering||!e._getGlobalFacetedRowModel?e.getPreFilteredRowModel():e._getGlobalFacetedRowModel(),e._getGlobalFacetedUniqueValues=e.options.getFacetedUniqueValues&&e.options.getFacetedUniqueValues(e,"__global__"),e.getGlobalFacetedUniqueValues=()=>e._getGlobalFacetedUniqueValues?e._getGlobalFacetedUniqueValues():new Map,e._getGlobalFacetedMinMaxValues=e.options.getFacetedMinMaxValues&&e.options.getFacetedMinMaxValues(e,"__global__"),e.getGlobalFacetedMinMaxValues=()=>{if(e._getGlobalFacetedMinMaxValues)return e._getGlobalFacetedMinMaxValues()}}},is={getInitialState:e=>({globalFilter:void 0,...e}),getDefaultOptions:e=>({onGlobalFilterChange:te("globalFilter",e),globalFilterFn:"auto",getColumnCanGlobalFilter:n=>{var t;let r=(t=e.getCoreRowModel().flatRows[0])==null||(t=t._getAllCellsByColumnId()[n.id])==null?void 0:t.getValue();return typeof r=="string"||typeof r=="number"}}),createColumn:(e,n)=>{e.getCanGlobalFilter=()=>{var t,r,o,i;return((t=e.columnDef.enableGlobalFilter)!=null?t:!0)&&((r=n.options.enableGlobalFilter)!=null?r:!0)&&((o=n.options.enableFilters)!=null?o:!0)&&((i=n.options.getColumnCanGlobalFilter==null?void 0:n.options.getColumnCanGlobalFilter(e))!=null?i:!0)&&!!e.accessorFn}},createTable:e=>{e.getGlobalAutoFilterFn=()=>_e.includesString,e.getGlobalFilterFn=()=>{var n,t;let{globalFilterFn:r}=e.options;return mt(r)?r:r==="auto"?e.getGlobalAutoFilterFn():(n=(t=e.options.filterFns)==null?void 0:t[r])!=null?n:_e[r]},e.setGlobalFilter=n=>{e.options.onGlobalFilterChange==null||e.options.onGlobalFilterChange(n)},e.resetGlobalFilter=n=>{e.setGlobalFilter(n?void 0:e.initialState.globalFilter)}}},ss={getInitialState:e=>({expanded:{},...e}),getDefaultOptions:e=>({onExpandedChange:te("expanded",e),paginateExpandedRows:!0}),createTable:e=>{let n=!1,t=!1;e._autoResetExpanded=()=>{var r,o;if(!n){e._queue(()=>{n=!0});return}if((r=(o=e.options.autoResetAll)!=null?o:e.options.autoResetExpanded)!=null?r:!e.options.manualExpanding){if(t)return;t=!0,e._queue(()=>{e.resetExpanded(),t=!1})}},e.setExpanded=r=>e.options.onExpandedChange==null?void 0:e.options.onExpandedChange(r),e.toggleAllRowsExpanded=r=>{r??!e.getIsAllRowsExpanded()?e.setExpanded(!0):e.setExpanded({})},e.resetExpanded=r=>{var o,i;e.setExpanded(r?{}:(o=(i=e.initialState)==null?void 0:i.expanded)!=null?o:{})},e.getCanSomeRowsExpand=()=>e.getPrePaginationRowModel().flatRows.some(r=>r.getCanExpand()),e.getToggleAllRowsExpandedHandler=()=>r=>{r.persist==null||r.persist(),e.toggleAllRowsExpanded()},e.getIsSomeRowsExpanded=()=>{let r=e.getState().expanded;return r===!0||Object.values(r).some(Boolean)},e.getIsAllRowsExpanded=()=>{let r=e.getState().expanded;return typeof r=="boolean"?r===!0:!(!Object.keys(r).length||e.getRowModel().flatRows.some(o=>!o.getIsExpanded()))},e.getExpandedDepth=()=>{let r=0;return(e.getState().expanded===!0?Object.keys(e.getRowModel().rowsById):Object.keys(e.getState().expanded)).forEach(i=>{let s=i.split(".");r=Math.max(r,s.length)}),r},e.getPreExpandedRowModel=()=>e.getSortedRowModel(),e.getExpandedRowModel=()=>(!e._getExpandedRowModel&&e.options.getExpandedRowModel&&(e._getExpandedRowModel=e.options.getExpandedRowModel(e)),e.options.manualExpanding||!e._getExpandedRowModel?e.getPreExpandedRowModel():e._getExpandedRowModel())},createRow:(e,n)=>{e.toggleExpanded=t=>{n.setExpanded(r=>{var o;let i=r===!0?!0:!!(r!=null&&r[e.id]),s={};if(r===!0?Object.keys(n.getRowModel().rowsById).forEach(a=>{s[a]=!0}):s=r,t=(o=t)!=null?o:!i,!i&&t)return{...s,[e.id]:!0};if(i&&!t){let{[e.id]:a,...l}=s;return l}return r})},e.getIsExpanded=()=>{var t;let r=n.getState().expanded;return!!((t=n.options.getIsRowExpanded==null?void 0:n.options.getIsRowExpanded(e))!=null?t:r===!0||r?.[e.id])},e.getCanExpand=()=>{var t,r,o;return(t=n.options.getRowCanExpand==null?void 0:n.options.getRowCanExpand(e))!=null?t:((r=n.options.enableExpanding)!=null?r:!0)&&!!((o=e.subRows)!=null&&o.length)},e.getIsAllParentsExpanded=()=>{let t=!0,r=e;for(;t&&r.parentId;)r=n.getRow(r.parentId,!0),t=r.getIsExpanded();return t},e.getToggleExpandedHandler=()=>{let t=e.getCanExpand();return()=>{t&&e.toggleExpanded()}}}},cn=0,fn=10,an=()=>({pageIndex:cn,pageSize:fn}),ls={getInitialState:e=>({...e,pagination:{...an(),...e?.pagination}}),getDefaultOptions:e=>({onPaginationChange:te("pagination",e)}),createTable:e=>{let n=!1,t=!1;e._autoResetPageIndex=()=>{var r,o;if(!n){e._queue(()=>{n=!0});return}if((r=(o=e.options.autoResetAll)!=null?o:e.options.autoResetPageIndex)!=null?r:!e.options.manualPagination){if(t)return;t=!0,e._queue(()=>{e.resetPageIndex(),t=!1})}},e.setPagination=r=>{let o=i=>Re(r,i);return e.options.onPaginationChange==null?void 0:e.options.onPaginationChange(o)},e.resetPagination=r=>{var o;e.setPagination(r?an():(o=e.initialState.pagination)!=null?o:an())},e.setPageIndex=r=>{e.setPagination(o=>{let i=Re(r,o.pageIndex),s=typeof e.options.pageCount>"u"||e.options.pageCount===-1?Number.MAX_SAFE_INTEGER:e.options.pageCount-1;return i=Math.max(0,Math.min(i,s)),{...o,pageIndex:i}})},e.resetPageIndex=r=>{var o,i;e.setPageIndex(r?cn:(o=(i=e.initialState)==null||(i=i.pagination)==null?void 0:i.pageIndex)!=null?o:cn)},e.resetPageSize=r=>{var o,i;e.setPageSize(r?fn:(o=(i=e.initialState)==null||(i=i.pagination)==null?void 0:i.pageSize)!=null?o:fn)},e.setPageSize=r=>{e.setPagination(o=>{let i=Math.max(1,Re(r,o.pageSize)),s=o.pageSize*o.pageIndex,a=Math.floor(s/i);return{...o,pageIndex:a,pageSize:i}})},e.setPageCount=r=>e.setPagination(o=>{var i;let s=Re(r,(i=e.options.pageCount)!=null?i:-1);return typeof s=="number"&&(s=Math.max(-1,s)),{...o,pageCount:s}}),e.getPageOptions=C(()=>[e.getPageCount()],r=>{let o=[];return r&&r>0&&(o=[...new Array(r)].fill(null).map((i,s)=>s)),o},E(e.options,"debugTable","getPageOptions")),e.getCanPreviousPage=()=>e.getState().pagination.pageIndex>0,e.getCanNextPage=()=>{let{pageIndex:r}=e.getState().pagination,o=e.getPageCount();return o===-1?!0:o===0?!1:r<o-1},e.previousPage=()=>e.setPageIndex(r=>r-1),e.nextPage=()=>e.setPageIndex(r=>r+1),e.firstPage=()=>e.setPageIndex(0),e.lastPage=()=>e.setPageIndex(e.getPageCount()-1),e.getPrePaginationRowModel=()=>e.getExpandedRowModel(),e.getPaginationRowModel=()=>(!e._getPaginationRowModel&&e.options.getPaginationRowModel&&(e._getPaginationRowModel=e.options.getPaginationRowModel(e)),e.options.manualPagination||!e._getPaginationRowModel?e.getPrePaginationRowModel():e._getPaginationRowModel()),e.getPageCount=()=>{var r;return(r=e.options.pageCount)!=null?r:Math.ceil(e.getRowCount()/e.getState().pagination.pageSize)},e.getRowCount=()=>{var r;return(r=e.options.rowCount)!=null?r:e.getPrePaginationRowModel().rows.length}}},un=()=>({top:[],bottom:[]}),as={getInitialState:e=>({rowPinning:un(),...e}),getDefaultOptions:e=>({onRowPinningChange:te("rowPinning",e)}),createRow:(e,n)=>{e.pin=(t,r,o)=>{let i=r?e.getLeafRows().map(l=>{let{id:u}=l;return u}):[],s=o?e.getParentRows().map(l=>{let{id:u}=l;return u}):[],a=new Set([...s,e.id,...i]);n.setRowPinning(l=>{var u,f;if(t==="bottom"){var c,g;return{top:((c=l?.top)!=null?c:[]).filter(p=>!(a!=null&&a.has(p))),bottom:[...((g=l?.bottom)!=null?g:[]).filter(p=>!(a!=null&&a.has(p))),...Array.from(a)]}}if(t==="top"){var d,h;return{top:[...((d=l?.top)!=null?d:[]).filter(p=>!(a!=null&&a.has(p))),...Array.from(a)],bottom:((h=l?.bottom)!=null?h:[]).filter(p=>!(a!=null&&a.has(p)))}}return{top:((u=l?.top)!=null?u:[]).filter(p=>!(a!=null&&a.has(p))),bottom:((f=l?.bottom)!=null?f:[]).filter(p=>!(a!=null&&a.has(p)))}})},e.getCanPin=()=>{var t;let{enableRowPinning:r,enablePinning:o}=n.options;return typeof r=="function"?r(e):(t=r??o)!=null?t:!0},e.getIsPinned=()=>{let t=[e.id],{top:r,bottom:o}=n.getState().rowPinning,i=t.some(a=>r?.includes(a)),s=t.some(a=>o?.includes(a));return i?"top":s?"bottom":!1},e.getPinnedIndex=()=>{var t,r;let o=e.getIsPinned();if(!o)return-1;let i=(t=o==="top"?n.getTopRows():n.getBottomRows())==null?void 0:t.map(s=>{let{id:a}=s;return a});return(r=i?.indexOf(e.id))!=null?r:-1}},createTable:e=>{e.setRowPinning=n=>e.options.onRowPinningChange==null?void 0:e.options.onRowPinningChange(n),e.resetRowPinning=n=>{var t,r;return e.setRowPinning(n?un():(t=(r=e.initialState)==null?void 0:r.rowPinning)!=null?t:un())},e.getIsSomeRowsPinned=n=>{var t;let r=e.getState().rowPinning;if(!n){var o,i;return!!((o=r.top)!=null&&o.length||(i=r.bottom)!=null&&i.length)}return!!((t=r[n])!=null&&t.length)},e._getPinnedRows=(n,t,r)=>{var o;return((o=e.options.keepPinnedRows)==null||o?(t??[]).map(s=>{let a=e.getRow(s,!0);return a.getIsAllParentsExpanded()?a:null}):(t??[]).map(s=>n.find(a=>a.id===s))).filter(Boolean).map(s=>({...s,position:r}))},e.getTopRows=C(()=>[e.getRowModel().rows,e.getState().rowPinning.top],(n,t)=>e._getPinnedRows(n,t,"top"),E(e.options,"debugRows","getTopRows")),e.getBottomRows=C(()=>[e.getRowModel().rows,e.getState().rowPinning.bottom],(n,t)=>e._getPinnedRows(n,t,"bottom"),E(e.options,"debugRows","getBottomRows")),e.getCenterRows=C(()=>[e.getRowModel().rows,e.getState().rowPinning.top,e.getState().rowPinning.bottom],(n,t,r)=>{let o=new Set([...t??[],...r??[]]);return n.filter(i=>!o.has(i.id))},E(e.options,"debugRows","getCenterRows"))}},us={getInitialState:e=>({rowSelection:{},...e}),getDefaultOptions:e=>({onRowSelectionChange:te("rowSelection",e),enableRowSelection:!0,enableMultiRowSelection:!0,enableSubRowSelection:!0}),createTable:e=>{e.setRowSelection=n=>e.options.onRowSelectionChange==null?void 0:e.options.onRowSelectionChange(n),e.resetRowSelection=n=>{var t;return e.setRowSelection(n?{}:(t=e.initialState.rowSelection)!=null?t:{})},e.toggleAllRowsSelected=n=>{e.setRowSelection(t=>{n=typeof n<"u"?n:!e.getIsAllRowsSelected();let r={...t},o=e.getPreGroupedRowModel().flatRows;return n?o.forEach(i=>{i.getCanSelect()&&(r[i.id]=!0)}):o.forEach(i=>{delete r[i.id]}),r})},e.toggleAllPageRowsSelected=n=>e.setRowSelection(t=>{let r=typeof n<"u"?n:!e.getIsAllPageRowsSelected(),o={...t};return e.getRowModel().rows.forEach(i=>{gn(o,i.id,r,!0,e)}),o}),e.getPreSelectedRowModel=()=>e.getCoreRowModel(),e.getSelectedRowModel=C(()=>[e.getState().rowSelection,e.getCoreRowModel()],(n,t)=>Object.keys(n).length?dn(e,t):{rows:[],flatRows:[],rowsById:{}},E(e.options,"debugTable","getSelectedRowModel")),e.getFilteredSelectedRowModel=C(()=>[e.getState().rowSelection,e.getFilteredRowModel()],(n,t)=>Object.keys(n).length?dn(e,t):{rows:[],flatRows:[],rowsById:{}},E(e.options,"debugTable","getFilteredSelectedRowModel")),e.getGroupedSelectedRowModel=C(()=>[e.getState().rowSelection,e.getSortedRowModel()],(n,t)=>Object.keys(n).length?dn(e,t):{rows:[],flatRows:[],rowsById:{}},E(e.options,"debugTable","getGroupedSelectedRowModel")),e.getIsAllRowsSelected=()=>{let n=e.getFilteredRowModel().flatRows,{rowSelection:t}=e.getState(),r=!!(n.length&&Object.keys(t).length);return r&&n.some(o=>o.getCanSelect()&&!t[o.id])&&(r=!1),r},e.getIsAllPageRowsSelected=()=>{let n=e.getPaginationRowModel().flatRows.filter(o=>o.getCanSelect()),{rowSelection:t}=e.getState(),r=!!n.length;return r&&n.some(o=>!t[o.id])&&(r=!1),r},e.getIsSomeRowsSelected=()=>{var n;let t=Object.keys((n=e.getState().rowSelection)!=null?n:{}).length;return t>0&&t<e.getFilteredRowModel().flatRows.length},e.getIsSomePageRowsSelected=()=>{let n=e.getPaginationRowModel().flatRows;return e.getIsAllPageRowsSelected()?!1:n.filter(t=>t.getCanSelect()).some(t=>t.getIsSelected()||t.getIsSomeSelected())},e.getToggleAllRowsSelectedHandler=()=>n=>{e.toggleAllRowsSelected(n.target.checked)},e.getToggleAllPageRowsSelectedHandler=()=>n=>{e.toggleAllPageRowsSelected(n.target.checked)}},createRow:(e,n)=>{e.toggleSelected=(t,r)=>{let o=e.getIsSelected();n.setRowSelection(i=>{var s;if(t=typeof t<"u"?t:!o,e.getCanSelect()&&o===t)return i;let a={...i};return gn(a,e.id,t,(s=r?.selectChildren)!=null?s:!0,n),a})},e.getIsSelected=()=>{let{rowSelection:t}=n.getState();return yn(e,t)},e.getIsSomeSelected=()=>{let{rowSelection:t}=n.getState();return pn(e,t)==="some"},e.getIsAllSubRowsSelected=()=>{let{rowSelection:t}=n.getState();return pn(e,t)==="all"},e.getCanSelect=()=>{var t;return typeof n.options.enableRowSelection=="function"?n.options.enableRowSelection(e):(t=n.options.enableRowSelection)!=null?t:!0},e.getCanSelectSubRows=()=>{var t;return typeof n.options.enableSubRowSelection=="function"?n.options.enableSubRowSelection(e):(t=n.options.enableSubRowSelection)!=null?t:!0},e.getCanMultiSelect=()=>{var t;return typeof n.options.enableMultiRowSelection=="function"?n.options.enableMultiRowSelection(e):(t=n.options.enableMultiRowSelection)!=null?t:!0},e.getToggleSelectedHandler=()=>{let t=e.getCanSelect();return r=>{var o;t&&e.toggleSelected((o=r.target)==null?void 0:o.checked)}}}},gn=(e,n,t,r,o)=>{var i;let s=o.getRow(n,!0);t?(s.getCanMultiSelect()||Object.keys(e).forEach(a=>delete e[a]),s.getCanSelect()&&(e[n]=!0)):delete e[n],r&&(i=s.subRows)!=null&&i.length&&s.getCanSelectSubRows()&&s.subRows.forEach(a=>gn(e,a.id,t,r,o))};function dn(e,n){let t=e.getState().rowSelection,r=[],o={},i=function(s,a){return s.map(l=>{var u;let f=yn(l,t);if(f&&(r.push(l),o[l.id]=l),(u=l.subRows)!=null&&u.length&&(l={...l,subRows:i(l.subRows)}),f)return l}).filter(Boolean)};return{rows:i(n.rows),flatRows:r,rowsById:o}}function yn(e,n){var t;return(t=n[e.id])!=null?t:!1}function pn(e,n,t){var r;if(!((r=e.subRows)!=null&&r.length))return!1;let o=!0,i=!1;return e.subRows.forEach(s=>{if(!(i&&!o)&&(s.getCanSelect()&&(yn(s,n)?i=!0:o=!1),s.subRows&&s.subRows.length)){let a=pn(s,n);a==="all"?i=!0:(a==="some"&&(i=!0),o=!1)}}),o?"all":i?"some":!1}var hn=/([0-9]+)/gm,ds=(e,n,t)=>zr(be(e.getValue(t)).toLowerCase(),be(n.getValue(t)).toLowerCase()),cs=(e,n,t)=>zr(be(e.getValue(t)),be(n.getValue(t))),fs=(e,n,t)=>vn(be(e.getValue(t)).toLowerCase(),be(n.getValue(t)).toLowerCase()),gs=(e,n,t)=>vn(be(e.getValue(t)),be(n.getValue(t))),ps=(e,n,t)=>{let r=e.getValue(t),o=n.getValue(t);return r>o?1:r<o?-1:0},hs=(e,n,t)=>vn(e.getValue(t),n.getValue(t));function vn(e,n){return e===n?0:e>n?1:-1}function be(e){return typeof e=="number"?isNaN(e)||e===1/0||e===-1/0?"":String(e):typeof e=="string"?e:""}function zr(e,n){let t=e.split(hn).filter(Boolean),r=n.split(hn).filter(Boolean);for(;t.length&&r.length;){let o=t.shift(),i=r.shift(),s=parseInt(o,10),a=parseInt(i,10),l=[s,a].sort();if(isNaN(l[0])){if(o>i)return 1;if(i>o)return-1;continue}if(isNaN(l[1]))return isNaN(s)?-1:1;if(s>a)return 1;if(a>s)return-1}return t.length-r.length}var et={alphanumeric:ds,alphanumericCaseSensitive:cs,text:fs,textCaseSensitive:gs,datetime:ps,basic:hs},ms={getInitialState:e=>({sorting:[],...e}),getDefaultColumnDef:()=>({sortingFn:"auto",sortUndefined:1}),getDefaultOptions:e=>({onSortingChange:te("sorting",e),isMultiSortEvent:n=>n.shiftKey}),createColumn:(e,n)=>{e.getAutoSortingFn=()=>{let t=n.getFilteredRowModel().flatRows.slice(10),r=!1;for(let o of t){let i=o?.getValue(e.id);if(Object.prototype.toString.call(i)==="[object Date]")return et.datetime;if(typeof i=="string"&&(r=!0,i.split(hn).length>1))return et.alphanumeric}return r?et.text:et.basic},e.getAutoSortDir=()=>{let t=n.getFilteredRowModel().flatRows[0];return typeof t?.getValue(e.id)=="string"?"asc":"desc"},e.getSortingFn=()=>{var t,r;if(!e)throw new Error;return mt(e.columnDef.sortingFn)?e.columnDef.sortingFn:e.columnDef.sortingFn==="auto"?e.getAutoSortingFn():(t=(r=n.options.sortingFns)==null?void 0:r[e.columnDef.sortingFn])!=null?t:et[e.columnDef.sortingFn]},e.toggleSorting=(t,r)=>{let o=e.getNextSortingOrder(),i=typeof t<"u"&&t!==null;n.setSorting(s=>{let a=s?.find(d=>d.id===e.id),l=s?.findIndex(d=>d.id===e.id),u=[],f,c=i?t:o==="desc";if(s!=null&&s.length&&e.getCanMultiSort()&&r?a?f="toggle":f="add":s!=null&&s.length&&l!==s.length-1?f="replace":a?f="toggle":f="replace",f==="toggle"&&(i||o||(f="remove")),f==="add"){var g;u=[...s,{id:e.id,desc:c}],u.splice(0,u.length-((g=n.options.maxMultiSortColCount)!=null?g:Number.MAX_SAFE_INTEGER))}else f==="toggle"?u=s.map(d=>d.id===e.id?{...d,desc:c}:d):f==="remove"?u=s.filter(d=>d.id!==e.id):u=[{id:e.id,desc:c}];return u})},e.getFirstSortDir=()=>{var t,r;return((t=(r=e.columnDef.sortDescFirst)!=null?r:n.options.sortDescFirst)!=null?t:e.getAutoSortDir()==="desc")?"desc":"asc"},e.getNextSortingOrder=t=>{var r,o;let i=e.getFirstSortDir(),s=e.getIsSorted();return s?s!==i&&((r=n.options.enableSortingRemoval)==null||r)&&(!(t&&(o=n.options.enableMultiRemove)!=null)||o)?!1:s==="desc"?"asc":"desc":i},e.getCanSort=()=>{var t,r;return((t=e.columnDef.enableSorting)!=null?t:!0)&&((r=n.options.enableSorting)!=null?r:!0)&&!!e.accessorFn},e.getCanMultiSort=()=>{var t,r;return(t=(r=e.columnDef.enableMultiSort)!=null?r:n.options.enableMultiSort)!=null?t:!!e.accessorFn},e.getIsSorted=()=>{var t;let r=(t=n.getState().sorting)==null?void 0:t.find(o=>o.id===e.id);return r?r.desc?"desc":"asc":!1},e.getSortIndex=()=>{var t,r;return(t=(r=n.getState().sorting)==null?void 0:r.findIndex(o=>o.id===e.id))!=null?t:-1},e.clearSorting=()=>{n.setSorting(t=>t!=null&&t.length?t.filter(r=>r.id!==e.id):[])},e.getToggleSortingHandler=()=>{let t=e.getCanSort();return r=>{t&&(r.persist==null||r.persist(),e.toggleSorting==null||e.toggleSorting(void 0,e.getCanMultiSort()?n.options.isMultiSortEvent==null?void 0:n.options.isMultiSortEvent(r):!1))}}},createTable:e=>{e.setSorting=n=>e.options.onSortingChange==null?void 0:e.options.onSortingChange(n),e.resetSorting=n=>{var t,r;e.setSorting(n?[]:(t=(r=e.initialState)==null?void 0:r.sorting)!=null?t:[])},e.getPreSortedRowModel=()=>e.getGroupedRowModel(),e.getSortedRowModel=()=>(!e._getSortedRowModel&&e.options.getSortedRowModel&&(e._getSortedRowModel=e.options.getSortedRowModel(e)),e.options.manualSorting||!e._getSortedRowModel?e.getPreSortedRowModel():e._getSortedRowModel())}},_s=[Ai,rs,Zi,es,Ni,zi,os,is,ms,Ji,ss,ls,as,us,ts];function Gr(e){var n,t;let r=[..._s,...(n=e._features)!=null?n:[]],o={_features:r},i=o._features.reduce((g,d)=>Object.assign(g,d.getDefaultOptions==null?void 0:d.getDefaultOptions(o)),{}),s=g=>o.options.mergeOptions?o.options.mergeOptions(i,g):{...i,...g},l={...{},...(t=e.initialState)!=null?t:{}};o._features.forEach(g=>{var d;l=(d=g.getInitialState==null?void 0:g.getInitialState(l))!=null?d:l});let u=[],f=!1,c={_features:r,options:{...i,...e},initialState:l,_queue:g=>{u.push(g),f||(f=!0,Promise.resolve().then(()=>{for(;u.length;)u.shift()();f=!1}).catch(d=>setTimeout(()=>{throw d})))},reset:()=>{o.setState(o.initialState)},setOptions:g=>{let d=Re(g,o.options);o.options=s(d)},getState:()=>o.options.state,setState:g=>{o.options.onStateChange==null||o.options.onStateChange(g)},_getRowId:(g,d,h)=>{var p;return(p=o.options.getRowId==null?void 0:o.options.getRowId(g,d,h))!=null?p:`${h?[h.id,d].join("."):d}`},getCoreRowModel:()=>(o._getCoreRowModel||(o._getCoreRowModel=o.options.getCoreRowModel(o)),o._getCoreRowModel()),getRowModel:()=>o.getPaginationRowModel(),getRow:(g,d)=>{let h=(d?o.getPrePaginationRowModel():o.getRowModel()).rowsById[g];if(!h&&(h=o.getCoreRowModel().rowsById[g],!h))throw new Error;return h},_getDefaultColumnDef:C(()=>[o.options.defaultColumn],g=>{var d;return g=(d=g)!=null?d:{},{header:h=>{let p=h.header.column.columnDef;return p.accessorKey?p.accessorKey:p.accessorFn?p.id:null},cell:h=>{var p,_;return(p=(_=h.renderValue())==null||_.toString==null?void 0:_.toString())!=null?p:null},...o._features.reduce((h,p)=>Object.assign(h,p.getDefaultColumnDef==null?void 0:p.getDefaultColumnDef()),{}),...g}},E(e,"debugColumns","_getDefaultColumnDef")),_getColumnDefs:()=>o.options.columns,getAllColumns:C(()=>[o._getColumnDefs()],g=>{let d=function(h,p,_){return _===void 0&&(_=0),h.map(m=>{let y=Hi(o,m,_,p),R=m;return y.columns=R.columns?d(R.columns,y,_+1):[],y})};return d(g)},E(e,"debugColumns","getAllColumns")),getAllFlatColumns:C(()=>[o.getAllColumns()],g=>g.flatMap(d=>d.getFlatColumns()),E(e,"debugColumns","getAllFlatColumns")),_getAllFlatColumnsById:C(()=>[o.getAllFlatColumns()],g=>g.reduce((d,h)=>(d[h.id]=h,d),{}),E(e,"debugColumns","getAllFlatColumnsById")),getAllLeafColumns:C(()=>[o.getAllColumns(),o._getOrderColumnsFn()],(g,d)=>{let h=g.flatMap(p=>p.getLeafColumns());return d(h)},E(e,"debugColumns","getAllLeafColumns")),getColumn:g=>o._getAllFlatColumnsById()[g]};Object.assign(o,c);for(let g=0;g<o._features.length;g++){let d=o._features[g];d==null||d.createTable==null||d.createTable(o)}return o}function Br(){return e=>C(()=>[e.options.data],n=>{let t={rows:[],flatRows:[],rowsById:{}},r=function(o,i,s){i===void 0&&(i=0);let a=[];for(let u=0;u<o.length;u++){let f=mn(e,e._getRowId(o[u],u,s),o[u],u,i,void 0,s?.id);if(t.flatRows.push(f),t.rowsById[f.id]=f,a.push(f),e.options.getSubRows){var l;f.originalSubRows=e.options.getSubRows(o[u],u),(l=f.originalSubRows)!=null&&l.length&&(f.subRows=r(f.originalSubRows,i+1,f))}}return a};return t.rows=r(n),t},E(e.options,"debugTable","getRowModel",()=>e._autoResetPageIndex()))}function Ur(){return(e,n)=>C(()=>{var t;return[(t=e.getColumn(n))==null?void 0:t.getFacetedRowModel()]},t=>{var r;if(!t)return;let o=(r=t.flatRows[0])==null?void 0:r.getUniqueValues(n);if(typeof o>"u")return;let i=[o,o];for(let s=0;s<t.flatRows.length;s++){let a=t.flatRows[s].getUniqueValues(n);for(let l=0;l<a.length;l++){let u=a[l];u<i[0]?i[0]=u:u>i[1]&&(i[1]=u)}}return i},E(e.options,"debugTable","getFacetedMinMaxValues"))}function Kr(e,n,t){return t.options.filterFromLeafRows?ys(e,n,t):vs(e,n,t)}function ys(e,n,t){var r;let o=[],i={},s=(r=t.options.maxLeafRowFilterDepth)!=null?r:100,a=function(l,u){u===void 0&&(u=0);let f=[];for(let g=0;g<l.length;g++){var c;let d=l[g],h=mn(t,d.id,d.original,d.index,d.depth,void 0,d.parentId);if(h.columnFilters=d.columnFilters,(c=d.subRows)!=null&&c.length&&u<s){if(h.subRows=a(d.subRows,u+1),d=h,n(d)&&!h.subRows.length){f.push(d),i[d.id]=d,o.push(d);continue}if(n(d)||h.subRows.length){f.push(d),i[d.id]=d,o.push(d);continue}}else d=h,n(d)&&(f.push(d),i[d.id]=d,o.push(d))}return f};return{rows:a(e),flatRows:o,rowsById:i}}function vs(e,n,t){var r;let o=[],i={},s=(r=t.options.maxLeafRowFilterDepth)!=null?r:100,a=function(l,u){u===void 0&&(u=0);let f=[];for(let g=0;g<l.length;g++){let d=l[g];if(n(d)){var c;if((c=d.subRows)!=null&&c.length&&u<s){let p=mn(t,d.id,d.original,d.index,d.depth,void 0,d.parentId);p.subRows=a(d.subRows,u+1),d=p}f.push(d),o.push(d),i[d.id]=d}}return f};return{rows:a(e),flatRows:o,rowsById:i}}function jr(){return(e,n)=>C(()=>[e.getPreFilteredRowModel(),e.getState().columnFilters,e.getState().globalFilter,e.getFilteredRowModel()],(t,r,o)=>{if(!t.rows.length||!(r!=null&&r.length)&&!o)return t;let i=[...r.map(a=>a.id).filter(a=>a!==n),o?"__global__":void 0].filter(Boolean),s=a=>{for(let l=0;l<i.length;l++)if(a.columnFilters[i[l]]===!1)return!1;return!0};return Kr(t.rows,s,e)},E(e.options,"debugTable","getFacetedRowModel"))}function qr(){return(e,n)=>C(()=>{var t;return[(t=e.getColumn(n))==null?void 0:t.getFacetedRowModel()]},t=>{if(!t)return new Map;let r=new Map;for(let i=0;i<t.flatRows.length;i++){let s=t.flatRows[i].getUniqueValues(n);for(let a=0;a<s.length;a++){let l=s[a];if(r.has(l)){var o;r.set(l,((o=r.get(l))!=null?o:0)+1)}else r.set(l,1)}}return r},E(e.options,"debugTable",`getFacetedUniqueValues_${n}`))}function Wr(){return e=>C(()=>[e.getPreFilteredRowModel(),e.getState().columnFilters,e.getState().globalFilter],(n,t,r)=>{if(!n.rows.length||!(t!=null&&t.length)&&!r){for(let g=0;g<n.flatRows.length;g++)n.flatRows[g].columnFilters={},n.flatRows[g].columnFiltersMeta={};return n}let o=[],i=[];(t??[]).forEach(g=>{var d;let h=e.getColumn(g.id);if(!h)return;let p=h.getFilterFn();p&&o.push({id:g.id,filterFn:p,resolvedValue:(d=p.resolveFilterValue==null?void 0:p.resolveFilterValue(g.value))!=null?d:g.value})});let s=(t??[]).map(g=>g.id),a=e.getGlobalFilterFn(),l=e.getAllLeafColumns().filter(g=>g.getCanGlobalFilter());r&&a&&l.length&&(s.push("__global__"),l.forEach(g=>{var d;i.push({id:g.id,filterFn:a,resolvedValue:(d=a.resolveFilterValue==null?void 0:a.resolveFilterValue(r))!=null?d:r})}));let u,f;for(let g=0;g<n.flatRows.length;g++){let d=n.flatRows[g];if(d.columnFilters={},o.length)for(let h=0;h<o.length;h++){u=o[h];let p=u.id;d.columnFilters[p]=u.filterFn(d,p,u.resolvedValue,_=>{d.columnFiltersMeta[p]=_})}if(i.length){for(let h=0;h<i.length;h++){f=i[h];let p=f.id;if(f.filterFn(d,p,f.resolvedValue,_=>{d.columnFiltersMeta[p]=_})){d.columnFilters.__global__=!0;break}}d.columnFilters.__global__!==!0&&(d.columnFilters.__global__=!1)}}let c=g=>{for(let d=0;d<s.length;d++)if(g.columnFilters[s[d]]===!1)return!1;return!0};return Kr(n.rows,c,e)},E(e.options,"debugTable","getFilteredRowModel",()=>e._autoResetPageIndex()))}function Xr(){return e=>C(()=>[e.getState().sorting,e.getPreSortedRowModel()],(n,t)=>{if(!t.rows.length||!(n!=null&&n.length))return t;let r=e.getState().sorting,o=[],i=r.filter(l=>{var u;return(u=e.getColumn(l.id))==null?void 0:u.getCanSort()}),s={};i.forEach(l=>{let u=e.getColumn(l.id);u&&(s[l.id]={sortUndefined:u.columnDef.sortUndefined,invertSorting:u.columnDef.invertSorting,sortingFn:u.getSortingFn()})});let a=l=>{let u=l.map(f=>({...f}));return u.sort((f,c)=>{for(let d=0;d<i.length;d+=1){var g;let h=i[d],p=s[h.id],_=p.sortUndefined,m=(g=h?.desc)!=null?g:!1,y=0;if(_){let R=f.getValue(h.id),P=c.getValue(h.id),I=R===void 0,D=P===void 0;if(I||D){if(_==="first")return I?-1:1;if(_==="last")return I?1:-1;y=I&&D?0:I?_:-_}}if(y===0&&(y=p.sortingFn(f,c,h.id)),y!==0)return m&&(y*=-1),p.invertSorting&&(y*=-1),y}return f.index-c.index}),u.forEach(f=>{var c;o.push(f),(c=f.subRows)!=null&&c.length&&(f.subRows=a(f.subRows))}),u};return{rows:a(t.rows),flatRows:o,rowsById:t.rowsById}},E(e.options,"debugTable","getSortedRowModel",()=>e._autoResetPageIndex()))}function _t(e,n){return e?Ss(e)?ee(e,n):e:null}function Ss(e){return ws(e)||typeof e=="function"||Cs(e)}function ws(e){return typeof e=="function"&&(()=>{let n=Object.getPrototypeOf(e);return n.prototype&&n.prototype.isReactComponent})()}function Cs(e){return typeof e=="object"&&typeof e.$$typeof=="symbol"&&["react.memo","react.forward_ref"].includes(e.$$typeof.description)}function Yr(e){let n={state:{},onStateChange:()=>{},renderFallbackValue:null,...e},[t]=H(()=>({current:Gr(n)})),[r,o]=H(()=>t.current.initialState);return t.current.setOptions(i=>({...i,...e,state:{...r,...e.state},onStateChange:s=>{o(s),e.onStateChange==null||e.onStateChange(s)}})),t.current}function ze(e,n,t){let r=t.initialDeps??[],o;return()=>{var i,s,a,l;let u;t.key&&((i=t.debug)!=null&&i.call(t))&&(u=Date.now());let f=e();if(!(f.length!==r.length||f.some((d,h)=>r[h]!==d)))return o;r=f;let g;if(t.key&&((s=t.debug)!=null&&s.call(t))&&(g=Date.now()),o=n(...f),t.key&&((a=t.debug)!=null&&a.call(t))){let d=Math.round((Date.now()-u)*100)/100,h=Math.round((Date.now()-g)*100)/100,p=h/16,_=(m,y)=>{for(m=String(m);m.length<y;)m=" "+m;return m};console.info(`%c\u23F1 ${_(h,5)} /${_(d,5)} ms`,`
             font-size: .6rem;
             font-weight: bold;
-            color: hsl(${Math.max(0,Math.min(120-120*p,120))}deg 100% 31%);`,t?.key)}return(l=t?.onChange)==null||l.call(t,o),o}}function yt(e,n){if(e===void 0)throw new Error(`Unexpected undefined${n?`: ${n}`:""}`);return e}var Jr=(e,n)=>Math.abs(e-n)<1,Qr=(e,n,t)=>{let r;return function(...o){e.clearTimeout(r),r=e.setTimeout(()=>n.apply(this,o),t)}};var Es=e=>e,Rs=e=>{let n=Math.max(e.startIndex-e.overscan,0),t=Math.min(e.endIndex+e.overscan,e.count-1),r=[];for(let o=n;o<=t;o++)r.push(o);return r},eo=(e,n)=>{let t=e.scrollElement;if(!t)return;let r=e.targetWindow;if(!r)return;let o=s=>{let{width:a,height:l}=s;n({width:Math.round(a),height:Math.round(l)})};if(o(t.getBoundingClientRect()),!r.ResizeObserver)return()=>{};let i=new r.ResizeObserver(s=>{let a=s[0];if(a?.borderBoxSize){let l=a.borderBoxSize[0];if(l){o({width:l.inlineSize,height:l.blockSize});return}}o(t.getBoundingClientRect())});return i.observe(t,{box:"border-box"}),()=>{i.unobserve(t)}},Zr={passive:!0};var bs=typeof window>"u"?!0:"onscrollend"in window,to=(e,n)=>{let t=e.scrollElement;if(!t)return;let r=e.targetWindow;if(!r)return;let o=0,i=bs?()=>{}:Qr(r,()=>{n(o,!1)},e.options.isScrollingResetDelay),s=u=>()=>{o=t[e.options.horizontal?"scrollLeft":"scrollTop"],i(),n(o,u)},a=s(!0),l=s(!1);return l(),t.addEventListener("scroll",a,Zr),t.addEventListener("scrollend",l,Zr),()=>{t.removeEventListener("scroll",a),t.removeEventListener("scrollend",l)}};var xs=(e,n,t)=>{if(n?.borderBoxSize){let r=n.borderBoxSize[0];if(r)return Math.round(r[t.options.horizontal?"inlineSize":"blockSize"])}return Math.round(e.getBoundingClientRect()[t.options.horizontal?"width":"height"])};var no=(e,{adjustments:n=0,behavior:t},r)=>{var o,i;let s=e+n;(i=(o=r.scrollElement)==null?void 0:o.scrollTo)==null||i.call(o,{[r.options.horizontal?"left":"top"]:s,behavior:t})},vt=class{constructor(n){this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.isScrolling=!1,this.scrollToIndexTimeoutId=null,this.measurementsCache=[],this.itemSizeCache=new Map,this.pendingMeasuredCacheIndexes=[],this.scrollRect=null,this.scrollOffset=null,this.scrollDirection=null,this.scrollAdjustments=0,this.elementsCache=new Map,this.observer=(()=>{let t=null,r=()=>t||(!this.targetWindow||!this.targetWindow.ResizeObserver?null:t=new this.targetWindow.ResizeObserver(o=>{o.forEach(i=>{this._measureElement(i.target,i)})}));return{disconnect:()=>{var o;return(o=r())==null?void 0:o.disconnect()},observe:o=>{var i;return(i=r())==null?void 0:i.observe(o,{box:"border-box"})},unobserve:o=>{var i;return(i=r())==null?void 0:i.unobserve(o)}}})(),this.range=null,this.setOptions=t=>{Object.entries(t).forEach(([r,o])=>{typeof o>"u"&&delete t[r]}),this.options={debug:!1,initialOffset:0,overscan:1,paddingStart:0,paddingEnd:0,scrollPaddingStart:0,scrollPaddingEnd:0,horizontal:!1,getItemKey:Es,rangeExtractor:Rs,onChange:()=>{},measureElement:xs,initialRect:{width:0,height:0},scrollMargin:0,gap:0,indexAttribute:"data-index",initialMeasurementsCache:[],lanes:1,isScrollingResetDelay:150,enabled:!0,...t}},this.notify=(t,r)=>{var o,i;let{startIndex:s,endIndex:a}=this.range??{startIndex:void 0,endIndex:void 0},l=this.calculateRange();(t||s!==l?.startIndex||a!==l?.endIndex)&&((i=(o=this.options).onChange)==null||i.call(o,this,r))},this.cleanup=()=>{this.unsubs.filter(Boolean).forEach(t=>t()),this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.observer.disconnect(),this.elementsCache.clear()},this._didMount=()=>()=>{this.cleanup()},this._willUpdate=()=>{var t;let r=this.options.enabled?this.options.getScrollElement():null;if(this.scrollElement!==r){if(this.cleanup(),!r){this.notify(!1,!1);return}this.scrollElement=r,this.scrollElement&&"ownerDocument"in this.scrollElement?this.targetWindow=this.scrollElement.ownerDocument.defaultView:this.targetWindow=((t=this.scrollElement)==null?void 0:t.window)??null,this._scrollToOffset(this.getScrollOffset(),{adjustments:void 0,behavior:void 0}),this.unsubs.push(this.options.observeElementRect(this,o=>{this.scrollRect=o,this.notify(!1,!1)})),this.unsubs.push(this.options.observeElementOffset(this,(o,i)=>{this.scrollAdjustments=0,this.scrollDirection=i?this.getScrollOffset()<o?"forward":"backward":null,this.scrollOffset=o;let s=this.isScrolling;this.isScrolling=i,this.notify(s!==i,i)}))}},this.getSize=()=>this.options.enabled?(this.scrollRect=this.scrollRect??this.options.initialRect,this.scrollRect[this.options.horizontal?"width":"height"]):(this.scrollRect=null,0),this.getScrollOffset=()=>this.options.enabled?(this.scrollOffset=this.scrollOffset??(typeof this.options.initialOffset=="function"?this.options.initialOffset():this.options.initialOffset),this.scrollOffset):(this.scrollOffset=null,0),this.getFurthestMeasurement=(t,r)=>{let o=new Map,i=new Map;for(let s=r-1;s>=0;s--){let a=t[s];if(o.has(a.lane))continue;let l=i.get(a.lane);if(l==null||a.end>l.end?i.set(a.lane,a):a.end<l.end&&o.set(a.lane,!0),o.size===this.options.lanes)break}return i.size===this.options.lanes?Array.from(i.values()).sort((s,a)=>s.end===a.end?s.index-a.index:s.end-a.end)[0]:void 0},this.getMeasurementOptions=ze(()=>[this.options.count,this.options.paddingStart,this.options.scrollMargin,this.options.getItemKey,this.options.enabled],(t,r,o,i,s)=>(this.pendingMeasuredCacheIndexes=[],{count:t,paddingStart:r,scrollMargin:o,getItemKey:i,enabled:s}),{key:!1}),this.getMeasurements=ze(()=>[this.getMeasurementOptions(),this.itemSizeCache],({count:t,paddingStart:r,scrollMargin:o,getItemKey:i,enabled:s},a)=>{var l;if(!s)return this.measurementsCache=[],this.itemSizeCache.clear(),[];this.measurementsCache.length===0&&(this.measurementsCache=this.options.initialMeasurementsCache,this.measurementsCache.forEach(c=>{this.itemSizeCache.set(c.key,c.size)}));let u=this.pendingMeasuredCacheIndexes.length>0?Math.min(...this.pendingMeasuredCacheIndexes):0;this.pendingMeasuredCacheIndexes=[];let f=this.measurementsCache.slice(0,u);for(let c=u;c<t;c++){let g=(l=this.measurementsCache[c])==null?void 0:l.measureElement;g||(g=P=>{let I=i(c),D=this.elementsCache.get(I);if(!P){D&&(this.observer.unobserve(D),this.elementsCache.delete(I));return}D!==P&&(D&&this.observer.unobserve(D),this.observer.observe(P),this.elementsCache.set(I,P)),P.isConnected&&this.resizeItem(c,this.options.measureElement(P,void 0,this))});let d=i(c),h=this.options.lanes===1?f[c-1]:this.getFurthestMeasurement(f,c),p=h?h.end+this.options.gap:r+o,_=a.get(d),m=typeof _=="number"?_:this.options.estimateSize(c),y=p+m,R=h?h.lane:c%this.options.lanes;f[c]={index:c,start:p,size:m,end:y,key:d,lane:R,measureElement:g}}return this.measurementsCache=f,f},{key:!1,debug:()=>this.options.debug}),this.calculateRange=ze(()=>[this.getMeasurements(),this.getSize(),this.getScrollOffset()],(t,r,o)=>this.range=t.length>0&&r>0?Ms({measurements:t,outerSize:r,scrollOffset:o}):null,{key:!1,debug:()=>this.options.debug}),this.getIndexes=ze(()=>[this.options.rangeExtractor,this.calculateRange(),this.options.overscan,this.options.count],(t,r,o,i)=>r===null?[]:t({startIndex:r.startIndex,endIndex:r.endIndex,overscan:o,count:i}),{key:!1,debug:()=>this.options.debug}),this.indexFromElement=t=>{let r=this.options.indexAttribute,o=t.getAttribute(r);return o?parseInt(o,10):(console.warn(`Missing attribute name '${r}={index}' on measured element.`),-1)},this._measureElement=(t,r)=>{let o=this.indexFromElement(t),i=this.getMeasurements()[o];if(!i||!t.isConnected){this.elementsCache.forEach((a,l)=>{a===t&&(this.observer.unobserve(t),this.elementsCache.delete(l))});return}let s=this.elementsCache.get(i.key);s!==t&&(s&&this.observer.unobserve(s),this.observer.observe(t),this.elementsCache.set(i.key,t)),this.resizeItem(o,this.options.measureElement(t,r,this))},this.resizeItem=(t,r)=>{let o=this.getMeasurements()[t];if(!o)return;let i=this.itemSizeCache.get(o.key)??o.size,s=r-i;s!==0&&((this.shouldAdjustScrollPositionOnItemSizeChange!==void 0?this.shouldAdjustScrollPositionOnItemSizeChange(o,s,this):o.start<this.getScrollOffset()+this.scrollAdjustments)&&this._scrollToOffset(this.getScrollOffset(),{adjustments:this.scrollAdjustments+=s,behavior:void 0}),this.pendingMeasuredCacheIndexes.push(o.index),this.itemSizeCache=new Map(this.itemSizeCache.set(o.key,r)),this.notify(!0,!1))},this.measureElement=t=>{t&&this._measureElement(t,void 0)},this.getVirtualItems=ze(()=>[this.getIndexes(),this.getMeasurements()],(t,r)=>{let o=[];for(let i=0,s=t.length;i<s;i++){let a=t[i],l=r[a];o.push(l)}return o},{key:!1,debug:()=>this.options.debug}),this.getVirtualItemForOffset=t=>{let r=this.getMeasurements();if(r.length!==0)return yt(r[ro(0,r.length-1,o=>yt(r[o]).start,t)])},this.getOffsetForAlignment=(t,r)=>{let o=this.getSize(),i=this.getScrollOffset();r==="auto"&&(t<=i?r="start":t>=i+o?r="end":r="start"),r==="start"?t=t:r==="end"?t=t-o:r==="center"&&(t=t-o/2);let s=this.options.horizontal?"scrollWidth":"scrollHeight",l=(this.scrollElement?"document"in this.scrollElement?this.scrollElement.document.documentElement[s]:this.scrollElement[s]:0)-o;return Math.max(Math.min(l,t),0)},this.getOffsetForIndex=(t,r="auto")=>{t=Math.max(0,Math.min(t,this.options.count-1));let o=this.getMeasurements()[t];if(!o)return;let i=this.getSize(),s=this.getScrollOffset();if(r==="auto")if(o.end>=s+i-this.options.scrollPaddingEnd)r="end";else if(o.start<=s+this.options.scrollPaddingStart)r="start";else return[s,r];let a=r==="end"?o.end+this.options.scrollPaddingEnd:o.start-this.options.scrollPaddingStart;return[this.getOffsetForAlignment(a,r),r]},this.isDynamicMode=()=>this.elementsCache.size>0,this.cancelScrollToIndex=()=>{this.scrollToIndexTimeoutId!==null&&this.targetWindow&&(this.targetWindow.clearTimeout(this.scrollToIndexTimeoutId),this.scrollToIndexTimeoutId=null)},this.scrollToOffset=(t,{align:r="start",behavior:o}={})=>{this.cancelScrollToIndex(),o==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getOffsetForAlignment(t,r),{adjustments:void 0,behavior:o})},this.scrollToIndex=(t,{align:r="auto",behavior:o}={})=>{t=Math.max(0,Math.min(t,this.options.count-1)),this.cancelScrollToIndex(),o==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size.");let i=this.getOffsetForIndex(t,r);if(!i)return;let[s,a]=i;this._scrollToOffset(s,{adjustments:void 0,behavior:o}),o!=="smooth"&&this.isDynamicMode()&&this.targetWindow&&(this.scrollToIndexTimeoutId=this.targetWindow.setTimeout(()=>{if(this.scrollToIndexTimeoutId=null,this.elementsCache.has(this.options.getItemKey(t))){let[u]=yt(this.getOffsetForIndex(t,a));Jr(u,this.getScrollOffset())||this.scrollToIndex(t,{align:a,behavior:o})}else this.scrollToIndex(t,{align:a,behavior:o})}))},this.scrollBy=(t,{behavior:r}={})=>{this.cancelScrollToIndex(),r==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getScrollOffset()+t,{adjustments:void 0,behavior:r})},this.getTotalSize=()=>{var t;let r=this.getMeasurements(),o;return r.length===0?o=this.options.paddingStart:o=this.options.lanes===1?((t=r[r.length-1])==null?void 0:t.end)??0:Math.max(...r.slice(-this.options.lanes).map(i=>i.end)),o-this.options.scrollMargin+this.options.paddingEnd},this._scrollToOffset=(t,{adjustments:r,behavior:o})=>{this.options.scrollToFn(t,{behavior:o,adjustments:r},this)},this.measure=()=>{var t,r;this.itemSizeCache=new Map,(r=(t=this.options).onChange)==null||r.call(t,this,!1)},this.setOptions(n)}},ro=(e,n,t,r)=>{for(;e<=n;){let o=(e+n)/2|0,i=t(o);if(i<r)e=o+1;else if(i>r)n=o-1;else return o}return e>0?e-1:0};function Ms({measurements:e,outerSize:n,scrollOffset:t}){let r=e.length-1,i=ro(0,r,a=>e[a].start,t),s=i;for(;s<r&&e[s].end<t+n;)s++;return{startIndex:i,endIndex:s}}var Fs=typeof document<"u"?ie:V;function Is(e){let n=Pe(()=>({}),{})[1],t={...e,onChange:(o,i)=>{var s;i?tn(n):n(),(s=e.onChange)==null||s.call(e,o,i)}},[r]=H(()=>new vt(t));return r.setOptions(t),V(()=>r._didMount(),[]),Fs(()=>r._willUpdate()),r}function oo(e){return Is({observeElementRect:eo,observeElementOffset:to,scrollToFn:no,...e})}function io(e){return{render:function(n){Qt(n,e)},unmount:function(){en(e)}}}var fo=Symbol.for("immer-nothing"),so=Symbol.for("immer-draftable"),T=Symbol.for("immer-state");function le(e,...n){throw new Error(`[Immer] minified error nr: ${e}. Full error at: https://bit.ly/3cXEKWf`)}var Ge=Object.getPrototypeOf;function Be(e){return!!e&&!!e[T]}function ve(e){return e?go(e)||Array.isArray(e)||!!e[so]||!!e.constructor?.[so]||Rt(e)||bt(e):!1}var Ts=Object.prototype.constructor.toString();function go(e){if(!e||typeof e!="object")return!1;let n=Ge(e);if(n===null)return!0;let t=Object.hasOwnProperty.call(n,"constructor")&&n.constructor;return t===Object?!0:typeof t=="function"&&Function.toString.call(t)===Ts}function Ue(e,n){Et(e)===0?Object.entries(e).forEach(([t,r])=>{n(t,r,e)}):e.forEach((t,r)=>n(r,t,e))}function Et(e){let n=e[T];return n?n.type_:Array.isArray(e)?1:Rt(e)?2:bt(e)?3:0}function Cn(e,n){return Et(e)===2?e.has(n):Object.prototype.hasOwnProperty.call(e,n)}function po(e,n,t){let r=Et(e);r===2?e.set(n,t):r===3?e.add(t):e[n]=t}function Ps(e,n){return e===n?e!==0||1/e===1/n:e!==e&&n!==n}function Rt(e){return e instanceof Map}function bt(e){return e instanceof Set}function B(e){return e.copy_||e.base_}function En(e,n){if(Rt(e))return new Map(e);if(bt(e))return new Set(e);if(Array.isArray(e))return Array.prototype.slice.call(e);if(!n&&go(e))return Ge(e)?{...e}:Object.assign(Object.create(null),e);let t=Object.getOwnPropertyDescriptors(e);delete t[T];let r=Reflect.ownKeys(t);for(let o=0;o<r.length;o++){let i=r[o],s=t[i];s.writable===!1&&(s.writable=!0,s.configurable=!0),(s.get||s.set)&&(t[i]={configurable:!0,writable:!0,enumerable:s.enumerable,value:e[i]})}return Object.create(Ge(e),t)}function Ke(e,n=!1){return xt(e)||Be(e)||!ve(e)||(Et(e)>1&&(e.set=e.add=e.clear=e.delete=Ds),Object.freeze(e),n&&Ue(e,(t,r)=>Ke(r,!0),!0)),e}function Ds(){le(2)}function xt(e){return Object.isFrozen(e)}var Rn={};function De(e){let n=Rn[e];return n||le(0,e),n}function Vs(e,n){Rn[e]||(Rn[e]=n)}var nt;function St(){return nt}function $s(e,n){return{drafts_:[],parent_:e,immer_:n,canAutoFreeze_:!0,unfinalizedDrafts_:0}}function lo(e,n){n&&(De("Patches"),e.patches_=[],e.inversePatches_=[],e.patchListener_=n)}function bn(e){xn(e),e.drafts_.forEach(Ls),e.drafts_=null}function xn(e){e===nt&&(nt=e.parent_)}function ao(e){return nt=$s(nt,e)}function Ls(e){let n=e[T];n.type_===0||n.type_===1?n.revoke_():n.revoked_=!0}function uo(e,n){n.unfinalizedDrafts_=n.drafts_.length;let t=n.drafts_[0];return e!==void 0&&e!==t?(t[T].modified_&&(bn(n),le(4)),ve(e)&&(e=wt(n,e),n.parent_||Ct(n,e)),n.patches_&&De("Patches").generateReplacementPatches_(t[T].base_,e,n.patches_,n.inversePatches_)):e=wt(n,t,[]),bn(n),n.patches_&&n.patchListener_(n.patches_,n.inversePatches_),e!==fo?e:void 0}function wt(e,n,t){if(xt(n))return n;let r=n[T];if(!r)return Ue(n,(o,i)=>co(e,r,n,o,i,t),!0),n;if(r.scope_!==e)return n;if(!r.modified_)return Ct(e,r.base_,!0),r.base_;if(!r.finalized_){r.finalized_=!0,r.scope_.unfinalizedDrafts_--;let o=r.copy_,i=o,s=!1;r.type_===3&&(i=new Set(o),o.clear(),s=!0),Ue(i,(a,l)=>co(e,r,o,a,l,t,s)),Ct(e,o,!1),t&&e.patches_&&De("Patches").generatePatches_(r,t,e.patches_,e.inversePatches_)}return r.copy_}function co(e,n,t,r,o,i,s){if(Be(o)){let a=i&&n&&n.type_!==3&&!Cn(n.assigned_,r)?i.concat(r):void 0,l=wt(e,o,a);if(po(t,r,l),Be(l))e.canAutoFreeze_=!1;else return}else s&&t.add(o);if(ve(o)&&!xt(o)){if(!e.immer_.autoFreeze_&&e.unfinalizedDrafts_<1)return;wt(e,o),(!n||!n.scope_.parent_)&&Ct(e,o)}}function Ct(e,n,t=!1){!e.parent_&&e.immer_.autoFreeze_&&e.canAutoFreeze_&&Ke(n,t)}function Os(e,n){let t=Array.isArray(e),r={type_:t?1:0,scope_:n?n.scope_:St(),modified_:!1,finalized_:!1,assigned_:{},parent_:n,base_:e,draft_:null,copy_:null,revoke_:null,isManual_:!1},o=r,i=Mn;t&&(o=[r],i=rt);let{revoke:s,proxy:a}=Proxy.revocable(o,i);return r.draft_=a,r.revoke_=s,a}var Mn={get(e,n){if(n===T)return e;let t=B(e);if(!Cn(t,n))return ks(e,t,n);let r=t[n];return e.finalized_||!ve(r)?r:r===Sn(e.base_,n)?(wn(e),e.copy_[n]=ot(r,e)):r},has(e,n){return n in B(e)},ownKeys(e){return Reflect.ownKeys(B(e))},set(e,n,t){let r=ho(B(e),n);if(r?.set)return r.set.call(e.draft_,t),!0;if(!e.modified_){let o=Sn(B(e),n),i=o?.[T];if(i&&i.base_===t)return e.copy_[n]=t,e.assigned_[n]=!1,!0;if(Ps(t,o)&&(t!==void 0||Cn(e.base_,n)))return!0;wn(e),ye(e)}return e.copy_[n]===t&&(t!==void 0||n in e.copy_)||Number.isNaN(t)&&Number.isNaN(e.copy_[n])||(e.copy_[n]=t,e.assigned_[n]=!0),!0},deleteProperty(e,n){return Sn(e.base_,n)!==void 0||n in e.base_?(e.assigned_[n]=!1,wn(e),ye(e)):delete e.assigned_[n],e.copy_&&delete e.copy_[n],!0},getOwnPropertyDescriptor(e,n){let t=B(e),r=Reflect.getOwnPropertyDescriptor(t,n);return r&&{writable:!0,configurable:e.type_!==1||n!=="length",enumerable:r.enumerable,value:t[n]}},defineProperty(){le(11)},getPrototypeOf(e){return Ge(e.base_)},setPrototypeOf(){le(12)}},rt={};Ue(Mn,(e,n)=>{rt[e]=function(){return arguments[0]=arguments[0][0],n.apply(this,arguments)}});rt.deleteProperty=function(e,n){return rt.set.call(this,e,n,void 0)};rt.set=function(e,n,t){return Mn.set.call(this,e[0],n,t,e[0])};function Sn(e,n){let t=e[T];return(t?B(t):e)[n]}function ks(e,n,t){let r=ho(n,t);return r?"value"in r?r.value:r.get?.call(e.draft_):void 0}function ho(e,n){if(!(n in e))return;let t=Ge(e);for(;t;){let r=Object.getOwnPropertyDescriptor(t,n);if(r)return r;t=Ge(t)}}function ye(e){e.modified_||(e.modified_=!0,e.parent_&&ye(e.parent_))}function wn(e){e.copy_||(e.copy_=En(e.base_,e.scope_.immer_.useStrictShallowCopy_))}var Hs=class{constructor(e){this.autoFreeze_=!0,this.useStrictShallowCopy_=!1,this.produce=(n,t,r)=>{if(typeof n=="function"&&typeof t!="function"){let i=t;t=n;let s=this;return function(l=i,...u){return s.produce(l,f=>t.call(this,f,...u))}}typeof t!="function"&&le(6),r!==void 0&&typeof r!="function"&&le(7);let o;if(ve(n)){let i=ao(this),s=ot(n,void 0),a=!0;try{o=t(s),a=!1}finally{a?bn(i):xn(i)}return lo(i,r),uo(o,i)}else if(!n||typeof n!="object"){if(o=t(n),o===void 0&&(o=n),o===fo&&(o=void 0),this.autoFreeze_&&Ke(o,!0),r){let i=[],s=[];De("Patches").generateReplacementPatches_(n,o,i,s),r(i,s)}return o}else le(1,n)},this.produceWithPatches=(n,t)=>{if(typeof n=="function")return(s,...a)=>this.produceWithPatches(s,l=>n(l,...a));let r,o;return[this.produce(n,t,(s,a)=>{r=s,o=a}),r,o]},typeof e?.autoFreeze=="boolean"&&this.setAutoFreeze(e.autoFreeze),typeof e?.useStrictShallowCopy=="boolean"&&this.setUseStrictShallowCopy(e.useStrictShallowCopy)}createDraft(e){ve(e)||le(8),Be(e)&&(e=As(e));let n=ao(this),t=ot(e,void 0);return t[T].isManual_=!0,xn(n),t}finishDraft(e,n){let t=e&&e[T];(!t||!t.isManual_)&&le(9);let{scope_:r}=t;return lo(r,n),uo(void 0,r)}setAutoFreeze(e){this.autoFreeze_=e}setUseStrictShallowCopy(e){this.useStrictShallowCopy_=e}applyPatches(e,n){let t;for(t=n.length-1;t>=0;t--){let o=n[t];if(o.path.length===0&&o.op==="replace"){e=o.value;break}}t>-1&&(n=n.slice(t+1));let r=De("Patches").applyPatches_;return Be(e)?r(e,n):this.produce(e,o=>r(o,n))}};function ot(e,n){let t=Rt(e)?De("MapSet").proxyMap_(e,n):bt(e)?De("MapSet").proxySet_(e,n):Os(e,n);return(n?n.scope_:St()).drafts_.push(t),t}function As(e){return Be(e)||le(10,e),mo(e)}function mo(e){if(!ve(e)||xt(e))return e;let n=e[T],t;if(n){if(!n.modified_)return n.base_;n.finalized_=!0,t=En(e,n.scope_.immer_.useStrictShallowCopy_)}else t=En(e,!0);return Ue(t,(r,o)=>{po(t,r,mo(o))}),n&&(n.finalized_=!1),t}function Mt(){class e extends Map{constructor(l,u){super(),this[T]={type_:2,parent_:u,scope_:u?u.scope_:St(),modified_:!1,finalized_:!1,copy_:void 0,assigned_:void 0,base_:l,draft_:this,isManual_:!1,revoked_:!1}}get size(){return B(this[T]).size}has(l){return B(this[T]).has(l)}set(l,u){let f=this[T];return s(f),(!B(f).has(l)||B(f).get(l)!==u)&&(t(f),ye(f),f.assigned_.set(l,!0),f.copy_.set(l,u),f.assigned_.set(l,!0)),this}delete(l){if(!this.has(l))return!1;let u=this[T];return s(u),t(u),ye(u),u.base_.has(l)?u.assigned_.set(l,!1):u.assigned_.delete(l),u.copy_.delete(l),!0}clear(){let l=this[T];s(l),B(l).size&&(t(l),ye(l),l.assigned_=new Map,Ue(l.base_,u=>{l.assigned_.set(u,!1)}),l.copy_.clear())}forEach(l,u){let f=this[T];B(f).forEach((c,g,d)=>{l.call(u,this.get(g),g,this)})}get(l){let u=this[T];s(u);let f=B(u).get(l);if(u.finalized_||!ve(f)||f!==u.base_.get(l))return f;let c=ot(f,u);return t(u),u.copy_.set(l,c),c}keys(){return B(this[T]).keys()}values(){let l=this.keys();return{[Symbol.iterator]:()=>this.values(),next:()=>{let u=l.next();return u.done?u:{done:!1,value:this.get(u.value)}}}}entries(){let l=this.keys();return{[Symbol.iterator]:()=>this.entries(),next:()=>{let u=l.next();if(u.done)return u;let f=this.get(u.value);return{done:!1,value:[u.value,f]}}}}[Symbol.iterator](){return this.entries()}}function n(a,l){return new e(a,l)}function t(a){a.copy_||(a.assigned_=new Map,a.copy_=new Map(a.base_))}class r extends Set{constructor(l,u){super(),this[T]={type_:3,parent_:u,scope_:u?u.scope_:St(),modified_:!1,finalized_:!1,copy_:void 0,base_:l,draft_:this,drafts_:new Map,revoked_:!1,isManual_:!1}}get size(){return B(this[T]).size}has(l){let u=this[T];return s(u),u.copy_?!!(u.copy_.has(l)||u.drafts_.has(l)&&u.copy_.has(u.drafts_.get(l))):u.base_.has(l)}add(l){let u=this[T];return s(u),this.has(l)||(i(u),ye(u),u.copy_.add(l)),this}delete(l){if(!this.has(l))return!1;let u=this[T];return s(u),i(u),ye(u),u.copy_.delete(l)||(u.drafts_.has(l)?u.copy_.delete(u.drafts_.get(l)):!1)}clear(){let l=this[T];s(l),B(l).size&&(i(l),ye(l),l.copy_.clear())}values(){let l=this[T];return s(l),i(l),l.copy_.values()}entries(){let l=this[T];return s(l),i(l),l.copy_.entries()}keys(){return this.values()}[Symbol.iterator](){return this.values()}forEach(l,u){let f=this.values(),c=f.next();for(;!c.done;)l.call(u,c.value,c.value,this),c=f.next()}}function o(a,l){return new r(a,l)}function i(a){a.copy_||(a.copy_=new Set,a.base_.forEach(l=>{if(ve(l)){let u=ot(l,a);a.drafts_.set(l,u),a.copy_.add(u)}else a.copy_.add(l)}))}function s(a){a.revoked_&&le(3,JSON.stringify(B(a)))}Vs("MapSet",{proxyMap_:n,proxySet_:o})}var ne=new Hs,_o=ne.produce,Pl=ne.produceWithPatches.bind(ne),Dl=ne.setAutoFreeze.bind(ne),Vl=ne.setUseStrictShallowCopy.bind(ne),$l=ne.applyPatches.bind(ne),Ll=ne.createDraft.bind(ne),Ol=ne.finishDraft.bind(ne);function xe(e){var n=H(function(){return Ke(typeof e=="function"?e():e,!0)}),t=n[1];return[n[0],J(function(r){t(typeof r=="function"?_o(r):Ke(r))},[])]}function Ns(e,n,t,r,o){window.Shiny.shinyapp.makeRequest(e,n,t,r,o)}function yo({method:e,args:n,blobs:t}){return new Promise((r,o)=>{Ns(e,n,i=>{r(i)},i=>{o(i)},t)})}function Fn({setData:e,newPatches:n,setCellEditMapAtLoc:t}){e(r=>{n.forEach(({rowIndex:o,columnIndex:i,value:s})=>{r[o][i]=s})}),n.forEach(({rowIndex:r,columnIndex:o,value:i})=>{t(r,o,s=>{s.value=i,s.state=fe.EditSuccess,s.errorTitle=void 0})})}function In(e){return e.map(t=>({rowIndex:t.row_index,columnIndex:t.column_index,value:t.value}))}function zs(e){return e.map(t=>({row_index:t.rowIndex,column_index:t.columnIndex,value:t.value}))}function vo({patchInfo:e,patches:n,onSuccess:t,onError:r,columns:o,setData:i,setCellEditMapAtLoc:s}){let a=zs(n);yo({method:e.key,args:[a]}).then(l=>{if(!Array.isArray(l))throw new Error("Expected a response of a list of patches");for(let f of l)if(!("row_index"in f&&"column_index"in f&&"value"in f))throw new Error("Expected list of patches containing `row_index`, `column_index`, and `value`");l=l;let u=In(l);n.forEach(({rowIndex:f,columnIndex:c,value:g})=>{s(f,c,d=>{d.state===fe.EditSaving&&(d.state=fe.Ready,d.value=g,d.errorTitle=void 0)})}),Fn({setData:i,newPatches:u,setCellEditMapAtLoc:s}),t(u)}).catch(l=>{n.forEach(({rowIndex:u,columnIndex:f,value:c})=>{s(u,f,g=>{g.value=String(c),g.state=fe.EditFailure,g.errorTitle=String(l)})}),r(l)})}var fe={EditSaving:"EditSaving",EditSuccess:"EditSuccess",EditFailure:"EditFailure",Editing:"Editing",Ready:"Ready"},Dn={EditSaving:"cell-edit-saving",EditSuccess:"cell-edit-success",EditFailure:"cell-edit-failure",Editing:"cell-edit-editing",Ready:void 0},Pn=e=>e!==null&&typeof e=="object"&&Object.prototype.hasOwnProperty.call(e,"isShinyHtml")&&e.isShinyHtml===!0,Tn=e=>e===null?"":Pn(e)?e.obj.html:e,So=({containerRef:e,rowId:n,cell:t,patchInfo:r,columns:o,coldefs:i,rowIndex:s,columnIndex:a,editCellsIsAllowed:l,getSortedRowModel:u,cellEditInfo:f,cellStyle:c,cellClassName:g,setData:d,setCellEditMapAtLoc:h,selection:p})=>{let _=t.getValue(),m=t.column.columnDef.meta.isHtmlColumn,y=f?.value??_,R=f?.state??fe.Ready,P=f?.errorTitle,I=f?.isEditing??!1,D=f?.editValue??Tn(y),q=Q(null),U=Q(null),K=J(({resetIsEditing:M=!1,resetEditValue:O=!1}={resetIsEditing:!0,resetEditValue:!0})=>{h(s,a,z=>{M&&(z.isEditing=!1),O&&(z.editValue=void 0)})},[s,a,h]),G=M=>{M.key==="Escape"&&(M.preventDefault(),M.stopPropagation(),K(),p.focusOffset(n,0))},Z=M=>{if(M.key!=="Tab")return;M.preventDefault(),M.stopPropagation();let O=M.shiftKey,z=a;for(;;){let W=z+(O?-1:1);if(W<0||W>=i.length)return;if(z=W,i[W].meta.isHtmlColumn!==!0)break}Ve(),h(s,z,W=>{W.isEditing=!0})},je=M=>{if(M.key!=="Enter")return;M.preventDefault(),M.stopPropagation();let O=M.shiftKey,z=u(),W=z.rows.findIndex(Oe=>Oe.id===n);if(W<0)return;let Xe=W+(O?-1:1);if(Xe<0||Xe>=z.rows.length)return;Ve();let Le=z.rows[Xe].index;h(Le,a,Oe=>{Oe.isEditing=!0})},it=M=>{[G,je,Z].forEach(O=>O(M))},Ve=J(()=>{if(h(s,a,M=>{M.errorTitle=void 0}),`${Tn(y)}`==`${D}`){K(),h(s,a,M=>{M.state=R});return}K({resetIsEditing:!0}),h(s,a,M=>{M.state=fe.EditSaving}),vo({patchInfo:r,patches:[{rowIndex:s,columnIndex:a,value:D}],onSuccess:M=>{K({resetEditValue:!0})},onError:M=>{},columns:o,setData:d,setCellEditMapAtLoc:h})},[h,s,a,y,D,K,r,o,d,R]);V(()=>{I&&U.current&&(U.current.focus(),U.current.select())},[I]),V(()=>{if(!I||!q.current||!U.current)return;let M=W=>{q.current?.contains(W.target)&&W.stopPropagation()},O=q.current;O.addEventListener("mousedown",M);let z=W=>{W.target!==U.current&&(Ve(),K())};return document.body.addEventListener("mousedown",z),()=>{O.removeEventListener("mousedown",M),document.body.removeEventListener("mousedown",z)}},[R,Ve,s,a,I,K]);function qe(M){I&&M.target.select()}function On(M){h(s,a,O=>{O.editValue=M.target.value})}let We,Se,we=P,$e=g,Ce=M=>{M&&($e?($e+=" ",$e+=M):$e=M)};Ce(Dn[I?fe.Editing:R]);let pe=!1,st=null;return R===fe.EditSaving?Se=D:(I?st=x.createElement("textarea",{value:String(D),onChange:On,onFocus:qe,onKeyDown:it,ref:U}):m?Ce("cell-html"):l&&(Ce("cell-editable"),We=M=>{h(s,a,O=>{O.isEditing=!0,O.editValue=Tn(y)})}),Pn(y)?pe=!0:Se=_t(t.column.columnDef.cell,t.getContext())),V(()=>{if(!q.current||!pe||!Pn(y))return;let M=JSON.parse(JSON.stringify(y.obj));window.Shiny.renderContentAsync(q.current,M);let O=q.current;return()=>{window.Shiny.unbindAll(O),O.replaceChildren("")}},[q,y,s,a,pe]),x.createElement("td",{ref:q,onDoubleClick:We,title:we,className:$e,style:{...c}},st,Se)};var wo=()=>{let[e,n]=xe(new Map);return Mt(),{cellEditMap:e,setCellEditMapAtLoc:(r,o,i)=>{n(s=>{let a=Co(r,o),l=s.get(a)??{};i(l),s.set(a,l)})},resetCellEditMap:()=>{n(new Map)}}},Co=(e,n)=>`[${e}, ${n}]`;var Eo=(e,n,t)=>{let r=Co(n,t);return[e.get(r)??{},r]};function Ft(e,n,t){let r=Object.assign({top:0,right:0,bottom:0,left:0},t),o=e,i=o.scrollTop+r.top,s=o.scrollLeft+r.left,a=i+o.clientHeight-r.top-r.bottom,l=s+o.clientWidth-r.left-r.right;for(let u=0;u<n.length;u++){let f=n[u],c=f.offsetTop,g=f.offsetLeft;if(c>=i&&c<=a&&g>=s&&g<=l)return f}return null}function Vn(e,n){return document?.defaultView?.getComputedStyle(e,null)?.getPropertyValue(n)}var xo=e=>{let[n,t]=H(!1),{range:r,from:o,to:i,onRangeChange:s}=e;return x.createElement(Gs,{range:r,value:[o,i],editing:n,onValueChange:a=>s(...a),onFocus:()=>t(!0),onBlur:()=>t(!1)})};var Gs=e=>{let[n,t]=e.value,{editing:r,onFocus:o}=e,[i,s]=e.range(),a=Q(null),l=Q(null);return x.createElement("div",{onBlur:u=>{if(!u.currentTarget.contains(u.relatedTarget))return e.onBlur()},onFocus:()=>o(),style:{display:"flex",gap:"0.5rem"}},x.createElement("input",{ref:a,className:`form-control form-control-sm ${a.current?.checkValidity()?"":"is-invalid"}`,style:{flex:"1 1 0",width:"0"},type:"number",placeholder:Ro(r,"Min",i),defaultValue:n,step:"any",onChange:u=>{let f=bo(u.target.value);a.current&&(a.current.classList.toggle("is-invalid",!u.target.checkValidity()),e.onValueChange([f,t]))}}),x.createElement("input",{ref:l,className:`form-control form-control-sm ${l.current?.checkValidity()?"":"is-invalid"}`,style:{flex:"1 1 0",width:"0"},type:"number",placeholder:Ro(r,"Max",s),defaultValue:t,step:"any",onChange:u=>{let f=bo(u.target.value);l.current&&(l.current.classList.toggle("is-invalid",!u.target.checkValidity()),e.onValueChange([n,f]))}}))};function Ro(e,n,t){if(e)return typeof t>"u"?n:`${n} (${t})`}function bo(e){if(e!=="")return+e}function Mo(e){let[n,t]=H([]),r=e?{getFilteredRowModel:Wr(),getFacetedRowModel:jr(),getFacetedUniqueValues:qr(),getFacetedMinMaxValues:Ur(),filterFns:{substring:(o,i,s,a)=>o.getValue(i)?.toString().includes(s)??!1},onColumnFiltersChange:t}:{};return{columnFilters:n,columnFiltersState:{columnFilters:n},filtersTableOptions:r,setColumnFilters:t}}var Fo=({header:e,className:n,...t})=>{let r=e.column.columnDef.meta?.typeHint;if(!r||r.type==="html")return null;if(r.type==="numeric"){let[o,i]=e.column.getFilterValue()??[void 0,void 0];return xo({from:o,to:i,range:()=>e.column.getFacetedMinMaxValues()??[void 0,void 0],onRangeChange:(a,l)=>e.column.setFilterValue([a,l])})}return x.createElement("input",{...t,value:e.column.getFilterValue()||"",className:`form-control form-control-sm ${n}`,type:"text",onChange:o=>e.column.setFilterValue(o.target.value)})};var re=class e{static{this._empty=new e(new Set)}constructor(n){this._set=n}static empty(){return this._empty}static just(...n){return this.empty().add(...n)}has(n){return this._set.has(n)}add(...n){let t=new Set(this._set.keys());for(let r of n)t.add(r);return new e(t)}toggle(n){return this.has(n)?this.delete(n):this.add(n)}delete(n){let t=new Set(this._set.keys());return t.delete(n),new e(t)}clear(){return e.empty()}[Symbol.iterator](){return this._set[Symbol.iterator]()}toList(){return[...this._set.keys()]}};var ae=class e{static{this._NONE="none"}static{this._ROW_SINGLE="single"}static{this._ROW_MULTIPLE="multiple"}static{this._COL_SINGLE="single"}static{this._col_multiple="multiple"}static{this._RECT_CELL="cell"}static{this._RECT_REGION="region"}static{this._rowEnum={NONE:e._NONE,SINGLE:e._ROW_SINGLE,MULTIPLE:e._ROW_MULTIPLE}}static{this._colEnum={NONE:e._NONE,SINGLE:e._COL_SINGLE,MULTIPLE:e._col_multiple}}static{this._rectEnum={NONE:e._NONE,REGION:e._RECT_REGION,CELL:e._RECT_CELL}}constructor({row:n,col:t,rect:r}){if(!Object.values(e._rowEnum).includes(n))throw new Error(`Invalid row selection mode: ${n}`);if(!Object.values(e._colEnum).includes(t))throw new Error(`Invalid col selection mode: ${t}`);if(!Object.values(e._rectEnum).includes(r))throw new Error(`Invalid rect selection mode: ${r}`);this.row=n,this.col=t,this.rect=r}isNone(){return this.row===e._rowEnum.NONE&&this.col===e._colEnum.NONE&&this.rect===e._rectEnum.NONE}};function To(e){return e||(e={row:"multiple",col:"none",rect:"none"}),new ae({row:e.row,col:e.col,rect:e.rect})}function Po({isEditingCell:e,editCellsIsAllowed:n,selectionModes:t,keyAccessor:r,focusOffset:o,focusEscape:i,onKeyDownEnter:s,between:a}){let[l,u]=H(re.empty()),[f,c]=H(null),g=p=>{if(t.isNone())return;let _=p.currentTarget,m=r(_);if(e&&_.classList.contains(Dn[fe.Editing]))return;let y=Bs(t,a,l,p,m,f);y&&(u(y.selection),y.anchor&&(c(m),_.focus()),p.preventDefault())},d=p=>{if(e||t.isNone())return;let _=p.currentTarget,m=r(_),y=l.has(m);if(p.key==="Escape"){i(_),p.preventDefault();return}if(t.row===ae._rowEnum.SINGLE){if(p.key===" "||p.key==="Enter")p.preventDefault(),n&&p.key==="Enter"?s(_):l.has(m)?u(re.empty()):u(re.just(m));else if(p.key==="ArrowUp"||p.key==="ArrowDown"){let R=o(m,p.key==="ArrowUp"?-1:1);R&&(p.preventDefault(),y&&u(re.just(R)))}}else t.row===ae._rowEnum.MULTIPLE&&(p.key===" "||p.key==="Enter"?(p.preventDefault(),n&&p.key==="Enter"?s(_):u(l.toggle(m))):(p.key==="ArrowUp"||p.key==="ArrowDown")&&o(m,p.key==="ArrowUp"?-1:1)&&p.preventDefault())};return{has(p){return l.has(p)},set(p,_){u(_?l.add(p):l.delete(p))},setMultiple(p){u(re.just(...p))},clear(){u(l.clear())},keys(){return l},itemHandlers(){return{onMouseDown:g,onKeyDown:d}},focusOffset:o}}var Io=/^mac/i.test(window.navigator.userAgentData?.platform??window.navigator.platform);function Bs(e,n,t,r,o,i){let{shiftKey:s,altKey:a}=r,l=Io?r.metaKey:r.ctrlKey;if((Io?r.ctrlKey:r.metaKey)||a||e.row===ae._rowEnum.NONE)return null;if(e.row===ae._rowEnum.SINGLE)return l&&!s?t.has(o)?{selection:re.empty(),anchor:!0}:{selection:re.just(o),anchor:!0}:{selection:re.just(o),anchor:!0};if(e.row===ae._rowEnum.MULTIPLE)if(s&&l){if(i!==null&&n){let f=n(i,o);return{selection:t.add(...f)}}}else{if(l)return{selection:t.toggle(o),anchor:!0};if(s){if(i!==null&&n){let f=n(i,o);return{selection:re.just(...f)}}}else return{selection:re.just(o),anchor:!0}}else throw new Error(`Unsupported row selection mode: ${e.row}`);return null}function Do({getColDefs:e}){let[n,t]=H([]);return{sorting:n,sortTableStateOptions:{sorting:n},sortTableOptions:{onSortingChange:r=>{let o=typeof r=="function"?r(n):r,i=e(),s=new Set(i.filter(l=>l.meta.isHtmlColumn).map(l=>l.header)),a=s.size==0?o:o.filter(l=>!s.has(l.id));t(a)},getSortedRowModel:Xr()},setSorting:t}}var Vo="sort-arrow",$o={viewBox:[-1,-1,2,2].map(e=>e*1.4).join(" "),width:"100%",height:"100%",style:{paddingLeft:"3px"}},Lo={stroke:"#333333",strokeWidth:"0.6",fill:"transparent"},Us=x.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",...$o,className:`${Vo} sort-arrow-up`},x.createElement("path",{d:"M -1 0.5 L 0 -0.5 L 1 0.5",...Lo,strokeLinecap:"round"})),Ks=x.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",...$o,className:`${Vo} sort-arrow-down`},x.createElement("path",{d:"M -1 -0.5 L 0 0.5 L 1 -0.5",...Lo,strokeLinecap:"round"})),Oo=({direction:e})=>{if(!e)return null;if(e==="asc")return Us;if(e==="desc")return Ks;throw new Error(`Unexpected sort direction: '${e}'`)};Mt();var ko=({location:e,rowIndex:n,columnIndex:t})=>`[${e}, ${n}, ${t}]`,Ho=({initStyleInfos:e,nrow:n,ncol:t})=>{let[r,o]=xe(new Map),i=J(l=>{let{location:u,rows:f,cols:c}=l;o(g=>{let d=f??Array.from({length:n},(p,_)=>_),h=c??Array.from({length:t},(p,_)=>_);for(let p of d)for(let _ of h){let m=ko({location:u,rowIndex:p,columnIndex:_}),y=g.get(m)??{style:{},class:void 0},R;y.class?l.class?R=`${y.class} ${l.class}`:R=y.class:l.class?R=l.class:R=void 0,g.set(m,{location:u,rowIndex:p,columnIndex:_,style:{...y.style,...l.style},class:R})}})},[t,n,o]),s=J(()=>{o(l=>{l.clear()})},[o]),a=J(l=>{s();for(let u of l)i(u)},[i,s]);return V(()=>{a(e)},[e,a]),{styleInfoMap:r,setStyleInfo:i,setStyleInfos:a,resetStyleInfos:s}};var Ao=(e,n,t,r)=>{let o=ko({location:n,rowIndex:t,columnIndex:r}),i=e.get(o);return{cellStyle:i?.style,cellClassName:i?.class}},Ba=document.createElement("cssStringToObj");var No=`
+            color: hsl(${Math.max(0,Math.min(120-120*p,120))}deg 100% 31%);`,t?.key)}return(l=t?.onChange)==null||l.call(t,o),o}}function yt(e,n){if(e===void 0)throw new Error(`Unexpected undefined${n?`: ${n}`:""}`);return e}var Jr=(e,n)=>Math.abs(e-n)<1,Qr=(e,n,t)=>{let r;return function(...o){e.clearTimeout(r),r=e.setTimeout(()=>n.apply(this,o),t)}};var Es=e=>e,Rs=e=>{let n=Math.max(e.startIndex-e.overscan,0),t=Math.min(e.endIndex+e.overscan,e.count-1),r=[];for(let o=n;o<=t;o++)r.push(o);return r},eo=(e,n)=>{let t=e.scrollElement;if(!t)return;let r=e.targetWindow;if(!r)return;let o=s=>{let{width:a,height:l}=s;n({width:Math.round(a),height:Math.round(l)})};if(o(t.getBoundingClientRect()),!r.ResizeObserver)return()=>{};let i=new r.ResizeObserver(s=>{let a=s[0];if(a?.borderBoxSize){let l=a.borderBoxSize[0];if(l){o({width:l.inlineSize,height:l.blockSize});return}}o(t.getBoundingClientRect())});return i.observe(t,{box:"border-box"}),()=>{i.unobserve(t)}},Zr={passive:!0};var bs=typeof window>"u"?!0:"onscrollend"in window,to=(e,n)=>{let t=e.scrollElement;if(!t)return;let r=e.targetWindow;if(!r)return;let o=0,i=bs?()=>{}:Qr(r,()=>{n(o,!1)},e.options.isScrollingResetDelay),s=u=>()=>{o=t[e.options.horizontal?"scrollLeft":"scrollTop"],i(),n(o,u)},a=s(!0),l=s(!1);return l(),t.addEventListener("scroll",a,Zr),t.addEventListener("scrollend",l,Zr),()=>{t.removeEventListener("scroll",a),t.removeEventListener("scrollend",l)}};var xs=(e,n,t)=>{if(n?.borderBoxSize){let r=n.borderBoxSize[0];if(r)return Math.round(r[t.options.horizontal?"inlineSize":"blockSize"])}return Math.round(e.getBoundingClientRect()[t.options.horizontal?"width":"height"])};var no=(e,{adjustments:n=0,behavior:t},r)=>{var o,i;let s=e+n;(i=(o=r.scrollElement)==null?void 0:o.scrollTo)==null||i.call(o,{[r.options.horizontal?"left":"top"]:s,behavior:t})},vt=class{constructor(n){this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.isScrolling=!1,this.scrollToIndexTimeoutId=null,this.measurementsCache=[],this.itemSizeCache=new Map,this.pendingMeasuredCacheIndexes=[],this.scrollRect=null,this.scrollOffset=null,this.scrollDirection=null,this.scrollAdjustments=0,this.elementsCache=new Map,this.observer=(()=>{let t=null,r=()=>t||(!this.targetWindow||!this.targetWindow.ResizeObserver?null:t=new this.targetWindow.ResizeObserver(o=>{o.forEach(i=>{this._measureElement(i.target,i)})}));return{disconnect:()=>{var o;return(o=r())==null?void 0:o.disconnect()},observe:o=>{var i;return(i=r())==null?void 0:i.observe(o,{box:"border-box"})},unobserve:o=>{var i;return(i=r())==null?void 0:i.unobserve(o)}}})(),this.range=null,this.setOptions=t=>{Object.entries(t).forEach(([r,o])=>{typeof o>"u"&&delete t[r]}),this.options={debug:!1,initialOffset:0,overscan:1,paddingStart:0,paddingEnd:0,scrollPaddingStart:0,scrollPaddingEnd:0,horizontal:!1,getItemKey:Es,rangeExtractor:Rs,onChange:()=>{},measureElement:xs,initialRect:{width:0,height:0},scrollMargin:0,gap:0,indexAttribute:"data-index",initialMeasurementsCache:[],lanes:1,isScrollingResetDelay:150,enabled:!0,...t}},this.notify=(t,r)=>{var o,i;let{startIndex:s,endIndex:a}=this.range??{startIndex:void 0,endIndex:void 0},l=this.calculateRange();(t||s!==l?.startIndex||a!==l?.endIndex)&&((i=(o=this.options).onChange)==null||i.call(o,this,r))},this.cleanup=()=>{this.unsubs.filter(Boolean).forEach(t=>t()),this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.observer.disconnect(),this.elementsCache.clear()},this._didMount=()=>()=>{this.cleanup()},this._willUpdate=()=>{var t;let r=this.options.enabled?this.options.getScrollElement():null;if(this.scrollElement!==r){if(this.cleanup(),!r){this.notify(!1,!1);return}this.scrollElement=r,this.scrollElement&&"ownerDocument"in this.scrollElement?this.targetWindow=this.scrollElement.ownerDocument.defaultView:this.targetWindow=((t=this.scrollElement)==null?void 0:t.window)??null,this._scrollToOffset(this.getScrollOffset(),{adjustments:void 0,behavior:void 0}),this.unsubs.push(this.options.observeElementRect(this,o=>{this.scrollRect=o,this.notify(!1,!1)})),this.unsubs.push(this.options.observeElementOffset(this,(o,i)=>{this.scrollAdjustments=0,this.scrollDirection=i?this.getScrollOffset()<o?"forward":"backward":null,this.scrollOffset=o;let s=this.isScrolling;this.isScrolling=i,this.notify(s!==i,i)}))}},this.getSize=()=>this.options.enabled?(this.scrollRect=this.scrollRect??this.options.initialRect,this.scrollRect[this.options.horizontal?"width":"height"]):(this.scrollRect=null,0),this.getScrollOffset=()=>this.options.enabled?(this.scrollOffset=this.scrollOffset??(typeof this.options.initialOffset=="function"?this.options.initialOffset():this.options.initialOffset),this.scrollOffset):(this.scrollOffset=null,0),this.getFurthestMeasurement=(t,r)=>{let o=new Map,i=new Map;for(let s=r-1;s>=0;s--){let a=t[s];if(o.has(a.lane))continue;let l=i.get(a.lane);if(l==null||a.end>l.end?i.set(a.lane,a):a.end<l.end&&o.set(a.lane,!0),o.size===this.options.lanes)break}return i.size===this.options.lanes?Array.from(i.values()).sort((s,a)=>s.end===a.end?s.index-a.index:s.end-a.end)[0]:void 0},this.getMeasurementOptions=ze(()=>[this.options.count,this.options.paddingStart,this.options.scrollMargin,this.options.getItemKey,this.options.enabled],(t,r,o,i,s)=>(this.pendingMeasuredCacheIndexes=[],{count:t,paddingStart:r,scrollMargin:o,getItemKey:i,enabled:s}),{key:!1}),this.getMeasurements=ze(()=>[this.getMeasurementOptions(),this.itemSizeCache],({count:t,paddingStart:r,scrollMargin:o,getItemKey:i,enabled:s},a)=>{var l;if(!s)return this.measurementsCache=[],this.itemSizeCache.clear(),[];this.measurementsCache.length===0&&(this.measurementsCache=this.options.initialMeasurementsCache,this.measurementsCache.forEach(c=>{this.itemSizeCache.set(c.key,c.size)}));let u=this.pendingMeasuredCacheIndexes.length>0?Math.min(...this.pendingMeasuredCacheIndexes):0;this.pendingMeasuredCacheIndexes=[];let f=this.measurementsCache.slice(0,u);for(let c=u;c<t;c++){let g=(l=this.measurementsCache[c])==null?void 0:l.measureElement;g||(g=P=>{let I=i(c),D=this.elementsCache.get(I);if(!P){D&&(this.observer.unobserve(D),this.elementsCache.delete(I));return}D!==P&&(D&&this.observer.unobserve(D),this.observer.observe(P),this.elementsCache.set(I,P)),P.isConnected&&this.resizeItem(c,this.options.measureElement(P,void 0,this))});let d=i(c),h=this.options.lanes===1?f[c-1]:this.getFurthestMeasurement(f,c),p=h?h.end+this.options.gap:r+o,_=a.get(d),m=typeof _=="number"?_:this.options.estimateSize(c),y=p+m,R=h?h.lane:c%this.options.lanes;f[c]={index:c,start:p,size:m,end:y,key:d,lane:R,measureElement:g}}return this.measurementsCache=f,f},{key:!1,debug:()=>this.options.debug}),this.calculateRange=ze(()=>[this.getMeasurements(),this.getSize(),this.getScrollOffset()],(t,r,o)=>this.range=t.length>0&&r>0?Ms({measurements:t,outerSize:r,scrollOffset:o}):null,{key:!1,debug:()=>this.options.debug}),this.getIndexes=ze(()=>[this.options.rangeExtractor,this.calculateRange(),this.options.overscan,this.options.count],(t,r,o,i)=>r===null?[]:t({startIndex:r.startIndex,endIndex:r.endIndex,overscan:o,count:i}),{key:!1,debug:()=>this.options.debug}),this.indexFromElement=t=>{let r=this.options.indexAttribute,o=t.getAttribute(r);return o?parseInt(o,10):(console.warn(`Missing attribute name '${r}={index}' on measured element.`),-1)},this._measureElement=(t,r)=>{let o=this.indexFromElement(t),i=this.getMeasurements()[o];if(!i||!t.isConnected){this.elementsCache.forEach((a,l)=>{a===t&&(this.observer.unobserve(t),this.elementsCache.delete(l))});return}let s=this.elementsCache.get(i.key);s!==t&&(s&&this.observer.unobserve(s),this.observer.observe(t),this.elementsCache.set(i.key,t)),this.resizeItem(o,this.options.measureElement(t,r,this))},this.resizeItem=(t,r)=>{let o=this.getMeasurements()[t];if(!o)return;let i=this.itemSizeCache.get(o.key)??o.size,s=r-i;s!==0&&((this.shouldAdjustScrollPositionOnItemSizeChange!==void 0?this.shouldAdjustScrollPositionOnItemSizeChange(o,s,this):o.start<this.getScrollOffset()+this.scrollAdjustments)&&this._scrollToOffset(this.getScrollOffset(),{adjustments:this.scrollAdjustments+=s,behavior:void 0}),this.pendingMeasuredCacheIndexes.push(o.index),this.itemSizeCache=new Map(this.itemSizeCache.set(o.key,r)),this.notify(!0,!1))},this.measureElement=t=>{t&&this._measureElement(t,void 0)},this.getVirtualItems=ze(()=>[this.getIndexes(),this.getMeasurements()],(t,r)=>{let o=[];for(let i=0,s=t.length;i<s;i++){let a=t[i],l=r[a];o.push(l)}return o},{key:!1,debug:()=>this.options.debug}),this.getVirtualItemForOffset=t=>{let r=this.getMeasurements();if(r.length!==0)return yt(r[ro(0,r.length-1,o=>yt(r[o]).start,t)])},this.getOffsetForAlignment=(t,r)=>{let o=this.getSize(),i=this.getScrollOffset();r==="auto"&&(t<=i?r="start":t>=i+o?r="end":r="start"),r==="start"?t=t:r==="end"?t=t-o:r==="center"&&(t=t-o/2);let s=this.options.horizontal?"scrollWidth":"scrollHeight",l=(this.scrollElement?"document"in this.scrollElement?this.scrollElement.document.documentElement[s]:this.scrollElement[s]:0)-o;return Math.max(Math.min(l,t),0)},this.getOffsetForIndex=(t,r="auto")=>{t=Math.max(0,Math.min(t,this.options.count-1));let o=this.getMeasurements()[t];if(!o)return;let i=this.getSize(),s=this.getScrollOffset();if(r==="auto")if(o.end>=s+i-this.options.scrollPaddingEnd)r="end";else if(o.start<=s+this.options.scrollPaddingStart)r="start";else return[s,r];let a=r==="end"?o.end+this.options.scrollPaddingEnd:o.start-this.options.scrollPaddingStart;return[this.getOffsetForAlignment(a,r),r]},this.isDynamicMode=()=>this.elementsCache.size>0,this.cancelScrollToIndex=()=>{this.scrollToIndexTimeoutId!==null&&this.targetWindow&&(this.targetWindow.clearTimeout(this.scrollToIndexTimeoutId),this.scrollToIndexTimeoutId=null)},this.scrollToOffset=(t,{align:r="start",behavior:o}={})=>{this.cancelScrollToIndex(),o==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getOffsetForAlignment(t,r),{adjustments:void 0,behavior:o})},this.scrollToIndex=(t,{align:r="auto",behavior:o}={})=>{t=Math.max(0,Math.min(t,this.options.count-1)),this.cancelScrollToIndex(),o==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size.");let i=this.getOffsetForIndex(t,r);if(!i)return;let[s,a]=i;this._scrollToOffset(s,{adjustments:void 0,behavior:o}),o!=="smooth"&&this.isDynamicMode()&&this.targetWindow&&(this.scrollToIndexTimeoutId=this.targetWindow.setTimeout(()=>{if(this.scrollToIndexTimeoutId=null,this.elementsCache.has(this.options.getItemKey(t))){let[u]=yt(this.getOffsetForIndex(t,a));Jr(u,this.getScrollOffset())||this.scrollToIndex(t,{align:a,behavior:o})}else this.scrollToIndex(t,{align:a,behavior:o})}))},this.scrollBy=(t,{behavior:r}={})=>{this.cancelScrollToIndex(),r==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getScrollOffset()+t,{adjustments:void 0,behavior:r})},this.getTotalSize=()=>{var t;let r=this.getMeasurements(),o;return r.length===0?o=this.options.paddingStart:o=this.options.lanes===1?((t=r[r.length-1])==null?void 0:t.end)??0:Math.max(...r.slice(-this.options.lanes).map(i=>i.end)),o-this.options.scrollMargin+this.options.paddingEnd},this._scrollToOffset=(t,{adjustments:r,behavior:o})=>{this.options.scrollToFn(t,{behavior:o,adjustments:r},this)},this.measure=()=>{var t,r;this.itemSizeCache=new Map,(r=(t=this.options).onChange)==null||r.call(t,this,!1)},this.setOptions(n)}},ro=(e,n,t,r)=>{for(;e<=n;){let o=(e+n)/2|0,i=t(o);if(i<r)e=o+1;else if(i>r)n=o-1;else return o}return e>0?e-1:0};function Ms({measurements:e,outerSize:n,scrollOffset:t}){let r=e.length-1,i=ro(0,r,a=>e[a].start,t),s=i;for(;s<r&&e[s].end<t+n;)s++;return{startIndex:i,endIndex:s}}var Fs=typeof document<"u"?ie:V;function Is(e){let n=Pe(()=>({}),{})[1],t={...e,onChange:(o,i)=>{var s;i?tn(n):n(),(s=e.onChange)==null||s.call(e,o,i)}},[r]=H(()=>new vt(t));return r.setOptions(t),V(()=>r._didMount(),[]),Fs(()=>r._willUpdate()),r}function oo(e){return Is({observeElementRect:eo,observeElementOffset:to,scrollToFn:no,...e})}function io(e){return{render:function(n){Qt(n,e)},unmount:function(){en(e)}}}var fo=Symbol.for("immer-nothing"),so=Symbol.for("immer-draftable"),T=Symbol.for("immer-state");function le(e,...n){throw new Error(`[Immer] minified error nr: ${e}. Full error at: https://bit.ly/3cXEKWf`)}var Ge=Object.getPrototypeOf;function Be(e){return!!e&&!!e[T]}function ve(e){return e?go(e)||Array.isArray(e)||!!e[so]||!!e.constructor?.[so]||Rt(e)||bt(e):!1}var Ts=Object.prototype.constructor.toString();function go(e){if(!e||typeof e!="object")return!1;let n=Ge(e);if(n===null)return!0;let t=Object.hasOwnProperty.call(n,"constructor")&&n.constructor;return t===Object?!0:typeof t=="function"&&Function.toString.call(t)===Ts}function Ue(e,n){Et(e)===0?Object.entries(e).forEach(([t,r])=>{n(t,r,e)}):e.forEach((t,r)=>n(r,t,e))}function Et(e){let n=e[T];return n?n.type_:Array.isArray(e)?1:Rt(e)?2:bt(e)?3:0}function Cn(e,n){return Et(e)===2?e.has(n):Object.prototype.hasOwnProperty.call(e,n)}function po(e,n,t){let r=Et(e);r===2?e.set(n,t):r===3?e.add(t):e[n]=t}function Ps(e,n){return e===n?e!==0||1/e===1/n:e!==e&&n!==n}function Rt(e){return e instanceof Map}function bt(e){return e instanceof Set}function B(e){return e.copy_||e.base_}function En(e,n){if(Rt(e))return new Map(e);if(bt(e))return new Set(e);if(Array.isArray(e))return Array.prototype.slice.call(e);if(!n&&go(e))return Ge(e)?{...e}:Object.assign(Object.create(null),e);let t=Object.getOwnPropertyDescriptors(e);delete t[T];let r=Reflect.ownKeys(t);for(let o=0;o<r.length;o++){let i=r[o],s=t[i];s.writable===!1&&(s.writable=!0,s.configurable=!0),(s.get||s.set)&&(t[i]={configurable:!0,writable:!0,enumerable:s.enumerable,value:e[i]})}return Object.create(Ge(e),t)}function Ke(e,n=!1){return xt(e)||Be(e)||!ve(e)||(Et(e)>1&&(e.set=e.add=e.clear=e.delete=Ds),Object.freeze(e),n&&Ue(e,(t,r)=>Ke(r,!0),!0)),e}function Ds(){le(2)}function xt(e){return Object.isFrozen(e)}var Rn={};function De(e){let n=Rn[e];return n||le(0,e),n}function Vs(e,n){Rn[e]||(Rn[e]=n)}var nt;function St(){return nt}function $s(e,n){return{drafts_:[],parent_:e,immer_:n,canAutoFreeze_:!0,unfinalizedDrafts_:0}}function lo(e,n){n&&(De("Patches"),e.patches_=[],e.inversePatches_=[],e.patchListener_=n)}function bn(e){xn(e),e.drafts_.forEach(Ls),e.drafts_=null}function xn(e){e===nt&&(nt=e.parent_)}function ao(e){return nt=$s(nt,e)}function Ls(e){let n=e[T];n.type_===0||n.type_===1?n.revoke_():n.revoked_=!0}function uo(e,n){n.unfinalizedDrafts_=n.drafts_.length;let t=n.drafts_[0];return e!==void 0&&e!==t?(t[T].modified_&&(bn(n),le(4)),ve(e)&&(e=wt(n,e),n.parent_||Ct(n,e)),n.patches_&&De("Patches").generateReplacementPatches_(t[T].base_,e,n.patches_,n.inversePatches_)):e=wt(n,t,[]),bn(n),n.patches_&&n.patchListener_(n.patches_,n.inversePatches_),e!==fo?e:void 0}function wt(e,n,t){if(xt(n))return n;let r=n[T];if(!r)return Ue(n,(o,i)=>co(e,r,n,o,i,t),!0),n;if(r.scope_!==e)return n;if(!r.modified_)return Ct(e,r.base_,!0),r.base_;if(!r.finalized_){r.finalized_=!0,r.scope_.unfinalizedDrafts_--;let o=r.copy_,i=o,s=!1;r.type_===3&&(i=new Set(o),o.clear(),s=!0),Ue(i,(a,l)=>co(e,r,o,a,l,t,s)),Ct(e,o,!1),t&&e.patches_&&De("Patches").generatePatches_(r,t,e.patches_,e.inversePatches_)}return r.copy_}function co(e,n,t,r,o,i,s){if(Be(o)){let a=i&&n&&n.type_!==3&&!Cn(n.assigned_,r)?i.concat(r):void 0,l=wt(e,o,a);if(po(t,r,l),Be(l))e.canAutoFreeze_=!1;else return}else s&&t.add(o);if(ve(o)&&!xt(o)){if(!e.immer_.autoFreeze_&&e.unfinalizedDrafts_<1)return;wt(e,o),(!n||!n.scope_.parent_)&&Ct(e,o)}}function Ct(e,n,t=!1){!e.parent_&&e.immer_.autoFreeze_&&e.canAutoFreeze_&&Ke(n,t)}function Os(e,n){let t=Array.isArray(e),r={type_:t?1:0,scope_:n?n.scope_:St(),modified_:!1,finalized_:!1,assigned_:{},parent_:n,base_:e,draft_:null,copy_:null,revoke_:null,isManual_:!1},o=r,i=Mn;t&&(o=[r],i=rt);let{revoke:s,proxy:a}=Proxy.revocable(o,i);return r.draft_=a,r.revoke_=s,a}var Mn={get(e,n){if(n===T)return e;let t=B(e);if(!Cn(t,n))return ks(e,t,n);let r=t[n];return e.finalized_||!ve(r)?r:r===Sn(e.base_,n)?(wn(e),e.copy_[n]=ot(r,e)):r},has(e,n){return n in B(e)},ownKeys(e){return Reflect.ownKeys(B(e))},set(e,n,t){let r=ho(B(e),n);if(r?.set)return r.set.call(e.draft_,t),!0;if(!e.modified_){let o=Sn(B(e),n),i=o?.[T];if(i&&i.base_===t)return e.copy_[n]=t,e.assigned_[n]=!1,!0;if(Ps(t,o)&&(t!==void 0||Cn(e.base_,n)))return!0;wn(e),ye(e)}return e.copy_[n]===t&&(t!==void 0||n in e.copy_)||Number.isNaN(t)&&Number.isNaN(e.copy_[n])||(e.copy_[n]=t,e.assigned_[n]=!0),!0},deleteProperty(e,n){return Sn(e.base_,n)!==void 0||n in e.base_?(e.assigned_[n]=!1,wn(e),ye(e)):delete e.assigned_[n],e.copy_&&delete e.copy_[n],!0},getOwnPropertyDescriptor(e,n){let t=B(e),r=Reflect.getOwnPropertyDescriptor(t,n);return r&&{writable:!0,configurable:e.type_!==1||n!=="length",enumerable:r.enumerable,value:t[n]}},defineProperty(){le(11)},getPrototypeOf(e){return Ge(e.base_)},setPrototypeOf(){le(12)}},rt={};Ue(Mn,(e,n)=>{rt[e]=function(){return arguments[0]=arguments[0][0],n.apply(this,arguments)}});rt.deleteProperty=function(e,n){return rt.set.call(this,e,n,void 0)};rt.set=function(e,n,t){return Mn.set.call(this,e[0],n,t,e[0])};function Sn(e,n){let t=e[T];return(t?B(t):e)[n]}function ks(e,n,t){let r=ho(n,t);return r?"value"in r?r.value:r.get?.call(e.draft_):void 0}function ho(e,n){if(!(n in e))return;let t=Ge(e);for(;t;){let r=Object.getOwnPropertyDescriptor(t,n);if(r)return r;t=Ge(t)}}function ye(e){e.modified_||(e.modified_=!0,e.parent_&&ye(e.parent_))}function wn(e){e.copy_||(e.copy_=En(e.base_,e.scope_.immer_.useStrictShallowCopy_))}var Hs=class{constructor(e){this.autoFreeze_=!0,this.useStrictShallowCopy_=!1,this.produce=(n,t,r)=>{if(typeof n=="function"&&typeof t!="function"){let i=t;t=n;let s=this;return function(l=i,...u){return s.produce(l,f=>t.call(this,f,...u))}}typeof t!="function"&&le(6),r!==void 0&&typeof r!="function"&&le(7);let o;if(ve(n)){let i=ao(this),s=ot(n,void 0),a=!0;try{o=t(s),a=!1}finally{a?bn(i):xn(i)}return lo(i,r),uo(o,i)}else if(!n||typeof n!="object"){if(o=t(n),o===void 0&&(o=n),o===fo&&(o=void 0),this.autoFreeze_&&Ke(o,!0),r){let i=[],s=[];De("Patches").generateReplacementPatches_(n,o,i,s),r(i,s)}return o}else le(1,n)},this.produceWithPatches=(n,t)=>{if(typeof n=="function")return(s,...a)=>this.produceWithPatches(s,l=>n(l,...a));let r,o;return[this.produce(n,t,(s,a)=>{r=s,o=a}),r,o]},typeof e?.autoFreeze=="boolean"&&this.setAutoFreeze(e.autoFreeze),typeof e?.useStrictShallowCopy=="boolean"&&this.setUseStrictShallowCopy(e.useStrictShallowCopy)}createDraft(e){ve(e)||le(8),Be(e)&&(e=As(e));let n=ao(this),t=ot(e,void 0);return t[T].isManual_=!0,xn(n),t}finishDraft(e,n){let t=e&&e[T];(!t||!t.isManual_)&&le(9);let{scope_:r}=t;return lo(r,n),uo(void 0,r)}setAutoFreeze(e){this.autoFreeze_=e}setUseStrictShallowCopy(e){this.useStrictShallowCopy_=e}applyPatches(e,n){let t;for(t=n.length-1;t>=0;t--){let o=n[t];if(o.path.length===0&&o.op==="replace"){e=o.value;break}}t>-1&&(n=n.slice(t+1));let r=De("Patches").applyPatches_;return Be(e)?r(e,n):this.produce(e,o=>r(o,n))}};function ot(e,n){let t=Rt(e)?De("MapSet").proxyMap_(e,n):bt(e)?De("MapSet").proxySet_(e,n):Os(e,n);return(n?n.scope_:St()).drafts_.push(t),t}function As(e){return Be(e)||le(10,e),mo(e)}function mo(e){if(!ve(e)||xt(e))return e;let n=e[T],t;if(n){if(!n.modified_)return n.base_;n.finalized_=!0,t=En(e,n.scope_.immer_.useStrictShallowCopy_)}else t=En(e,!0);return Ue(t,(r,o)=>{po(t,r,mo(o))}),n&&(n.finalized_=!1),t}function Mt(){class e extends Map{constructor(l,u){super(),this[T]={type_:2,parent_:u,scope_:u?u.scope_:St(),modified_:!1,finalized_:!1,copy_:void 0,assigned_:void 0,base_:l,draft_:this,isManual_:!1,revoked_:!1}}get size(){return B(this[T]).size}has(l){return B(this[T]).has(l)}set(l,u){let f=this[T];return s(f),(!B(f).has(l)||B(f).get(l)!==u)&&(t(f),ye(f),f.assigned_.set(l,!0),f.copy_.set(l,u),f.assigned_.set(l,!0)),this}delete(l){if(!this.has(l))return!1;let u=this[T];return s(u),t(u),ye(u),u.base_.has(l)?u.assigned_.set(l,!1):u.assigned_.delete(l),u.copy_.delete(l),!0}clear(){let l=this[T];s(l),B(l).size&&(t(l),ye(l),l.assigned_=new Map,Ue(l.base_,u=>{l.assigned_.set(u,!1)}),l.copy_.clear())}forEach(l,u){let f=this[T];B(f).forEach((c,g,d)=>{l.call(u,this.get(g),g,this)})}get(l){let u=this[T];s(u);let f=B(u).get(l);if(u.finalized_||!ve(f)||f!==u.base_.get(l))return f;let c=ot(f,u);return t(u),u.copy_.set(l,c),c}keys(){return B(this[T]).keys()}values(){let l=this.keys();return{[Symbol.iterator]:()=>this.values(),next:()=>{let u=l.next();return u.done?u:{done:!1,value:this.get(u.value)}}}}entries(){let l=this.keys();return{[Symbol.iterator]:()=>this.entries(),next:()=>{let u=l.next();if(u.done)return u;let f=this.get(u.value);return{done:!1,value:[u.value,f]}}}}[Symbol.iterator](){return this.entries()}}function n(a,l){return new e(a,l)}function t(a){a.copy_||(a.assigned_=new Map,a.copy_=new Map(a.base_))}class r extends Set{constructor(l,u){super(),this[T]={type_:3,parent_:u,scope_:u?u.scope_:St(),modified_:!1,finalized_:!1,copy_:void 0,base_:l,draft_:this,drafts_:new Map,revoked_:!1,isManual_:!1}}get size(){return B(this[T]).size}has(l){let u=this[T];return s(u),u.copy_?!!(u.copy_.has(l)||u.drafts_.has(l)&&u.copy_.has(u.drafts_.get(l))):u.base_.has(l)}add(l){let u=this[T];return s(u),this.has(l)||(i(u),ye(u),u.copy_.add(l)),this}delete(l){if(!this.has(l))return!1;let u=this[T];return s(u),i(u),ye(u),u.copy_.delete(l)||(u.drafts_.has(l)?u.copy_.delete(u.drafts_.get(l)):!1)}clear(){let l=this[T];s(l),B(l).size&&(i(l),ye(l),l.copy_.clear())}values(){let l=this[T];return s(l),i(l),l.copy_.values()}entries(){let l=this[T];return s(l),i(l),l.copy_.entries()}keys(){return this.values()}[Symbol.iterator](){return this.values()}forEach(l,u){let f=this.values(),c=f.next();for(;!c.done;)l.call(u,c.value,c.value,this),c=f.next()}}function o(a,l){return new r(a,l)}function i(a){a.copy_||(a.copy_=new Set,a.base_.forEach(l=>{if(ve(l)){let u=ot(l,a);a.drafts_.set(l,u),a.copy_.add(u)}else a.copy_.add(l)}))}function s(a){a.revoked_&&le(3,JSON.stringify(B(a)))}Vs("MapSet",{proxyMap_:n,proxySet_:o})}var ne=new Hs,_o=ne.produce,Pl=ne.produceWithPatches.bind(ne),Dl=ne.setAutoFreeze.bind(ne),Vl=ne.setUseStrictShallowCopy.bind(ne),$l=ne.applyPatches.bind(ne),Ll=ne.createDraft.bind(ne),Ol=ne.finishDraft.bind(ne);function xe(e){var n=H(function(){return Ke(typeof e=="function"?e():e,!0)}),t=n[1];return[n[0],J(function(r){t(typeof r=="function"?_o(r):Ke(r))},[])]}function Ns(e,n,t,r,o){window.Shiny.shinyapp.makeRequest(e,n,t,r,o)}function yo({method:e,args:n,blobs:t}){return new Promise((r,o)=>{Ns(e,n,i=>{r(i)},i=>{o(i)},t)})}function Fn({setData:e,newPatches:n,setCellEditMapAtLoc:t}){e(r=>{n.forEach(({rowIndex:o,columnIndex:i,value:s})=>{r[o][i]=s})}),n.forEach(({rowIndex:r,columnIndex:o,value:i})=>{t(r,o,s=>{s.value=i,s.state=fe.EditSuccess,s.errorTitle=void 0})})}function In(e){return e.map(t=>({rowIndex:t.row_index,columnIndex:t.column_index,value:t.value}))}function zs(e){return e.map(t=>({row_index:t.rowIndex,column_index:t.columnIndex,value:t.value}))}function vo({patchInfo:e,patches:n,onSuccess:t,onError:r,columns:o,setData:i,setCellEditMapAtLoc:s}){let a=zs(n);yo({method:e.key,args:[a]}).then(l=>{if(!Array.isArray(l))throw new Error("Expected a response of a list of patches");for(let f of l)if(!("row_index"in f&&"column_index"in f&&"value"in f))throw new Error("Expected list of patches containing `row_index`, `column_index`, and `value`");l=l;let u=In(l);n.forEach(({rowIndex:f,columnIndex:c,value:g})=>{s(f,c,d=>{d.state===fe.EditSaving&&(d.state=fe.Ready,d.value=g,d.errorTitle=void 0)})}),Fn({setData:i,newPatches:u,setCellEditMapAtLoc:s}),t(u)}).catch(l=>{n.forEach(({rowIndex:u,columnIndex:f,value:c})=>{s(u,f,g=>{g.value=String(c),g.state=fe.EditFailure,g.errorTitle=String(l)})}),r(l)})}var fe={EditSaving:"EditSaving",EditSuccess:"EditSuccess",EditFailure:"EditFailure",Editing:"Editing",Ready:"Ready"},Dn={EditSaving:"cell-edit-saving",EditSuccess:"cell-edit-success",EditFailure:"cell-edit-failure",Editing:"cell-edit-editing",Ready:void 0},Pn=e=>e!==null&&typeof e=="object"&&Object.prototype.hasOwnProperty.call(e,"isShinyHtml")&&e.isShinyHtml===!0,Tn=e=>e===null?"":Pn(e)?e.obj.html:e,So=({containerRef:e,rowId:n,cell:t,patchInfo:r,columns:o,coldefs:i,rowIndex:s,columnIndex:a,editCellsIsAllowed:l,getSortedRowModel:u,cellEditInfo:f,cellStyle:c,cellClassName:g,setData:d,setCellEditMapAtLoc:h,selection:p})=>{let _=t.getValue(),m=t.column.columnDef.meta.isHtmlColumn,y=f?.value??_,R=f?.state??fe.Ready,P=f?.errorTitle,I=f?.isEditing??!1,D=f?.editValue??Tn(y),q=Q(null),U=Q(null),K=J(({resetIsEditing:M=!1,resetEditValue:O=!1}={resetIsEditing:!0,resetEditValue:!0})=>{h(s,a,z=>{M&&(z.isEditing=!1),O&&(z.editValue=void 0)})},[s,a,h]),G=M=>{M.key==="Escape"&&(M.preventDefault(),M.stopPropagation(),K(),p.focusOffset(n,0))},Z=M=>{if(M.key!=="Tab")return;M.preventDefault(),M.stopPropagation();let O=M.shiftKey,z=a;for(;;){let W=z+(O?-1:1);if(W<0||W>=i.length)return;if(z=W,i[W].meta.isHtmlColumn!==!0)break}Ve(),h(s,z,W=>{W.isEditing=!0})},je=M=>{if(M.key!=="Enter")return;M.preventDefault(),M.stopPropagation();let O=M.shiftKey,z=u(),W=z.rows.findIndex(Oe=>Oe.id===n);if(W<0)return;let Xe=W+(O?-1:1);if(Xe<0||Xe>=z.rows.length)return;Ve();let Le=z.rows[Xe].index;h(Le,a,Oe=>{Oe.isEditing=!0})},it=M=>{[G,je,Z].forEach(O=>O(M))},Ve=J(()=>{if(h(s,a,M=>{M.errorTitle=void 0}),`${Tn(y)}`==`${D}`){K(),h(s,a,M=>{M.state=R});return}K({resetIsEditing:!0}),h(s,a,M=>{M.state=fe.EditSaving}),vo({patchInfo:r,patches:[{rowIndex:s,columnIndex:a,value:D}],onSuccess:M=>{K({resetEditValue:!0})},onError:M=>{},columns:o,setData:d,setCellEditMapAtLoc:h})},[h,s,a,y,D,K,r,o,d,R]);V(()=>{I&&U.current&&(U.current.focus(),U.current.select())},[I]),V(()=>{if(!I||!q.current||!U.current)return;let M=W=>{q.current?.contains(W.target)&&W.stopPropagation()},O=q.current;O.addEventListener("mousedown",M);let z=W=>{W.target!==U.current&&(Ve(),K())};return document.body.addEventListener("mousedown",z),()=>{O.removeEventListener("mousedown",M),document.body.removeEventListener("mousedown",z)}},[R,Ve,s,a,I,K]);function qe(M){I&&M.target.select()}function On(M){h(s,a,O=>{O.editValue=M.target.value})}let We,Se,we=P,$e=g,Ce=M=>{M&&($e?($e+=" ",$e+=M):$e=M)};Ce(Dn[I?fe.Editing:R]);let pe=!1,st=null;return R===fe.EditSaving?Se=D:(I?st=x.createElement("textarea",{value:String(D),onChange:On,onFocus:qe,onKeyDown:it,ref:U}):m?Ce("cell-html"):l&&(Ce("cell-editable"),We=M=>{h(s,a,O=>{O.isEditing=!0,O.editValue=Tn(y)})}),Pn(y)?pe=!0:Se=_t(t.column.columnDef.cell,t.getContext())),V(()=>{if(!q.current||!pe||!Pn(y))return;let M=JSON.parse(JSON.stringify(y.obj));window.Shiny.renderContentAsync(q.current,M);let O=q.current;return()=>{window.Shiny.unbindAll(O),O.replaceChildren("")}},[q,y,s,a,pe]),x.createElement("td",{ref:q,onDoubleClick:We,title:we,className:$e,style:{...c}},st,Se)};var wo=()=>{let[e,n]=xe(new Map);return Mt(),{cellEditMap:e,setCellEditMapAtLoc:(r,o,i)=>{n(s=>{let a=Co(r,o),l=s.get(a)??{};i(l),s.set(a,l)})},resetCellEditMap:()=>{n(new Map)}}},Co=(e,n)=>`[${e}, ${n}]`;var Eo=(e,n,t)=>{let r=Co(n,t);return[e.get(r)??{},r]};function Ft(e,n,t){let r=Object.assign({top:0,right:0,bottom:0,left:0},t),o=e,i=o.scrollTop+r.top,s=o.scrollLeft+r.left,a=i+o.clientHeight-r.top-r.bottom,l=s+o.clientWidth-r.left-r.right;for(let u=0;u<n.length;u++){let f=n[u],c=f.offsetTop,g=f.offsetLeft;if(c>=i&&c<=a&&g>=s&&g<=l)return f}return null}function Vn(e,n){return document?.defaultView?.getComputedStyle(e,null)?.getPropertyValue(n)}function Bm(e){let n=[],t=0;for(;t<e.length;){if(n.length+2>=e.length)return e;let r=t+1,o=r<e.length?e[r]-e[t]:0;if(o===1||o===-1)for(;r<e.length&&e[r]-e[r-1]===o;)r++;n.push(e[t],o===-1?t-r:r-t),t=r}return n.length<e.length?{runs:n}:e}function Bp({runs:e}){let n=[];for(let t=0;t<e.length;t+=2){let r=e[t],o=e[t+1],i=o<0?-1:1;for(let s=0;s<Math.abs(o);s++)n.push(r+s*i)}return n}var xo=e=>{let[n,t]=H(!1),{range:r,from:o,to:i,onRangeChange:s}=e;return x.createElement(Gs,{range:r,value:[o,i],editing:n,onValueChange:a=>s(...a),onFocus:()=>t(!0),onBlur:()=>t(!1)})};var Gs=e=>{let[n,t]=e.value,{editing:r,onFocus:o}=e,[i,s]=e.range(),a=Q(null),l=Q(null);return x.createElement("div",{onBlur:u=>{if(!u.currentTarget.contains(u.relatedTarget))return e.onBlur()},onFocus:()=>o(),style:{display:"flex",gap:"0.5rem"}},x.createElement("input",{ref:a,className:`form-control form-control-sm ${a.current?.checkValidity()?"":"is-invalid"}`,style:{flex:"1 1 0",width:"0"},type:"number",placeholder:Ro(r,"Min",i),defaultValue:n,step:"any",onChange:u=>{let f=bo(u.target.value);a.current&&(a.current.classList.toggle("is-invalid",!u.target.checkValidity()),e.onValueChange([f,t]))}}),x.createElement("input",{ref:l,className:`form-control form-control-sm ${l.current?.checkValidity()?"":"is-invalid"}`,style:{flex:"1 1 0",width:"0"},type:"number",placeholder:Ro(r,"Max",s),defaultValue:t,step:"any",onChange:u=>{let f=bo(u.target.value);l.current&&(l.current.classList.toggle("is-invalid",!u.target.checkValidity()),e.onValueChange([n,f]))}}))};function Ro(e,n,t){if(e)return typeof t>"u"?n:`${n} (${t})`}function bo(e){if(e!=="")return+e}function Mo(e){let[n,t]=H([]),r=e?{getFilteredRowModel:Wr(),getFacetedRowModel:jr(),getFacetedUniqueValues:qr(),getFacetedMinMaxValues:Ur(),filterFns:{substring:(o,i,s,a)=>o.getValue(i)?.toString().includes(s)??!1},onColumnFiltersChange:t}:{};return{columnFilters:n,columnFiltersState:{columnFilters:n},filtersTableOptions:r,setColumnFilters:t}}var Fo=({header:e,className:n,...t})=>{let r=e.column.columnDef.meta?.typeHint;if(!r||r.type==="html")return null;if(r.type==="numeric"){let[o,i]=e.column.getFilterValue()??[void 0,void 0];return xo({from:o,to:i,range:()=>e.column.getFacetedMinMaxValues()??[void 0,void 0],onRangeChange:(a,l)=>e.column.setFilterValue([a,l])})}return x.createElement("input",{...t,value:e.column.getFilterValue()||"",className:`form-control form-control-sm ${n}`,type:"text",onChange:o=>e.column.setFilterValue(o.target.value)})};var re=class e{static{this._empty=new e(new Set)}constructor(n){this._set=n}static empty(){return this._empty}static just(...n){return this.empty().add(...n)}has(n){return this._set.has(n)}add(...n){let t=new Set(this._set.keys());for(let r of n)t.add(r);return new e(t)}toggle(n){return this.has(n)?this.delete(n):this.add(n)}delete(n){let t=new Set(this._set.keys());return t.delete(n),new e(t)}clear(){return e.empty()}[Symbol.iterator](){return this._set[Symbol.iterator]()}toList(){return[...this._set.keys()]}};var ae=class e{static{this._NONE="none"}static{this._ROW_SINGLE="single"}static{this._ROW_MULTIPLE="multiple"}static{this._COL_SINGLE="single"}static{this._col_multiple="multiple"}static{this._RECT_CELL="cell"}static{this._RECT_REGION="region"}static{this._rowEnum={NONE:e._NONE,SINGLE:e._ROW_SINGLE,MULTIPLE:e._ROW_MULTIPLE}}static{this._colEnum={NONE:e._NONE,SINGLE:e._COL_SINGLE,MULTIPLE:e._col_multiple}}static{this._rectEnum={NONE:e._NONE,REGION:e._RECT_REGION,CELL:e._RECT_CELL}}constructor({row:n,col:t,rect:r}){if(!Object.values(e._rowEnum).includes(n))throw new Error(`Invalid row selection mode: ${n}`);if(!Object.values(e._colEnum).includes(t))throw new Error(`Invalid col selection mode: ${t}`);if(!Object.values(e._rectEnum).includes(r))throw new Error(`Invalid rect selection mode: ${r}`);this.row=n,this.col=t,this.rect=r}isNone(){return this.row===e._rowEnum.NONE&&this.col===e._colEnum.NONE&&this.rect===e._rectEnum.NONE}};function To(e){return e||(e={row:"multiple",col:"none",rect:"none"}),new ae({row:e.row,col:e.col,rect:e.rect})}function Po({isEditingCell:e,editCellsIsAllowed:n,selectionModes:t,keyAccessor:r,focusOffset:o,focusEscape:i,onKeyDownEnter:s,between:a}){let[l,u]=H(re.empty()),[f,c]=H(null),g=p=>{if(t.isNone())return;let _=p.currentTarget,m=r(_);if(e&&_.classList.contains(Dn[fe.Editing]))return;let y=Bs(t,a,l,p,m,f);y&&(u(y.selection),y.anchor&&(c(m),_.focus()),p.preventDefault())},d=p=>{if(e||t.isNone())return;let _=p.currentTarget,m=r(_),y=l.has(m);if(p.key==="Escape"){i(_),p.preventDefault();return}if(t.row===ae._rowEnum.SINGLE){if(p.key===" "||p.key==="Enter")p.preventDefault(),n&&p.key==="Enter"?s(_):l.has(m)?u(re.empty()):u(re.just(m));else if(p.key==="ArrowUp"||p.key==="ArrowDown"){let R=o(m,p.key==="ArrowUp"?-1:1);R&&(p.preventDefault(),y&&u(re.just(R)))}}else t.row===ae._rowEnum.MULTIPLE&&(p.key===" "||p.key==="Enter"?(p.preventDefault(),n&&p.key==="Enter"?s(_):u(l.toggle(m))):(p.key==="ArrowUp"||p.key==="ArrowDown")&&o(m,p.key==="ArrowUp"?-1:1)&&p.preventDefault())};return{has(p){return l.has(p)},set(p,_){u(_?l.add(p):l.delete(p))},setMultiple(p){u(re.just(...p))},clear(){u(l.clear())},keys(){return l},itemHandlers(){return{onMouseDown:g,onKeyDown:d}},focusOffset:o}}var Io=/^mac/i.test(window.navigator.userAgentData?.platform??window.navigator.platform);function Bs(e,n,t,r,o,i){let{shiftKey:s,altKey:a}=r,l=Io?r.metaKey:r.ctrlKey;if((Io?r.ctrlKey:r.metaKey)||a||e.row===ae._rowEnum.NONE)return null;if(e.row===ae._rowEnum.SINGLE)return l&&!s?t.has(o)?{selection:re.empty(),anchor:!0}:{selection:re.just(o),anchor:!0}:{selection:re.just(o),anchor:!0};if(e.row===ae._rowEnum.MULTIPLE)if(s&&l){if(i!==null&&n){let f=n(i,o);return{selection:t.add(...f)}}}else{if(l)return{selection:t.toggle(o),anchor:!0};if(s){if(i!==null&&n){let f=n(i,o);return{selection:re.just(...f)}}}else return{selection:re.just(o),anchor:!0}}else throw new Error(`Unsupported row selection mode: ${e.row}`);return null}function Do({getColDefs:e}){let[n,t]=H([]);return{sorting:n,sortTableStateOptions:{sorting:n},sortTableOptions:{onSortingChange:r=>{let o=typeof r=="function"?r(n):r,i=e(),s=new Set(i.filter(l=>l.meta.isHtmlColumn).map(l=>l.header)),a=s.size==0?o:o.filter(l=>!s.has(l.id));t(a)},getSortedRowModel:Xr()},setSorting:t}}var Vo="sort-arrow",$o={viewBox:[-1,-1,2,2].map(e=>e*1.4).join(" "),width:"100%",height:"100%",style:{paddingLeft:"3px"}},Lo={stroke:"#333333",strokeWidth:"0.6",fill:"transparent"},Us=x.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",...$o,className:`${Vo} sort-arrow-up`},x.createElement("path",{d:"M -1 0.5 L 0 -0.5 L 1 0.5",...Lo,strokeLinecap:"round"})),Ks=x.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",...$o,className:`${Vo} sort-arrow-down`},x.createElement("path",{d:"M -1 -0.5 L 0 0.5 L 1 -0.5",...Lo,strokeLinecap:"round"})),Oo=({direction:e})=>{if(!e)return null;if(e==="asc")return Us;if(e==="desc")return Ks;throw new Error(`Unexpected sort direction: '${e}'`)};Mt();var ko=({location:e,rowIndex:n,columnIndex:t})=>`[${e}, ${n}, ${t}]`,Ho=({initStyleInfos:e,nrow:n,ncol:t})=>{let[r,o]=xe(new Map),i=J(l=>{let{location:u,rows:f,cols:c}=l;o(g=>{let d=f==null?Array.from({length:n},(p,_)=>_):Array.isArray(f)?f:Bp(f),h=c??Array.from({length:t},(p,_)=>_);for(let p of d)for(let _ of h){let m=ko({location:u,rowIndex:p,columnIndex:_}),y=g.get(m)??{style:{},class:void 0},R;y.class?l.class?R=`${y.class} ${l.class}`:R=y.class:l.class?R=l.class:R=void 0,g.set(m,{location:u,rowIndex:p,columnIndex:_,style:{...y.style,...l.style},class:R})}})},[t,n,o]),s=J(()=>{o(l=>{l.clear()})},[o]),a=J(l=>{s();for(let u of l)i(u)},[i,s]);return V(()=>{a(e)},[e,a]),{styleInfoMap:r,setStyleInfo:i,setStyleInfos:a,resetStyleInfos:s}};var Ao=(e,n,t,r)=>{let o=ko({location:n,rowIndex:t,columnIndex:r}),i=e.get(o);return{cellStyle:i?.style,cellClassName:i?.class}},Ba=document.createElement("cssStringToObj");var No=`
 /*
  *
  * # Variables
@@ -261,7 +261,7 @@ shiny-data-frame .shiny-data-grid > table > tbody > tr > td.cell-edit-saving {
 shiny-data-frame .shiny-data-grid > table > tbody > tr > td.cell-edit-failure {
   outline: 2px var(--shiny-datagrid-table-cell-edit-failure-border-style) var(--shiny-datagrid-table-cell-edit-failure-border-color);
   background-color: var(--shiny-datagrid-table-cell-edit-failure-bgcolor);
-}`;function zo(e,n,t){let[r,o]=H(0),i=x.useCallback(a=>{o(-1),a.target===a.currentTarget&&Ft(e,n(),t)?.focus()},[e,n,t]),s=x.useCallback(a=>{o(0)},[]);return{containerTabIndex:r,containerHandlers:{onFocus:i,onBlur:s}}}function Go(e,n,t,r,o){return se(()=>{let i=e??!0;if(!i)return null;let s=typeof i=="string"?i:"Viewing rows {start} through {end} of {total}";if(!n||t.length===0||!r)return null;let a=n.scrollTop+r.clientHeight,l=n.scrollTop+n.clientHeight,[u,f]=js(a,l,t,(h,p)=>h.start+h.size/2);if(u===null||f===null)return null;let c=t[u],g=t[f];if(c===void 0||g===void 0||c.index===0&&g.index===o-1)return null;let d=qs(s,c.index+1,g.index+1,o);return x.createElement("div",{className:"shiny-data-grid-summary"},d)},[e,n,t,r,o])}function js(e,n,t,r){let o=null,i=null;for(let s=0;s<t.length;s++){let a=t[s];if(o===null)r(a,!0)>=e&&(o=s,i=s);else if(r(a,!1)<=n)i=s;else break}return[o,i]}function qs(e,n,t,r){return e.replace(/\{(start|end|total)\}/g,(o,i)=>i==="start"?n+"":i==="end"?t+"":i==="total"?r+"":o)}var Ws=({id:e,gridInfo:{payload:n,patchInfo:t,selectionModes:r},bgcolor:o})=>{let{columns:i,typeHints:s,data:a,options:l={width:void 0,height:void 0,fill:!1,styles:[]},htmlDeps:u}=n,{width:f,height:c,fill:g,filters:d,styles:h}=l,p=Q(null),_=Q(null),m=Q(null),[y,R]=xe(i),[P,I]=xe(s),D=Ho({initStyleInfos:h??[],nrow:a.length,ncol:y.length}),q=D.styleInfoMap,{setStyleInfos:U}=D,K=wo(),G=K.cellEditMap,Z=K.setCellEditMapAtLoc,je=K.resetCellEditMap,it=l.editable===!0,Ve=se(()=>{for(let v of G.values())if(v.isEditing)return!0;return!1},[G]),qe=se(()=>y.map((v,S)=>{let w=P?.[S],b=w?.type==="html",A=b?!1:void 0;return{accessorFn:(X,N)=>X[S],filterFn:w?.type==="numeric"?"inNumberRange":"includesString",header:v,meta:{colIndex:S,isHtmlColumn:b,typeHint:w},cell:({getValue:X})=>{let N=X();if(N==null)return"";switch(w?.type){case"numeric":case"date":case"datetime":case"duration":case"categorical":case"html":return N;case"string":case"boolean":return String(N);case"unknown":case"object":return typeof N=="string"?N:JSON.stringify(N);default:return N}},enableSorting:A}}),[y,P]),On=se(()=>a,[a]),We=xe(a),Se=We[0],we=We[1],Ce=Do({getColDefs:()=>qe}),pe=Ce.sorting,st=Ce.sortTableStateOptions,M=Ce.sortTableOptions,O=Ce.setSorting,{columnFilters:z,columnFiltersState:W,filtersTableOptions:Xe,setColumnFilters:Le}=Mo(d),Oe=J(({data:v,columns:S,typeHints:w})=>{R(S),we(v),I(w),je();let b=new Map;w?.forEach((N,ke)=>{b.set(S[ke],N)});let A=pe.filter(N=>b.has(N.id)),X=z.filter(N=>{let ke=b.get(N.id);return ke?ke.type==="numeric"?N.value===null||Array.isArray(N.value)&&N.value.every(Tt=>Tt!==null):typeof N.value=="string":!1});Le(X),O(A)},[z,je,Le,R,O,we,I,pe]),Ko={data:Se,columns:qe,state:{...st,...W},getCoreRowModel:Br(),...M,...Xe},j=Yr(Ko),Me=oo({count:j.getFilteredRowModel().rows.length,getScrollElement:()=>p.current,estimateSize:()=>31,overscan:15,paddingStart:_.current?.clientHeight??0,isScrollingResetDelay:10});ie(()=>{Me.scrollToOffset(0)},[n,Me]);let jo=Me.getTotalSize(),Fe=Me.getVirtualItems(),kn=(Fe.length>0&&Fe?.[0]?.start||0)-(_.current?.clientHeight??0),Hn=Fe.length>0?jo-(Fe?.[Fe.length-1]?.end||0):0,qo=Go(l.summary,p?.current,Fe,_.current,Me.options.count),An=l.style??"grid",Wo=An==="grid"?"shiny-data-grid-grid":"shiny-data-grid-table",Xo=An==="table"?"table table-sm":null,he=To(r),Js=!he.isNone(),Yo=he.row!==ae._rowEnum.NONE,ue=Po({isEditingCell:Ve,editCellsIsAllowed:it,selectionModes:he,keyAccessor:v=>v.dataset.key,focusEscape:v=>{setTimeout(()=>{v?.blur(),p.current?.focus()},0)},focusOffset:(v,S=0)=>{let w=j.getSortedRowModel(),b=w.rows.findIndex(X=>X.id===v);if(b<0||(b+=S,b<0||b>=w.rows.length))return null;let A=w.rows[b].id;return Me.scrollToIndex(b),setTimeout(()=>{p.current?.querySelector(`[data-key='${A}']`)?.focus()},0),A},between:(v,S)=>Xs(j.getSortedRowModel(),v,S),onKeyDownEnter:v=>{let S=Array(...v.childNodes.values()).filter(A=>A instanceof HTMLElement&&A.classList.contains("cell-editable"));if(S.length===0)return;let w=Ft(p.current,S);if(!w)return;let b=new MouseEvent("dblclick",{bubbles:!0,cancelable:!0});w.dispatchEvent(b)}});V(()=>{let v=w=>{let b=w.detail.cellSelection;if(b.type==="none"){ue.clear();return}else if(b.type==="row"){ue.setMultiple(b.rows.map(String));return}else console.error("Unhandled cell selection update:",b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateCellSelection",v),()=>{S.removeEventListener("updateCellSelection",v)}},[e,ue,Se]),V(()=>{u&&Shiny.renderDependenciesAsync([...u])},[u]),V(()=>{let v=w=>{let b=w.detail.patches,A=In(b);Fn({setData:we,newPatches:A,setCellEditMapAtLoc:Z})};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("addPatches",v),()=>{S.removeEventListener("addPatches",v)}},[y,e,Z,O,we]),V(()=>{let v=w=>{let b=w.detail;Oe(b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateData",v),()=>{S.removeEventListener("updateData",v)}},[y,e,je,we,Oe]),V(()=>{let v=w=>{let b=w.detail.sort,A=[];b.map(X=>{A.push({id:y[X.col],desc:X.desc})}),O(A)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateColumnSort",v),()=>{S.removeEventListener("updateColumnSort",v)}},[y,e,O]),V(()=>{let v=w=>{let b=w.detail.filter,A=[];b.map(X=>{A.push({id:y[X.col],value:X.value})}),Le(A)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateColumnFilter",v),()=>{S.removeEventListener("updateColumnFilter",v)}},[y,e,Le]),V(()=>{let v=w=>{let b=w.detail.styles;U(b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateStyles",v),()=>{S.removeEventListener("updateStyles",v)}},[e,U]),V(()=>{if(!e)return;let v=null;if(he.isNone())v=null;else if(he.row!==ae._rowEnum.NONE){let S=ue.keys().toList(),w=j.getSortedRowModel().rowsById;v={type:"row",rows:S.map(b=>b in w?w[b].index:null).filter(b=>b!==null)}}else console.error("Unhandled row selection mode:",he);Shiny.setInputValue(`${e}_cell_selection`,v)},[e,ue,he,j,j.getSortedRowModel]),V(()=>{if(!e)return;let v=[];pe.map(S=>{let w=y.indexOf(S.id);v.push({col:w,desc:S.desc})}),Shiny.setInputValue(`${e}_sort`,v),Shiny.setInputValue(`${e}_column_sort`,v)},[y,e,pe]),V(()=>{if(!e)return;let v=[];z.map(S=>{let w=y.indexOf(S.id);v.push({col:w,value:S.value})}),Shiny.setInputValue(`${e}_filter`,v),Shiny.setInputValue(`${e}_column_filter`,v)},[e,z,y]),V(()=>{if(!e)return;let v=j.getSortedRowModel().rows.map(S=>S.index);Shiny.setInputValue(`${e}_data_view_rows`,v),Shiny.setInputValue(`${e}_data_view_indices`,v)},[e,j,pe,z]),V(()=>{if(!e)return;let v=null;if(he.row!==ae._rowEnum.NONE){let S=ue.keys().toList(),w=j.getSortedRowModel().rowsById;v=S.map(b=>b in w?w[b].index:null).filter(b=>b!==null).sort()}Shiny.setInputValue(`${e}_selected_rows`,v)},[e,ue,he,j]);let Jo=x.useCallback(()=>m.current.querySelectorAll("[tabindex='-1']"),[m.current]),Nn=zo(p.current,Jo,{top:_.current?.clientHeight??0});V(()=>()=>{j.resetSorting(),ue.clear()},[n]);let Qo=j.getHeaderGroups().length;ie(()=>{let v=Se.length>0;if(v){p.current?.classList.add("scrolling");let S=p.current?.scrollHeight,w=p.current?.clientHeight;S&&w&&S<=w&&(v=!1)}p.current?.classList.toggle("scrolling",v)},[Se.length,p.current?.scrollHeight,p.current?.clientHeight]);let Zo=v=>S=>{(S.key===" "||S.key==="Enter")&&v.toggleSorting(void 0,S.shiftKey)},ei=Ys(Me),zn=`shiny-data-grid ${Wo}`;g&&(zn+=" html-fill-item");let It=!1;return x.createElement(x.Fragment,null,x.createElement("div",{className:zn,ref:p,style:{width:f,height:c,overflow:"auto"}},x.createElement("table",{className:Xo+(d?" filtering":""),"aria-rowcount":j.getRowCount(),"aria-multiselectable":Yo,style:{width:f===null||f==="auto"?void 0:"100%"}},x.createElement("thead",{ref:_,style:{backgroundColor:o}},j.getHeaderGroups().map((v,S)=>x.createElement("tr",{key:v.id,"aria-rowindex":S+1},It&&x.createElement("th",{className:"table-corner"}),v.headers.map(w=>{let b=w.isPlaceholder?void 0:x.createElement("div",{style:{cursor:w.column.getCanSort()?"pointer":void 0,userSelect:w.column.getCanSort()?"none":void 0}},_t(w.column.columnDef.header,w.getContext()),x.createElement(Oo,{direction:w.column.getIsSorted()}));return x.createElement("th",{key:w.id,colSpan:w.colSpan,style:{width:w.getSize()},scope:"col",tabIndex:0,onClick:w.column.getToggleSortingHandler(),onKeyDown:Zo(w.column),className:w.column.getCanSort()?void 0:"header-html"},b)}))),d&&x.createElement("tr",{className:"filters"},It&&x.createElement("th",{className:"table-corner"}),j.getFlatHeaders().map(v=>{let S=`filter-${v.id}`;return x.createElement("th",{key:S},x.createElement(Fo,{header:v}))}))),x.createElement("tbody",{ref:m,tabIndex:Nn.containerTabIndex,...Nn.containerHandlers},kn>0&&x.createElement("tr",{style:{height:`${kn}px`}}),Fe.map(v=>{let S=j.getRowModel().rows[v.index];return S&&x.createElement("tr",{key:v.key,"data-index":v.index,"aria-rowindex":v.index+Qo,"data-key":S.id,ref:ei,"aria-selected":ue.has(S.id),tabIndex:-1,...ue.itemHandlers()},It&&x.createElement("td",{className:"row-number"},S.index+1),S.getVisibleCells().map(w=>{let b=w.row.index,A=w.column.columnDef.meta.colIndex,[X,N]=Eo(G,b,A),{cellStyle:ke,cellClassName:Tt}=Ao(q,"body",b,A);return x.createElement(So,{key:w.id,rowId:w.row.id,containerRef:p,cell:w,patchInfo:t,editCellsIsAllowed:it,columns:y,coldefs:qe,rowIndex:b,columnIndex:A,getSortedRowModel:j.getSortedRowModel,cellEditInfo:X,cellStyle:ke,cellClassName:Tt,setData:we,setCellEditMapAtLoc:Z,selection:ue})}))}),Hn>0&&x.createElement("tr",{style:{height:`${Hn}px`}})))),qo)};function Xs(e,n,t){let r=e.rows.findIndex(s=>s.id===n),o=e.rows.findIndex(s=>s.id===t);if(r<0||o<0)return[];r>o&&([r,o]=[o,r]);let i=[];for(let s=r;s<=o;s++)i.push(e.rows[s].id);return i}function Ys(e){let n=Q([]),t=J(r=>{r&&(r.isConnected?e.measureElement(r):n.current.push(r))},[e]);return ie(()=>{n.current.length>0&&n.current.splice(0).forEach(e.measureElement)}),t}var $n=class extends Shiny.OutputBinding{find(n){return $(n).find("shiny-data-frame")}renderValue(n,t){n.renderValue(t)}renderError(n,t){n.classList.add("shiny-output-error"),n.renderError(t)}clearError(n){n.classList.remove("shiny-output-error"),n.clearError()}};Shiny.outputBindings.register(new $n,"shinyDataFrame");function Bo(e){if(!e)return;let n=Vn(e,"background-color");if(!n)return n;let t=n.match(/^rgba\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)$/);if(n==="transparent"||t&&parseFloat(t[4])===0){let r=Vn(e,"background-image");return r&&r!=="none"?void 0:Bo(e.parentElement)}return n}var Uo=document.createElement("template");Uo.innerHTML=`<style>${No}</style>`;var Ln=class extends HTMLElement{connectedCallback(){let[t]=[this];t.appendChild(Uo.content.cloneNode(!0)),this.errorRoot=document.createElement("span"),t.appendChild(this.errorRoot);let r=document.createElement("div");r.classList.add("html-fill-container","html-fill-item"),t.appendChild(r),this.reactRoot=io(r);let o=this.querySelector("script.data");if(o){let i=JSON.parse(o.innerText);this.renderValue(i)}}renderValue(t){if(this.clearError(),!t){this.reactRoot.render(null);return}this.reactRoot.render(x.createElement(nn,null,x.createElement(Ws,{id:this.id,gridInfo:t,bgcolor:Bo(this)})))}renderError(t){this.reactRoot.render(null),this.errorRoot.innerText=t.message}clearError(){this.reactRoot.render(null),this.errorRoot.innerText=""}};customElements.define("shiny-data-frame",Ln);$(function(){Shiny.addCustomMessageHandler("shinyDataFrameMessage",function(e){let n=new CustomEvent(e.handler,{detail:e.obj});document.getElementById(e.id)?.dispatchEvent(n)})});export{Ln as ShinyDataFrameOutput};
+}`;function zo(e,n,t){let[r,o]=H(0),i=x.useCallback(a=>{o(-1),a.target===a.currentTarget&&Ft(e,n(),t)?.focus()},[e,n,t]),s=x.useCallback(a=>{o(0)},[]);return{containerTabIndex:r,containerHandlers:{onFocus:i,onBlur:s}}}function Go(e,n,t,r,o){return se(()=>{let i=e??!0;if(!i)return null;let s=typeof i=="string"?i:"Viewing rows {start} through {end} of {total}";if(!n||t.length===0||!r)return null;let a=n.scrollTop+r.clientHeight,l=n.scrollTop+n.clientHeight,[u,f]=js(a,l,t,(h,p)=>h.start+h.size/2);if(u===null||f===null)return null;let c=t[u],g=t[f];if(c===void 0||g===void 0||c.index===0&&g.index===o-1)return null;let d=qs(s,c.index+1,g.index+1,o);return x.createElement("div",{className:"shiny-data-grid-summary"},d)},[e,n,t,r,o])}function js(e,n,t,r){let o=null,i=null;for(let s=0;s<t.length;s++){let a=t[s];if(o===null)r(a,!0)>=e&&(o=s,i=s);else if(r(a,!1)<=n)i=s;else break}return[o,i]}function qs(e,n,t,r){return e.replace(/\{(start|end|total)\}/g,(o,i)=>i==="start"?n+"":i==="end"?t+"":i==="total"?r+"":o)}var Ws=({id:e,gridInfo:{payload:n,patchInfo:t,selectionModes:r},bgcolor:o})=>{let{columns:i,typeHints:s,data:a,options:l={width:void 0,height:void 0,fill:!1,styles:[]},htmlDeps:u}=n,{width:f,height:c,fill:g,filters:d,styles:h}=l,p=Q(null),_=Q(null),m=Q(null),[y,R]=xe(i),[P,I]=xe(s),D=Ho({initStyleInfos:h??[],nrow:a.length,ncol:y.length}),q=D.styleInfoMap,{setStyleInfos:U}=D,K=wo(),G=K.cellEditMap,Z=K.setCellEditMapAtLoc,je=K.resetCellEditMap,it=l.editable===!0,Ve=se(()=>{for(let v of G.values())if(v.isEditing)return!0;return!1},[G]),qe=se(()=>y.map((v,S)=>{let w=P?.[S],b=w?.type==="html",A=b?!1:void 0;return{accessorFn:(X,N)=>X[S],filterFn:w?.type==="numeric"?"inNumberRange":"includesString",header:v,meta:{colIndex:S,isHtmlColumn:b,typeHint:w},cell:({getValue:X})=>{let N=X();if(N==null)return"";switch(w?.type){case"numeric":case"date":case"datetime":case"duration":case"categorical":case"html":return N;case"string":case"boolean":return String(N);case"unknown":case"object":return typeof N=="string"?N:JSON.stringify(N);default:return N}},enableSorting:A}}),[y,P]),On=se(()=>a,[a]),We=xe(a),Se=We[0],we=We[1],Ce=Do({getColDefs:()=>qe}),pe=Ce.sorting,st=Ce.sortTableStateOptions,M=Ce.sortTableOptions,O=Ce.setSorting,{columnFilters:z,columnFiltersState:W,filtersTableOptions:Xe,setColumnFilters:Le}=Mo(d),Oe=J(({data:v,columns:S,typeHints:w})=>{R(S),we(v),I(w),je();let b=new Map;w?.forEach((N,ke)=>{b.set(S[ke],N)});let A=pe.filter(N=>b.has(N.id)),X=z.filter(N=>{let ke=b.get(N.id);return ke?ke.type==="numeric"?N.value===null||Array.isArray(N.value)&&N.value.every(Tt=>Tt!==null):typeof N.value=="string":!1});Le(X),O(A)},[z,je,Le,R,O,we,I,pe]),Ko={data:Se,columns:qe,state:{...st,...W},getCoreRowModel:Br(),...M,...Xe},j=Yr(Ko),Me=oo({count:j.getFilteredRowModel().rows.length,getScrollElement:()=>p.current,estimateSize:()=>31,overscan:15,paddingStart:_.current?.clientHeight??0,isScrollingResetDelay:10});ie(()=>{Me.scrollToOffset(0)},[n,Me]);let jo=Me.getTotalSize(),Fe=Me.getVirtualItems(),kn=(Fe.length>0&&Fe?.[0]?.start||0)-(_.current?.clientHeight??0),Hn=Fe.length>0?jo-(Fe?.[Fe.length-1]?.end||0):0,qo=Go(l.summary,p?.current,Fe,_.current,Me.options.count),An=l.style??"grid",Wo=An==="grid"?"shiny-data-grid-grid":"shiny-data-grid-table",Xo=An==="table"?"table table-sm":null,he=To(r),Js=!he.isNone(),Yo=he.row!==ae._rowEnum.NONE,ue=Po({isEditingCell:Ve,editCellsIsAllowed:it,selectionModes:he,keyAccessor:v=>v.dataset.key,focusEscape:v=>{setTimeout(()=>{v?.blur(),p.current?.focus()},0)},focusOffset:(v,S=0)=>{let w=j.getSortedRowModel(),b=w.rows.findIndex(X=>X.id===v);if(b<0||(b+=S,b<0||b>=w.rows.length))return null;let A=w.rows[b].id;return Me.scrollToIndex(b),setTimeout(()=>{p.current?.querySelector(`[data-key='${A}']`)?.focus()},0),A},between:(v,S)=>Xs(j.getSortedRowModel(),v,S),onKeyDownEnter:v=>{let S=Array(...v.childNodes.values()).filter(A=>A instanceof HTMLElement&&A.classList.contains("cell-editable"));if(S.length===0)return;let w=Ft(p.current,S);if(!w)return;let b=new MouseEvent("dblclick",{bubbles:!0,cancelable:!0});w.dispatchEvent(b)}});V(()=>{let v=w=>{let b=w.detail.cellSelection;if(b.type==="none"){ue.clear();return}else if(b.type==="row"){ue.setMultiple(b.rows.map(String));return}else console.error("Unhandled cell selection update:",b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateCellSelection",v),()=>{S.removeEventListener("updateCellSelection",v)}},[e,ue,Se]),V(()=>{u&&Shiny.renderDependenciesAsync([...u])},[u]),V(()=>{let v=w=>{let b=w.detail.patches,A=In(b);Fn({setData:we,newPatches:A,setCellEditMapAtLoc:Z})};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("addPatches",v),()=>{S.removeEventListener("addPatches",v)}},[y,e,Z,O,we]),V(()=>{let v=w=>{let b=w.detail;Oe(b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateData",v),()=>{S.removeEventListener("updateData",v)}},[y,e,je,we,Oe]),V(()=>{let v=w=>{let b=w.detail.sort,A=[];b.map(X=>{A.push({id:y[X.col],desc:X.desc})}),O(A)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateColumnSort",v),()=>{S.removeEventListener("updateColumnSort",v)}},[y,e,O]),V(()=>{let v=w=>{let b=w.detail.filter,A=[];b.map(X=>{A.push({id:y[X.col],value:X.value})}),Le(A)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateColumnFilter",v),()=>{S.removeEventListener("updateColumnFilter",v)}},[y,e,Le]),V(()=>{let v=w=>{let b=w.detail.styles;U(b)};if(!e)return;let S=document.getElementById(e);if(S)return S.addEventListener("updateStyles",v),()=>{S.removeEventListener("updateStyles",v)}},[e,U]),V(()=>{if(!e)return;let v=null;if(he.isNone())v=null;else if(he.row!==ae._rowEnum.NONE){let S=ue.keys().toList(),w=j.getSortedRowModel().rowsById;v={type:"row",rows:S.map(b=>b in w?w[b].index:null).filter(b=>b!==null)}}else console.error("Unhandled row selection mode:",he);Shiny.setInputValue(`${e}_cell_selection:shiny.dataframe.cellSelection`,v!==null&&"rows"in v?{...v,rows:Bm(v.rows)}:v)},[e,ue,he,j,j.getSortedRowModel]),V(()=>{if(!e)return;let v=[];pe.map(S=>{let w=y.indexOf(S.id);v.push({col:w,desc:S.desc})}),Shiny.setInputValue(`${e}_sort`,v),Shiny.setInputValue(`${e}_column_sort`,v)},[y,e,pe]),V(()=>{if(!e)return;let v=[];z.map(S=>{let w=y.indexOf(S.id);v.push({col:w,value:S.value})}),Shiny.setInputValue(`${e}_filter`,v),Shiny.setInputValue(`${e}_column_filter`,v)},[e,z,y]),V(()=>{if(!e)return;let v=j.getSortedRowModel().rows.map(S=>S.index),w=Bm(v);Shiny.setInputValue(`${e}_data_view_rows:shiny.dataframe.indices`,w),Shiny.setInputValue(`${e}_data_view_indices:shiny.dataframe.indices`,w)},[e,j,pe,z]),V(()=>{if(!e)return;let v=null;if(he.row!==ae._rowEnum.NONE){let S=ue.keys().toList(),w=j.getSortedRowModel().rowsById;v=S.map(b=>b in w?w[b].index:null).filter(b=>b!==null).sort()}Shiny.setInputValue(`${e}_selected_rows:shiny.dataframe.indices`,v===null?null:Bm(v))},[e,ue,he,j]);let Jo=x.useCallback(()=>m.current.querySelectorAll("[tabindex='-1']"),[m.current]),Nn=zo(p.current,Jo,{top:_.current?.clientHeight??0});V(()=>()=>{j.resetSorting(),ue.clear()},[n]);let Qo=j.getHeaderGroups().length;ie(()=>{let v=Se.length>0;if(v){p.current?.classList.add("scrolling");let S=p.current?.scrollHeight,w=p.current?.clientHeight;S&&w&&S<=w&&(v=!1)}p.current?.classList.toggle("scrolling",v)},[Se.length,p.current?.scrollHeight,p.current?.clientHeight]);let Zo=v=>S=>{(S.key===" "||S.key==="Enter")&&v.toggleSorting(void 0,S.shiftKey)},ei=Ys(Me),zn=`shiny-data-grid ${Wo}`;g&&(zn+=" html-fill-item");let It=!1;return x.createElement(x.Fragment,null,x.createElement("div",{className:zn,ref:p,style:{width:f,height:c,overflow:"auto"}},x.createElement("table",{className:Xo+(d?" filtering":""),"aria-rowcount":j.getRowCount(),"aria-multiselectable":Yo,style:{width:f===null||f==="auto"?void 0:"100%"}},x.createElement("thead",{ref:_,style:{backgroundColor:o}},j.getHeaderGroups().map((v,S)=>x.createElement("tr",{key:v.id,"aria-rowindex":S+1},It&&x.createElement("th",{className:"table-corner"}),v.headers.map(w=>{let b=w.isPlaceholder?void 0:x.createElement("div",{style:{cursor:w.column.getCanSort()?"pointer":void 0,userSelect:w.column.getCanSort()?"none":void 0}},_t(w.column.columnDef.header,w.getContext()),x.createElement(Oo,{direction:w.column.getIsSorted()}));return x.createElement("th",{key:w.id,colSpan:w.colSpan,style:{width:w.getSize()},scope:"col",tabIndex:0,onClick:w.column.getToggleSortingHandler(),onKeyDown:Zo(w.column),className:w.column.getCanSort()?void 0:"header-html"},b)}))),d&&x.createElement("tr",{className:"filters"},It&&x.createElement("th",{className:"table-corner"}),j.getFlatHeaders().map(v=>{let S=`filter-${v.id}`;return x.createElement("th",{key:S},x.createElement(Fo,{header:v}))}))),x.createElement("tbody",{ref:m,tabIndex:Nn.containerTabIndex,...Nn.containerHandlers},kn>0&&x.createElement("tr",{style:{height:`${kn}px`}}),Fe.map(v=>{let S=j.getRowModel().rows[v.index];return S&&x.createElement("tr",{key:v.key,"data-index":v.index,"aria-rowindex":v.index+Qo,"data-key":S.id,ref:ei,"aria-selected":ue.has(S.id),tabIndex:-1,...ue.itemHandlers()},It&&x.createElement("td",{className:"row-number"},S.index+1),S.getVisibleCells().map(w=>{let b=w.row.index,A=w.column.columnDef.meta.colIndex,[X,N]=Eo(G,b,A),{cellStyle:ke,cellClassName:Tt}=Ao(q,"body",b,A);return x.createElement(So,{key:w.id,rowId:w.row.id,containerRef:p,cell:w,patchInfo:t,editCellsIsAllowed:it,columns:y,coldefs:qe,rowIndex:b,columnIndex:A,getSortedRowModel:j.getSortedRowModel,cellEditInfo:X,cellStyle:ke,cellClassName:Tt,setData:we,setCellEditMapAtLoc:Z,selection:ue})}))}),Hn>0&&x.createElement("tr",{style:{height:`${Hn}px`}})))),qo)};function Xs(e,n,t){let r=e.rows.findIndex(s=>s.id===n),o=e.rows.findIndex(s=>s.id===t);if(r<0||o<0)return[];r>o&&([r,o]=[o,r]);let i=[];for(let s=r;s<=o;s++)i.push(e.rows[s].id);return i}function Ys(e){let n=Q([]),t=J(r=>{r&&(r.isConnected?e.measureElement(r):n.current.push(r))},[e]);return ie(()=>{n.current.length>0&&n.current.splice(0).forEach(e.measureElement)}),t}var $n=class extends Shiny.OutputBinding{find(n){return $(n).find("shiny-data-frame")}renderValue(n,t){n.renderValue(t)}renderError(n,t){n.classList.add("shiny-output-error"),n.renderError(t)}clearError(n){n.classList.remove("shiny-output-error"),n.clearError()}};Shiny.outputBindings.register(new $n,"shinyDataFrame");function Bo(e){if(!e)return;let n=Vn(e,"background-color");if(!n)return n;let t=n.match(/^rgba\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)$/);if(n==="transparent"||t&&parseFloat(t[4])===0){let r=Vn(e,"background-image");return r&&r!=="none"?void 0:Bo(e.parentElement)}return n}var Uo=document.createElement("template");Uo.innerHTML=`<style>${No}</style>`;var Ln=class extends HTMLElement{connectedCallback(){let[t]=[this];t.appendChild(Uo.content.cloneNode(!0)),this.errorRoot=document.createElement("span"),t.appendChild(this.errorRoot);let r=document.createElement("div");r.classList.add("html-fill-container","html-fill-item"),t.appendChild(r),this.reactRoot=io(r);let o=this.querySelector("script.data");if(o){let i=JSON.parse(o.innerText);this.renderValue(i)}}renderValue(t){if(this.clearError(),!t){this.reactRoot.render(null);return}this.reactRoot.render(x.createElement(nn,null,x.createElement(Ws,{id:this.id,gridInfo:t,bgcolor:Bo(this)})))}renderError(t){this.reactRoot.render(null),this.errorRoot.innerText=t.message}clearError(){this.reactRoot.render(null),this.errorRoot.innerText=""}};customElements.define("shiny-data-frame",Ln);$(function(){Shiny.addCustomMessageHandler("shinyDataFrameMessage",function(e){let n=new CustomEvent(e.handler,{detail:e.obj});document.getElementById(e.id)?.dispatchEvent(n)})});export{Ln as ShinyDataFrameOutput};
 /*! Bundled license information:
 
 @tanstack/table-core/build/lib/index.mjs:
@@ -0,0 +1,41 @@
+// reconnect/reconnect.ts
+var resumeToken = null;
+var received = 0;
+function createSocket() {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  let path = window.location.pathname;
+  if (!path.endsWith("/"))
+    path += "/";
+  path += "websocket/";
+  if (resumeToken !== null) {
+    path += `?resume=${encodeURIComponent(resumeToken)}&received=${received}`;
+  }
+  const ws = new WebSocket(`${protocol}//${window.location.host}${path}`);
+  ws.binaryType = "arraybuffer";
+  ws.allowReconnect = true;
+  let first = true;
+  let ackTimeout = null;
+  ws.addEventListener("message", (e) => {
+    if (first && typeof e.data === "string" && e.data.startsWith('{"config"')) {
+      resumeToken = null;
+      received = 0;
+    }
+    first = false;
+    received++;
+    if (ackTimeout === null) {
+      ackTimeout = window.setTimeout(() => {
+        ackTimeout = null;
+        if (ws.readyState === WebSocket.OPEN) {
+          ws.send(JSON.stringify({ ack: received }));
+        }
+      }, 1e3);
+    }
+  });
+  return ws;
+}
+if (!Shiny.createSocket) {
+  Shiny.addCustomMessageHandler("shiny.resume", (token) => {
+    resumeToken = token;
+  });
+  Shiny.createSocket = createSocket;
+}
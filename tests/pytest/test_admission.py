@@ -0,0 +1,154 @@
+"""Tests for `shiny.session.AdmissionControl`."""
+
+from __future__ import annotations
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from shiny import App, ui
+from shiny.session import AdmissionControl
+from shiny.session._admission import Admission
+
+
+def test_admission_queue():
+    admission = Admission(AdmissionControl(max_sessions=2, max_queued=2))
+
+    page_a = admission.admit_page("a", 0, None)
+    page_b = admission.admit_page("b", 0, None)
+    assert (page_a.status, page_b.status) == ("ok", "ok")
+    # Sessions are held for the browsers that were let in
+    wait1 = admission.admit_page("c", 0, None)
+    assert (wait1.status, wait1.position) == ("wait", 1)
+    wait2 = admission.admit_page("d", 0, None)
+    assert (wait2.status, wait2.position) == ("wait", 2)
+    assert admission.admit_page("e", 0, None).status == "busy"
+
+    assert admission.admit_session("a", 0, page_a.ticket)
+    assert not admission.admit_session("x", 2, None)
+    assert admission.admit_page("d", 1, wait2.ticket).status == "wait"
+    assert admission.admit_session("b", 1, page_b.ticket)
+
+    # First come, first served
+    assert admission.admit_page("d", 1, wait2.ticket).status == "wait"
+    assert admission.admit_page("c", 1, wait1.ticket).status == "ok"
+    assert admission.admit_page("d", 1, wait2.ticket).status == "wait"
+    assert admission.admit_page("d", 0, wait2.ticket).status == "ok"
+    assert admission._queue == {}
+
+
+def test_admission_reserved_sessions():
+    admission = Admission(AdmissionControl(max_sessions=2))
+
+    page = admission.admit_page("a", 0, None)
+    assert page.status == "ok"
+    assert page.ticket is not None
+    # Reloading the page keeps the same session
+    assert admission.admit_page("a", 0, page.ticket) == page
+    assert len(admission._reserved) == 1
+
+    # Clients without the ticket can't take the session held for the browser
+    assert admission.admit_session("b", 0, None)
+    assert not admission.admit_session("c", 1, None)
+    assert not admission.admit_session("c", 1, "unknown")
+    assert admission.admit_session("a", 1, page.ticket)
+    assert not admission._reserved
+    assert not admission.admit_session("a", 2, page.ticket)
+
+
+def test_admission_rate():
+    admission = Admission(AdmissionControl(rate=1, burst=2))
+
+    assert admission.admit_page("a", 0, None).status == "ok"
+    assert admission.admit_session("a", 0, None)
+    assert admission.admit_session("a", 1, None)
+    assert not admission.admit_session("a", 2, None)
+    assert admission.admit_session("b", 2, None)
+
+    page = admission.admit_page("a", 2, None)
+    assert page.status == "rate_limited"
+    assert 0 < page.retry_after <= 1
+
+
+def test_admission_control_validation():
+    with pytest.raises(ValueError, match="max_sessions"):
+        AdmissionControl(max_sessions=0)
+    with pytest.raises(ValueError, match="rate"):
+        AdmissionControl(rate=0)
+
+
+@pytest.mark.asyncio
+async def test_app_admission_page():
+    httpx = pytest.importorskip("httpx")
+    app = App(
+        ui.page_fluid("Hello"),
+        None,
+        admission_control=AdmissionControl(max_sessions=1, max_queued=1),
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    client1, client2, client3 = (
+        httpx.AsyncClient(transport=transport, base_url="http://test") for _ in range(3)
+    )
+    async with client1, client2, client3:
+        assert "Hello" in (await client1.get("/")).text
+
+        res = await client2.get("/")
+        assert res.status_code == 200
+        assert "number 1 in line" in res.text
+        assert res.headers["Cache-Control"] == "no-store"
+        assert "shiny_admission_ticket" in res.cookies
+
+        res = await client3.get("/")
+        assert res.status_code == 503
+        assert res.headers["Retry-After"] == "5"
+
+        assert "Please wait" in (await client2.get("/")).text
+
+        # The session held for the first browser is freed (as if it closed), and the
+        # waiting browser is let in (with its ticket)
+        assert app._admission is not None
+        app._admission._reserved.clear()
+        assert "Hello" in (await client2.get("/")).text
+        assert "number 1 in line" in (await client3.get("/")).text
+
+
+def test_app_refuses_sessions_when_full():
+    app = App(
+        ui.page_fluid(),
+        None,
+        admission_control=AdmissionControl(max_sessions=1),
+    )
+    client = TestClient(app)
+
+    with client.websocket_connect("/websocket/") as ws1:
+        ws1.send_text('{"method":"init","data":{}}')
+        ws1.receive_text()
+        assert len(app._sessions) == 1
+
+        with client.websocket_connect("/websocket/") as ws2:
+            with pytest.raises(WebSocketDisconnect) as e:
+                ws2.receive_text()
+        assert e.value.code == 1013
+        assert len(app._sessions) == 1
+
+
+def test_app_holds_sessions_for_admitted_browsers():
+    app = App(
+        ui.page_fluid(),
+        None,
+        admission_control=AdmissionControl(max_sessions=1),
+    )
+    browser, other = TestClient(app), TestClient(app)
+    browser.get("/")
+
+    # A websocket that didn't get the page can't take the session held for the browser
+    with other.websocket_connect("/websocket/") as ws:
+        with pytest.raises(WebSocketDisconnect) as e:
+            ws.receive_text()
+    assert e.value.code == 1013
+
+    with browser.websocket_connect("/websocket/") as ws:
+        ws.send_text('{"method":"init","data":{}}')
+        ws.receive_text()
+        assert len(app._sessions) == 1
@@ -0,0 +1,257 @@
+"""Tests for `shiny._app`."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from htmltools import HTMLDependency
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.routing import Match
+from starlette.types import Scope
+
+import shiny._dependency_server
+from shiny import App, ui
+from shiny._compress import accepted_encoding
+from shiny._dependency_server import DependencyServer
+
+pytest.importorskip("httpx")
+from starlette.testclient import TestClient  # noqa: E402
+
+
+def test_static_ui_etag():
+    app = App(ui.page_fluid("Hello"), None)
+    client = TestClient(app)
+
+    res = client.get("/")
+    assert res.status_code == 200
+    etag = res.headers["etag"]
+
+    res = client.get("/", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    res = client.get("/", headers={"If-None-Match": '"other"'})
+    assert res.status_code == 200
+
+
+def test_callable_ui_cache():
+    calls: list[str] = []
+
+    def app_ui(request: Request):
+        lang = request.query_params.get("lang", "en")
+        calls.append(lang)
+        return ui.page_fluid(f"Hello {lang}")
+
+    app = App(
+        app_ui,
+        None,
+        ui_cache_key=lambda request: request.query_params.get("lang", "en"),
+        ui_cache_size=2,
+    )
+    client = TestClient(app)
+
+    assert "Hello en" in client.get("/").text
+    assert "Hello en" in client.get("/?lang=en").text
+    assert "Hello fr" in client.get("/?lang=fr").text
+    assert calls == ["en", "fr"]
+
+    # "en" is the least recently used page, so it is evicted
+    client.get("/?lang=de")
+    client.get("/")
+    assert calls == ["en", "fr", "de", "en"]
+
+    etag = client.get("/?lang=de").headers["etag"]
+    res = client.get("/?lang=de", headers={"If-None-Match": f"W/{etag}"})
+    assert res.status_code == 304
+
+
+def test_callable_ui_without_cache():
+    calls: list[int] = []
+
+    def app_ui(request: Request):
+        calls.append(1)
+        return ui.page_fluid("Hello")
+
+    client = TestClient(App(app_ui, None))
+    client.get("/")
+    client.get("/")
+    assert len(calls) == 2
+
+
+def test_ui_cache_key_requires_ui_function():
+    with pytest.raises(ValueError, match="ui_cache_key"):
+        App(ui.page_fluid("Hello"), None, ui_cache_key=lambda request: 1)
+
+
+def test_page_compression():
+    app = App(ui.page_fluid("Hello"), None)
+    client = TestClient(app)
+
+    res = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Hello" in res.text
+    gzip_etag = res.headers["etag"]
+
+    res = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers
+    assert res.headers["etag"] != gzip_etag
+    assert "Hello" in res.text
+
+    res = client.get(
+        "/", headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag}
+    )
+    assert res.status_code == 304
+
+
+def test_accepted_encoding():
+    def accepted(accept_encoding: str):
+        return accepted_encoding(Headers({"accept-encoding": accept_encoding}))
+
+    assert accepted("gzip, deflate") == "gzip"
+    assert accepted("gzip;q=0.5") == "gzip"
+    assert accepted("gzip; q=0") is None
+    assert accepted("gzip;q=0.0, *;q=0") is None
+    assert accepted("deflate, *") == "gzip"
+    # Malformed q-values rule out the coding, rather than failing the request
+    assert accepted("gzip;q=abc") is None
+    assert accepted("gzip;q=, deflate") is None
+    assert accepted("gzip;q=nan, *;q=0.1") == "gzip"
+
+
+def test_static_assets_compression(tmp_path: Path):
+    (tmp_path / "big.css").write_text("body { color: red; }\n" * 500)
+    (tmp_path / "small.css").write_text("body { color: red; }\n")
+    (tmp_path / "pre.js").write_text("console.log('hello');\n" * 500)
+    (tmp_path / "pre.js.gz").write_bytes(gzip.compress(b"precompressed"))
+
+    app = App(ui.page_fluid("Hello"), None, static_assets=tmp_path)
+    client = TestClient(app)
+
+    res = client.get("/big.css", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.text == "body { color: red; }\n" * 500
+    assert "cache-control" not in res.headers
+
+    res2 = client.get(
+        "/big.css",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": res.headers["etag"]},
+    )
+    assert res2.status_code == 304
+
+    res = client.get("/big.css", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers
+
+    res = client.get("/small.css", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+
+    res = client.get("/pre.js", headers={"Accept-Encoding": "gzip"})
+    assert res.text == "precompressed"
+
+
+def test_dependency_cache_control(tmp_path: Path):
+    packaged = HTMLDependency(
+        "packaged",
+        "1.0.0",
+        source={"package": "shiny", "subdir": "www/shared/jquery"},
+        script={"src": "jquery-3.6.0.min.js"},
+    )
+    local = HTMLDependency(
+        "local",
+        "1.0.0",
+        source={"subdir": str(tmp_path)},
+        script={"src": "local.js"},
+    )
+    (tmp_path / "local.js").write_text("console.log('hello');\n")
+
+    client = TestClient(App(ui.page_fluid(packaged, local), None))
+
+    res = client.get("/lib/packaged-1.0.0/jquery-3.6.0.min.js")
+    assert res.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    res = client.get("/lib/local-1.0.0/local.js")
+    assert res.status_code == 200
+    assert "cache-control" not in res.headers
+
+    # In debug mode, files may change in place
+    client = TestClient(App(ui.page_fluid(packaged), None, debug=True))
+    res = client.get("/lib/packaged-1.0.0/jquery-3.6.0.min.js")
+    assert "cache-control" not in res.headers
+
+
+def test_dependency_dispatch(tmp_path: Path):
+    deps: list[HTMLDependency] = []
+    for i in range(50):
+        dep_dir = tmp_path / f"dep{i}"
+        dep_dir.mkdir()
+        (dep_dir / "dep.js").write_text(f"console.log({i});\n")
+        deps.append(
+            HTMLDependency(
+                f"dep{i}",
+                "1.0.0",
+                source={"subdir": str(dep_dir)},
+                script={"src": "dep.js"},
+            )
+        )
+    app = App(ui.page_fluid(*deps), None, static_assets=tmp_path)
+    # All of the dependencies are served by a single route
+    assert len(app._dependency_handler.routes) == 2
+    client = TestClient(app)
+
+    assert client.get("/lib/dep7-1.0.0/dep.js").text == "console.log(7);\n"
+    assert client.get("/lib/dep49-1.0.0/dep.js").text == "console.log(49);\n"
+    assert client.get("/lib/dep7-1.0.0/missing.js").status_code == 404
+    assert client.get("/lib/dep7-2.0.0/dep.js").status_code == 404
+    # Static assets are still served
+    assert client.get("/dep3/dep.js").text == "console.log(3);\n"
+
+
+def test_dependency_table_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SHINY_DEPENDENCY_TABLE_DIR", str(tmp_path / "shared"))
+    dep_dir = tmp_path / "dep"
+    dep_dir.mkdir()
+    (dep_dir / "dep.js").write_text("console.log('shared');\n")
+    dep = HTMLDependency(
+        "dep", "1.0.0", source={"subdir": str(dep_dir)}, script={"src": "dep.js"}
+    )
+
+    # Two apps that stand in for the same app running in two worker processes.
+    # Only the first one renders the dependency.
+    app1 = App(ui.page_fluid(dep), None)
+    app2 = App(ui.page_fluid("Hello"), None)
+
+    res = TestClient(app2).get("/lib/dep-1.0.0/dep.js")
+    assert res.text == "console.log('shared');\n"
+    assert "lib/dep-1.0.0" in app1._dependency_server
+    assert "lib/dep-1.0.0" in app2._dependency_server
+
+
+def test_dependency_table_shared_is_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(shiny._dependency_server, "_MTIME_RESOLUTION", 0)
+    shared_dir = str(tmp_path / "shared")
+    server1 = DependencyServer(shared_dir)
+    server2 = DependencyServer(shared_dir)
+
+    scans: list[str] = []
+    scandir = os.scandir
+
+    def counting_scandir(path: str):
+        scans.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    scope: Scope = {"type": "http", "path": "/lib/dep-1.0.0/dep.js", "root_path": ""}
+
+    assert server2.matches(scope)[0] == Match.NONE
+    assert server2.matches(scope)[0] == Match.NONE
+    assert len(scans) == 1
+
+    server1.add("lib/dep-1.0.0", str(tmp_path), name="dep")
+    os.utime(shared_dir, ns=(0, 1))
+    assert server2.matches(scope)[0] == Match.FULL
+    assert len(scans) == 2
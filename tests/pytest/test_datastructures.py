@@ -1,6 +1,8 @@
 """Tests for `shiny.datastructures`."""
 
-from shiny._datastructures import PriorityQueueFIFO
+import pytest
+
+from shiny._datastructures import LRUCache, PriorityQueueFIFO
 
 
 def test_priority_queue_fifo():
@@ -17,3 +19,48 @@ def test_priority_queue_fifo():
     assert q.get() == "7"
     assert q.get() == "9"
     assert q.get() == "8"
+    assert q.empty()
+
+    with pytest.raises(IndexError):
+        q.get()
+
+
+def test_priority_queue_fifo_drain():
+    q: PriorityQueueFIFO[str] = PriorityQueueFIFO()
+    q.put(0, "a")
+    q.put(0, "b")
+    q.put(-1, "c")
+
+    drained: list[str] = []
+    for item in q.drain():
+        drained.append(item)
+        if item == "a":
+            # Items put while draining are drained in priority order
+            q.put(1, "d")
+            q.put(0, "e")
+
+    assert drained == ["a", "d", "b", "e", "c"]
+    assert q.empty()
+
+
+def test_lru_cache():
+    now = 0.0
+    cache: LRUCache[str, int] = LRUCache(2, ttl=10, timer=lambda: now)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is now the least recently used item, so it's evicted
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    # Items expire after `ttl` seconds
+    now = 10.0
+    assert cache.get("a") is None
+    assert "c" not in cache
+    cache.set("a", 4)
+    assert cache.get("a") == 4
@@ -0,0 +1,139 @@
+"""Tests for draining an app (`App.drain()`)."""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+from pathlib import Path
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import shiny._app
+import shiny._prefork
+import shiny.reactive._core
+from shiny import App, ui
+from shiny._connection import MockConnection
+from shiny._workers import Workers
+
+
+@pytest.fixture(autouse=True)
+def reactive_environment(monkeypatch: pytest.MonkeyPatch):
+    # The sessions of these tests flush the reactive environment, which shouldn't run
+    # the effects that other tests left behind in the global one
+    monkeypatch.setattr(
+        shiny.reactive._core,
+        "_reactive_environment",
+        shiny.reactive._core.ReactiveEnvironment(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_drain(monkeypatch: pytest.MonkeyPatch):
+    httpx = pytest.importorskip("httpx")
+    monkeypatch.setattr(shiny._app, "DRAIN_CHECK_INTERVAL", 0.01)
+
+    app = App(
+        ui.page_fluid(),
+        None,
+        health_endpoint="/health/",
+        drain_timeout=0.5,
+        drain_idle_timeout=0.1,
+    )
+    active_conn, idle_conn = MockConnection(), MockConnection()
+    active = app._create_session(active_conn)
+    idle = app._create_session(idle_conn)
+    runs = [asyncio.create_task(active._run()), asyncio.create_task(idle._run())]
+    for conn in (active_conn, idle_conn):
+        conn.cause_receive('{"method":"init","data":{}}')
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        res = await client.get("/health/ready")
+        assert res.status_code == 200
+        assert res.json() == {"status": "ok", "sessions": 2}
+
+        res = await client.post("/health/drain")
+        assert res.status_code == 202
+        assert app.draining
+
+        res = await client.get("/health/ready")
+        assert res.status_code == 503
+        assert res.json() == {"status": "draining", "sessions": 2}
+        res = await client.get("/health")
+        assert res.status_code == 200
+
+        # Idle sessions are closed, and active ones continue
+        for _ in range(5):
+            active_conn.cause_receive('{"method":"update","data":{"x":1}}')
+            await asyncio.sleep(0.05)
+        assert list(app._sessions) == [active.id]
+
+        # Until the timeout
+        await asyncio.wait_for(app.drain(), 1)
+        assert not app._sessions
+
+        res = await client.get("/health/ready")
+        assert res.status_code == 503
+        assert res.json() == {"status": "drained", "sessions": 0}
+
+    for conn in (active_conn, idle_conn):
+        conn.cause_disconnect()
+    await asyncio.gather(*runs)
+
+
+def test_drained_app_refuses_sessions():
+    app = App(ui.page_fluid(), None)
+    asyncio.run(app.drain())
+
+    with TestClient(app).websocket_connect("/websocket/") as ws:
+        with pytest.raises(WebSocketDisconnect) as e:
+            ws.receive_text()
+    assert e.value.code == 1013
+    assert not app._sessions
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_forwarded_requests(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setattr(shiny._app, "DRAIN_CHECK_INTERVAL", 0.01)
+    closed: list[bool] = []
+
+    class Listener:
+        def close(self) -> None:
+            closed.append(True)
+
+    class Server:
+        servers = [Listener()]
+
+    monkeypatch.setattr(shiny._prefork, "_worker_server", Server())
+
+    app = App(ui.page_fluid(), None)
+    app._workers = Workers(str(tmp_path))
+    app._workers.forwarding = 1
+
+    task = asyncio.create_task(app.drain())
+    await asyncio.sleep(0.05)
+    # The worker stops accepting connections, and waits for the forwarded request
+    assert closed == [True]
+    assert not task.done()
+
+    app._workers.forwarding = 0
+    await asyncio.wait_for(task, 1)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="No SIGUSR1")
+@pytest.mark.asyncio
+async def test_drain_on_sigusr1_is_opt_in():
+    sig = getattr(signal, "SIGUSR1")
+
+    app = App(ui.page_fluid(), None)
+    async with app._lifespan(app.starlette_app):
+        assert signal.getsignal(sig) is signal.SIG_DFL
+
+    app = App(ui.page_fluid(), None, drain_on_sigusr1=True)
+    async with app._lifespan(app.starlette_app):
+        assert signal.getsignal(sig) is not signal.SIG_DFL
+    assert signal.getsignal(sig) is signal.SIG_DFL
@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+import shiny
+from shiny import render, ui
+
+# Modules with heavy dependencies that `import shiny` should not import
+LAZY_MODULES = (
+    "click",
+    "narwhals",
+    "shiny._main",
+    "shiny.render._data_frame",
+    "shiny.ui._chat",
+    "shiny.ui._markdown_stream",
+    "uvicorn",
+)
+
+
+def test_import_shiny_defers_heavy_modules():
+    # Import shiny in a fresh interpreter, where no other test has imported the lazy
+    # modules yet
+    code = "import json, sys, shiny; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    imported = set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    assert "shiny" in imported
+    for module in LAZY_MODULES:
+        assert module not in imported
+
+
+def test_lazy_attributes():
+    from shiny._main import run_app
+    from shiny.render._data_frame import DataGrid, data_frame
+    from shiny.render._data_frame_utils._selection import CellSelection
+    from shiny.ui._chat import Chat
+    from shiny.ui._markdown_stream import output_markdown_stream
+
+    assert shiny.run_app is run_app
+    assert render.data_frame is data_frame
+    assert render.DataGrid is DataGrid
+    assert render.CellSelection is CellSelection
+    assert ui.Chat is Chat
+    assert ui.output_markdown_stream is output_markdown_stream
+
+    for name in ui.__all__:
+        assert hasattr(ui, name)
+    for name in render.__all__:
+        assert hasattr(render, name)
+
+
+@pytest.mark.parametrize("module", [shiny, render, ui])
+def test_lazy_attributes_missing(module: ModuleType):
+    with pytest.raises(AttributeError, match="has no attribute 'not_an_attribute'"):
+        module.not_an_attribute
@@ -0,0 +1,65 @@
+from htmltools import HTMLDependency, TagList, tags
+
+from shiny import module, ui
+
+dep = HTMLDependency("memo-dep", "1.0", source={"subdir": "."}, script={"src": "x.js"})
+
+
+def test_memoize_caches_rendered_ui():
+    calls: list[str] = []
+
+    @ui.memoize
+    def header(title: str, *, level: int = 2):
+        calls.append(title)
+        return ui.div(tags.h2(title, class_=f"level-{level}"), dep)
+
+    expected = TagList(ui.div(tags.h2("Hi", class_="level-2"), dep)).render()
+
+    first = header("Hi")
+    second = header("Hi")
+    assert calls == ["Hi"]
+    assert isinstance(first, TagList)
+    assert first.render() == expected
+    assert second.render() == expected
+
+    # Different arguments are rendered separately
+    assert "level-3" in str(header("Hi", level=3))
+    assert "Bye" in str(header("Bye"))
+    assert calls == ["Hi", "Hi", "Bye"]
+
+    # The returned UI can be used as a child of other UI
+    page = ui.page_fluid(header("Hi")).render()
+    assert '<h2 class="level-2">Hi</h2>' in page["html"]
+    assert dep in page["dependencies"]
+
+
+def test_memoize_uses_module_namespace():
+    @ui.memoize
+    def text(label: str):
+        return ui.input_text("txt", label)
+
+    @module.ui
+    def mod_ui():
+        return text("Label")
+
+    assert 'id="txt"' in str(text("Label"))
+    assert 'id="mod-txt"' in str(mod_ui("mod"))
+    assert 'id="txt"' in str(text("Label"))
+
+
+def test_memoize_unhashable_args_and_max_size():
+    calls: list[object] = []
+
+    @ui.memoize(max_size=1)
+    def items(x: object):
+        calls.append(x)
+        return ui.div(str(x))
+
+    items(["a"])
+    items(["a"])
+    assert calls == [["a"], ["a"]]
+
+    items("a")
+    items("b")
+    items("a")
+    assert calls[2:] == ["a", "b", "a"]
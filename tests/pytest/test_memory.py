@@ -0,0 +1,284 @@
+"""Tests for `shiny.session.MemoryAccounting`."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shiny import App, reactive, ui
+from shiny._connection import MockConnection
+from shiny.session import MemoryAccounting, session_context
+from shiny.session._memory import session_hash
+
+
+def create_app(**kwargs: object) -> App:
+    return App(
+        ui.page_fluid(),
+        None,
+        memory_accounting=MemoryAccounting(check_interval=0, **kwargs),  # type: ignore
+    )
+
+
+def test_memory_usage():
+    app = create_app()
+    session = app._create_session(MockConnection())
+    session.input["n"]._set(1000)
+
+    with session_context(session):
+        data = reactive.Value(b"x" * 10_000)
+
+        @reactive.calc
+        def doubled() -> bytes:
+            return data() * 2
+
+        @reactive.calc
+        def same() -> bytes:
+            return data()
+
+    with reactive.isolate():
+        doubled()
+        same()
+
+    (usage,) = app.memory_usage()
+    assert usage["id"] == session.id
+
+    nodes = {(node["kind"], node["name"]): node["bytes"] for node in usage["nodes"]}
+    assert nodes[("calc", "doubled")] > 20_000
+    # Objects shared by several nodes are only counted once
+    assert (
+        nodes[("calc", "same")] + nodes[("value", "(other reactive values)")] < 11_000
+    )
+    assert 0 < nodes[("input", "n")] < 100
+    assert usage["bytes"] == sum(nodes.values())
+    assert usage["nodes"][0]["name"] == "doubled"
+
+
+def test_memory_usage_of_data_frames():
+    pd = pytest.importorskip("pandas")
+    pl = pytest.importorskip("polars")
+
+    app = create_app()
+    session = app._create_session(MockConnection())
+    pd_df = pd.DataFrame({"x": range(10_000)})
+    pl_df = pl.DataFrame({"x": range(10_000)})
+    with session_context(session):
+        values: list[reactive.Value[Any]] = [
+            reactive.Value(pd_df),
+            reactive.Value(pl_df),
+        ]
+
+    (usage,) = app.memory_usage()
+    total = pd_df.memory_usage(deep=True).sum() + pl_df.estimated_size()
+    assert usage["bytes"] >= total
+    assert len(values) == 2
+
+
+def test_memory_usage_requires_accounting():
+    with pytest.raises(RuntimeError, match="memory_accounting"):
+        App(ui.page_fluid(), None).memory_usage()
+
+    with pytest.raises(ValueError, match="soft_limit"):
+        MemoryAccounting(soft_limit=2, hard_limit=1)
+
+
+@pytest.mark.asyncio
+async def test_memory_soft_limit_evicts_calcs():
+    app = create_app(soft_limit=5_000)
+    session = app._create_session(MockConnection())
+    runs: list[int] = []
+
+    with session_context(session):
+        n = reactive.Value(10_000)
+
+        @reactive.calc
+        def big() -> bytes:
+            return b"x" * n()
+
+        @reactive.effect
+        def _():
+            runs.append(len(big()))
+
+    await reactive.flush()
+    assert runs == [10_000]
+    assert big._exec_count == 1
+
+    assert await session._memory.check()  # type: ignore
+    assert big._value == []
+    assert app.memory_usage()[0]["bytes"] < 5_000
+
+    # The calc is recomputed when read, and its dependents are invalidated, since the
+    # value may have changed (but not the reader)
+    with reactive.isolate():
+        assert len(big()) == 10_000
+    assert big._exec_count == 2
+    await reactive.flush()
+    assert runs == [10_000, 10_000]
+    assert big._exec_count == 2
+
+    # ...and it's still invalidated by its dependencies
+    n.set(20)
+    await reactive.flush()
+    assert runs == [10_000, 10_000, 20]
+    assert big._exec_count == 3
+
+
+@pytest.mark.asyncio
+async def test_memory_hard_limit_closes_session():
+    app = create_app(soft_limit=1_000, hard_limit=5_000)
+    session = app._create_session(MockConnection())
+    session.input["n"]._set("x" * 10_000)
+    assert session.id in app._sessions
+
+    assert not await session._memory.check()  # type: ignore
+    assert session.id not in app._sessions
+
+
+@pytest.mark.asyncio
+async def test_memory_evicted_calc_reader_is_not_invalidated():
+    app = create_app()
+    session = app._create_session(MockConnection())
+    runs: list[int] = []
+
+    with session_context(session):
+
+        @reactive.calc
+        def value() -> str:
+            return "x" * 1000
+
+        @reactive.effect
+        def _():
+            runs.append(len(value()))
+
+    await reactive.flush()
+    assert session._memory is not None
+    assert session._memory.evict_calcs() > 0
+
+    # The effect that reads the evicted calc gets the recomputed value, and isn't
+    # invalidated by it
+    with session_context(session):
+        runs_before = len(runs)
+
+        @reactive.effect
+        def _():
+            runs.append(len(value()))
+
+    await reactive.flush()
+    assert runs[runs_before:] == [1000, 1000]
+    assert value._exec_count == 2
+    await reactive.flush()
+    assert len(runs) == runs_before + 2
+
+
+def test_node_tracking_is_disabled_on_shutdown(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("httpx")
+    from starlette.testclient import TestClient
+
+    from shiny.reactive import _reactives
+    from shiny.session import _memory
+
+    monkeypatch.setattr(_memory, "_node_tracking_count", 0)
+    monkeypatch.setattr(_reactives, "_track_node", None)
+
+    app1, app2 = create_app(), create_app()
+    assert _reactives._track_node is not None
+    with TestClient(app1):
+        pass
+    # The other app still tracks its sessions' objects
+    assert _reactives._track_node is not None
+    with TestClient(app2):
+        pass
+    assert _reactives._track_node is None
+
+
+def test_memory_endpoint():
+    pytest.importorskip("httpx")
+    from starlette.testclient import TestClient
+
+    app = create_app(endpoint="/admin/memory")
+    session = app._create_session(MockConnection())
+    session.input["n"]._set(1)
+
+    res = TestClient(app).get("/admin/memory")
+    assert res.status_code == 200
+    info: dict[str, Any] = res.json()
+    sessions: list[dict[str, Any]] = info["sessions"]
+    assert [s["id"] for s in sessions] == [session_hash(session.id)]
+    assert info["bytes"] == sessions[0]["bytes"] > 0
+    assert session.id not in str(info)
+
+
+@pytest.mark.asyncio
+async def test_memory_idle_timeout_evicts_calcs():
+    app = create_app(idle_timeout=0.05)
+    session = app._create_session(MockConnection())
+    memory = session._memory
+    assert memory is not None
+
+    with session_context(session):
+
+        @reactive.calc
+        def value() -> str:
+            return "x" * 1000
+
+    with reactive.isolate():
+        value()
+
+    memory.start()
+    memory.on_activity()
+    await asyncio.sleep(0.02)
+    assert value._value != []
+    await asyncio.sleep(0.1)
+    assert value._value == []
+
+    with reactive.isolate():
+        value()
+    memory.on_activity()
+    await asyncio.sleep(0.1)
+    assert value._value == []
+    assert value._exec_count == 2
+
+    await session.close()
+    assert memory._idle_task is None
+
+
+@pytest.mark.asyncio
+async def test_memory_offload_dir(tmp_path: Path):
+    app = create_app(offload_dir=tmp_path)
+    session = app._create_session(MockConnection())
+    memory = session._memory
+    assert memory is not None
+
+    with session_context(session):
+
+        @reactive.calc
+        def value() -> dict[str, str]:
+            return {"x": "x" * 1000}
+
+        @reactive.calc
+        def unpicklable() -> object:
+            return threading.Lock()
+
+    with reactive.isolate():
+        value()
+        unpicklable()
+
+    assert memory.evict_calcs() > 1000
+    assert value._value == [] and unpicklable._value == []
+    assert len(list(tmp_path.glob("*/*.pickle"))) == 1
+
+    # Offloaded values are read back instead of recomputed, and their files removed
+    with reactive.isolate():
+        assert value() == {"x": "x" * 1000}
+        unpicklable()
+    assert value._exec_count == 1
+    assert unpicklable._exec_count == 2
+    gc.collect()
+    assert list(tmp_path.glob("*/*.pickle")) == []
+
+    await session.close()
+    assert list(tmp_path.iterdir()) == []
@@ -7,6 +7,14 @@ from typing import Dict, Set
 from tests.pytest._utils import skip_on_windows
 
 known_entries: Dict[str, Set[str]] = {
+    # narwhals `DataFrame.filter()`, not playwright's `Locator.filter()`
+    "shiny/plotutils.py": {
+        "frame = frame.filter(_all_horizontal(frame, keep_rows))",
+    },
+    # narwhals `LazyFrame.filter()`
+    "shiny/render/_data_frame_utils/_sort_filter.py": {
+        "nw_lazy = nw_lazy.filter(expr)",
+    },
     # "tests/pytest/test_poll.py": {
     #     "my_locator.filter('foo')",
     # }
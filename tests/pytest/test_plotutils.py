@@ -0,0 +1,171 @@
+"""Tests for `shiny.plotutils`."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shiny.plotutils import (
+    PointIndex,
+    brushed_points,
+    near_points,
+    to_float,
+    within_brush,
+)
+from shiny.types import BrushInfo
+
+
+def make_df(n: int = 2000) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    x = rng.uniform(1, 100, n)
+    y = rng.normal(50, 20, n)
+    # A few values that need special handling: missing, and out of the plot range
+    x[:3] = np.nan
+    y[3:6] = [-1e6, 1e6, np.inf]
+    return pd.DataFrame(
+        {
+            "x": x,
+            "y": y,
+            "panel": rng.choice(["a", "b"], n),
+        },
+        index=rng.permutation(n),
+    )
+
+
+def make_info(
+    px: float, py: float, *, logx: float | None = None, panel: str | None = None
+) -> Any:
+    mapping: dict[str, Any] = {"x": "x", "y": "y"}
+    info: dict[str, Any] = {
+        "x": px,
+        "y": py,
+        "coords_css": {"x": 0, "y": 0},
+        "coords_img": {"x": px, "y": py},
+        "img_css_ratio": {"x": 2, "y": 2},
+        "mapping": mapping,
+        "domain": {
+            "left": 0 if logx is None else 0.5,
+            "right": 100 if logx is None else 2,
+            "bottom": 0,
+            "top": 100,
+        },
+        "range": {"left": 10, "right": 810, "bottom": 610, "top": 10},
+        "log": {"x": logx, "y": None},
+    }
+    if panel is not None:
+        mapping["panelvar1"] = "panel"
+        info["panelvar1"] = panel
+    return info
+
+
+@pytest.mark.parametrize("logx", [None, 10])
+@pytest.mark.parametrize("panel", [None, "b"])
+@pytest.mark.parametrize(
+    "point", [(400, 300), (10, 300), (805, 605), (400, 10), (-50, -50)]
+)
+def test_point_index_near_matches_near_points(
+    point: tuple[float, float], logx: float | None, panel: str | None
+):
+    df = make_df()
+    index = PointIndex(df)
+    info = make_info(*point, logx=logx, panel=panel)
+
+    for threshold, max_points in [(5, None), (30, None), (30, 4)]:
+        expected = near_points(df, info, threshold=threshold, max_points=max_points)
+        rows = index.near(info, threshold=threshold, max_points=max_points)
+        assert set(df.iloc[rows].index) == set(expected.index)
+        assert len(rows) == len(expected)
+
+    # The index is reused for later events
+    assert len(index._grids) == 1
+
+
+def test_point_index_near_order():
+    df = pd.DataFrame({"x": [50.0, 51.0, 50.5, 90.0], "y": [50.0, 50.0, 50.0, 50.0]})
+    info = make_info(410, 310)
+
+    rows = PointIndex(df).near(info, threshold=10)
+    assert list(rows) == [0, 2, 1]
+    assert list(rows) == list(
+        df.index.get_indexer(near_points(df, info, threshold=10).index)
+    )
+
+
+@pytest.mark.parametrize("direction", ["x", "y", "xy"])
+def test_point_index_brushed_matches_brushed_points(direction: str):
+    df = make_df()
+    brush = make_info(0, 0, panel="a")
+    brush.update(
+        {"xmin": 20, "xmax": 40.5, "ymin": 30, "ymax": 1e6, "direction": direction}
+    )
+
+    expected = brushed_points(df, brush)
+    rows = PointIndex(df).brushed(brush)
+    assert list(df.iloc[rows].index) == list(expected.index)
+
+
+def test_point_index_empty():
+    df = make_df()
+    index = PointIndex(df)
+    assert len(index.near(None)) == 0
+    assert len(index.brushed(None)) == 0
+
+    with pytest.raises(ValueError, match="not in names of input"):
+        PointIndex(df, xvar="missing").near(make_info(0, 0))
+
+    info = make_info(0, 0)
+    info["mapping"] = {}
+    with pytest.raises(ValueError, match="not able to automatically infer `xvar`"):
+        index.near(info)
+
+
+def test_plotutils_polars():
+    pl = pytest.importorskip("polars")
+
+    df = make_df()
+    pl_df = pl.from_pandas(df.reset_index(drop=True))
+
+    info = make_info(400, 300, panel="a")
+    expected = near_points(df, info, threshold=30, add_dist=True)
+    actual = near_points(pl_df, info, threshold=30, add_dist=True)
+    assert isinstance(actual, pl.DataFrame)
+    assert actual["dist"].to_list() == expected["dist"].to_list()
+    assert list(PointIndex(pl_df).near(info, threshold=30)) == list(
+        df.index.get_indexer(expected.index)
+    )
+
+    brush = make_info(0, 0)
+    brush.update({"xmin": 20, "xmax": 40.5, "ymin": 30, "ymax": 60, "direction": "xy"})
+    expected = brushed_points(df, brush, all_rows=True)
+    actual = brushed_points(pl_df, brush, all_rows=True)
+    assert isinstance(actual, pl.DataFrame)
+    assert actual["selected_"].to_list() == expected["selected_"].to_list()
+
+    # Lazy frames stay lazy
+    lazy = brushed_points(pl_df.lazy(), brush)
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect()["x"].to_list() == brushed_points(df, brush)["x"].to_list()
+
+
+def test_to_float_and_within_brush():
+    x = pd.Series([1.5, 2.0, 3.0], index=[10, 20, 30])
+    assert to_float(x) is x
+
+    s = pd.Series(["b", "a", None, "b"], index=[3, 2, 1, 0])
+    s_float = to_float(s)
+    assert isinstance(s_float, pd.Series)
+    assert list(s_float.index) == [3, 2, 1, 0]
+    assert s_float.tolist() == [2.0, 1.0, 0.0, 2.0]
+
+    dates = pd.Series(pd.to_datetime(["1970-01-02", "1970-01-03"]).astype("M8[s]"))
+    assert to_float(dates).tolist() == [1.0, 2.0]
+    assert to_float(pd.DatetimeIndex(dates)).tolist() == [1.0, 2.0]
+
+    brush = cast(BrushInfo, {"xmin": 2, "xmax": 3})
+    keep = within_brush(x, brush, "x")
+    assert isinstance(keep, pd.Series)
+    assert keep.tolist() == [False, True, True]
+    assert list(keep.index) == [10, 20, 30]
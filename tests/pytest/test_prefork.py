@@ -0,0 +1,59 @@
+"""Tests for `shiny run --workers --preload`."""
+
+from __future__ import annotations
+
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from shiny._utils import random_port
+
+APP = """
+import os
+from pathlib import Path
+from shiny import App, ui
+
+with open(Path(__file__).parent / "loads.txt", "a") as f:
+    f.write(f"{os.getpid()}\\n")
+
+app = App(ui.page_fluid("Hello"), None)
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires fork")
+def test_workers_are_forked_from_loaded_app(tmp_path: Path):
+    (tmp_path / "app.py").write_text(APP)
+    port = random_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "shiny", "run", "--workers", "2", "--preload"]
+        + ["--port", str(port), str(tmp_path / "app.py")],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/") as res:
+                    assert b"Hello" in res.read()
+                break
+            except OSError:
+                if time.monotonic() > deadline or proc.poll() is not None:
+                    raise
+                time.sleep(0.1)
+    finally:
+        proc.send_signal(signal.SIGINT)
+        output, _ = proc.communicate(timeout=30)
+
+    assert proc.returncode == 0, output
+    assert "Started parent process" in output
+    assert output.count("Application startup complete") == 2
+    assert "Traceback" not in output
+    # The app was only loaded by the parent process
+    assert (tmp_path / "loads.txt").read_text().split() == [str(proc.pid)]
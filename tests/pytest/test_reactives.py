@@ -8,7 +8,8 @@ import pytest
 from shiny import App, render, req, ui
 from shiny._connection import MockConnection
 from shiny.reactive import Value, calc, effect, event, flush, invalidate_later, isolate
-from shiny.reactive._core import ReactiveWarning
+from shiny.reactive._core import Context, Dependents, ReactiveWarning
+from shiny.reactive._reactives import Calc_
 from shiny.types import ActionButtonValue, SilentException
 
 from .mocktime import MockTime
@@ -221,6 +222,29 @@ async def test_recursive_async_calc():
         assert v() == 0
 
 
+def test_sync_calc_runs_without_coroutines(monkeypatch: pytest.MonkeyPatch):
+    def no_coroutines(self: Calc_[int]):
+        raise AssertionError("A sync calc should not create coroutines")
+
+    monkeypatch.setattr(Calc_, "get_value", no_coroutines)
+    monkeypatch.setattr(Calc_, "update_value", no_coroutines)
+
+    v = Value(1)
+
+    @calc()
+    def r() -> int:
+        return v() * 2
+
+    with isolate():
+        assert r() == 2
+        assert r() == 2
+        assert r._exec_count == 1
+
+        v.set(2)
+        assert r() == 4
+        assert r._exec_count == 2
+
+
 # ======================================================================
 # async
 # ======================================================================
@@ -660,6 +684,32 @@ async def test_dependent_invalidation():
     assert error_occurred is False
 
 
+def test_dependents_invalidate_in_creation_order():
+    dependents = Dependents()
+    contexts = [Context() for _ in range(4)]
+    invalidated: list[int] = []
+    for ctx in contexts:
+        ctx.on_invalidate(lambda ctx=ctx: invalidated.append(ctx.id))
+
+    # Register out of creation order, and more than once
+    for i in [2, 0, 3, 0, 1]:
+        with contexts[i]():
+            dependents.register()
+
+    contexts[3].invalidate()
+    assert list(dependents._dependents) == [contexts[i].id for i in [2, 0, 1]]
+
+    dependents.invalidate()
+    assert invalidated == [contexts[i].id for i in [3, 0, 1, 2]]
+    assert dependents._dependents == {}
+    assert all(ctx._dependencies is None for ctx in contexts)
+
+    # Invalidated contexts are not registered again
+    with contexts[0]():
+        dependents.register()
+    assert dependents._dependents == {}
+
+
 # ------------------------------------------------------------
 # req() pauses execution in @effect() and @calc()
 # ------------------------------------------------------------
@@ -0,0 +1,146 @@
+"""Tests for reconnecting to sessions (`App(reconnect_timeout=)`)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+from shiny._connection import ConnectionClosed, MockConnection, ResumableConnection
+
+
+class RecordingConnection(MockConnection):
+    def __init__(self):
+        super().__init__()
+        self.sent: list[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+
+@pytest.mark.asyncio
+async def test_resumable_connection_sends_missed_messages():
+    conn1 = RecordingConnection()
+    conn = ResumableConnection(conn1, timeout=10)
+
+    await conn.send("a")
+    await conn.send("b")
+    conn1.cause_receive('{"ack":1}')
+    conn1.cause_receive("x")
+    assert await conn.receive() == "x"
+    assert list(conn._replay) == ["b"]
+
+    conn1.cause_disconnect()
+    receive = asyncio.create_task(conn.receive())
+    await asyncio.sleep(0)
+    await conn.send("c")
+    assert conn1.sent == ["a", "b"]
+
+    # Messages that are no longer kept can't be sent again
+    assert not await conn.resume(RecordingConnection(), 0)
+    assert not await conn.resume(RecordingConnection(), 4)
+
+    conn2 = RecordingConnection()
+    resume = asyncio.create_task(conn.resume(conn2, 1))
+    conn2.cause_receive("y")
+    assert await receive == "y"
+    assert conn2.sent == ["b", "c"]
+
+    # The client may reconnect before its previous connection is known to be lost
+    conn3 = RecordingConnection()
+    resume3 = asyncio.create_task(conn.resume(conn3, 3))
+    await asyncio.sleep(0)
+    assert await resume
+    await conn.send("d")
+    assert conn2.sent == ["b", "c"]
+    assert conn3.sent == ["d"]
+
+    await conn.close(1001, None)
+    assert await resume3
+    with pytest.raises(ConnectionClosed):
+        await conn.receive()
+
+
+@pytest.mark.asyncio
+async def test_resumable_connection_timeout():
+    conn1 = MockConnection()
+    conn = ResumableConnection(conn1, timeout=0.05)
+    conn1.cause_disconnect()
+    with pytest.raises(ConnectionClosed):
+        await asyncio.wait_for(conn.receive(), 1)
+    assert not await conn.resume(MockConnection(), 0)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_to_session():
+    runs: list[int] = []
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @reactive.calc
+        def doubled() -> int:
+            runs.append(input.n())
+            return input.n() * 2
+
+        @render.text
+        def txt():
+            return str(doubled())
+
+    app = App(ui.page_fluid(), server, reconnect_timeout=10)
+    assert "reconnect.js" in app._render_page(ui.page_fluid(), "lib/")["html"]
+
+    conn1 = RecordingConnection()
+    session = app._create_session(conn1)
+    run = asyncio.create_task(session._run())
+    conn1.cause_receive(
+        '{"method":"init","data":{"n":1,".clientdata_output_txt_hidden":false}}'
+    )
+    await asyncio.sleep(0.05)
+
+    messages = [json.loads(x) for x in conn1.sent]
+    assert messages[1] == {"allowReconnect": True}
+    token: str = messages[2]["custom"]["shiny.resume"]
+    assert any(x.get("values") == {"txt": "2"} for x in messages)
+    received = len(conn1.sent)
+
+    # The session is kept while the client is away
+    conn1.cause_disconnect()
+    await asyncio.sleep(0.05)
+    assert session.id in app._sessions
+    assert not await app._resume_session("unknown", MockConnection(), "0")
+
+    conn2 = RecordingConnection()
+    resume = asyncio.create_task(app._resume_session(token, conn2, str(received)))
+    conn2.cause_receive(
+        '{"method":"init","data":{"n":1,".clientdata_output_txt_hidden":false}}'
+    )
+    conn2.cause_receive('{"method":"update","data":{"n":2}}')
+    await asyncio.sleep(0.05)
+    assert runs == [1, 2]
+    values = [json.loads(x)["values"] for x in conn2.sent if '"values"' in x]
+    assert [x for x in values if x] == [{"txt": "4"}]
+
+    await session.close()
+    assert await resume
+    await run
+    assert session.id not in app._sessions
+
+
+@pytest.mark.asyncio
+async def test_reconnect_to_ended_session():
+    app = App(ui.page_fluid(), None, reconnect_timeout=10)
+    conn1 = RecordingConnection()
+    session = app._create_session(conn1)
+    run = asyncio.create_task(session._run())
+    conn1.cause_receive('{"method":"init","data":{}}')
+    await asyncio.sleep(0.05)
+    assert isinstance(session._conn, ResumableConnection)
+    token = session._conn.token
+
+    # A client that missed too many messages starts over
+    conn1.cause_disconnect()
+    await asyncio.sleep(0.05)
+    assert not await app._resume_session(token, MockConnection(), "1000")
+    await run
+    assert session.id not in app._sessions
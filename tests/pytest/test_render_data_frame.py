@@ -1,14 +1,17 @@
+import warnings
 from typing import Any, cast
 
 import pandas as pd
 import pytest
 from htmltools import TagChild, TagList
 
-from shiny import reactive, render
+from shiny import App, reactive, render, ui
+from shiny._connection import MockConnection
 from shiny._deprecated import ShinyDeprecationWarning
 from shiny._utils import wrap_async
 from shiny.render._data_frame_utils._selection import SelectionModes
 from shiny.render._data_frame_utils._tbl_data import as_data_frame
+from shiny.render._data_frame_utils._types import ColumnFilter, ColumnSort
 from shiny.session._session import (
     RenderedDeps,
     ResolvedId,
@@ -163,3 +166,511 @@ async def test_update_cell_value_assertions():
             with pytest.raises(ValueError) as e:
                 await df.update_cell_value("a", row=-1, col=0)
             assert "`row` to be greater than" in str(e.value)
+
+
+def test_index_runs_input_handlers():
+    from shiny.input_handler import input_handlers
+
+    def process(type: str, value: object) -> object:
+        return input_handlers._process_value(type, value, ResolvedId("x"), test_session)
+
+    assert process("shiny.dataframe.indices", {"runs": []}) == ()
+    assert process("shiny.dataframe.indices", {"runs": [0, 4]}) == (0, 1, 2, 3)
+    assert process("shiny.dataframe.indices", {"runs": [9, -3, 1, 2, 10, 1]}) == (
+        9,
+        8,
+        7,
+        1,
+        2,
+        10,
+    )
+    # Plain arrays of indices (sent when the runs wouldn't be shorter) and `None` are
+    # also accepted
+    assert process("shiny.dataframe.indices", [3, 1]) == (3, 1)
+    assert process("shiny.dataframe.indices", None) is None
+
+    assert process(
+        "shiny.dataframe.cellSelection", {"type": "row", "rows": {"runs": [5, -2]}}
+    ) == {"type": "row", "rows": (5, 4)}
+    assert process("shiny.dataframe.cellSelection", {"type": "none"}) == {
+        "type": "none"
+    }
+    assert process("shiny.dataframe.cellSelection", None) is None
+
+
+def test_as_index_array():
+    import numpy as np
+
+    from shiny.render._data_frame_utils._indices import as_index_array
+
+    arr = as_index_array((4, 0, 2))
+    assert arr.dtype == np.intp
+    assert arr.tolist() == [4, 0, 2]
+    assert as_index_array(()).tolist() == []
+
+    # Index arrays subset data frames like sequences of row numbers do
+    from shiny.render._data_frame_utils._tbl_data import subset_frame
+
+    nw_df = as_data_frame(pd.DataFrame({"a": [10, 11, 12, 13, 14]}))
+    assert subset_frame(nw_df, rows=arr)["a"].to_list() == [14, 10, 12]
+
+
+def test_patched_frame_applies_new_patches():
+    from shiny.render._data_frame_utils._patch import PatchedFrame
+
+    pd_data = pd.DataFrame({"a": ["1", "2", "3"], "b": ["4", "5", "6"]})
+    nw_data = as_data_frame(pd_data)
+    patched_frame: PatchedFrame[pd.DataFrame] = PatchedFrame()
+
+    assert patched_frame.apply(nw_data) is nw_data
+    assert patched_frame.pop_dirty_rows() is None
+
+    patched_frame.add([{"row_index": 0, "column_index": 0, "value": "10"}])
+    first = patched_frame.apply(nw_data)
+    assert first["a"].to_list() == ["10", "2", "3"]
+
+    patched_frame.add(
+        [
+            {"row_index": 2, "column_index": 1, "value": "60"},
+            {"row_index": 2, "column_index": 1, "value": "61"},
+        ]
+    )
+    second = patched_frame.apply(nw_data)
+    assert second["a"].to_list() == ["10", "2", "3"]
+    assert second["b"].to_list() == ["4", "5", "61"]
+    assert len(patched_frame.patches) == 2
+    assert patched_frame.pop_dirty_rows() == {0, 2}
+    assert patched_frame.pop_dirty_rows() == set()
+
+    # Neither the data nor previous results are modified in place
+    assert pd_data["a"].to_list() == ["1", "2", "3"]
+    assert pd_data["b"].to_list() == ["4", "5", "6"]
+    assert first["b"].to_list() == ["4", "5", "6"]
+
+    # New data has all patches applied to it
+    other = as_data_frame(pd.DataFrame({"a": ["0", "0", "0"], "b": ["0", "0", "0"]}))
+    assert patched_frame.apply(other)["b"].to_list() == ["0", "0", "61"]
+
+    version = patched_frame.version
+    patched_frame.clear()
+    assert patched_frame.version > version
+    assert patched_frame.patches == {}
+    assert patched_frame.apply(nw_data) is nw_data
+    assert patched_frame.pop_dirty_rows() is None
+
+
+def test_cell_patch_map_is_a_snapshot():
+    pd_data = pd.DataFrame({"a": ["1", "2"]})
+
+    @render.data_frame
+    def df():
+        return pd_data
+
+    df._session = test_session
+
+    with session_context(test_session):
+        with reactive.isolate():
+            df._value.set(render.DataGrid(pd_data))
+            before = df._cell_patch_map()
+
+            df._set_cell_patch_map_patches(
+                [{"row_index": 1, "column_index": 0, "value": "x"}]
+            )
+            after = df._cell_patch_map()
+            assert before == {}
+            assert after is not before
+            assert list(after) == [(1, 0)]
+
+            df._clear_cell_patches()
+            assert list(after) == [(1, 0)]
+            assert df._cell_patch_map() == {}
+
+
+@pytest.mark.asyncio
+async def test_styles_by_row_only_restyles_patched_rows():
+    pd_data = pd.DataFrame({"a": ["1", "2", "3", "4"]})
+    styled: list[list[str]] = []
+
+    def styles(data: pd.DataFrame) -> list[render.StyleInfo]:
+        styled.append(data["a"].to_list())
+        return [
+            {
+                "rows": [i for i, x in enumerate(data["a"]) if x.startswith("-")],
+                "class": "neg",
+            },
+            {"class": "cell"},
+        ]
+
+    @render.data_frame
+    def df():
+        return pd_data
+
+    sent: list[dict[str, Any]] = []
+
+    async def send_message_to_browser(handler: str, obj: dict[str, Any]):
+        sent.append(obj)
+
+    df._session = test_session
+    df._send_message_to_browser = send_message_to_browser
+
+    with session_context(test_session):
+        with reactive.isolate():
+            df._value.set(render.DataGrid(pd_data, styles=styles, styles_by_row=True))
+
+            # All rows are styled the first time
+            await df._attempt_update_cell_style()
+            assert styled == [["1", "2", "3", "4"]]
+
+            df._set_cell_patch_map_patches(
+                [{"row_index": 2, "column_index": 0, "value": "-3"}]
+            )
+            await df._attempt_update_cell_style()
+            assert styled[1:] == [["-3"]]
+            assert df.data_patched()["a"].to_list() == ["1", "2", "-3", "4"]
+
+        # The style update effect has no rows left to restyle
+        await reactive.flush()
+        assert len(sent) == 2
+
+    assert sent[-1]["styles"] == [
+        {"location": "body", "rows": (), "cols": None, "style": None, "class": "neg"},
+        {
+            "location": "body",
+            "rows": (0, 1, 3),
+            "cols": None,
+            "style": None,
+            "class": "cell",
+        },
+        {"location": "body", "rows": (2,), "cols": None, "style": None, "class": "neg"},
+        {
+            "location": "body",
+            "rows": (2,),
+            "cols": None,
+            "style": None,
+            "class": "cell",
+        },
+    ]
+
+
+def test_sort_filter_lazy_frame():
+    import narwhals.stable.v1 as nw
+
+    pl = pytest.importorskip("polars")
+    from shiny.render._data_frame_utils._sort_filter import sort_filter_lazy_frame
+
+    nw_lazy = nw.from_native(
+        pl.LazyFrame({"a": [3, 1, None, 2, 1], "b": ["x", "Y", "z", "xy", None]})
+    )
+
+    def rows(
+        sort: list[ColumnSort], filters: list[ColumnFilter]
+    ) -> list[tuple[Any, ...]]:
+        return sort_filter_lazy_frame(nw_lazy, sort, filters).collect().rows()
+
+    # Missing values are last, in either direction
+    ascending = rows([{"col": 0, "desc": False}], [])
+    assert [row[0] for row in ascending] == [1, 1, 2, 3, None]
+    descending = rows([{"col": 0, "desc": True}], [])
+    assert [row[0] for row in descending] == [3, 2, 1, 1, None]
+    # Case-insensitive substring filters
+    assert rows([], [{"col": 1, "value": "y"}]) == [(1, "Y"), (2, "xy")]
+    assert len(rows([], [{"col": 1, "value": ""}])) == 5
+    # Inclusive numeric ranges, with open ends
+    assert rows([], [{"col": 0, "value": (2, None)}]) == [(3, "x"), (2, "xy")]
+    assert rows([], [{"col": 0, "value": (None, 1)}]) == [(1, "Y"), (1, None)]
+    # Filters are combined
+    assert rows(
+        [{"col": 0, "desc": True}],
+        [{"col": 0, "value": (1, 3)}, {"col": 1, "value": "x"}],
+    ) == [(3, "x"), (2, "xy")]
+
+
+@pytest.mark.parametrize("library", ["pandas", "polars"])
+def test_sort_filter_engine(library: str):
+    from shiny.render._data_frame_utils._sort_filter import SortFilterEngine
+
+    data = {"a": [3, 1, None, 2, 1], "b": ["x", "Y", "z", "xy", None]}
+    if library == "pandas":
+        native = pd.DataFrame(data)
+    else:
+        pl = pytest.importorskip("polars")
+        native = pl.DataFrame(data)
+    engine = SortFilterEngine(as_data_frame(native))
+
+    # Missing values are last and ties keep their order, in either direction
+    assert engine.sorted_rows(()).tolist() == [0, 1, 2, 3, 4]
+    assert engine.sorted_rows([{"col": 0, "desc": False}]).tolist() == [1, 4, 3, 0, 2]
+    assert engine.sorted_rows([{"col": 0, "desc": True}]).tolist() == [0, 3, 1, 4, 2]
+    # Sorts are cached
+    sort: list[ColumnSort] = [{"col": 0, "desc": False}]
+    assert engine.sorted_rows(sort) is engine.sorted_rows(sort)
+
+    # Case-insensitive substring filters
+    assert engine.view_rows((), [{"col": 1, "value": "y"}]).tolist() == [1, 3]
+    assert engine.view_rows((), [{"col": 1, "value": ""}]).tolist() == [0, 1, 2, 3, 4]
+    # Inclusive numeric ranges, with open ends
+    assert engine.view_rows((), [{"col": 0, "value": (2, None)}]).tolist() == [0, 3]
+    assert engine.view_rows((), [{"col": 0, "value": (None, 1)}]).tolist() == [1, 4]
+    # Filters are combined and applied to the sorted rows
+    assert engine.view_rows(
+        [{"col": 0, "desc": True}],
+        [{"col": 0, "value": (1, 3)}, {"col": 1, "value": "x"}],
+    ).tolist() == [0, 3]
+
+
+@pytest.mark.asyncio
+async def test_server_sort_filter_render():
+    pd_data = pd.DataFrame({"a": [3, 1, 4, 2], "b": ["w", "x", "y", "z"]})
+
+    @render.data_frame
+    def df():
+        return render.DataGrid(
+            pd_data,
+            editable=True,
+            selection_mode="rows",
+            server_sort_filter=True,
+            max_rows=2,
+            styles=[{"rows": [1, 2], "class": "x"}],
+        )
+
+    session = App(ui.page_fluid(), None)._create_session(MockConnection())
+    df._session = session
+    messages: list[dict[str, Any]] = []
+
+    async def send_message(handler: str, obj: dict[str, Any]) -> None:
+        messages.append({"handler": handler, **obj})
+
+    df._send_message_to_browser = send_message
+
+    with session_context(session):
+        with reactive.isolate():
+            # Only the first rows are sent, with the styles of those rows
+            res = await df.render()
+            assert res is not None
+            payload = cast(dict[str, Any], res["payload"])
+            assert payload["data"] == [[3, "w"], [1, "x"]]
+            assert payload["options"]["styles"][0]["rows"] == (1,)
+            assert df.data()["a"].tolist() == [3, 1, 4, 2]
+
+        # The server sorts and filters all rows, and sends the first rows in view
+        session.input[f"{df.output_id}_column_sort"]._set([{"col": 0, "desc": True}])
+        session.input[f"{df.output_id}_column_filter"]._set(
+            [{"col": 0, "value": [2, None]}]
+        )
+        await reactive.flush()
+        assert [message["handler"] for message in messages] == [
+            "updateData",
+            "updateStyles",
+        ]
+        assert messages[0]["data"] == [[4, "y"], [3, "w"]]
+        assert messages[1]["styles"][0]["rows"] == (0,)
+        with reactive.isolate():
+            assert df.data_view_rows() == (2, 0, 3)
+            assert df.data_view_indices().tolist() == [2, 0, 3]
+            assert df.data_view()["a"].tolist() == [4, 3, 2]
+
+            # The browser's rows are positions within the rows it was sent
+            session.input[f"{df.output_id}_cell_selection"]._set(
+                {"type": "row", "rows": [1]}
+            )
+            assert df.cell_selection()["rows"] == (0,)
+            assert await df._patches_handler(
+                ({"row_index": 1, "column_index": 1, "value": "v"},)
+            ) == [{"row_index": 1, "column_index": 1, "value": "v"}]
+            assert df.cell_patches() == [
+                {"row_index": 0, "column_index": 1, "value": "v"}
+            ]
+
+        # Edits are kept when the rows in view change
+        messages.clear()
+        session.input[f"{df.output_id}_column_sort"]._set([{"col": 0, "desc": False}])
+        await reactive.flush()
+        assert messages[0]["handler"] == "updateData"
+        assert messages[0]["data"] == [[2, "z"], [3, "v"]]
+        with reactive.isolate():
+            assert df.cell_patches() == [
+                {"row_index": 0, "column_index": 1, "value": "v"}
+            ]
+            assert df.data_view_rows() == (3, 0, 2)
+
+            # New data is sorted and filtered in the same way
+            messages.clear()
+            await df.update_data(pd.DataFrame({"a": [9, 8, 1, 7], "b": list("abcd")}))
+            assert messages[0]["handler"] == "updateData"
+            assert messages[0]["data"] == [[7, "d"], [8, "b"]]
+            assert df.cell_patches() == []
+
+
+def test_lazy_frame_data():
+    pl = pytest.importorskip("polars")
+    from shiny.render._data_frame_utils._tbl_data import collect_lazy_frame
+
+    lazy = pl.LazyFrame({"a": [3, 1, None, 2]}).select(pl.col("a") + 1)
+
+    with pytest.warns(UserWarning, match="Only the first 2 rows"):
+        collected = collect_lazy_frame(lazy, max_rows=2)
+    assert isinstance(collected, pl.DataFrame)
+    assert collected["a"].to_list() == [4, 2]
+    # The sorting and filtering apply to all rows, before they're limited
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        collected = collect_lazy_frame(
+            lazy,
+            max_rows=2,
+            sort=[{"col": 0, "desc": True}],
+            filters=[{"col": 0, "value": (None, 3)}],
+        )
+    assert collected["a"].to_list() == [3, 2]
+    # Eager data is returned as is
+    assert collect_lazy_frame(collected, max_rows=1) is collected
+
+    grid = render.DataGrid(lazy, max_rows=3)
+    assert grid.data is lazy
+    with pytest.warns(UserWarning, match="Only the first 3 rows"):
+        assert grid.to_payload()["data"] == [[4], [2], [None]]
+
+    # Only some rows are collected, so edits couldn't be kept
+    with pytest.raises(ValueError, match="Lazy frames can't be edited"):
+        render.DataTable(lazy, editable=True)
+
+
+@pytest.mark.asyncio
+async def test_lazy_frame_render():
+    pl = pytest.importorskip("polars")
+
+    lazy = pl.LazyFrame({"a": [3, 1, 4, 2]})
+
+    @render.data_frame
+    def df():
+        return render.DataGrid(lazy, max_rows=2)
+
+    session = App(ui.page_fluid(), None)._create_session(MockConnection())
+    df._session = session
+    messages: list[dict[str, Any]] = []
+
+    async def send_message(handler: str, obj: dict[str, Any]) -> None:
+        messages.append({"handler": handler, **obj})
+
+    df._send_message_to_browser = send_message
+
+    with session_context(session):
+        with reactive.isolate():
+            with pytest.warns(UserWarning, match="Only the first 2 rows"):
+                await df.render()
+            assert df.data()["a"].to_list() == [3, 1]
+
+            with pytest.raises(ValueError, match="can't be updated"):
+                await df.update_cell_value("0", row=0, col=0)
+
+        # The rows are collected again, with the user's sorting and filtering
+        session.input[f"{df.output_id}_column_sort"]._set([{"col": 0, "desc": True}])
+        session.input[f"{df.output_id}_column_filter"]._set(
+            [{"col": 0, "value": [None, 3]}]
+        )
+        with pytest.warns(UserWarning, match="Only the first 2 rows"):
+            await reactive.flush()
+        with reactive.isolate():
+            assert df.data()["a"].to_list() == [3, 2]
+        assert messages[-1]["handler"] == "updateData"
+        assert messages[-1]["data"] == [[3], [2]]
+
+        # Other data is used as it is
+        with reactive.isolate():
+            await df.update_data(pl.DataFrame({"a": [5, 6, 7]}))
+            assert df.data()["a"].to_list() == [5, 6, 7]
+
+
+def test_style_info_vectorized_rows():
+    import narwhals.stable.v1 as nw
+
+    from shiny.render._data_frame_utils._styles import (
+        as_browser_style_infos,
+        encode_browser_style_infos,
+    )
+
+    a = pd.Series(range(10))
+    b = pd.Series([None] * 5 + [1.0] * 5)
+    pd_data = pd.DataFrame({"a": a, "b": b})
+
+    style_infos: list[render.StyleInfo] = [
+        {"rows": nw.col("a") >= 3, "class": "expr"},
+        {"rows": b.notna(), "class": "series"},
+        {"rows": nw.col("b") > 0, "class": "nulls"},
+    ]
+    infos = as_browser_style_infos(style_infos, into_data=pd_data)
+    assert [info["rows"] for info in infos] == [
+        tuple(range(3, 10)),
+        tuple(range(5, 10)),
+        tuple(range(5, 10)),
+    ]
+
+    with pytest.raises(TypeError, match="boolean dtype"):
+        bad_info: render.StyleInfo = {"rows": a, "class": "x"}
+        as_browser_style_infos([bad_info], into_data=pd_data)
+
+    # Consecutive rows are sent as runs
+    encoded = encode_browser_style_infos(
+        infos
+        + [
+            {
+                "location": "body",
+                "rows": (1, 4),
+                "cols": None,
+                "style": None,
+                "class": "y",
+            }
+        ]
+    )
+    assert encoded[0]["rows"] == {"runs": [3, 7]}
+    assert encoded[-1]["rows"] == (1, 4)
+
+
+def test_encode_index_runs():
+    import numpy as np
+
+    from shiny.input_handler import input_handlers
+    from shiny.render._data_frame_utils._indices import encode_index_runs
+
+    assert encode_index_runs(()) == []
+    assert encode_index_runs((9, 8, 7, 1, 2, 10)) == [9, -3, 1, 2, 10, 1]
+    assert encode_index_runs((1, 2, 3, 2, 1)) == [1, 3, 2, -2]
+    assert encode_index_runs(np.arange(5, 1000)) == [5, 995]
+
+    # Round trips through the browser's encoding
+    rows = (0, 1, 2, 7, 5, 4, 3, 20)
+    assert (
+        input_handlers._process_value(
+            "shiny.dataframe.indices",
+            {"runs": encode_index_runs(rows)},
+            ResolvedId("x"),
+            test_session,
+        )
+        == rows
+    )
+
+
+def test_data_view_rows_from_browser():
+    from shiny.input_handler import input_handlers
+
+    pd_data = pd.DataFrame({"a": [3, 1, 2]})
+
+    @render.data_frame
+    def df():
+        return pd_data
+
+    session = App(ui.page_fluid(), None)._create_session(MockConnection())
+    df._session = session
+    rows = input_handlers._process_value(
+        "shiny.dataframe.indices", {"runs": [2, -3]}, ResolvedId("x"), session
+    )
+    session.input[f"{df.output_id}_data_view_rows"]._set(rows)
+
+    with session_context(session):
+        with reactive.isolate():
+            df._value.set(render.DataGrid(pd_data))
+
+            # The input is a tuple of row numbers, as it was before runs were sent
+            assert rows == (2, 1, 0)
+            assert df.data_view_rows() == (2, 1, 0)
+            assert df.data_view_indices().tolist() == [2, 1, 0]
+            assert df.data_view()["a"].tolist() == [2, 1, 3]
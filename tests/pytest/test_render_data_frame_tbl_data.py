@@ -393,3 +393,38 @@ def test_dtype_coverage():
         errs.append(f"Missing: {dtype_name}")
 
     assert not errs, "Missing narwhals dtype implementations:\n" + "\n".join(errs)
+
+
+def test_serialize_frame_renders_html_cells_in_bulk():
+    process_ui_calls: list[TagChild] = []
+
+    class _CountingSession(_MockSession):
+        def _process_ui(self, ui: TagChild) -> RenderedDeps:
+            process_ui_calls.append(ui)
+            return super()._process_ui(ui)
+
+    html_dep2 = htmltools.HTMLDependency("test-dep", version="2", head="head-content")
+    link = span("link", html_dep)
+    df = pd.DataFrame(
+        {
+            "html": [link] * 500 + [span("other", html_dep2), None],
+            "num": range(502),
+        }
+    )
+
+    with session_context(cast(Session, _CountingSession())):
+        res = serialize_frame(df)
+
+    assert res["typeHints"][0] == {"type": "html"}
+    assert res["data"][0] == [
+        {"isShinyHtml": True, "obj": {"deps": [], "html": "<span>link</span>"}},
+        0,
+    ]
+    assert res["data"][500][0] == {
+        "isShinyHtml": True,
+        "obj": {"deps": [], "html": "<span>other</span>"},
+    }
+    assert res["data"][501] == [None, 501]
+    # Dependencies are deduped (keeping the latest version) and processed once
+    assert len(process_ui_calls) == 1
+    assert res.get("htmlDeps") == [html_dep2.as_dict()]
@@ -0,0 +1,163 @@
+"""Tests for `shiny.ui.SelectizeChoices` and server-side `update_selectize()`."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from urllib.parse import urlencode
+
+import pytest
+from starlette.requests import Request
+
+from shiny import App, ui
+from shiny._connection import MockConnection
+from shiny.session import session_context
+from shiny.ui._selectize_choices import shared_selectize_choices
+
+CHOICES = {
+    "ca": "California",
+    "co": "Colorado",
+    "ct": "Connecticut",
+    "ny": "New York",
+    "nj": "New Jersey",
+    "nc": "North Carolina",
+    "nd": "North Dakota",
+}
+
+
+def values(index: ui.SelectizeChoices, positions: list[int]) -> list[str]:
+    return [index._values[i] for i in positions]
+
+
+def test_search_matches_all_words():
+    index = ui.SelectizeChoices(CHOICES)
+    assert len(index) == len(CHOICES)
+
+    assert values(index, index.search("new", limit=10)) == ["ny", "nj"]
+    assert values(index, index.search("OR", limit=10)) == ["ca", "co", "ny", "nc", "nd"]
+    assert values(index, index.search("nor ar", limit=10)) == ["nc"]
+    assert values(index, index.search("north xyz", limit=10)) == []
+    assert values(index, index.search("", limit=3)) == ["ca", "co", "ct"]
+
+    # Matches of any word, in the order of the choices
+    assert values(index, index.search("jersey new", limit=10)) == ["nj"]
+    assert values(index, index.search("jersey york", limit=10, conjunction="or")) == [
+        "ny",
+        "nj",
+    ]
+
+
+def test_search_limit_and_exclude():
+    index = ui.SelectizeChoices(CHOICES)
+    assert values(index, index.search("o", limit=2)) == ["ca", "co"]
+    assert values(index, index.search("o", limit=2, exclude=["co"])) == ["ca", "ct"]
+    assert index.search("o", limit=0) == []
+    assert index.positions(["nd", "xx", "ca"]) == [0, 6]
+
+
+def test_search_fields_and_optgroups():
+    index = ui.SelectizeChoices(
+        {
+            "West": {"ca": "California", "co": "Colorado"},
+            "East": {"ny": "New York", "ct": "Connecticut"},
+        }
+    )
+    assert values(index, index.search("east", limit=10)) == []
+    assert values(index, index.search("east", limit=10, fields=["optgroup"])) == [
+        "ny",
+        "ct",
+    ]
+    assert values(index, index.search("c", limit=10, fields=["value"])) == [
+        "ca",
+        "co",
+        "ct",
+    ]
+    assert (
+        values(index, index.search("west york", limit=10, fields=["label", "optgroup"]))
+        == []
+    )
+    assert values(
+        index,
+        index.search(
+            "west york", limit=10, fields=["label", "optgroup"], conjunction="or"
+        ),
+    ) == ["ca", "co", "ny"]
+
+
+def test_search_uses_the_index_for_long_words():
+    labels = [f"item {i:05d}" for i in range(10_000)]
+    index = ui.SelectizeChoices(labels)
+    assert values(index, index.search("09 99", limit=5)) == [
+        "item 00099",
+        "item 00990",
+        "item 00991",
+        "item 00992",
+        "item 00993",
+    ]
+    assert values(index, index.search("0999", limit=5)) == [
+        "item 00999",
+        "item 09990",
+        "item 09991",
+        "item 09992",
+        "item 09993",
+    ]
+    assert index._indexes["label"]._ngrams is not None
+
+
+def test_custom_search():
+    calls: list[tuple[str, int]] = []
+
+    def search(query: str, limit: int) -> list[str]:
+        calls.append((query, limit))
+        return ["nd", "unknown", "ny", "nj"]
+
+    index = ui.SelectizeChoices(CHOICES, search=search)
+    assert values(index, index.search("x", limit=2, exclude=["ny"])) == ["nd", "nj"]
+    assert calls == [("x", 3)]
+
+
+@pytest.mark.asyncio
+async def test_update_selectize_server():
+    app = App(ui.page_fluid(), None)
+    session = app._create_session(MockConnection())
+    index = ui.SelectizeChoices(
+        {"ca": ui.tags.b("California"), "co": "Colorado", "ct": "Connecticut"}
+    )
+
+    async def get_choices(query: str) -> list[dict[str, Any]]:
+        (handler,) = session._dynamic_routes.values()
+        request = Request(
+            {
+                "type": "http",
+                "query_string": urlencode({"query": query, "maxop": 2}).encode(),
+            }
+        )
+        return json.loads((await handler(request)).body)  # type: ignore
+
+    with session_context(session):
+        ui.update_selectize("state", choices=index, selected="ct", server=True)
+
+    # Selected choices are always included
+    assert await get_choices("co") == [
+        {"value": "co", "label": "Colorado"},
+        {"value": "ct", "label": "Connecticut"},
+    ]
+    assert await get_choices("c") == [
+        {"value": "ca", "label": "<b>California</b>"},
+        {"value": "co", "label": "Colorado"},
+        {"value": "ct", "label": "Connecticut"},
+    ]
+
+
+def test_shared_selectize_choices():
+    choices = dict(CHOICES)
+
+    # Sessions that pass the same choices to `update_selectize()` share their index
+    index = shared_selectize_choices(choices)
+    assert shared_selectize_choices(choices) is index
+
+    # ...unless the choices were modified
+    choices["tx"] = "Texas"
+    new_index = shared_selectize_choices(choices)
+    assert new_index is not index
+    assert values(new_index, new_index.search("texas", limit=5)) == ["tx"]
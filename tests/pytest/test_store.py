@@ -0,0 +1,94 @@
+"""Tests for `shiny.store`."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from shiny import App, ui
+from shiny.store import FileStore, MemoryStore, SQLiteStore, Store
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Store:
+    if request.param == "memory":
+        return MemoryStore()
+    if request.param == "file":
+        return FileStore(tmp_path / "store")
+    return SQLiteStore(tmp_path / "store.sqlite3")
+
+
+def test_store(store: Store):
+    assert store.get("x") is None
+    assert store.get("x", 0) == 0
+
+    store.set("x", {"a": [1, 2]})
+    store.set("y", None)
+    assert store.get("x") == {"a": [1, 2]}
+    assert store.get("y", 0) is None
+
+    store.delete("x")
+    store.delete("x")
+    assert store.get("x") is None
+
+    calls: list[int] = []
+
+    def compute() -> int:
+        calls.append(1)
+        return 42
+
+    assert store.get_or_set("z", compute) == 42
+    assert store.get_or_set("z", compute) == 42
+    assert len(calls) == 1
+
+    store.clear()
+    assert store.get("y", 0) == 0
+    assert store.get("z") is None
+
+
+def test_store_ttl(store: Store):
+    store.set("x", 1, ttl=0.05)
+    store.set("y", 2)
+    assert store.get("x") == 1
+    time.sleep(0.1)
+    assert store.get("x") is None
+    assert store.get("y") == 2
+
+    with pytest.raises(ValueError, match="ttl"):
+        store.set("x", 1, ttl=0)
+
+
+@pytest.mark.asyncio
+async def test_store_async(store: Store):
+    await store.set_async("x", [1, 2])
+    assert await store.get_async("x") == [1, 2]
+    assert await store.get_async("y", 0) == 0
+    await store.delete_async("x")
+    assert store.get("x") is None
+    store.set("y", 1)
+    await store.clear_async()
+    assert await store.get_async("y") is None
+
+
+def test_stores_are_shared(tmp_path: Path):
+    file1, file2 = FileStore(tmp_path / "files"), FileStore(tmp_path / "files")
+    file1.set("x", 1)
+    assert file2.get("x") == 1
+
+    db1 = SQLiteStore(tmp_path / "db.sqlite3")
+    db2 = SQLiteStore(tmp_path / "db.sqlite3")
+    db1.set("x", 1)
+    assert db2.get("x") == 1
+    db2.delete("x")
+    assert db1.get("x") is None
+
+
+def test_app_store(tmp_path: Path):
+    app = App(ui.page_fluid(), None)
+    assert isinstance(app.store, MemoryStore)
+    assert app.store is app.store
+
+    store = FileStore(tmp_path)
+    assert App(ui.page_fluid(), None, store=store).store is store
@@ -1,9 +1,12 @@
+import os
 import tempfile
+from pathlib import Path
 from typing import Callable, Optional
 
 import pytest
 from htmltools import Tag
 
+import shiny.ui._theme
 from shiny import App
 from shiny.ui import (
     Theme,
@@ -17,6 +20,7 @@ from shiny.ui import (
     sidebar,
 )
 from shiny.ui._theme import (
+    THEME_CACHE_DIR_ENV_VAR,
     ShinyThemePreset,
     shiny_theme_presets,
     shiny_theme_presets_bundled,
@@ -106,6 +110,97 @@ def test_theme_css_compiles_and_is_cached(preset: ShinyThemePreset):
     assert second_css.find(".MY_MIXIN") != -1
 
 
+@skip_on_windows
+def test_theme_css_persistent_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import sass
+
+    monkeypatch.setenv(THEME_CACHE_DIR_ENV_VAR, str(tmp_path))
+
+    css = Theme("shiny").add_rules(".MY_RULE { color: red; }").to_css()
+    cache_files = os.listdir(tmp_path)
+    assert len(cache_files) == 1
+    assert (tmp_path / cache_files[0]).read_text() == css
+
+    # A new Theme with the same Sass code reads the CSS from the cache, without
+    # compiling it again
+    def fail_compile(**kwargs: object) -> str:
+        raise AssertionError("Theme CSS should have been read from the cache")
+
+    monkeypatch.setattr(sass, "compile", fail_compile)
+    assert Theme("shiny").add_rules(".MY_RULE { color: red; }").to_css() == css
+
+    # Different Sass code or compile arguments are cached separately
+    monkeypatch.undo()
+    monkeypatch.setenv(THEME_CACHE_DIR_ENV_VAR, str(tmp_path))
+    Theme("shiny").add_rules(".MY_RULE { color: blue; }").to_css()
+    Theme("shiny").add_rules(".MY_RULE { color: red; }").to_css(
+        {"output_style": "expanded"}
+    )
+    assert len(os.listdir(tmp_path)) == 3
+
+
+@skip_on_windows
+def test_theme_css_persistent_cache_include_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    include_dir = tmp_path / "include"
+    include_dir.mkdir()
+    monkeypatch.setenv(THEME_CACHE_DIR_ENV_VAR, str(cache_dir))
+
+    def compile_theme() -> str:
+        return (
+            Theme("bootstrap", include_paths=include_dir)
+            .add_rules('@import "my_rules";')
+            .to_css()
+        )
+
+    (include_dir / "_my_rules.scss").write_text(".MY_RULE { color: red; }")
+    assert ".MY_RULE{color:red}" in compile_theme()
+
+    # Changing an imported file invalidates the cached CSS
+    (include_dir / "_my_rules.scss").write_text(".MY_RULE { color: green; }")
+    assert ".MY_RULE{color:green}" in compile_theme()
+
+
+@skip_on_windows
+def test_theme_css_persistent_cache_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv(THEME_CACHE_DIR_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    Theme("shiny").add_rules(".MY_RULE { color: red; }").to_css()
+    monkeypatch.setenv(THEME_CACHE_DIR_ENV_VAR, "")
+    Theme("shiny").add_rules(".MY_RULE { color: blue; }").to_css()
+    assert os.listdir(tmp_path) == []
+
+
+@skip_on_windows
+def test_theme_css_persistent_cache_pruned(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv(THEME_CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(shiny.ui._theme, "THEME_CACHE_MAX_FILES", 2)
+
+    def compile_theme(color: str) -> None:
+        Theme("bootstrap").add_rules(f".MY_RULE {{ color: {color}; }}").to_css()
+
+    def cache_files() -> set[str]:
+        return set(os.listdir(tmp_path))
+
+    compile_theme("red")
+    red = cache_files()
+    compile_theme("green")
+    # Using the red theme again makes the green one the least recently used
+    for path in tmp_path.iterdir():
+        os.utime(path, (0, 0))
+    compile_theme("red")
+    compile_theme("blue")
+    assert len(cache_files()) == 2
+    assert red < cache_files()
+
+
 def test_theme_update_preset():
     theme = Theme("shiny")
     assert theme._preset == "shiny"
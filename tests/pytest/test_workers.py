@@ -0,0 +1,138 @@
+"""Tests for routing requests between the worker processes of an app."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from shiny import App, ui
+from shiny._connection import MockConnection
+from shiny._workers import WORKERS_DIR_ENV_VAR, Workers
+from shiny.store import SQLiteStore
+
+
+@pytest.mark.asyncio
+async def test_session_requests_are_forwarded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    httpx = pytest.importorskip("httpx")
+
+    monkeypatch.setenv(WORKERS_DIR_ENV_VAR, str(tmp_path))
+    app1 = App(ui.page_fluid(), None)
+    app2 = App(ui.page_fluid(), None)
+    assert app1._workers is not None and app2._workers is not None
+    await app1._workers.start(app1)
+    await app2._workers.start(app2)
+
+    try:
+        session = app1._create_session(MockConnection())
+        assert app2._workers.owner(session.id) == app1._workers.id
+        assert app1._workers.owner(session.id) is None
+
+        def handler(request: Request) -> PlainTextResponse:
+            return PlainTextResponse(f"x={request.query_params['x']}")
+
+        url = session.dynamic_route("echo", handler)
+
+        transport = httpx.ASGITransport(app=app2)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            res = await client.get(f"/{url}&x=1")
+            assert res.status_code == 200
+            assert res.text == "x=1"
+
+            # A worker that isn't running
+            await app1._workers.stop()
+            res = await client.get(f"/{url}&x=1")
+            assert res.status_code == 404
+    finally:
+        await app1._workers.stop()
+        await app2._workers.stop()
+
+    # The workers share a store
+    assert isinstance(app1.store, SQLiteStore)
+    app1.store.set("x", [1, 2])
+    assert app2.store.get("x") == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_websockets_are_forwarded(tmp_path: Path):
+    async def echo(scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "websocket"
+        assert (await receive())["type"] == "websocket.connect"
+        await send({"type": "websocket.accept"})
+        while True:
+            message = await receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            await send({"type": "websocket.send", "text": message["text"] * 2})
+
+    owner = Workers(str(tmp_path))
+    await owner.start(echo)
+    assert owner.id is not None
+
+    received: asyncio.Queue[Message] = asyncio.Queue()
+    sent: list[Message] = []
+    for message in [
+        {"type": "websocket.connect"},
+        {"type": "websocket.receive", "text": "a"},
+        {"type": "websocket.disconnect", "code": 1000},
+    ]:
+        received.put_nowait(message)
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope: Scope = {
+        "type": "websocket",
+        "path": "/websocket/",
+        "headers": [],
+        "state": {},
+    }
+    try:
+        assert await Workers(str(tmp_path)).forward(owner.id, scope, received.get, send)
+    finally:
+        await owner.stop()
+
+    assert sent == [
+        {"type": "websocket.accept"},
+        {"type": "websocket.send", "text": "aa"},
+    ]
+    assert not await Workers(str(tmp_path)).forward(owner.id, scope, received.get, send)
+
+
+@pytest.mark.asyncio
+async def test_available_workers(tmp_path: Path):
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        pass
+
+    workers = [Workers(str(tmp_path)) for _ in range(3)]
+    for w in workers:
+        await w.start(app)
+    w1, w2, w3 = workers
+
+    assert w1.available() in (w2.id, w3.id)
+    w2.set_draining()
+    assert w1.available() == w3.id
+    assert w2.available() in (w1.id, w3.id)
+
+    await w3.stop()
+    assert w1.available() is None
+    for w in workers:
+        await w.stop()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_workers_not_valid_with_reload():
+    import click
+
+    from shiny import run_app
+
+    with pytest.raises(click.UsageError, match="--reload"):
+        run_app("app.py", workers=2, reload=True)